@@ -22,6 +22,9 @@ from nomad_dtu_nanolab_plugin.schema_packages.basesections import (
     MappingMeasurement,
     MappingResult,
 )
+from nomad_dtu_nanolab_plugin.schema_packages.units import (
+    to_quantity,
+)
 
 if TYPE_CHECKING:
     from nomad.datamodel.datamodel import EntryArchive
@@ -319,19 +322,19 @@ class DTUPLMeasurement(MappingMeasurement, PlotSection, Schema):
         range_str = metadata.get('Range', None)
 
         meta = PLMetadata(
-            thickness=ureg.Quantity(thickness, 'um'),
-            wafer_diameter=ureg.Quantity(waferdiam, 'mm'),
-            scan_diameter=ureg.Quantity(scandiam, 'mm'),
-            resolution=ureg.Quantity(resolution, 'mm'),
-            scan_rate=ureg.Quantity(scanrate, 'mm/s'),
-            used_laser=ureg.Quantity(laser, 'nm'),
-            used_power=ureg.Quantity(power, 'mW'),
+            thickness=to_quantity(thickness, 'um'),
+            wafer_diameter=to_quantity(waferdiam, 'mm'),
+            scan_diameter=to_quantity(scandiam, 'mm'),
+            resolution=to_quantity(resolution, 'mm'),
+            scan_rate=to_quantity(scanrate, 'mm/s'),
+            used_laser=to_quantity(laser, 'nm'),
+            used_power=to_quantity(power, 'mW'),
             used_filter=filter,
             gain_factor=gain,
-            temperature=ureg.Quantity(temperature, 'degC'),
-            center_wafelength=ureg.Quantity(centerwavelength, 'nm'),
-            slit_width=ureg.Quantity(slitwidth, 'mm'),
-            gratings=ureg.Quantity(gratings, 'g/mm'),
+            temperature=to_quantity(temperature, 'degC'),
+            center_wafelength=to_quantity(centerwavelength, 'nm'),
+            slit_width=to_quantity(slitwidth, 'mm'),
+            gratings=to_quantity(gratings, 'g/mm'),
             detector=detector,
             wavelength_range=[
                 (ureg.Quantity(float(self.remove_unit(part))), 'nm')
@@ -364,10 +367,10 @@ class DTUPLMeasurement(MappingMeasurement, PlotSection, Schema):
                 result = PLMappingResult()
 
             result.position = key
-            result.peak_lambda = ureg.Quantity(values[0], 'nm')
-            result.peak_intensity = ureg.Quantity(values[1], 'V')
+            result.peak_lambda = to_quantity(values[0], 'nm')
+            result.peak_intensity = to_quantity(values[1], 'V')
             result.signal_intensity = values[2]
-            result.peak_fwhm = ureg.Quantity(values[3], 'nm')
+            result.peak_fwhm = to_quantity(values[3], 'nm')
 
             result.normalize(archive, logger)
             new_results.append(result)
@@ -31,6 +31,8 @@ from nomad.metainfo import Package, Quantity, Section, SubSection
 from nomad.units import ureg
 from structlog.stdlib import BoundLogger
 
+from nomad_dtu_nanolab_plugin.schema_packages.units import to_magnitude
+
 if TYPE_CHECKING:
     from nomad.datamodel.datamodel import EntryArchive
     from structlog.stdlib import BoundLogger
@@ -108,15 +110,15 @@ class MappingResult(MeasurementResult):
             self.y_relative, ureg.Quantity
         ):
             self.name = (
-                f'Sample x = {self.x_relative.to("mm").magnitude:.1f} mm, '
-                f'y = {self.y_relative.to("mm").magnitude:.1f} mm'
+                f'Sample x = {to_magnitude(self.x_relative, "mm"):.1f} mm, '
+                f'y = {to_magnitude(self.y_relative, "mm"):.1f} mm'
             )
         elif isinstance(self.x_absolute, ureg.Quantity) and isinstance(
             self.y_absolute, ureg.Quantity
         ):
             self.name = (
-                f'Stage x = {self.x_absolute.to("mm").magnitude:.1f} mm, '
-                f'y = {self.y_absolute.to("mm").magnitude:.1f} mm'
+                f'Stage x = {to_magnitude(self.x_absolute, "mm"):.1f} mm, '
+                f'y = {to_magnitude(self.y_absolute, "mm"):.1f} mm'
             )
 
 
@@ -469,8 +471,8 @@ class MappingMeasurement(DtuNanolabMeasurement):
             x, y = self.sample_alignment.affine_transformation.transform_vector(
                 np.array(
                     [
-                        result.x_absolute.to('m').magnitude,
-                        result.y_absolute.to('m').magnitude,
+                        to_magnitude(result.x_absolute, 'm'),
+                        to_magnitude(result.y_absolute, 'm'),
                     ]
                 )
             )
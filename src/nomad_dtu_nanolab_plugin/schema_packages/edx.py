@@ -24,6 +24,11 @@ from nomad_dtu_nanolab_plugin.schema_packages.basesections import (
     MappingResult,
     RectangularSampleAlignment,
 )
+from nomad_dtu_nanolab_plugin.schema_packages.units import (
+    to_magnitude,
+    to_quantities,
+    to_quantity,
+)
 
 if TYPE_CHECKING:
     from nomad.datamodel.datamodel import EntryArchive
@@ -148,20 +153,20 @@ class EDXMeasurement(MappingMeasurement, PlotSection, Schema):
             if isinstance(result.x_relative, ureg.Quantity) and isinstance(
                 result.y_relative, ureg.Quantity
             ):
-                x.append(result.x_relative.to('mm').magnitude)
-                y.append(result.y_relative.to('mm').magnitude)
+                x.append(to_magnitude(result.x_relative, 'mm'))
+                y.append(to_magnitude(result.y_relative, 'mm'))
                 x_title = 'X Sample Position (mm)'
                 y_title = 'Y Sample Position (mm)'
             elif isinstance(result.x_absolute, ureg.Quantity) and isinstance(
                 result.y_absolute, ureg.Quantity
             ):
-                x.append(result.x_absolute.to('mm').magnitude)
-                y.append(result.y_absolute.to('mm').magnitude)
+                x.append(to_magnitude(result.x_absolute, 'mm'))
+                y.append(to_magnitude(result.y_absolute, 'mm'))
                 x_title = 'X Stage Position (mm)'
                 y_title = 'Y Stage Position (mm)'
             else:
                 continue
-            thickness.append(result.layer_thickness.to('nm').magnitude)
+            thickness.append(to_magnitude(result.layer_thickness, 'nm'))
             quantification: EDXQuantification
             for quantification in result.quantifications:
                 quantifications[quantification.element].append(
@@ -407,8 +412,8 @@ class EDXMeasurement(MappingMeasurement, PlotSection, Schema):
             archive (EntryArchive): The archive containing the section.
             logger (BoundLogger): A structlog logger.
         """
-        corner_x = ureg.Quantity(df_alignment['corner x'].dropna().values, 'mm')
-        corner_y = ureg.Quantity(df_alignment['corner y'].dropna().values, 'mm')
+        corner_x = to_quantity(df_alignment['corner x'].dropna(), 'mm')
+        corner_y = to_quantity(df_alignment['corner y'].dropna(), 'mm')
         sample_alignment = DTUSampleAlignment(
             x_upper_left=corner_x[0],
             y_upper_left=corner_y[0],
@@ -416,7 +421,7 @@ class EDXMeasurement(MappingMeasurement, PlotSection, Schema):
             y_lower_right=corner_y[1],
         )
 
-        avg_layer_thickness = ureg.Quantity(
+        avg_layer_thickness = to_quantity(
             df_data['Layer 1 Thickness (nm)'].mean(), 'nm'
         )
 
@@ -425,19 +430,23 @@ class EDXMeasurement(MappingMeasurement, PlotSection, Schema):
             label for label in df_data.columns if re.match(pattern, label)
         ]
 
+        elements = [label.split(' ')[2] for label in percentage_labels]
+        atomic_fractions = (df_data[percentage_labels].to_numpy() * 1e-2).tolist()
+        # The positions and thicknesses of all the points are converted at once
+        x_absolute = to_quantities(df_data['X (mm)'], 'mm')
+        y_absolute = to_quantities(df_data['Y (mm)'], 'mm')
+        layer_thickness = to_quantities(df_data['Layer 1 Thickness (nm)'], 'nm')
+
         results = []
-        for _, row in df_data.iterrows():
-            quantifications = []
-            for label in percentage_labels:
-                element = label.split(' ')[2]
-                atomic_fraction = row[label] * 1e-2
-                quantifications.append(
-                    EDXQuantification(element=element, atomic_fraction=atomic_fraction)
-                )
+        for i in range(len(df_data)):
+            quantifications = [
+                EDXQuantification(element=element, atomic_fraction=atomic_fraction)
+                for element, atomic_fraction in zip(elements, atomic_fractions[i])
+            ]
             result = EDXResult(
-                x_absolute=ureg.Quantity(row['X (mm)'], 'mm'),
-                y_absolute=ureg.Quantity(row['Y (mm)'], 'mm'),
-                layer_thickness=ureg.Quantity(row['Layer 1 Thickness (nm)'], 'nm'),
+                x_absolute=x_absolute[i],
+                y_absolute=y_absolute[i],
+                layer_thickness=layer_thickness[i],
                 quantifications=quantifications,
             )
             result.normalize(archive, logger)
@@ -16,7 +16,9 @@
 # limitations under the License.
 #
 
+import functools
 import json
+import logging
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -38,7 +40,6 @@ from nomad.datamodel.metainfo.workflow import (
 )
 from nomad.datamodel.results import Material, Results
 from nomad.metainfo import MEnum, MProxy, Package, Quantity, Section, SubSection
-from nomad.units import ureg
 from nomad_material_processing.general import (
     SubstrateReference,
     ThinFilm,
@@ -67,9 +68,17 @@ from nomad_dtu_nanolab_plugin.schema_packages.substrate import (
     DTUSubstrateBatch,
 )
 from nomad_dtu_nanolab_plugin.schema_packages.target import DTUTarget
+from nomad_dtu_nanolab_plugin.schema_packages.units import (
+    get_unit,
+    to_quantity,
+)
 from nomad_dtu_nanolab_plugin.sputter_log_reader import (
-    generate_timeline,
-    get_nested_value,
+    LogfileProcessor,
+    ProcessingStats,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.nomad_mapping import (
+    compile_nomad_map,
+    format_input_path,
     map_environment_params_to_nomad,
     map_gas_flow_params_to_nomad,
     map_material_params_to_nomad,
@@ -77,11 +86,9 @@ from nomad_dtu_nanolab_plugin.sputter_log_reader import (
     map_s_cracker_params_to_nomad,
     map_sputter_source_params_to_nomad,
     map_step_params_to_nomad,
-    read_events,
-    read_logfile,
-    write_params,
-    # format_logfile,
 )
+from nomad_dtu_nanolab_plugin.sputter_log_reader.params import write_params
+from nomad_dtu_nanolab_plugin.sputter_log_reader.reduction import reduce_step_params
 
 if TYPE_CHECKING:
     from nomad.datamodel.datamodel import EntryArchive
@@ -91,6 +98,78 @@ import os
 
 m_package = Package(name='DTU customised sputter Schemas')
 
+# The NOMAD maps of the steps are compiled once, with their units, and applied
+# to the parameters of each step (see DTUSputtering.write_mapped_data)
+SPUTTER_SOURCE_NAMES = ['magkeeper3', 'magkeeper4', 'taurus']
+STEP_NOMAD_MAP = compile_nomad_map(
+    map_step_params_to_nomad(None), 'step', skip=1, unit_factory=get_unit
+)
+ENVIRONMENT_NOMAD_MAP = compile_nomad_map(
+    map_environment_params_to_nomad(None),
+    'environment',
+    skip=1,
+    unit_factory=get_unit,
+)
+GAS_FLOW_NOMAD_MAPS = {
+    gas_name: compile_nomad_map(
+        map_gas_flow_params_to_nomad(None, gas_name),
+        'gas_flow',
+        skip=1,
+        unit_factory=get_unit,
+    )
+    for gas_name in ['ar', 'h2s', 'ph3']
+}
+S_CRACKER_NOMAD_MAP = compile_nomad_map(
+    map_s_cracker_params_to_nomad(None),
+    'cracker_source',
+    skip=1,
+    unit_factory=get_unit,
+)
+SPUTTER_SOURCE_NOMAD_MAPS = {
+    (source_name, power_type): compile_nomad_map(
+        map_sputter_source_params_to_nomad(None, source_name, power_type),
+        'source',
+        skip=1,
+        unit_factory=get_unit,
+    )
+    for source_name in SPUTTER_SOURCE_NAMES
+    for power_type in ['RF', 'DC', 'pulsed_DC']
+}
+MATERIAL_NOMAD_MAPS = {
+    source_name: compile_nomad_map(
+        map_material_params_to_nomad(None, source_name),
+        'target',
+        skip=1,
+        unit_factory=get_unit,
+    )
+    for source_name in SPUTTER_SOURCE_NAMES
+}
+
+
+# Function to compile the NOMAD map of the main parameters, which only depends
+# on whether the S cracker and each gun were enabled during the deposition, so
+# that it is compiled once for each combination of enabled sources
+@functools.cache
+def compile_params_nomad_map(s_cracker_enabled, enabled_guns):
+    deposition = {gun: {'enabled': True} for gun in enabled_guns}
+    deposition['SCracker'] = {'enabled': s_cracker_enabled}
+    return compile_nomad_map(
+        map_params_to_nomad({'deposition': deposition}, list(enabled_guns)),
+        'sputtering',
+        unit_factory=get_unit,
+    )
+
+
+# Function to check if the debug messages of a logger are emitted, so that they
+# are only formatted when needed. The loggers not wrapping a logging.Logger are
+# assumed to emit them
+def is_debug_enabled(logger):
+    for name in ['_logger', 'logger']:
+        wrapped = getattr(logger, name, None)
+        if isinstance(wrapped, logging.Logger):
+            return wrapped.isEnabledFor(logging.DEBUG)
+    return True
+
 
 class DtuSubstrateMounting(ArchiveSection):
     """
@@ -1169,6 +1248,113 @@ class DepositionParameters(ArchiveSection):
             self.ph3_partial_pressure = ph3 * 0.1 / flow * p * self.sputter_pressure.u
 
 
+class DTUProcessingStage(ArchiveSection):
+    """
+    Wall time, number of rows and peak memory of a stage of the processing of
+    the log file.
+    """
+
+    m_def = Section()
+    name = Quantity(
+        type=str,
+        description='The name of the stage (Ex: read_logfile, filter_gas).',
+    )
+    parent = Quantity(
+        type=str,
+        description='The name of the stage the stage is nested in, if any.',
+    )
+    count = Quantity(
+        type=int,
+        description='The number of times the stage was run.',
+    )
+    wall_time = Quantity(
+        type=np.float64,
+        description=(
+            'The wall time spent in the stage, nested stages included, summed '
+            'over the runs of the stage.'
+        ),
+        unit='s',
+    )
+    rows = Quantity(
+        type=int,
+        description='The number of rows of the log file processed by the stage.',
+    )
+    peak_memory = Quantity(
+        type=np.float64,
+        description=(
+            'The peak of the memory allocated during the stage, only traced if '
+            'the DTU_NANOLAB_PROFILE_MEMORY environment variable is set to 1.'
+        ),
+        unit='byte',
+    )
+
+
+class DTUProcessingStats(ArchiveSection):
+    """
+    Statistics of the processing of the log file, to find the slow entries
+    and their slowest stages.
+    """
+
+    m_def = Section()
+    total_time = Quantity(
+        type=np.float64,
+        description='The wall time spent processing the log file.',
+        unit='s',
+    )
+    slowest_stage = Quantity(
+        type=str,
+        description='The name of the stage, without nested stages, that took '
+        'the longest.',
+    )
+    stages = SubSection(
+        section_def=DTUProcessingStage,
+        repeats=True,
+    )
+
+
+class DTUTimeSeriesReduction(ArchiveSection):
+    """
+    Reduction of the time series of a type of channel written to the steps,
+    from the full resolution of the log file.
+    """
+
+    m_def = Section()
+    channel_type = Quantity(
+        type=MEnum(['measurement', 'setpoint', 'state']),
+        description='The type of channel the time series belong to.',
+    )
+    strategy = Quantity(
+        type=MEnum(
+            [
+                'none',
+                'stride',
+                'bucket_mean',
+                'bucket_min',
+                'bucket_max',
+                'lttb',
+                'change_point',
+            ]
+        ),
+        description='The strategy used to reduce the time series.',
+    )
+    max_points = Quantity(
+        type=int,
+        description='The number of points above which a time series is reduced.',
+    )
+    series = Quantity(
+        type=int,
+        description='The number of time series of this type of channel.',
+    )
+    points = Quantity(
+        type=int,
+        description='The total number of points of the time series in the log file.',
+    )
+    reduced_points = Quantity(
+        type=int,
+        description='The total number of points of the time series in the steps.',
+    )
+
+
 class DTUSputtering(SputterDeposition, PlotSection, Schema):
     """
     Class autogenerated from yaml schema.
@@ -1213,8 +1399,20 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
     deposition_parameters = SubSection(
         section_def=DepositionParameters,
     )
+    processing_stats = SubSection(
+        section_def=DTUProcessingStats,
+    )
+    time_series_reduction = SubSection(
+        section_def=DTUTimeSeriesReduction,
+        repeats=True,
+    )
 
     def plot(self, events_plot, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
+        # The plotting stack is only imported when the entry is plotted
+        from nomad_dtu_nanolab_plugin.sputter_log_reader.plotting import (
+            generate_timeline,
+        )
+
         # Plotting the events on a timeline from the generate_timeline function
         timeline = generate_timeline(events_plot, self.lab_id)
 
@@ -1263,55 +1461,76 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
 
     # Helper method to write the data
     def write_data(self, config: dict):
-        input_dict = config.get('input_dict')
-        input_keys = config.get('input_keys')
-        output_obj = config.get('output_obj')
-        output_obj_name = config.get('output_obj_name')
-        output_keys = config.get('output_keys')
-        unit = config.get('unit')
-        logger = config.get('logger')
-
-        joined_keys = "']['".join(input_keys)
-        params_str = f"params['{joined_keys}']"
-        subsection_str = f"{output_obj_name}.{'.'.join(output_keys)}"
-
-        value = get_nested_value(input_dict, input_keys)
-
-        # Checking that the value exists
-        if value is None:
-            logger.warning(f'Missing {params_str}: Could not set {subsection_str}')
-            return
-        # We check if the value is a TimeDelta object and convert it to seconds
-        if isinstance(value, pd._libs.tslibs.timedeltas.Timedelta):
-            try:
-                value = value.total_seconds()
-            except AttributeError:
-                logger.warning(f'{params_str}.total_seconds method is invalid')
-                return
-            value = ureg.Quantity(value, 'second')
-        elif unit is not None:
-            if isinstance(value, list):
-                for i in range(len(value)):
-                    try:
-                        value[i] = ureg.Quantity(value[i], unit)
-                    except Exception as e:
-                        logger.warning(f'Failed to convert {params_str} to {unit}: {e}')
-                        return
-            else:
+        nomad_map = compile_nomad_map(
+            [[config.get('input_keys'), config.get('output_keys'), config.get('unit')]],
+            config.get('output_obj_name'),
+            unit_factory=get_unit,
+        )
+        self.write_mapped_data(
+            nomad_map,
+            config.get('input_dict'),
+            config.get('output_obj'),
+            config.get('logger'),
+        )
+
+    def write_mapped_data(
+        self,
+        nomad_map: tuple,
+        input_dict: dict,
+        output_obj: ArchiveSection,
+        logger: 'BoundLogger',
+        prefix: tuple = (),
+    ) -> None:
+        """
+        Writes the values of a compiled NOMAD map (see compile_nomad_map) from
+        the parameters to the quantities of a section.
+
+        Args:
+            nomad_map (tuple): The compiled NOMAD map.
+            input_dict (dict): The parameters (of the step if the map of a step).
+            output_obj (ArchiveSection): The section being written.
+            logger (BoundLogger): A structlog logger.
+            prefix (tuple): The keys skipped when compiling the map (Ex: the
+              step key), only used in the log messages.
+        """
+        debug = is_debug_enabled(logger)
+        for param in nomad_map:
+            value = param.get(input_dict)
+
+            # Checking that the value exists
+            if value is None:
+                logger.warning(
+                    f'Missing {format_input_path(param, prefix)}: '
+                    f'Could not set {param.output_path}'
+                )
+                continue
+            # We check if the value is a TimeDelta object and convert it to seconds
+            if isinstance(value, pd.Timedelta):
+                value = to_quantity(value.total_seconds(), 'second')
+            elif param.unit is not None:
+                # the time series are converted as a whole, as a single Quantity
+                # array, rather than element by element
                 try:
-                    value = ureg.Quantity(value, unit)
+                    value = to_quantity(value, param.unit)
                 except Exception as e:
-                    logger.warning(f'Failed to convert {params_str} to {unit}: {e}')
-                    return
-        # Traverse the path to set the nested attribute
-        try:
-            obj = output_obj
-            for attr in output_keys[:-1]:
-                obj = getattr(obj, attr)
-            setattr(obj, output_keys[-1], value)
-            logger.info(f'Set {params_str} to {subsection_str}')
-        except Exception as e:
-            logger.warning(f'Failed to set {params_str} to {subsection_str}: {e}')
+                    logger.warning(
+                        f'Failed to convert {format_input_path(param, prefix)} '
+                        f'to {param.unit}: {e}'
+                    )
+                    continue
+            # Set the nested attribute with the precompiled setter
+            try:
+                param.set(output_obj, value)
+            except Exception as e:
+                logger.warning(
+                    f'Failed to set {format_input_path(param, prefix)} to '
+                    f'{param.output_path}: {e}'
+                )
+                continue
+            if debug:
+                logger.debug(
+                    f'Set {format_input_path(param, prefix)} to {param.output_path}'
+                )
 
     def generate_general_log_data(self, params: dict, logger: 'BoundLogger') -> None:
         """
@@ -1327,10 +1546,17 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
         self.datetime = params['overview']['log_start_time'].to_pydatetime()
         self.end_time = params['overview']['log_end_time'].to_pydatetime()
 
-        gun_list = ['magkeeper3', 'magkeeper4', 'taurus']
+        gun_list = SPUTTER_SOURCE_NAMES
 
         # Mapping the params to the respective sections
-        param_nomad_map = map_params_to_nomad(params, gun_list)
+        param_nomad_map = compile_params_nomad_map(
+            bool(params['deposition'].get('SCracker', {}).get('enabled', False)),
+            tuple(
+                gun
+                for gun in gun_list
+                if params['deposition'].get(gun, {}).get('enabled', False)
+            ),
+        )
 
         # Initializing a temporary class objects
         sputtering = DTUSputtering()
@@ -1363,18 +1589,8 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
 
         sputtering.log_file_report = format_log_for_html(write_params(params))
 
-        # Looping through the param_nomad_map
-        for input_keys, output_keys, unit in param_nomad_map:
-            config = {
-                'input_dict': params,
-                'input_keys': input_keys,
-                'output_obj': sputtering,
-                'output_obj_name': 'sputtering',
-                'output_keys': output_keys,
-                'unit': unit,
-                'logger': logger,
-            }
-            self.write_data(config)
+        # Writing the mapped params to the sputtering section
+        self.write_mapped_data(param_nomad_map, params, sputtering, logger)
 
         # Getting the deposition sub-dictionary
         deposition = params.get('deposition', {})
@@ -1382,7 +1598,7 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
         # Special case for the adjusted instrument parameters
         instrument_reference = InstrumentParameters()
         if 'platen_position' in deposition:
-            instrument_reference.platen_rotation = ureg.Quantity(
+            instrument_reference.platen_rotation = to_quantity(
                 deposition['platen_position'], 'degree'
             )
         sputtering.instruments = [instrument_reference]
@@ -1398,20 +1614,10 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
             # Initializing a temporary step object
             step = DTUSteps()
 
-            step_param_nomad_map = map_step_params_to_nomad(key)
-
-            # Looping through the step_param_nomad_map
-            for input_keys, output_keys, unit in step_param_nomad_map:
-                config = {
-                    'input_dict': step_params,
-                    'input_keys': input_keys,
-                    'output_obj': step,
-                    'output_obj_name': 'step',
-                    'output_keys': output_keys,
-                    'unit': unit,
-                    'logger': logger,
-                }
-                self.write_data(config)
+            # Writing the mapped step params to the step section
+            self.write_mapped_data(
+                STEP_NOMAD_MAP, step_params.get(key), step, logger, prefix=(key,)
+            )
 
             # generate the sources
 
@@ -1492,20 +1698,14 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
         for zone in [1, 2, 3]:
             cracker_source.vapor_source.__setattr__(f'zone{zone}_temp', DtuZoneTemp())
 
-        s_cracker_param_nomad_map = map_s_cracker_params_to_nomad(key)
-
-        # Looping through the s_cracker_param_nomad_map
-        for input_keys, output_keys, unit in s_cracker_param_nomad_map:
-            config = {
-                'input_dict': step_params,
-                'input_keys': input_keys,
-                'output_obj': cracker_source,
-                'output_obj_name': 'cracker_source',
-                'output_keys': output_keys,
-                'unit': unit,
-                'logger': logger,
-            }
-            self.write_data(config)
+        # Writing the mapped s cracker params to the cracker source section
+        self.write_mapped_data(
+            S_CRACKER_NOMAD_MAP,
+            step_params.get(key),
+            cracker_source,
+            logger,
+            prefix=(key,),
+        )
         cracker_source.material = [
             DtuCrackerMaterial(
                 pure_substance=PureSubstanceSection(molecular_formula='S')
@@ -1522,7 +1722,7 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
     ) -> None:
         sources = []
 
-        for source_name in ['magkeeper3', 'magkeeper4', 'taurus']:
+        for source_name in SPUTTER_SOURCE_NAMES:
             # Create a DTUSource object and set it to the relevant attribute
             source = DTUSputteringSource()
             source.material = []
@@ -1558,24 +1758,15 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
 
             source.vapor_source.power_sp = DtuPowerSetPoint()
 
-            # Mapping the source_param_nomad_map
-            source_param_nomad_map = map_sputter_source_params_to_nomad(
-                key, source_name, power_type
+            # Writing the mapped source params to the source section
+            self.write_mapped_data(
+                SPUTTER_SOURCE_NOMAD_MAPS[(source_name, power_type)],
+                step_params.get(key),
+                source,
+                logger,
+                prefix=(key,),
             )
 
-            # Looping through the source_param_nomad_map
-            for input_keys, output_keys, unit in source_param_nomad_map:
-                config = {
-                    'input_dict': step_params,
-                    'input_keys': input_keys,
-                    'output_obj': source,
-                    'output_obj_name': 'source',
-                    'output_keys': output_keys,
-                    'unit': unit,
-                    'logger': logger,
-                }
-                self.write_data(config)
-
             target = self.generate_material_log_data(
                 step_params, key, source_name, archive, logger
             )
@@ -1598,19 +1789,14 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
 
         target = DTUTargetComponent()
 
-        # Mapping the material_param_nomad_map
-        material_param_nomad_map = map_material_params_to_nomad(key, source_name)
-        for input_keys, output_keys, unit in material_param_nomad_map:
-            config = {
-                'input_dict': step_params,
-                'input_keys': input_keys,
-                'output_obj': target,
-                'output_obj_name': 'target',
-                'output_keys': output_keys,
-                'unit': unit,
-                'logger': logger,
-            }
-            self.write_data(config)
+        # Writing the mapped material params to the target section
+        self.write_mapped_data(
+            MATERIAL_NOMAD_MAPS[source_name],
+            step_params.get(key),
+            target,
+            logger,
+            prefix=(key,),
+        )
         # Run the normalizer of the target subsection to find reference from lab_id
         target.normalize(archive, logger)
         target_list.append(target)
@@ -1624,20 +1810,14 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
         environment.gas_flow = []
         environment.pressure = Pressure()
 
-        environment_param_nomad_map = map_environment_params_to_nomad(key)
-
-        # Looping through the environment_param_nomad_map
-        for input_keys, output_keys, unit in environment_param_nomad_map:
-            config = {
-                'input_dict': step_params,
-                'input_keys': input_keys,
-                'output_obj': environment,
-                'output_obj_name': 'environment',
-                'output_keys': output_keys,
-                'unit': unit,
-                'logger': logger,
-            }
-            self.write_data(config)
+        # Writing the mapped environment params to the environment section
+        self.write_mapped_data(
+            ENVIRONMENT_NOMAD_MAP,
+            step_params.get(key),
+            environment,
+            logger,
+            prefix=(key,),
+        )
 
         gas_flow = self.generate_gas_flow_log_data(step_params, key, logger)
 
@@ -1655,20 +1835,14 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
             single_gas_flow.flow_rate = VolumetricFlowRate()
             single_gas_flow.gas = PureSubstanceSection()
 
-            gas_flow_param_nomad_map = map_gas_flow_params_to_nomad(key, gas_name)
-
-            # Looping through the gas_flow_param_nomad_map
-            for input_keys, output_keys, unit in gas_flow_param_nomad_map:
-                config = {
-                    'input_dict': step_params,
-                    'input_keys': input_keys,
-                    'output_obj': single_gas_flow,
-                    'output_obj_name': 'gas_flow',
-                    'output_keys': output_keys,
-                    'unit': unit,
-                    'logger': logger,
-                }
-                self.write_data(config)
+            # Writing the mapped gas flow params to the gas flow section
+            self.write_mapped_data(
+                GAS_FLOW_NOMAD_MAPS[gas_name],
+                step_params.get(key),
+                single_gas_flow,
+                logger,
+                prefix=(key,),
+            )
 
             gas_flow.append(single_gas_flow)
 
@@ -1735,6 +1909,50 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
 
         self.samples = samples
 
+    def generate_processing_stats(self, stats: ProcessingStats) -> DTUProcessingStats:
+        """
+        Generates the processing_stats section from the stages recorded while
+        processing the log file.
+
+        Args:
+            stats (ProcessingStats): The stats of the processing of the log file.
+
+        Returns:
+            DTUProcessingStats: The processing stats section.
+        """
+        stages = []
+        for name, record in stats.stages.items():
+            stage = DTUProcessingStage(
+                name=name, count=record['count'], wall_time=record['wall_time']
+            )
+            for key in ['parent', 'rows', 'peak_memory']:
+                if record[key] is not None:
+                    setattr(stage, key, record[key])
+            stages.append(stage)
+        return DTUProcessingStats(
+            total_time=stats.total_time,
+            slowest_stage=stats.slowest_stage(),
+            stages=stages,
+        )
+
+    def generate_time_series_reduction(
+        self, reduction: dict
+    ) -> list[DTUTimeSeriesReduction]:
+        """
+        Generates the time_series_reduction sections from the report of the
+        reduction of the step time series.
+
+        Args:
+            reduction (dict): The report of reduce_step_params, by channel type.
+
+        Returns:
+            list[DTUTimeSeriesReduction]: The reduction of each type of channel.
+        """
+        return [
+            DTUTimeSeriesReduction(channel_type=channel_type, **record)
+            for channel_type, record in reduction.items()
+        ]
+
     def add_target_to_workflow(self, archive: 'EntryArchive') -> None:
         """
         Temporary method to add the target to the workflow2.inputs list.
@@ -1761,6 +1979,9 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
         """
         # Analysing log file
         if self.log_file:
+            # The stages of the processing of the log file are logged and
+            # written to the processing_stats section
+            stats = ProcessingStats(logger=logger)
             # Extracting the sample name from the log file name
             log_name = os.path.basename(self.log_file)
             sample_id = '_'.join(log_name.split('_')[0:3])
@@ -1769,19 +1990,34 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
                 self.lab_id = sample_id
             # Openning the log file
             with archive.m_context.raw_file(self.log_file, 'r') as log:
-                log_df = read_logfile(log.name)
-                # formated_log_df = format_logfile(log_df)
-                events_plot, params, step_params = read_events(log_df)
+                # The logfile is read and its events extracted, the parameters
+                # being only extracted below when they are first accessed
+                result = LogfileProcessor(log.name, stats=stats).result()
+            events_plot = result.events_to_plot
+            params = result.main_params
+            step_params = result.step_params
+            for stage, error in result.errors.items():
+                logger.warning(f'Failed to read the logfile ({stage} stage): {error}')
             if params is not None:
                 # Writing logfile data to the respective sections
-                sputtering = self.generate_general_log_data(params, logger)
+                with stats.stage('generate_general_log_data'):
+                    sputtering = self.generate_general_log_data(params, logger)
 
             if step_params is not None and sputtering is not None:
-                steps = self.generate_step_log_data(step_params, archive, logger)
-                sputtering.steps.extend(steps)
+                # The time series of the steps are reduced before being
+                # written, see STEP_SERIES_REDUCTION
+                with stats.stage('reduce_step_params'):
+                    step_params, reduction = reduce_step_params(step_params)
+                self.time_series_reduction = self.generate_time_series_reduction(
+                    reduction
+                )
+                with stats.stage('generate_step_log_data'):
+                    steps = self.generate_step_log_data(step_params, archive, logger)
+                    sputtering.steps.extend(steps)
 
             # Merging the sputtering object with self
-            merge_sections(self, sputtering, logger)
+            with stats.stage('merge_sections'):
+                merge_sections(self, sputtering, logger)
 
             # Run the normalizer of the deposition.parameters subsection
             self.deposition_parameters.normalize(archive, logger)
@@ -1794,7 +2030,10 @@ class DTUSputtering(SputterDeposition, PlotSection, Schema):
 
             # Triggering the plotting of the timeline and the sample position plot
             self.figures = []
-            self.plot(events_plot, archive, logger)
+            with stats.stage('generate_timeline'):
+                self.plot(events_plot, archive, logger)
+
+            self.processing_stats = self.generate_processing_stats(stats)
 
             if self.deposition_parameters is not None:
                 self.add_libraries(archive, logger)
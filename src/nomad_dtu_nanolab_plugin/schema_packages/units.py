@@ -0,0 +1,46 @@
+"""
+Conversion of the values written to the NOMAD sections into pint Quantities.
+Parsing a unit string is much slower than building a Quantity from a pint
+Unit, so the Unit of each unit string is parsed once and cached, and the
+lists and arrays of values are converted as a whole, as a single Quantity.
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+from nomad.units import ureg
+
+
+# Function to get the pint Unit of a unit string (Ex: 'mm', 'cm^3/minute'),
+# parsed only once per unit string
+@functools.cache
+def get_unit(unit):
+    return ureg.Unit(unit)
+
+
+# Function to convert a value, or a whole list, array or pd.Series of values,
+# into a Quantity of unit (unit string or pint Unit)
+def to_quantity(value, unit):
+    if isinstance(unit, str):
+        unit = get_unit(unit)
+    if isinstance(value, (list, tuple, pd.Series, pd.Index)):
+        value = np.asarray(value)
+    return ureg.Quantity(value, unit)
+
+
+# Function to convert the values of a list, array or pd.Series into a list of
+# scalar Quantities of unit, for the repeated sections holding one of the
+# values each (Ex: the EDXResult of each point of an EDX map)
+def to_quantities(values, unit):
+    if isinstance(unit, str):
+        unit = get_unit(unit)
+    return [ureg.Quantity(value, unit) for value in np.asarray(values).tolist()]
+
+
+# Function to get the magnitude of a Quantity in unit (unit string or pint
+# Unit), the unit being parsed only once
+def to_magnitude(quantity, unit):
+    if isinstance(unit, str):
+        unit = get_unit(unit)
+    return quantity.to(unit).magnitude
@@ -1,4 +1,3 @@
-import re
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
@@ -23,6 +22,11 @@ from nomad_dtu_nanolab_plugin.schema_packages.basesections import (
     MappingMeasurement,
     MappingResult,
 )
+from nomad_dtu_nanolab_plugin.schema_packages.units import (
+    to_magnitude,
+    to_quantities,
+    to_quantity,
+)
 
 if TYPE_CHECKING:
     from nomad.datamodel.datamodel import EntryArchive
@@ -327,32 +331,37 @@ class DTUXpsMeasurement(MappingMeasurement, PlotSection, Schema):
         results = []
 
         for coord in coords_list:
-            mask = dataframe.apply(lambda row: (row['X'], row['Y']) == coord, axis=1)
+            mask = (dataframe['X'] == coord[0]) & (dataframe['Y'] == coord[1])
             coord_data = dataframe[mask]
             mapping_result = XpsMappingResult(
-                x_relative=ureg.Quantity(coord[0], 'mm'),
-                y_relative=ureg.Quantity(coord[1], 'mm'),
+                x_relative=to_quantity(coord[0], 'mm'),
+                y_relative=to_quantity(coord[1], 'mm'),
             )
-            peaks = []
-            coord_data = coord_data.assign(Element=coord_data['Peak'])
-
-            for index, row in coord_data.iterrows():
-                peak_info = XpsFittedPeak(
-                    origin=ureg.Quantity(row['Peak'], 'eV'),
-                    be_position=ureg.Quantity(row['Peak BE (eV)'], 'eV'),
-                    intensity=ureg.Quantity(row['Intensity (counts)'], '1/s'),
-                    fwhm=ureg.Quantity(row['FWHM (eV)'], 'eV'),
-                    area=ureg.Quantity(row['Area (counts*eV)'], 'cps*eV'),
-                    atomic_percent=row['Atomic %'],
-                )
 
-                peaks.append(peak_info)
+            # The values of all the peaks of the coordinate are converted at once
+            peaks = [
+                XpsFittedPeak(
+                    origin=origin,
+                    be_position=be_position,
+                    intensity=intensity,
+                    fwhm=fwhm,
+                    area=area,
+                    atomic_percent=atomic_percent,
+                )
+                for origin, be_position, intensity, fwhm, area, atomic_percent in zip(
+                    coord_data['Peak'].tolist(),
+                    to_quantities(coord_data['Peak BE (eV)'], 'eV'),
+                    to_quantities(coord_data['Intensity (counts)'], '1/s'),
+                    to_quantities(coord_data['FWHM (eV)'], 'eV'),
+                    to_quantities(coord_data['Area (counts*eV)'], 'cps*eV'),
+                    coord_data['Atomic %'].tolist(),
+                )
+            ]
 
-                # figure out whiche element the peak is from
-                current_element = row['Peak']
-                match = re.split(r'\d', current_element, maxsplit=1)
-                current_element = match[0]
-                coord_data.loc[index, 'Element'] = current_element
+            # figure out which element each peak is from
+            coord_data = coord_data.assign(
+                Element=coord_data['Peak'].str.split(r'\d', n=1, regex=True).str[0]
+            )
 
             mapping_result.peaks = peaks
 
@@ -381,15 +390,15 @@ class DTUXpsMeasurement(MappingMeasurement, PlotSection, Schema):
             if isinstance(result.x_relative, ureg.Quantity) and isinstance(
                 result.y_relative, ureg.Quantity
             ):
-                x.append(result.x_relative.to('mm').magnitude)
-                y.append(result.y_relative.to('mm').magnitude)
+                x.append(to_magnitude(result.x_relative, 'mm'))
+                y.append(to_magnitude(result.y_relative, 'mm'))
                 x_title = 'X Sample Position (mm)'
                 y_title = 'Y Sample Position (mm)'
             elif isinstance(result.x_absolute, ureg.Quantity) and isinstance(
                 result.y_absolute, ureg.Quantity
             ):
-                x.append(result.x_absolute.to('mm').magnitude)
-                y.append(result.y_absolute.to('mm').magnitude)
+                x.append(to_magnitude(result.x_absolute, 'mm'))
+                y.append(to_magnitude(result.y_absolute, 'mm'))
                 x_title = 'X Stage Position (mm)'
                 y_title = 'Y Stage Position (mm)'
             else:
@@ -39,6 +39,9 @@ from nomad_dtu_nanolab_plugin.schema_packages.basesections import (
     MappingMeasurement,
     MappingResult,
 )
+from nomad_dtu_nanolab_plugin.schema_packages.units import (
+    to_magnitude,
+)
 
 if TYPE_CHECKING:
     from nomad.datamodel.datamodel import EntryArchive
@@ -87,7 +90,7 @@ class DTUXRDMeasurement(XRayDiffraction, MappingMeasurement, PlotSection, Schema
         for result in self.results:
             fig.add_trace(
                 go.Scatter(
-                    x=result.two_theta.to('deg').magnitude,
+                    x=to_magnitude(result.two_theta, 'deg'),
                     y=result.intensity.magnitude,
                     mode='lines',
                     name=result.name,
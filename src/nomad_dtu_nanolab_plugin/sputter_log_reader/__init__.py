@@ -0,0 +1,121 @@
+"""
+Reader of the logfiles of the IDOL combinatorial sputtering chamber.
+
+Created on Fri Jun  7 10:46:17 2024
+
+@author: eugbe
+
+LogfileProcessor only runs the stages of the processing that are needed:
+
+    processor = LogfileProcessor(file_path)
+    events = processor.events()
+    main_params = processor.params()
+    step_params = processor.steps()
+
+The reader is split in the following modules, each one only importing the
+modules listed before it:
+    constants: column names, reference values and thresholds
+    context: LogContext (formatted logfile), time axis helpers, ProcessingStats
+    conditions: rules defining the conditions of the events
+    events: Lf_Event and its subclasses, EventIndex
+    io: reading, formatting and caching of the logfiles, Optix spectra
+    filters: extraction of the events from a logfile
+    params: read_events, ReadEventsResult and the reports
+    reduction: reduction of the step time series written to the NOMAD entries
+    nomad_mapping: mapping of the parameters to the NOMAD sections
+    processor: LogfileProcessor
+    plotting: plotly plots and chamber visualization (matplotlib)
+    cli: batch processing of the logfiles (dtu-nanolab-logfiles)
+
+The other names defined in these modules can still be imported from the
+package, the module defining them being imported when they are first
+accessed. In particular, the plotting stacks are only imported when a
+plotting function is used.
+"""
+
+import importlib
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader.context import (
+    LogContext,
+    ProcessingStats,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.events import EventIndex, Lf_Event
+from nomad_dtu_nanolab_plugin.sputter_log_reader.io import (
+    read_cached_logfile,
+    read_logfile,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.params import (
+    ReadEventsResult,
+    read_events,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.processor import LogfileProcessor
+
+__all__ = [
+    'EventIndex',
+    'Lf_Event',
+    'LogContext',
+    'LogfileProcessor',
+    'ProcessingStats',
+    'ReadEventsResult',
+    'read_cached_logfile',
+    'read_events',
+    'read_logfile',
+]
+
+# Modules searched, in order, for the names accessed on the package
+SUBMODULES = [
+    'constants',
+    'context',
+    'conditions',
+    'events',
+    'io',
+    'filters',
+    'params',
+    'reduction',
+    'nomad_mapping',
+    'processor',
+    'cli',
+]
+# The plotting functions (plotly) and the chamber visualization (matplotlib)
+# are defined in the plotting module, which is only imported when one of them
+# is first accessed
+PLOTTING_MODULE = f'{__name__}.plotting'
+PLOTTING_NAMES = frozenset(
+    {
+        'Gun',
+        'Sample',
+        'add_vertical_lines',
+        'cartesian',
+        'create_3d_plot',
+        'create_default_plot',
+        'create_dual_y_plot',
+        'create_stack_plot',
+        'generate_bias_plot',
+        'generate_optix_cascade_plot',
+        'generate_overview_plot',
+        'generate_plots',
+        'generate_timeline',
+        'get_axis_title',
+        'plot_logfile_chamber',
+        'plot_matplotlib_chamber_config',
+        'polar',
+        'quick_plot',
+        'read_guns',
+        'read_samples',
+        'setup_plot_params',
+        'update_scatter_colors',
+    }
+)
+
+
+# Function to import the names of the modules of the reader when they are
+# accessed as attributes of the package (Ex: sputter_log_reader.quick_plot)
+def __getattr__(name):
+    if name in PLOTTING_NAMES:
+        return getattr(importlib.import_module(PLOTTING_MODULE), name)
+    if not name.startswith('__'):
+        for submodule in SUBMODULES:
+            module = importlib.import_module(f'{__name__}.{submodule}')
+            if name in vars(module):
+                return vars(module)[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
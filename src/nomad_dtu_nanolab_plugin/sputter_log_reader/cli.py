@@ -0,0 +1,543 @@
+"""
+Processing of the logfiles of a samples folder (plots and reports), run in
+batch mode with the dtu-nanolab-logfiles command (see batch_main).
+"""
+
+import argparse
+import concurrent.futures
+import copy
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader.constants import (
+    LOG_READER_VERSION,
+    PLOTLY_CONFIG,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.io import (
+    hash_file,
+    read_logfile,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.params import (
+    build_file_paths,
+    consolidate_data_to_csv,
+    print_params,
+    read_events,
+    save_report_as_text,
+)
+
+# ---------MAIN FUNCTION PARAMETERS------------
+
+# Set the execution flags
+PRINT_MAIN_PARAMS = False
+PRINT_STEP_PARAMS = False
+PRINT_FIGURES = False
+TEST_SPECIFIC_LOGFILE = False
+REMOVE_SAMPLES = True
+SAVE_STEP_PARAMS = False
+# Stages of the processing of a logfile (plots and reports), which can be
+# toggled in batch mode (see batch_main)
+PROCESSING_STAGES = ('timeline', 'bias', 'overview', 'chamber', 'report')
+# Manifest of the logfiles processed in batch mode, stored in samples_dir
+LOGFILE_MANIFEST_NAME = 'logfile_manifest.json'
+
+SAMPLES_TO_REMOVE = [
+    'mittma_0025_Cu_Recording Set 2024.11.05-10.13.29',
+    'mittma_0026_Cu_Recording Set 2024.11.06-09.44.32',
+    'mittma_0027_Cu_Recording Set 2024.11.19-11.33.19',
+]
+
+SAMPLES_TO_TEST = [
+    'mittma_0025_Cu_Recording Set 2024.11.05-10.13.29',
+    'mittma_0026_Cu_Recording Set 2024.11.06-09.44.32',
+    # 'eugbe_0007_Sb_Recording Set 2024.10.09-09.39.04',
+    # 'anait_0003_BaS_Zr_Recording Set 2024.09.09-08.38.24',
+    # 'mittma_0010_RT_Recording Set 2024.07.02-10.00.29',
+    # 'mittma_0009_Cu_H2S_and_PH3_RT_RecordingSet 2024.06.24-10.08.37 1',
+    # 'mittma_0007_Cu_Recording Set 2024.06.03-09.52.29',
+    # 'anait_0010_Ba_Recording Set 2024.11.12-09.20.00',
+    'mittma_0027_Cu_Recording Set 2024.11.19-11.33.19',
+    'mittma_0028_Cu_Recording Set 2024.11.22-07.19.41',
+]
+
+
+def explore_log_files(samples_dir, logfiles_extension):
+    """
+    Explore all the folders in samples_dir and collect log files based on
+    the specified conditions.
+
+    Args:
+        samples_dir (str): The directory containing sample folders.
+        logfiles_extension (str): The extension of the log files to look for.
+        TEST_SPECIFIC_LOGFILE (bool): Flag to test specific log files.
+        SAMPLES_TO_TEST (list): List of sample names to test.
+        REMOVE_SAMPLES (bool): Flag to remove specific samples.
+        SAMPLES_TO_REMOVE (list): List of sample names to remove.
+
+    Returns:
+        dict: A dictionary with log file names and their corresponding folders.
+    """
+    logfiles = {'name': [], 'folder': []}
+
+    # In samples_dir, explore all the folders (samples names)
+    for folder in os.listdir(samples_dir):
+        sample_path = os.path.join(samples_dir, folder, 'log_files')
+
+        # Check if the sample_path exists and is a directory
+        if os.path.isdir(sample_path):
+            # Iterate over files in the sample_path directory
+            for file in os.listdir(sample_path):
+                if re.match(r'^\w+\d{4}\w+', file) and file.endswith(
+                    f'.{logfiles_extension}'
+                ):
+                    logfile_name = re.sub(rf'\.{logfiles_extension}$', '', file)
+                    if TEST_SPECIFIC_LOGFILE:
+                        if logfile_name in SAMPLES_TO_TEST:
+                            logfiles['name'].append(logfile_name)
+                            logfiles['folder'].append(sample_path)
+                    elif not TEST_SPECIFIC_LOGFILE:
+                        if REMOVE_SAMPLES and (logfile_name not in SAMPLES_TO_REMOVE):
+                            logfiles['name'].append(logfile_name)
+                            logfiles['folder'].append(sample_path)
+                        elif not REMOVE_SAMPLES:
+                            logfiles['name'].append(logfile_name)
+                            logfiles['folder'].append(sample_path)
+
+    return logfiles
+
+
+# ---------------MAIN-----------
+
+
+def main():
+    # global events_to_plot, main_params, step_params, all_params
+    samples_dir = r'Z:\P110143-phosphosulfides-Andrea\Data\Samples'
+    logfiles_extension = 'CSV'
+
+    # Initialize the the general param dictionary
+    all_params = {}
+
+    logfiles = explore_log_files(samples_dir, logfiles_extension)
+
+    # Loop over all the logfiles in the directory
+    for i in range(len(logfiles['name'])):
+        main_params = process_logfile(
+            logfiles['name'][i], logfiles['folder'][i], logfiles_extension
+        )
+
+        # ---APPEND THE MAIN PARAMS TO THE ALL PARAMS DICTIONARY---
+        all_params[get_sample_key(logfiles['name'][i])] = main_params
+
+    # ----CONSILIDATE THE DATA INTO A SINGLE CSV FILE-----
+
+    print('Consolidating the data into a single CSV file')
+    consolidate_data_to_csv(all_params, samples_dir, process_NaN=True)
+
+    print('Processing done')
+
+
+# Function to process a single logfile: read it, extract its events and
+# params, and export the plots and reports of the selected stages
+# (see PROCESSING_STAGES) next to the logfile. Returns the main params
+def process_logfile(
+    logfile_name, logfile_folder, logfiles_extension, stages=PROCESSING_STAGES
+):
+    # Default Logfile location
+    print('\n')
+    print(f'Processing logfile {logfile_name}.CSV')
+    logfile_path = f'{logfile_folder}/{logfile_name}.{logfiles_extension}'
+
+    # ---------DEFAULT EXPORT LOCATIONS-------------
+    # Specify the path and filename for the report text file
+
+    (
+        txt_file_path,
+        step_file_path,
+        timeline_file_path,
+        bias_file_path,
+        overview_file_path,
+        chamber_file_path,
+    ) = build_file_paths({'name': [logfile_name], 'folder': [logfile_folder]}, 0)
+    # ---------READ THE DATA-------------
+
+    # Read the log file and spectrum data
+    print('Extracting all the events from the logfile')
+    data = read_logfile(logfile_path)
+
+    # ----READ ALL THE EVENTS IN THE LOGFILE----
+    # The parameters of the reports are extracted when first needed
+    result = read_events(data)
+    events_to_plot = result.events_to_plot
+    main_params = result.main_params
+
+    # The plotting stacks are only imported if a plot is generated
+    if set(stages) - {'report'}:
+        from nomad_dtu_nanolab_plugin.sputter_log_reader import plotting as plots
+
+    # --------GRAPH THE DIFFERENT STEPS ON A TIME LINE------------
+
+    if 'timeline' in stages:
+        # Create the figure
+        print('Generating the plotly plot')
+        plotly_timeline = plots.generate_timeline(events_to_plot, logfile_name)
+
+        if PRINT_FIGURES:
+            plotly_timeline.show(config=PLOTLY_CONFIG)
+
+        # Save the image as an interactive html file
+        plotly_timeline.write_html(timeline_file_path)
+
+    # --------GRAPH THE DC BIAS AS A FUNCTION OF TIME------------
+
+    if 'bias' in stages:
+        bias_plot = plots.generate_bias_plot(events_to_plot, logfile_name)
+
+        if PRINT_FIGURES:
+            bias_plot.show(config=PLOTLY_CONFIG)
+
+        bias_plot.write_html(bias_file_path)
+
+    # --------GRAPH THE OVERVIEW PLOT----------------
+
+    if 'overview' in stages:
+        overview_plot = plots.generate_overview_plot(data, logfile_name)
+
+        if PRINT_FIGURES:
+            overview_plot.show(config=PLOTLY_CONFIG)
+
+        overview_plot.write_html(overview_file_path)
+
+    # -----GRAPH THE CHAMBER CONFIG---
+    if 'chamber' in stages and 'platen_position' in main_params['deposition']:
+        chamber_plot, _ = plots.plot_logfile_chamber(main_params, logfile_name)
+        # export matplotlib plot as png
+        chamber_plot.savefig(chamber_file_path, dpi=300)
+        plots.plt.close(chamber_plot)
+
+    # --------PRINT DERIVED QUANTITIES REPORTS-------------
+
+    if PRINT_MAIN_PARAMS:
+        print(f'Derived quantities report for logfile\n{logfile_name}:\n')
+        print_params(main_params)
+
+    if PRINT_STEP_PARAMS:
+        print(f'Step report for logfile\n{logfile_name}:\n')
+        print_params(result.step_params)
+
+    if 'report' in stages:
+        # ---SAVE THE REPORT QUANTITIES IN A TEXT FILE---
+
+        print('Saving the derived quantities report as a text file')
+        save_report_as_text(main_params, txt_file_path, logfile_name)
+
+        # --SAVE THE STEP REPORT QUANTITIES IN A TEXT FILE
+        if SAVE_STEP_PARAMS:
+            save_report_as_text(result.step_params, step_file_path, logfile_name)
+
+    return main_params
+
+
+# Function to get the key of a sample in all_params from the name of its
+# logfile (Ex: 'mittma_0025_Cu_Recording Set ...' -> 'mittma_0025_Cu')
+def get_sample_key(logfile_name):
+    return '_'.join(str(logfile_name).split('_')[0:3])
+
+
+# Function run by the worker processes of run_batch. Errors are returned
+# instead of raised, so that a failing logfile does not stop the batch
+def _process_logfile_worker(logfile_name, logfile_folder, logfiles_extension, stages):
+    try:
+        main_params = process_logfile(
+            logfile_name, logfile_folder, logfiles_extension, stages
+        )
+    except Exception as e:
+        return None, f'{type(e).__name__}: {e}'
+    return main_params, None
+
+
+# Function to process all the logfiles of samples_dir in parallel
+def run_batch(
+    samples_dir,
+    workers=None,
+    stages=PROCESSING_STAGES,
+    logfiles_extension='CSV',
+    force=False,
+):
+    """
+    This function processes all the logfiles found by explore_log_files in
+    samples_dir with a pool of worker processes (os.cpu_count() if workers is
+    None), and consolidates the params of all the logfiles into a single CSV
+    file. A logfile failing to be processed is reported and skipped.
+    The processed logfiles are recorded in the manifest of samples_dir (see
+    LOGFILE_MANIFEST_NAME), and unless force is True, the logfiles that did
+    not change since they were processed with the same stages and
+    LOG_READER_VERSION are not processed again: their params are loaded
+    from the manifest.
+    Returns the all_params dictionary and the dictionary of the errors by
+    logfile name.
+    """
+    logfiles = explore_log_files(samples_dir, logfiles_extension)
+    manifest = load_logfile_manifest(samples_dir)
+    # the manifest is saved if any of its entries was updated, including the
+    # mtime of the logfiles touched without being changed
+    loaded_manifest = copy.deepcopy(manifest)
+
+    all_params = {}
+    errors = {}
+    to_process = {}
+    for logfile_name, logfile_folder in zip(logfiles['name'], logfiles['folder']):
+        logfile_path = f'{logfile_folder}/{logfile_name}.{logfiles_extension}'
+        main_params = None
+        if not force:
+            main_params = load_up_to_date_params(
+                manifest, samples_dir, logfile_path, stages
+            )
+        if main_params is not None:
+            all_params[get_sample_key(logfile_name)] = main_params
+        else:
+            to_process[logfile_name] = logfile_folder
+    print(
+        f'{len(to_process)} logfiles to process, {len(all_params)} logfiles up to date'
+    )
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                _process_logfile_worker,
+                logfile_name,
+                logfile_folder,
+                logfiles_extension,
+                tuple(stages),
+            ): logfile_name
+            for logfile_name, logfile_folder in to_process.items()
+        }
+        for future in concurrent.futures.as_completed(futures):
+            logfile_name = futures[future]
+            try:
+                main_params, error = future.result()
+            except Exception as e:
+                main_params, error = None, f'{type(e).__name__}: {e}'
+            if error is not None:
+                print(f'Error: Unable to process logfile {logfile_name}. {error}')
+                errors[logfile_name] = error
+            else:
+                all_params[get_sample_key(logfile_name)] = main_params
+                record_processed_logfile(
+                    manifest,
+                    samples_dir,
+                    f'{to_process[logfile_name]}/{logfile_name}.{logfiles_extension}',
+                    stages,
+                    main_params,
+                )
+
+    if manifest != loaded_manifest:
+        save_logfile_manifest(manifest, samples_dir)
+
+    # Keep the order of the logfiles, whatever the order of completion
+    all_params = {
+        key: all_params[key]
+        for key in map(get_sample_key, logfiles['name'])
+        if key in all_params
+    }
+
+    if all_params:
+        print('Consolidating the data into a single CSV file')
+        consolidate_data_to_csv(all_params, samples_dir, process_NaN=True)
+
+    print(
+        f'Processing done: {len(to_process) - len(errors)} logfiles processed, '
+        f'{len(errors)} failed'
+    )
+    return all_params, errors
+
+
+# ----------FUNCTIONS FOR THE INCREMENTAL BATCH PROCESSING------------
+
+
+# The manifest is a JSON file mapping the path of each processed logfile
+# (relative to samples_dir) to its size, mtime and hash, the
+# LOG_READER_VERSION and the stages it was processed with, its outputs and
+# the JSON file of its main params
+def load_logfile_manifest(samples_dir):
+    manifest_path = os.path.join(samples_dir, LOGFILE_MANIFEST_NAME)
+    try:
+        with open(manifest_path, encoding='utf-8') as file:
+            manifest = json.load(file)
+    except FileNotFoundError:
+        return {'logfiles': {}}
+    except (OSError, ValueError) as e:
+        print(f'Warning: Unable to read the manifest {manifest_path}: {e}')
+        return {'logfiles': {}}
+    manifest.setdefault('logfiles', {})
+    return manifest
+
+
+def save_logfile_manifest(manifest, samples_dir):
+    manifest_path = os.path.join(samples_dir, LOGFILE_MANIFEST_NAME)
+    temp_path = f'{manifest_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(temp_path, manifest_path)
+
+
+# Function to get the outputs written by process_logfile for each stage
+def get_logfile_outputs(logfile_name, logfile_folder, stages=PROCESSING_STAGES):
+    (
+        txt_file_path,
+        step_file_path,
+        timeline_file_path,
+        bias_file_path,
+        overview_file_path,
+        chamber_file_path,
+    ) = build_file_paths({'name': [logfile_name], 'folder': [logfile_folder]}, 0)
+    outputs = {
+        'timeline': [timeline_file_path],
+        'bias': [bias_file_path],
+        'overview': [overview_file_path],
+        'chamber': [chamber_file_path],
+        'report': [txt_file_path, step_file_path]
+        if SAVE_STEP_PARAMS
+        else [txt_file_path],
+    }
+    return [path for stage in stages for path in outputs[stage]]
+
+
+# Function to load the main params of a logfile from the manifest, if the
+# logfile and its outputs are up to date. Returns None otherwise
+def load_up_to_date_params(manifest, samples_dir, logfile_path, stages):
+    entry = manifest['logfiles'].get(os.path.relpath(logfile_path, samples_dir))
+    if (
+        entry is None
+        or entry.get('reader_version') != LOG_READER_VERSION
+        or not set(stages) <= set(entry.get('stages', []))
+    ):
+        return None
+    stat = os.stat(logfile_path)
+    if (stat.st_size, stat.st_mtime) != (entry['size'], entry['mtime']):
+        # The logfile was touched, it is only processed again if its
+        # content changed
+        if stat.st_size != entry['size'] or hash_file(logfile_path) != entry['hash']:
+            return None
+        entry['mtime'] = stat.st_mtime
+    # The chamber plot is only produced for some depositions, so the outputs
+    # of the manifest are the ones that were actually written
+    paths = [
+        os.path.join(samples_dir, path) for path in [*entry['outputs'], entry['params']]
+    ]
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    # The params are only stored as JSON, the pickles written by the previous
+    # versions are never loaded, as samples_dir can be shared
+    if not entry['params'].endswith('.json'):
+        return None
+    try:
+        with open(os.path.join(samples_dir, entry['params']), encoding='utf-8') as file:
+            return json.load(file, object_hook=decode_params)
+    except (OSError, ValueError) as e:
+        print(f'Warning: Unable to load the params of {logfile_path}: {e}')
+        return None
+
+
+# Function to record a processed logfile in the manifest, and store its main
+# params next to it
+def record_processed_logfile(manifest, samples_dir, logfile_path, stages, main_params):
+    logfile_folder = os.path.dirname(logfile_path)
+    logfile_name = os.path.splitext(os.path.basename(logfile_path))[0]
+    params_path = os.path.join(logfile_folder, f'{logfile_name}_params.json')
+    try:
+        with open(params_path, 'w', encoding='utf-8') as file:
+            json.dump(encode_params(main_params), file)
+    except (OSError, TypeError, ValueError) as e:
+        print(f'Warning: Unable to store the params of {logfile_path}: {e}')
+        return
+    stat = os.stat(logfile_path)
+    outputs = get_logfile_outputs(logfile_name, logfile_folder, stages)
+    manifest['logfiles'][os.path.relpath(logfile_path, samples_dir)] = {
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'hash': hash_file(logfile_path),
+        'reader_version': LOG_READER_VERSION,
+        'stages': list(stages),
+        'outputs': [
+            os.path.relpath(path, samples_dir)
+            for path in outputs
+            if os.path.exists(path)
+        ],
+        'params': os.path.relpath(params_path, samples_dir),
+    }
+
+
+# Function to convert the main params to JSON values. The timestamps and
+# timedeltas are tagged with their type, so that decode_params restores them
+# and the consolidated CSV is the same for the logfiles loaded from the manifest
+def encode_params(obj):
+    if isinstance(obj, dict):
+        return {key: encode_params(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [encode_params(value) for value in obj]
+    if isinstance(obj, pd.Timestamp):
+        return {'__timestamp__': obj.isoformat()}
+    if isinstance(obj, pd.Timedelta):
+        return {'__timedelta__': obj.isoformat()}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+
+# JSON object hook restoring the values tagged by encode_params
+def decode_params(obj):
+    if obj.keys() == {'__timestamp__'}:
+        return pd.Timestamp(obj['__timestamp__'])
+    if obj.keys() == {'__timedelta__'}:
+        return pd.Timedelta(obj['__timedelta__'])
+    return obj
+
+
+# Command line entry point of the batch processing
+def batch_main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Process the sputtering logfiles of a samples directory.'
+    )
+    parser.add_argument(
+        'samples_dir',
+        help='directory with one folder per sample, holding a log_files folder',
+    )
+    parser.add_argument(
+        '-j',
+        '--workers',
+        type=int,
+        default=None,
+        help='number of worker processes (default: number of CPUs)',
+    )
+    parser.add_argument(
+        '--extension', default='CSV', help='extension of the logfiles (default: CSV)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='process all the logfiles, even the ones that are up to date',
+    )
+    for stage in PROCESSING_STAGES:
+        parser.add_argument(
+            f'--no-{stage}',
+            dest=stage,
+            action='store_false',
+            help=f'do not export the {stage} output',
+        )
+    args = parser.parse_args(argv)
+    stages = [stage for stage in PROCESSING_STAGES if getattr(args, stage)]
+    _, errors = run_batch(
+        args.samples_dir,
+        workers=args.workers,
+        stages=stages,
+        logfiles_extension=args.extension,
+        force=args.force,
+    )
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,318 @@
+"""
+Rules defining the conditions of the events, evaluated once per logfile
+(see get_event_conditions).
+"""
+
+import operator
+import threading
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader.constants import (
+    BIAS_THRESHOLD,
+    CRACKER_ZONE_1_MIN_TEMP,
+    CRACKER_ZONE_2_MIN_TEMP,
+    CRACKER_ZONE_3_MIN_TEMP,
+    CURRENT_THRESHOLD,
+    MFC_FLOW_THRESHOLD,
+    POWER_FWD_RFL_THRESHOLD,
+    POWER_SETPOINT_DIFF_THRESHOLD,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.context import (
+    LogContext,
+    get_column_values,
+    get_source_list,
+)
+
+##------EVENT CONDITION RULES DEFINITION------
+
+
+class EventExpr:
+    """
+    Node of the expression of an event condition, built from the named
+    columns of the logfile (col) and the conditions of other events (cond)
+    with the usual operators (Ex: (col('PC MFC 1 Flow') > 1) & ~cond('h2s_on')).
+    The key of a node identifies its expression, so that the sub-expressions
+    shared by several conditions are only evaluated once.
+    """
+
+    def __init__(self, op, *args):
+        self.op = op
+        self.args = args
+        self.key = (
+            op,
+            *(arg.key if isinstance(arg, EventExpr) else arg for arg in args),
+        )
+
+    def _apply(self, op, other):
+        return EventExpr(op, self, other)
+
+    def __and__(self, other):
+        return self._apply('and', other)
+
+    def __or__(self, other):
+        return self._apply('or', other)
+
+    def __invert__(self):
+        return EventExpr('not', self)
+
+    def __sub__(self, other):
+        return self._apply('sub', other)
+
+    def __gt__(self, other):
+        return self._apply('gt', other)
+
+    def __lt__(self, other):
+        return self._apply('lt', other)
+
+    def __eq__(self, other):
+        return self._apply('eq', other)
+
+    def __ne__(self, other):
+        return self._apply('ne', other)
+
+    # the comparison operators build expressions, so the nodes are not hashable
+    __hash__ = None
+
+    def diff(self):
+        return EventExpr('diff', self)
+
+    def shift_back(self):
+        # value of the next row (Ex: to include the first point of a ramp),
+        # False for the last row
+        return EventExpr('shift_back', self)
+
+
+# Column of the logfile. If the column is missing, the default value is used
+# for all the rows, or a KeyError is raised if there is no default
+def col(name, default=None):
+    return EventExpr('col', name, default)
+
+
+# Condition of another event, referenced by the name of its rule
+def cond(name):
+    return EventExpr('cond', name)
+
+
+# Any of the conditions of other events (False if there is none)
+def any_cond(names):
+    return EventExpr('any', *names)
+
+
+class EventRule:
+    """
+    Condition of an event category. If one of the columns in requires is
+    missing from the logfile, the condition is given by fallback instead
+    (an expression, or False by default).
+    """
+
+    def __init__(self, expr, requires=(), fallback=False):
+        self.expr = expr
+        self.requires = tuple(requires)
+        self.fallback = fallback
+
+
+# Conditions of the event categories not tied to a source
+EVENT_RULES = {
+    'cracker_on_open': EventRule(
+        (col('Sulfur Cracker Zone 1 Current Temperature') > CRACKER_ZONE_1_MIN_TEMP)
+        & (col('Sulfur Cracker Zone 2 Current Temperature') > CRACKER_ZONE_2_MIN_TEMP)
+        & (col('Sulfur Cracker Zone 3 Current Temperature') > CRACKER_ZONE_3_MIN_TEMP)
+        & (col('Sulfur Cracker Control Enabled') == 1),
+        requires=['Sulfur Cracker Zone 1 Current Temperature'],
+    ),
+    'temp_ctrl': EventRule(
+        col('Temperature Control Enabled') == 1,
+        requires=['Temperature Control Enabled'],
+        fallback=col('Substrate Heater Temperature Setpoint')
+        != col('Substrate Heater Temperature'),
+    ),
+    'ph3_on': EventRule(
+        (col('PC MFC 4 Setpoint') > MFC_FLOW_THRESHOLD)
+        & (col('PC MFC 4 Flow') > MFC_FLOW_THRESHOLD)
+    ),
+    'h2s_on': EventRule(
+        (col('PC MFC 6 Setpoint') > MFC_FLOW_THRESHOLD)
+        & (col('PC MFC 6 Flow') > MFC_FLOW_THRESHOLD)
+    ),
+    'ar_on': EventRule(
+        (col('PC MFC 1 Setpoint') > MFC_FLOW_THRESHOLD)
+        & (col('PC MFC 1 Flow') > MFC_FLOW_THRESHOLD)
+    ),
+    'deposition': EventRule(
+        (col('PC Substrate Shutter Open') == 1) & cond('any_source_on_open')
+    ),
+    'xtal2_shutter_open': EventRule(
+        col('Xtal 2 Shutter Open') == 1, requires=['Xtal 2 Shutter Open']
+    ),
+    'platen_bias_on': EventRule(
+        (col('Power Supply 7 Enabled') == 1)
+        & (col('Power Supply 7 DC Bias') > BIAS_THRESHOLD),
+        requires=['Power Supply 7 Enabled'],
+    ),
+}
+
+
+# Conditions of the event categories of each source, as functions of the
+# source number. The rules are named '<category>_<source number>'. The
+# optional columns of the sources default to 0
+SOURCE_EVENT_RULES = {
+    'source_enabled': lambda n: EventRule(col(f'Source {n} Enabled', 0) != 0),
+    'source_on': lambda n: EventRule(
+        cond(f'source_enabled_{n}')
+        & (
+            (
+                (col(f'Source {n} Current', 0) > CURRENT_THRESHOLD)
+                | (col(f'Source {n} DC Bias', 0) > BIAS_THRESHOLD)
+            )
+            | (
+                (col(f'Source {n} Fwd Power', 0) - col(f'Source {n} Rfl Power', 0))
+                > POWER_FWD_RFL_THRESHOLD
+            )
+        )
+    ),
+    'source_on_open': lambda n: EventRule(
+        cond(f'source_on_{n}') & (col(f'PC Source {n} Shutter Open') == 1)
+    ),
+    'source_ramp_up_wo1stpoint': lambda n: EventRule(
+        cond(f'source_enabled_{n}')
+        & (col(f'Source {n} Output Setpoint', 0).diff() > POWER_SETPOINT_DIFF_THRESHOLD)
+    ),
+    'source_ramp_up': lambda n: EventRule(
+        cond(f'source_ramp_up_wo1stpoint_{n}')
+        | cond(f'source_ramp_up_wo1stpoint_{n}').shift_back()
+    ),
+}
+
+
+# Function to build the rules of all the event categories for the sources
+# of the logfile
+def build_event_rules(source_list):
+    rules = {}
+    for source_number in source_list:
+        for category, make_rule in SOURCE_EVENT_RULES.items():
+            rules[f'{category}_{source_number}'] = make_rule(source_number)
+    rules['any_source_on'] = EventRule(
+        any_cond([f'source_on_{n}' for n in source_list])
+    )
+    rules['any_source_on_open'] = EventRule(
+        any_cond([f'source_on_open_{n}' for n in source_list])
+    )
+    rules.update(EVENT_RULES)
+    return rules
+
+
+class EventConditions:
+    """
+    Evaluates the rules of the event conditions on a logfile, returning the
+    condition of each rule as a boolean pd.Series (Ex: conditions['ar_on']).
+    The rules referenced by a condition are evaluated first, following the
+    dependencies between the rules, and every (sub-)expression is evaluated
+    once with NumPy and cached, so that the expressions shared by several
+    rules (Ex: the source being enabled) are not evaluated again.
+    The conditions can be evaluated by several threads at the same time: the
+    lock is only held to look up and publish the cached values, the first
+    published value being kept if two threads evaluate the same expression.
+    """
+
+    _OPERATORS = {
+        'and': np.logical_and,
+        'or': np.logical_or,
+        'sub': operator.sub,
+        'gt': operator.gt,
+        'lt': operator.lt,
+        'eq': operator.eq,
+        'ne': operator.ne,
+    }
+
+    def __init__(self, data, rules):
+        self.data = data
+        self.rules = rules
+        self._values = {}
+        self._conditions = {}
+        # rules being evaluated by each thread, to detect circular references
+        self._local = threading.local()
+        # the conditions are shared by the threads evaluating the sources
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name):
+        with self._lock:
+            condition = self._conditions.get(name)
+        if condition is None:
+            mask = np.broadcast_to(self._evaluate_rule(name), len(self.data))
+            condition = pd.Series(mask.astype(bool), index=self.data.index)
+            with self._lock:
+                condition = self._conditions.setdefault(name, condition)
+        return condition
+
+    def __contains__(self, name):
+        return name in self.rules
+
+    def evaluate_all(self):
+        return {name: self[name] for name in self.rules}
+
+    def _evaluate_rule(self, name):
+        evaluating = getattr(self._local, 'evaluating', None)
+        if evaluating is None:
+            evaluating = self._local.evaluating = set()
+        if name in evaluating:
+            raise ValueError(f'Circular reference in the event rule {name}')
+        rule = self.rules[name]
+        expr = rule.expr
+        if any(column not in self.data.columns for column in rule.requires):
+            expr = rule.fallback
+        evaluating.add(name)
+        try:
+            return self._evaluate(expr)
+        finally:
+            evaluating.discard(name)
+
+    def _evaluate(self, expr):
+        if not isinstance(expr, EventExpr):
+            return expr
+        with self._lock:
+            if expr.key in self._values:
+                return self._values[expr.key]
+        if expr.op == 'col':
+            name, default = expr.args
+            if default is None:
+                value = self.data[name].to_numpy()
+            else:
+                value = get_column_values(self.data, name, default)
+        elif expr.op == 'cond':
+            value = self[expr.args[0]].to_numpy()
+        elif expr.op == 'any':
+            value = reduce(
+                np.logical_or, (self[name].to_numpy() for name in expr.args), False
+            )
+        elif expr.op == 'not':
+            value = np.logical_not(self._evaluate(expr.args[0]))
+        elif expr.op == 'diff':
+            values = np.broadcast_to(self._evaluate(expr.args[0]), len(self.data))
+            value = np.full(len(values), np.nan)
+            value[1:] = values[1:] - values[:-1]
+        elif expr.op == 'shift_back':
+            values = np.broadcast_to(self._evaluate(expr.args[0]), len(self.data))
+            value = np.concatenate((values[1:], np.zeros(min(len(values), 1), bool)))
+        else:
+            left, right = (self._evaluate(arg) for arg in expr.args)
+            value = self._OPERATORS[expr.op](left, right)
+        with self._lock:
+            return self._values.setdefault(expr.key, value)
+
+
+# Function to get the conditions of the events of a logfile. For a
+# LogContext, the conditions are evaluated once and shared by all the filters
+def get_event_conditions(data, source_list=None):
+    if isinstance(data, LogContext):
+        if source_list is None:
+            source_list = data.source_list
+        return data.memoize(
+            ('event_conditions', tuple(source_list)),
+            lambda: EventConditions(data, build_event_rules(source_list)),
+        )
+    if source_list is None:
+        source_list = get_source_list(data)
+    return EventConditions(data, build_event_rules(source_list))
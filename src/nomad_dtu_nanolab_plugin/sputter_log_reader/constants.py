@@ -0,0 +1,584 @@
+"""
+Column names, reference values and thresholds of the logfile reader.
+"""
+
+
+# -----USEFUL DICTIONARIES AND LISTS-----
+
+# column names dictionary
+COL = {
+    'time': 'Time Stamp',
+    'pressure_wrg': 'PC Wide Range Gauge',
+    'pressure': 'PC Capman Pressure',
+    'pressure_sp': 'PC Capman Pressure Setpoint',
+    'ps1_en': 'Power Supply 1 Enable',
+    'ps1_ed': 'Power Supply 1 Enabled',
+    'ps1_out_sp': 'Power Supply 1 Output Setpoint',
+    'ps1_volt_sp': 'Power Supply 1 Voltage Setpoint',
+    'ps1_curr_sp': 'Power Supply 1 Current Setpoint',
+    'ps1_power': 'Power Supply 1 Power',
+    'ps1_volt': 'Power Supply 1 Voltage',
+    'ps1_curr': 'Power Supply 1 Current',
+    'ps1_pulse_en': 'Power Supply 1 Pulse Enable',
+    'ps1_pulse_freq_sp': 'Power Supply 1 Pulse Frequency Setpoint',
+    'ps1_pulse_freq': 'Power Supply 1 Pulse Frequency',
+    'ps1_rev_time_sp': 'Power Supply 1 Reverse Time Setpoint',
+    'ps1_rev_time': 'Power Supply 1 Reverse Time',
+    'ps2_en': 'Power Supply 2 Enable',
+    'ps2_ed': 'Power Supply 2 Enabled',
+    'ps2_out_sp': 'Power Supply 2 Output Setpoint',
+    'ps2_fwd_pwr': 'Power Supply 2 Fwd Power',
+    'ps2_rfl_pwr': 'Power Supply 2 Rfl Power',
+    'ps2_dc_bias': 'Power Supply 2 DC Bias',
+    'ps2_load_cap_pos': 'Power Supply 2 Load Cap Position',
+    'ps2_tune_cap_pos': 'Power Supply 2 Tune Cap Position',
+    'ps3_en': 'Power Supply 3 Enable',
+    'ps3_ed': 'Power Supply 3 Enabled',
+    'ps3_out_sp': 'Power Supply 3 Output Setpoint',
+    'ps3_fwd_pwr': 'Power Supply 3 Fwd Power',
+    'ps3_rfl_pwr': 'Power Supply 3 Rfl Power',
+    'ps3_dc_bias': 'Power Supply 3 DC Bias',
+    'ps3_load_cap_pos': 'Power Supply 3 Load Cap Position',
+    'ps3_tune_cap_pos': 'Power Supply 3 Tune Cap Position',
+    'mfc1_flow': 'PC MFC 1 Flow',
+    'mfc1_sp': 'PC MFC 1 Setpoint',
+    'ar_flow': 'PC MFC 1 Flow',
+    'ar_sp': 'PC MFC 1 Setpoint',
+    'mfc2_flow': 'PC MFC 2 Flow',
+    'mfc2_sp': 'PC MFC 2 Setpoint',
+    # "n2_flow": "PC MFC 2 Flow",  # Need to check
+    # "n2_sp": "PC MFC 2 Setpoint",  # Need to check
+    'mfc3_flow': 'PC MFC 3 Flow',
+    'mfc3_sp': 'PC MFC 3 Setpoint',
+    # "o2_flow": "PC MFC 3 Flow",   # Need to check
+    # "o2_sp": "PC MFC 3 Setpoint",   # Need to check
+    'mfc4_flow': 'PC MFC 4 Flow',
+    'mfc4_sp': 'PC MFC 4 Setpoint',
+    'ph3_flow': 'PC MFC 4 Flow',
+    'ph3_sp': 'PC MFC 4 Setpoint',
+    'mfc5_flow': 'PC MFC 5 Flow',
+    'mfc5_sp': 'PC MFC 5 Setpoint',
+    'nh3_flow': 'PC MFC 5 Flow',
+    'nh3_sp': 'PC MFC 5 Setpoint',
+    'mfc6_flow': 'PC MFC 6 Flow',
+    'mfc6_sp': 'PC MFC 6 Setpoint',
+    'h2s_flow': 'PC MFC 6 Flow',
+    'h2s_sp': 'PC MFC 6 Setpoint',
+    'sub_shutter_open': 'PC Substrate Shutter Open',
+    'proc_phase': 'Process Phase',
+    'proc_time_tracker': 'Process Time Tracker',
+    'thk_rate': 'Thickness Rate',
+    'thk': 'Thickness',
+    'thk_tooling': 'Thickness Tooling',
+    'thk_active_mat': 'Thickness Active Material',
+    'thk_mat_density': 'Thickness Material Density',
+    'thk_mat_z': 'Thickness Material Z',
+    'thk_q': 'Thickness Q',
+    'thk_err': 'Thickness Error',
+    'sub_temp_ctrl_en': 'Substrate Heater Temperature Control Enable',
+    'sub_temp_sp': 'Substrate Heater Temperature Setpoint',
+    'sub_temp': 'Substrate Heater Temperature',
+    'sub_temp2': 'Substrate Heater Temperature 2',
+    'sub_curr': 'Substrate Heater Current',
+    'sul_crk_zone1_temp': 'Sulfur Cracker Zone 1 Current Temperature',
+    'sul_crk_zone1_en': 'Sulfur Cracker Zone 1 Enabled',
+    'sul_crk_zone1_sp': 'Sulfur Cracker Zone 1 Temperature Setpoint',
+    'sul_crk_zone2_temp': 'Sulfur Cracker Zone 2 Current Temperature',
+    'sul_crk_zone2_en': 'Sulfur Cracker Zone 2 Enabled',
+    'sul_crk_zone2_sp': 'Sulfur Cracker Zone 2 Temperature Setpoint',
+    'sul_crk_zone3_temp': 'Sulfur Cracker Zone 3 Current Temperature',
+    'sul_crk_zone3_en': 'Sulfur Cracker Zone 3 Enabled',
+    'sul_crk_zone3_sp': 'Sulfur Cracker Zone 3 Temperature Setpoint',
+    'sul_crk_lambda': 'Sulfur Cracker Control Sensor Value',
+    'sul_crk_ctrl_en': 'Sulfur Cracker Control Enabled',
+    'sul_crk_ctrl_mode': 'Sulfur Cracker Control Mode',
+    'sul_crk_ctrl_sensor': 'Sulfur Cracker Control Sensor Value',
+    'sul_crk_ctrl_sp': 'Sulfur Cracker Control Setpoint',
+    'sul_crk_ctrl_fb': 'Sulfur Cracker Control Setpoint Feedback',
+    'sul_crk_valve_freq_sp': 'Sulfur Cracker Control Valve InitFrequency Setpoint',
+    'sul_crk_valve_pw_sp': 'Sulfur Cracker Control Valve PulseWidth Setpoint',
+    'sul_crk_valve_pw_fb': 'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback',
+    'sul_crk_valve_sp': 'Sulfur Cracker Control Valve Setpoint',
+    'sul_crk_valve_val': 'Sulfur Cracker Control Valve Value',
+    's1_load': 'PC Source 1 Loaded Target',
+    's1_mat': 'PC Source 1 Material',
+    's1_shutter': 'PC Source 1 Shutter Open',
+    's1_pdc_ps1': 'PC Source 1 Switch-PDC-PWS1',
+    's1_rf1_ps2': 'PC Source 1 Switch-RF1-PWS2',
+    's1_rf2_ps3': 'PC Source 1 Switch-RF2-PWS3',
+    's1_usage': 'PC Source 1 Usage',
+    's1_usage_calc': 'PC Source 1 Usage Calculation',
+    's3_load': 'PC Source 3 Loaded Target',
+    's3_mat': 'PC Source 3 Material',
+    's3_shutter': 'PC Source 3 Shutter Open',
+    's3_pdc_ps1': 'PC Source 3 Switch-PDC-PWS1',
+    's3_rf1_ps2': 'PC Source 3 Switch-RF1-PWS2',
+    's3_rf2_ps3': 'PC Source 3 Switch-RF2-PWS3',
+    's3_usage': 'PC Source 3 Usage',
+    's3_usage_calc': 'PC Source 3 Usage Calculation',
+    's4_load': 'PC Source 4 Loaded Target',
+    's4_mat': 'PC Source 4 Material',
+    's4_shutter': 'PC Source 4 Shutter Open',
+    's4_pdc_ps1': 'PC Source 4 Switch-PDC-PWS1',
+    's4_rf1_ps2': 'PC Source 4 Switch-RF1-PWS2',
+    's4_rf2_ps3': 'PC Source 4 Switch-RF2-PWS3',
+    's4_usage': 'PC Source 4 Usage',
+    's4_usage_calc': 'PC Source 4 Usage Calculation',
+    'sub_rot_pos': 'Substrate Rotation_Position',
+    'sub_rot_pos_sp': 'Substrate Rotation_PositionSetpoint',
+    'xtal1_shutter': 'Xtal 1 Shutter Open',
+    'xtal2_shutter': 'Xtal 2 Shutter Open',
+    'ps7_en': 'Power Supply 7 Enable',
+    'ps7_ed': 'Power Supply 7 Enabled',
+    'ps7_out_sp': 'Power Supply 7 Output Setpoint',
+    'ps7_fwd_pwr': 'Power Supply 7 Fwd Power',
+    'ps7_rfl_pwr': 'Power Supply 7 Rfl Power',
+    'ps7_dc_bias': 'Power Supply 7 DC Bias',
+    'ps7_load_cap_pos': 'Power Supply 7 Load Cap Position',
+    'ps7_tune_cap_pos': 'Power Supply 7 Tune Cap Position',
+}
+for source_number in ['1', '3', '4']:
+    COL[f's{source_number}_en'] = f'Source {source_number} Enable'
+    COL[f's{source_number}_ed'] = f'Source {source_number} Enabled'
+    COL[f's{source_number}_out_sp'] = f'Source {source_number} Output Setpoint'
+    COL[f's{source_number}_volt_sp'] = f'Source {source_number} Voltage Setpoint'
+    COL[f's{source_number}_curr_sp'] = f'Source {source_number} Current Setpoint'
+    COL[f's{source_number}_power'] = f'Source {source_number} Power'
+    COL[f's{source_number}_volt'] = f'Source {source_number} Voltage'
+    COL[f's{source_number}_curr'] = f'Source {source_number} Current'
+    COL[f's{source_number}_pulse_en'] = f'Source {source_number} Pulse Enable'
+    COL[f's{source_number}_pulse_freq_sp'] = (
+        f'Source {source_number} Pulse Frequency Setpoint'
+    )
+    COL[f's{source_number}_pulse_freq'] = f'Source {source_number} Pulse Frequency'
+    COL[f's{source_number}_rev_time_sp'] = (
+        f'Source {source_number} Reverse Time Setpoint'
+    )
+    COL[f's{source_number}_rev_time'] = f'Source {source_number} Reverse Time'
+    COL[f's{source_number}_fwd_pwr'] = f'Source {source_number} Fwd Power'
+    COL[f's{source_number}_rfl_pwr'] = f'Source {source_number} Rfl Power'
+    COL[f's{source_number}_dc_bias'] = f'Source {source_number} DC Bias'
+    COL[f's{source_number}_load_cap_pos'] = f'Source {source_number} Load Cap Position'
+    COL[f's{source_number}_tune_cap_pos'] = f'Source {source_number} Tune Cap Position'
+
+# Elements name to symbol dict
+ELEMENTS = {
+    '': 'X',
+    'Hydrogen': 'H',
+    'Helium': 'He',
+    'Lithium': 'Li',
+    'Beryllium': 'Be',
+    'Boron': 'B',
+    'Carbon': 'C',
+    'Nitrogen': 'N',
+    'Oxygen': 'O',
+    'Fluorine': 'F',
+    'Neon': 'Ne',
+    'Sodium': 'Na',
+    'Magnesium': 'Mg',
+    'Aluminium': 'Al',
+    'Silicon': 'Si',
+    'Phosphorus': 'P',
+    'Sulfur': 'S',
+    'Chlorine': 'Cl',
+    'Argon': 'Ar',
+    'Potassium': 'K',
+    'Calcium': 'Ca',
+    'Scandium': 'Sc',
+    'Titanium': 'Ti',
+    'Vanadium': 'V',
+    'Chromium': 'Cr',
+    'Manganese': 'Mn',
+    'Iron': 'Fe',
+    'Cobalt': 'Co',
+    'Nickel': 'Ni',
+    'Copper': 'Cu',
+    'Zinc': 'Zn',
+    'Gallium': 'Ga',
+    'Germanium': 'Ge',
+    'Arsenic': 'As',
+    'Selenium': 'Se',
+    'Bromine': 'Br',
+    'Krypton': 'Kr',
+    'Rubidium': 'Rb',
+    'Strontium': 'Sr',
+    'Yttrium': 'Y',
+    'Zirconium': 'Zr',
+    'Niobium': 'Nb',
+    'Molybdenum': 'Mo',
+    'Technetium': 'Tc',
+    'Ruthenium': 'Ru',
+    'Rhodium': 'Rh',
+    'Palladium': 'Pd',
+    'Silver': 'Ag',
+    'Cadmium': 'Cd',
+    'Indium': 'In',
+    'Tin': 'Sn',
+    'Antimony': 'Sb',
+    'Tellurium': 'Te',
+    'Iodine': 'I',
+    'Xenon': 'Xe',
+    'Caesium': 'Cs',
+    'Barium': 'Ba',
+    'Lanthanum': 'La',
+    'Cerium': 'Ce',
+    'Praseodymium': 'Pr',
+    'Neodymium': 'Nd',
+    'Promethium': 'Pm',
+    'Samarium': 'Sm',
+    'Europium': 'Eu',
+    'Gadolinium': 'Gd',
+    'Terbium': 'Tb',
+    'Dysprosium': 'Dy',
+    'Holmium': 'Ho',
+    'Erbium': 'Er',
+    'Thulium': 'Tm',
+    'Ytterbium': 'Yb',
+    'Lutetium': 'Lu',
+    'Hafnium': 'Hf',
+    'Tantalum': 'Ta',
+    'Tungsten': 'W',
+    'Rhenium': 'Re',
+    'Osmium': 'Os',
+    'Iridium': 'Ir',
+    'Platinum': 'Pt',
+    'Gold': 'Au',
+    'Mercury': 'Hg',
+    'Thallium': 'Tl',
+    'Lead': 'Pb',
+    'Bismuth': 'Bi',
+    'Polonium': 'Po',
+    'Astatine': 'At',
+    'Radon': 'Rn',
+    'Francium': 'Fr',
+    'Radium': 'Ra',
+    'Actinium': 'Ac',
+    'Thorium': 'Th',
+    'Protactinium': 'Pa',
+    'Uranium': 'U',
+    'Neptunium': 'Np',
+    'Plutonium': 'Pu',
+    'Americium': 'Am',
+    'Curium': 'Cm',
+    'Berkelium': 'Bk',
+    'Californium': 'Cf',
+    'Einsteinium': 'Es',
+    'Fermium': 'Fm',
+    'Mendelevium': 'Md',
+    'Nobelium': 'No',
+    'Lawrencium': 'Lr',
+    'Rutherfordium': 'Rf',
+    'Dubnium': 'Db',
+    'Seaborgium': 'Sg',
+    'Bohrium': 'Bh',
+    'Hassium': 'Hs',
+    'Meitnerium': 'Mt',
+    'Darmastadtium': 'Ds',
+    'Roentgenium': 'Rg',
+    'Copernicium': 'Cn',
+    'Nihonium': 'Nh',
+    'Flerovium': 'Fl',
+    'Moscovium': 'Mc',
+    'Livermorium': 'Lv',
+    'Tennessine': 'Ts',
+    'Oganesson': 'Og',
+}
+IONS = {
+    '': '',
+    'sulphide': 'S',
+    'sulfide': 'S',
+    'antimonide': 'Sb',
+    'phosphide': 'P',
+    'arsenide': 'As',
+    'telluride': 'Te',
+    'oxide': 'O',
+    'fluoride': 'F',
+    'chloride': 'Cl',
+    'bromide': 'Br',
+    'iodide': 'I',
+    'selenide': 'Se',
+    'nitride': 'N',
+    'carbide': 'C',
+    'hydride': 'H',
+}
+
+# ----SPUTTER LOG READER METHODS----
+
+# ---------REFERENCE VALUES-------------
+
+# Set of reference values used in different parts of the script
+# Proportion of values needed to be above the threshold to consider the
+# plasma rf or dc
+TOLERANCE = 0.85
+# Propotion of values needed to be above the threshold to consider the
+# plasma to be one particular type or the other
+POWER_TYPE_TOLERANCE = 0.1
+# Eletrical current threshold above which a dc plasma is considered on
+CURRENT_THRESHOLD = 0.01  # miliamps
+# Bias threshold above which a rf plasma is considered on
+BIAS_THRESHOLD = 0.01  # volts
+# Power setpoint difference threshold above which a
+# plasma is considered ramping up
+POWER_SETPOINT_DIFF_THRESHOLD = 0.01  # watts
+# Temperature setpoint difference threshold above which the
+# substrate temp is considered ramping up
+TEMP_SETPOINT_DIFF_THRESHOLD = 0.11  # degrees
+# Temperature setpoint of cracker's zones above which the
+# the cracker is considered on
+CRACKER_ZONE_1_MIN_TEMP = 70  # degrees
+CRACKER_ZONE_2_MIN_TEMP = 150  # degrees
+CRACKER_ZONE_3_MIN_TEMP = 200  # degrees
+# Temperature below which the deposition is considered room temperature
+RT_TEMP_THRESHOLD = 30  # degrees
+# Time for the qcm to stabilize after the Xtal 2 shutter opens
+STAB_TIME = 30  # seconds
+CAPMAN_PRESSURE_THRESHOLD = 0
+# Threshold above which the flow of the mfc is considered on
+MFC_FLOW_THRESHOLD = 1  # sccm
+# Fr
+# action of the length of the deposition dataframe to consider for the
+# beginning and end of the deposition voltage averaging
+FRAQ_ROWS_AVG_VOLTAGE = 5  # %
+# Number of timesteps to consider for the continuity limit
+CONTINUITY_LIMIT = 10
+# Special continuity limit for deposition events
+DEPOSITION_CONTINUITY_LIMIT = 200
+# Minimum size of a domain in terms of numbers of average timestep
+MIN_DOMAIN_SIZE = 10
+# Minimum size of a deposition in terms of numbers of average timestep
+MIN_DEPOSITION_SIZE = 60
+# Minimum size for the temp ramp down events
+MIN_TEMP_RAMP_DOWN_SIZE = 100
+# Size of the temperature control domains above which we consider that the
+# temperature control makes a domain
+MIN_TEMP_CTRL_SIZE = 20
+# Max pressure to read the base pressure
+MAX_BASE_PRESSURE = 1e-6  # Torr
+# variation in percent to consider that the cracker temperature is the same
+# as the cracker temperature during deposition to read the cracker induced
+# base pressure
+WITHIN_RANGE_PARAM = 5  # %
+# FWD and RFL Power difference threshold above which the plasma is considered
+# on
+POWER_FWD_RFL_THRESHOLD = 10  # watts
+# Categories of events to be considered in the main report
+
+
+# ---LOGFILE READING VALUES---
+
+# Format of the 'Time Stamp' column of the IDOL logfiles
+# (Ex: 'Jun-03-2024 09:52:29.123 AM')
+TIMESTAMP_FORMAT = '%b-%d-%Y %I:%M:%S.%f %p'
+# Number of lines before the header line in the IDOL logfiles
+LOGFILE_HEADER_LINE = 2
+# Prefixes of the columns used by the event filters and the parameters
+# extraction. Used to read only the relevant columns of the logfile
+EVENT_COLUMN_PREFIXES = (
+    'Time Stamp',
+    'PC ',
+    'Power Supply',
+    'Substrate',
+    'Sulfur Cracker',
+    'Thickness',
+    'Xtal',
+    'Temperature Control',
+)
+# Version of the logfile reading and formatting. Must be increased whenever
+# read_logfile or format_logfile change, to invalidate the cached logfiles
+LOG_READER_VERSION = 1
+# Environment variables to configure the cache of the parsed logfiles, which
+# is only used if its directory is set
+LOGFILE_CACHE_DIR_ENV = 'DTU_NANOLAB_LOGFILE_CACHE_DIR'
+LOGFILE_CACHE_MAX_SIZE_ENV = 'DTU_NANOLAB_LOGFILE_CACHE_MAX_SIZE'
+LOGFILE_CACHE_MAX_AGE_ENV = 'DTU_NANOLAB_LOGFILE_CACHE_MAX_AGE'
+LOGFILE_CACHE_MAX_SIZE = 2048  # MB
+LOGFILE_CACHE_MAX_AGE = 30  # days
+# Default number of rows parsed at once when parsing a logfile in chunks
+LOGFILE_CHUNK_SIZE = 100_000
+# Environment variable to set the number of threads evaluating the events and
+# parameters of the different sources at the same time (1 is serial)
+SOURCE_WORKERS_ENV = 'DTU_NANOLAB_SOURCE_WORKERS'
+SOURCE_WORKERS = 1
+# Environment variable to also trace the peak memory allocated by each stage
+# of the processing with tracemalloc (set to 1 to enable). Tracing slows the
+# processing down, so it is disabled by default
+PROFILE_MEMORY_ENV = 'DTU_NANOLAB_PROFILE_MEMORY'
+MONTH_ABBREVIATIONS = {
+    b'Jan': 1,
+    b'Feb': 2,
+    b'Mar': 3,
+    b'Apr': 4,
+    b'May': 5,
+    b'Jun': 6,
+    b'Jul': 7,
+    b'Aug': 8,
+    b'Sep': 9,
+    b'Oct': 10,
+    b'Nov': 11,
+    b'Dec': 12,
+}
+
+
+# ---REPORT VALUES---
+
+CATEGORIES_MAIN_REPORT = [
+    'deposition',
+    'ramp_up_temp',
+    'ramp_down_high_temp',
+    'source_presput',
+    'source_ramp_up',
+    'cracker_base_pressure',
+    'source_deprate2_film_meas',
+]
+CATEGORIES_STEPS = [
+    'deposition',
+    'ramp_up_temp',
+    'ramp_down_high_temp',
+    'source_presput',
+    'source_ramp_up',
+]
+# ------OTHER VALUES------
+
+# Categories of events to select the last event before the deposition, if possible
+CATEGORIES_LAST_EVENT = ['source_deprate2_film_meas', 'ramp_up_temp', 'source_ramp_up']
+# Categories of events to put in the bottom of the timeline plot
+CATEGORIES_FIRST = {
+    'deposition',
+    'ramp_up_temp',
+    'ramp_down_high_temp',
+    'ramp_down_low_temp',
+}
+SOURCE_NAME = {
+    '0': 's_cracker',
+    '1': 'taurus',
+    '3': 'magkeeper3',
+    '4': 'magkeeper4',
+    'all': 'All',
+}
+
+SOURCE_LABEL = {
+    's_cracker': 'S Cracker',
+    'taurus': 'Taurus',
+    'magkeeper3': 'Magkeeper3',
+    'magkeeper4': 'Magkeeper4',
+    'all': 'All',
+}
+GAS_NUMBER = {
+    'ar': 1,
+    'ph3': 4,
+    'h2s': 6,
+}
+
+# ----PLOT VALUES-----
+
+
+BASE_HEIGHT = 250
+WIDTH = 700
+HEIGHT = 450
+VERTICAL_SPACING = 0.02
+ROLLING_NUM = 50
+ROLLING_FRAC_MAX = 0.2
+
+EXPORT_SCALE = 20
+# Define a dictionary for step colors in the timeline plot
+STEP_COLORS = {
+    'Deposition': 'blue',
+    'Sub Temp Ramp Up': 'green',
+    'Sub High Temp Ramp Down': 'red',
+    'Sub Low Temp Ramp Down': 'pink',
+    'Source 4 Ramp Up': 'purple',
+    'Source 4 On': '#EE82EE',  # Violet
+    'Source 4 On Open': '#FF00FF',  # Fuchsia
+    'Source 4 Presput': 'magenta',
+    'Source 4 Film Dep Rate Meas': '#DA70D6',  # Orchid
+    'Source 3 Ramp Up': 'blue',
+    'Source 3 On': '#1E90FF',  # Dodger Blue
+    'Source 3 On Open': '#6495ED',  # Cornflower Blue
+    'Source 3 Presput': '#87CEFA',  # Light Sky Blue
+    'Source 3 Film Dep Rate Meas': '#4682B4',  # Steel Blue
+    'Source 1 Ramp Up': '#006400',  # Dark Green
+    'Source 1 On': 'green',
+    'Source 1 On Open': '#008000',  # Green
+    'Source 1 Presput': '#90EE90',  # Light Green
+    'Source 1 Film Dep Rate Meas': '#32CD32',  # Lime Green
+    'All Source Film Dep Rate Meas': 'grey',
+    'Cracker On Open': '#CCCC00',
+    'H2S On': 'orange',
+    'PH3 On': 'cyan',
+    'Ar On': 'black',
+    'S Dep Rate Meas': '#B22222',  # Firebrick
+    'Cracker Pressure Meas': 'brown',
+}
+# Choosing what to plot in the overview plot
+OVERVIEW_PLOT = [
+    'PC Substrate Shutter Open',
+    'PC Capman Pressure',
+    'Substrate Heater Temperature',
+    'Sulfur Cracker Control Enabled',
+    'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback',
+    'Sulfur Cracker Control Setpoint Feedback',
+    'Sulfur Cracker Control Sensor Value',
+]
+for gas in ['ar', 'ph3', 'h2s']:
+    OVERVIEW_PLOT.append(f'PC MFC {GAS_NUMBER[gas]} Flow')
+
+for source_number in ['1', '3', '4']:
+    OVERVIEW_PLOT.append(f'Source {source_number} DC Bias')
+    OVERVIEW_PLOT.append(f'Source {source_number} Voltage')
+    OVERVIEW_PLOT.append(f'Source {source_number} Output Setpoint')
+
+# Set y-axis titles
+DICT_RENAME = {
+    'Sulfur Cracker Control Enabled': 'Cracker Open',
+    'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback': 'Cracker Pulse Width',
+    'Sulfur Cracker Control Setpoint Feedback': 'Cracker Frequency',
+}
+DPI = 300
+PLOTLY_CONFIG = {
+    'toImageButtonOptions': {
+        'format': 'png',
+        # 'width': 10*WIDTH,
+        # 'height': 10*HEIGHT,
+        'scale': 10,
+    }
+}
+
+# ---STEP TIME SERIES REDUCTION VALUES---
+
+# Strategy and maximum number of points of the time series written to the
+# steps of the NOMAD entries, for each type of channel:
+#   measurement: measured values (Ex: flows, pressure, voltage)
+#   setpoint: setpoint-like values, constant between their changes
+#   state: boolean states (Ex: shutter open, cracker valve pulsing)
+# The strategies are 'none', 'stride', 'bucket_mean', 'bucket_min',
+# 'bucket_max', 'lttb' and 'change_point' (see reduce_series). The series with
+# at most max_points points are not reduced. The time series are written at
+# the full resolution of the log file unless a reduction is enabled with the
+# STEP_SERIES_REDUCTION_ENV environment variables, as the reductions are lossy
+# (the max_points below are used if only a strategy is set)
+STEP_SERIES_REDUCTION = {
+    'measurement': {'strategy': 'none', 'max_points': 1000},
+    'setpoint': {'strategy': 'none', 'max_points': 1000},
+    'state': {'strategy': 'none', 'max_points': 1000},
+}
+# Minimum number of points of a reduced time series (its first and last points)
+MIN_SERIES_POINTS = 2
+# Names of the setpoint-like time series of the step parameters
+SETPOINT_SERIES = [
+    'power_sp',
+    'valve_on_time',
+    'valve_frequency',
+    'pulse_frequency',
+    'dead_time',
+]
+# Environment variables overriding the reduction of a type of channel, set to
+# 'strategy' or 'strategy:max_points' (Ex: DTU_NANOLAB_STEP_SERIES_MEASUREMENT
+# set to 'bucket_mean:500')
+STEP_SERIES_REDUCTION_ENV = 'DTU_NANOLAB_STEP_SERIES_{}'
+
+# ---EVENT STATISTICS---
+
+# Statistics of the numeric columns of an event computed in a single pass over
+# its data and cached by the event (see Lf_Event.get_stat). The other
+# statistics (Ex: 'std', 'mode') are computed by pandas when first looked up
+EVENT_STATS = ['mean', 'min', 'max', 'first', 'last']
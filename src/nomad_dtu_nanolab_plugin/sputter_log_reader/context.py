@@ -0,0 +1,635 @@
+"""
+LogContext, the container of a formatted logfile shared by its events, the
+helpers working on its time axis and columns, and ProcessingStats, recording
+the stages of the processing.
+"""
+
+import concurrent.futures
+import contextlib
+import os
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader.constants import (
+    MONTH_ABBREVIATIONS,
+    PROFILE_MEMORY_ENV,
+    SOURCE_WORKERS,
+    SOURCE_WORKERS_ENV,
+    TIMESTAMP_FORMAT,
+)
+
+##------LOGFILE CONTAINER DEFINITION------
+
+
+class LogContext:
+    """
+    Timestamp-aware container of a formatted logfile, shared by all the
+    events extracted from it. The time axis is stored once as int64
+    nanoseconds (time_ns) and as the datetime 'Time Stamp' column
+    (time_stamps), so that the helpers working on the time axis never parse
+    or copy it again. The DataFrame API is forwarded to the underlying
+    DataFrame, so the container can be passed as data or raw_data to the
+    filters and the Lf_Event methods.
+    The log-wide statistics (avg_timestep, time_span, source_list) are
+    computed on first access and memoized, so that they are computed once per
+    logfile and not once per event. The context should therefore only be
+    built once the logfile is formatted.
+    """
+
+    def __init__(self, data, timestamp_col='Time Stamp', source_list=None):
+        if isinstance(data, LogContext):
+            data = data.data
+        self.data = data
+        self.timestamp_col = timestamp_col
+        self.time_stamps = get_time_stamps(data, timestamp_col)
+        self.time_ns = to_time_ns(self.time_stamps)
+        self._stats = {}
+        if source_list is not None:
+            self._stats['source_list'] = source_list
+        # optional columns requested through column() or column_values()
+        # but missing from the logfile
+        self.missing_columns = set()
+        # the sources can be evaluated in several threads sharing the context
+        self._lock = threading.RLock()
+        # the EventIndex of the events extracted from the logfile, built by
+        # read_events to query the events in a time window of the log
+        self.event_index = None
+
+    def memoize(self, name, func):
+        with self._lock:
+            if name not in self._stats:
+                self._stats[name] = func()
+            return self._stats[name]
+
+    # average time difference between two consecutive timestamps of the log
+    @property
+    def avg_timestep(self):
+        return self.memoize(
+            'avg_timestep', lambda: cal_avg_timestep(self, self.timestamp_col)
+        )
+
+    # first and last timestamps of the log
+    @property
+    def time_span(self):
+        return self.memoize(
+            'time_span', lambda: (self.time_stamps.iloc[0], self.time_stamps.iloc[-1])
+        )
+
+    @property
+    def source_list(self):
+        return self.memoize('source_list', lambda: get_source_list(self.data))
+
+    # whether the rows of the log are ordered in time
+    @property
+    def time_sorted(self):
+        return self.memoize('time_sorted', lambda: is_time_sorted(self.time_ns))
+
+    def column(self, name, default=0):
+        """
+        Returns the column of the logfile as a pd.Series. If the column is
+        missing, a Series of the default value sharing the index of the logfile
+        is returned instead. Its values are a read-only array cached for each
+        default value, so that it is not rebuilt for every missing column.
+        """
+        if name in self.data.columns:
+            return self[name]
+        return pd.Series(
+            self.column_values(name, default, broadcast=True),
+            index=self.data.index,
+            name=name,
+            copy=False,
+        )
+
+    def column_values(self, name, default=0, broadcast=False):
+        """
+        Returns the values of the column of the logfile as an array. If the
+        column is missing, the default value is returned as a scalar, which
+        broadcasts against the other columns, or as a cached read-only array
+        if broadcast is True. The missing columns are recorded in
+        missing_columns.
+        """
+        if name in self.data.columns:
+            return self[name].to_numpy()
+        with self._lock:
+            self.missing_columns.add(name)
+        if not broadcast:
+            return default
+        return self.memoize(
+            ('default_column', type(default), default),
+            lambda: read_only(np.full(len(self.data), default)),
+        )
+
+    def take(self, rows):
+        """
+        Returns the rows of the logfile at the given (sorted) positions. The
+        rows of a continuous range are returned as a slice, which shares the
+        memory of the logfile instead of copying it.
+        """
+        if len(rows) > 0 and rows[-1] - rows[0] + 1 == len(rows):
+            return self.data.iloc[rows[0] : rows[-1] + 1]
+        return self.data.iloc[rows]
+
+    def __getitem__(self, key):
+        if isinstance(key, str) and key == self.timestamp_col:
+            return self.time_stamps
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        self.data[key] = value
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __getattr__(self, name):
+        # Only called for the attributes not defined by the container
+        if name == 'data':
+            raise AttributeError(name)
+        return getattr(self.data, name)
+
+    # The logfile is shared by all the events, so it is never copied
+    # when the events are
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+# Function to get the 'Time Stamp' column of a DataFrame (or LogContext) as
+# datetime, only parsing it if it has not been parsed already
+def get_time_stamps(df, timestamp_col='Time Stamp'):
+    if isinstance(df, LogContext):
+        return df.time_stamps
+    time_stamps = df[timestamp_col]
+    if not pd.api.types.is_datetime64_any_dtype(time_stamps):
+        time_stamps = parse_time_stamps(time_stamps)
+    return time_stamps
+
+
+# Function to get the time axis of a DataFrame (or LogContext) as int64
+# nanoseconds
+def get_time_ns(df, timestamp_col='Time Stamp'):
+    if isinstance(df, LogContext):
+        return df.time_ns
+    return to_time_ns(get_time_stamps(df, timestamp_col))
+
+
+def to_time_ns(time_stamps):
+    return np.asarray(time_stamps, dtype='datetime64[ns]').view(np.int64)
+
+
+def to_ns(time_stamp):
+    return pd.Timestamp(time_stamp).value
+
+
+def is_time_sorted(time_ns):
+    return bool((np.diff(time_ns) >= 0).all())
+
+
+def read_only(array):
+    array.flags.writeable = False
+    return array
+
+
+# Function to get an optional column of a DataFrame (or LogContext) as a
+# pd.Series, with the default value for all the rows if the column is missing
+def get_column(df, name, default=0):
+    if isinstance(df, LogContext):
+        return df.column(name, default)
+    if name in df.columns:
+        return df[name]
+    return pd.Series(np.full(len(df), default), index=df.index, name=name)
+
+
+# Function to get the values of an optional column of a DataFrame (or
+# LogContext) as an array, or the default value as a scalar if the column is
+# missing
+def get_column_values(df, name, default=0):
+    if isinstance(df, LogContext):
+        return df.column_values(name, default)
+    if name in df.columns:
+        return df[name].to_numpy()
+    return default
+
+
+# Function to get the average timestep of a DataFrame, memoized if the
+# DataFrame is a LogContext
+def get_avg_timestep(df, timestamp_col='Time Stamp'):
+    if isinstance(df, LogContext):
+        return df.avg_timestep
+    return cal_avg_timestep(df, timestamp_col)
+
+
+# Function to get the first and last timestamps of a DataFrame, memoized if
+# the DataFrame is a LogContext
+def get_time_span(df, timestamp_col='Time Stamp'):
+    if isinstance(df, LogContext):
+        return df.time_span
+    return df[timestamp_col].iloc[0], df[timestamp_col].iloc[-1]
+
+
+# Function to get the number of threads evaluating the sources at the same
+# time, set by the DTU_NANOLAB_SOURCE_WORKERS environment variable
+def get_source_workers():
+    return max(int(os.environ.get(SOURCE_WORKERS_ENV, SOURCE_WORKERS)), 1)
+
+
+# Function to apply func to each source of the source_list, returning the
+# results in the order of the source_list. With several workers, the sources
+# are evaluated at the same time in a thread pool (NumPy and pandas release
+# the GIL for most of the filtering), and the results are still returned in
+# the order of the serial evaluation
+def map_sources(func, source_list, workers=None):
+    if workers is None:
+        workers = get_source_workers()
+    source_list = list(source_list)
+    if workers <= 1 or len(source_list) <= 1:
+        return [func(source_number) for source_number in source_list]
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(workers, len(source_list))
+    ) as executor:
+        return list(executor.map(func, source_list))
+
+
+##------PROCESSING INSTRUMENTATION DEFINITION------
+
+
+class ProcessingStats:
+    """
+    Records the wall time, the number of rows and the peak memory allocated
+    (traced with tracemalloc if trace_memory is True) of the named stages of
+    the processing of a logfile:
+
+        stats = ProcessingStats()
+        with stats.stage('read_logfile') as stage:
+            data = read_logfile(file_path)
+            stage['rows'] = len(data)
+
+    The stages can be nested, the record of a nested stage holding the name
+    of its parent stage, and the peak memory of a stage including the peaks of
+    its nested stages. The records of the stages are stored in stages, in the
+    order the stages are entered, and each run of a stage is sent to the
+    (structlog) logger, if any, when it ends. A stage run several times (Ex: a
+    stage per event or per source) is recorded once, with the number of runs
+    in count, the total of their wall times and rows, and the highest of their
+    peak memories.
+    """
+
+    def __init__(self, trace_memory=None, logger=None):
+        if trace_memory is None:
+            trace_memory = os.environ.get(PROFILE_MEMORY_ENV, '0') == '1'
+        self.trace_memory = trace_memory
+        self.logger = logger
+        self.stages = {}
+        # names of the stages being run, the last one being the innermost
+        self._running = []
+        # memory at the start and running peak of each stage being traced
+        self._traced = []
+        self._started_tracing = False
+
+    @contextlib.contextmanager
+    def stage(self, name, rows=None):
+        parent = self._running[-1] if self._running else None
+        # The record of a stage is added when the stage is first entered, so
+        # the stages are kept in the order they are entered
+        self.stages.setdefault(
+            name,
+            {
+                'parent': parent,
+                'count': 0,
+                'wall_time': None,
+                'rows': None,
+                'peak_memory': None,
+            },
+        )
+        run = {'parent': parent, 'wall_time': None, 'rows': rows, 'peak_memory': None}
+        self._running.append(name)
+        if self.trace_memory:
+            self._start_tracing()
+        start_time = time.perf_counter()
+        try:
+            yield run
+        finally:
+            run['wall_time'] = time.perf_counter() - start_time
+            self._running.pop()
+            if self.trace_memory:
+                run['peak_memory'] = self._stop_tracing()
+            self._add_run(name, run)
+            if self.logger is not None:
+                self.logger.info('processing stage', stage=name, **run)
+
+    # method to aggregate a run of a stage in the record of the stage, the
+    # wall times and rows of the runs being summed and their peaks maxed
+    def _add_run(self, name, run):
+        record = self.stages[name]
+        record['count'] += 1
+        for key, aggregate in [('wall_time', sum), ('rows', sum), ('peak_memory', max)]:
+            values = [value for value in (record[key], run[key]) if value is not None]
+            record[key] = aggregate(values) if values else None
+
+    def _start_tracing(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        current, peak = tracemalloc.get_traced_memory()
+        # The peak is reset for the new stage, so the running peak of the
+        # enclosing stage is kept before
+        if self._traced:
+            self._traced[-1][1] = max(self._traced[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._traced.append([current, current])
+
+    def _stop_tracing(self):
+        start, peak = self._traced.pop()
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        if self._traced:
+            self._traced[-1][1] = max(self._traced[-1][1], peak)
+        elif self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return peak - start
+
+    # wall time of each stage
+    @property
+    def timings(self):
+        return {name: record['wall_time'] for name, record in self.stages.items()}
+
+    # wall time of all the stages, the nested stages being counted once
+    @property
+    def total_time(self):
+        return sum(
+            record['wall_time']
+            for record in self.stages.values()
+            if record['parent'] is None
+        )
+
+    # name of the stage, without nested stages, that took the longest
+    def slowest_stage(self):
+        parents = {record['parent'] for record in self.stages.values()}
+        leaves = {
+            name: record['wall_time']
+            for name, record in self.stages.items()
+            if name not in parents and record['wall_time'] is not None
+        }
+        return max(leaves, key=leaves.get) if leaves else None
+
+
+# ----------FUNCTIONS FOR HANDLING TIMESTAMPS------------
+
+
+# Function to parse the 'Time Stamp' column of the logfile. The IDOL
+# timestamps have a fixed width layout (Ex: 'Jun-03-2024 09:52:29.123 AM'),
+# which allows to parse them field by field on a byte array instead of row by
+# row. Falls back to pd.to_datetime if the layout is not the expected one
+def parse_time_stamps(time_stamps):
+    time_stamps = pd.Series(time_stamps)
+    try:
+        # Parse the first timestamp with pandas to get the datetime resolution
+        # that pd.to_datetime would use for the whole column
+        reference = pd.to_datetime(time_stamps.iloc[:1], format=TIMESTAMP_FORMAT)
+        nanoseconds = _parse_fixed_width_time_stamps(
+            np.asarray(time_stamps, dtype=np.bytes_)
+        )
+    except (ValueError, TypeError, KeyError, UnicodeEncodeError):
+        return pd.to_datetime(time_stamps, format=TIMESTAMP_FORMAT)
+    return pd.Series(
+        nanoseconds.view('datetime64[ns]'),
+        index=time_stamps.index,
+        name=time_stamps.name,
+    ).astype(reference.dtype)
+
+
+# Helper function of parse_time_stamps returning the timestamps as int64
+# nanoseconds. Raises a ValueError for any value not matching the layout
+def _parse_fixed_width_time_stamps(values):
+    width = values.dtype.itemsize
+    # 'Mon-DD-YYYY HH:MM:SS.' is followed by one to nine fraction digits and
+    # ' AM' or ' PM'
+    fraction_width = width - 24
+    max_fraction_width = 9
+    if values.size == 0 or not 1 <= fraction_width <= max_fraction_width:
+        raise ValueError('Unexpected timestamp width')
+    chars = values.view(np.uint8).reshape(-1, width)
+    separators = {3: '-', 6: '-', 11: ' ', 14: ':', 17: ':', 20: '.', width - 3: ' '}
+    for position, separator in separators.items():
+        if not (chars[:, position] == ord(separator)).all():
+            raise ValueError('Unexpected timestamp separator')
+
+    def to_int(start, stop, min_value, max_value):
+        digits = chars[:, start:stop].astype(np.int64) - ord('0')
+        if ((digits < 0) | (digits > 9)).any():  # noqa: PLR2004
+            raise ValueError('Unexpected timestamp digit')
+        weights = 10 ** np.arange(stop - start - 1, -1, -1, dtype=np.int64)
+        number = digits @ weights
+        if ((number < min_value) | (number > max_value)).any():
+            raise ValueError('Timestamp field out of range')
+        return number
+
+    day = to_int(4, 6, 1, 31)
+    year = to_int(7, 11, 1, 9999)
+    hour = to_int(12, 14, 1, 12)
+    minute = to_int(15, 17, 0, 59)
+    second = to_int(18, 20, 0, 59)
+    fraction = to_int(21, 21 + fraction_width, 0, 10**fraction_width - 1)
+
+    month_names = values.astype('S3')
+    month = np.zeros(len(values), dtype=np.int64)
+    for month_name in np.unique(month_names):
+        month[month_names == month_name] = MONTH_ABBREVIATIONS[month_name]
+    # Like strptime, accept both upper and lower case AM/PM
+    is_am = np.isin(chars[:, -2], [ord('A'), ord('a')])
+    is_pm = np.isin(chars[:, -2], [ord('P'), ord('p')])
+    if not ((is_am | is_pm) & np.isin(chars[:, -1], [ord('M'), ord('m')])).all():
+        raise ValueError('Unexpected timestamp meridiem')
+    hour = hour % 12 + 12 * is_pm
+
+    months = (year - 1970).astype('datetime64[Y]').astype('datetime64[M]') + (
+        month - 1
+    ).astype('timedelta64[M]')
+    dates = months.astype('datetime64[D]') + (day - 1).astype('timedelta64[D]')
+    # Days out of the month (Ex: Feb-30) would roll over to the next month
+    if (dates.astype('datetime64[M]') != months).any():
+        raise ValueError('Timestamp day out of range')
+    nanoseconds = dates.astype('datetime64[ns]').view(np.int64)
+    nanoseconds += ((hour * 60 + minute) * 60 + second) * 1_000_000_000
+    nanoseconds += fraction * 10 ** (max_fraction_width - fraction_width)
+    return nanoseconds
+
+
+# Function to calculate the average time step
+# between consecutive timestamps in a DataFrame
+def cal_avg_timestep(df, timestamp_col='Time Stamp'):
+    """
+    This function calculates the average time step between consecutive
+    timestamps in a DataFrame.
+    """
+    time_stamps = get_time_stamps(df, timestamp_col)
+    values = time_stamps.to_numpy()
+    if len(values) <= 1 or values.dtype.kind != 'M' or np.isnat(values).any():
+        return time_stamps.diff().dropna().mean()
+    # The sum of the time differences is the difference between the last and
+    # first timestamps, so the mean is computed without building the diff.
+    # As pandas does, the mean is truncated to the resolution of the timestamps
+    unit = np.datetime_data(values.dtype)[0]
+    ints = values.view(np.int64)
+    return pd.Timedelta(
+        np.timedelta64(int((ints[-1] - ints[0]) / (len(ints) - 1)), unit)
+    )
+
+
+# Function to extract continuous domains based on time continuity
+def find_continuous_domains(time_ns, continuity_time, min_domain_time):
+    """
+    This function segments a time axis (int64 nanoseconds) into continuous
+    time domains. A new domain starts wherever the time difference between
+    two consecutive timestamps is greater than continuity_time, and only the
+    domains lasting more than min_domain_time are kept.
+    It returns the arrays of the start and end row positions of the domains.
+    """
+    empty = np.array([], dtype=np.intp)
+    if len(time_ns) == 0 or pd.isna(continuity_time) or pd.isna(min_domain_time):
+        return empty, empty
+    # positions of the first row after each discontinuity
+    breaks = np.flatnonzero(np.diff(time_ns) > pd.Timedelta(continuity_time).value) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks - 1, [len(time_ns) - 1]))
+    # remove all the domains that are less than a certain time
+    # interval to only keep big domains
+    keep = time_ns[ends] - time_ns[starts] > pd.Timedelta(min_domain_time).value
+    return starts[keep], ends[keep]
+
+
+# Function to get the rows of a time axis (int64 nanoseconds) before the
+# reference time, as a slice of the first rows if the time axis is ordered,
+# and as a boolean mask otherwise
+def rows_before(time_ns, ref_ns):
+    if is_time_sorted(time_ns):
+        return slice(0, np.searchsorted(time_ns, ref_ns, side='left'))
+    return time_ns < ref_ns
+
+
+def event_filter(df, bounds, timestamp_col='Time Stamp'):
+    time_ns = get_time_ns(df, timestamp_col)
+    start_ns = pd.Timestamp(bounds[0]).value
+    end_ns = pd.Timestamp(bounds[1]).value
+    if isinstance(df, LogContext):
+        time_sorted = df.time_sorted
+    else:
+        time_sorted = is_time_sorted(time_ns)
+    # The logfiles are ordered in time, which allows to slice the rows
+    # between the bounds without copying them
+    if time_sorted:
+        start = np.searchsorted(time_ns, start_ns, side='left')
+        stop = np.searchsorted(time_ns, end_ns, side='right')
+        return df.iloc[start:stop]
+    return df[(time_ns >= start_ns) & (time_ns <= end_ns)]
+
+
+# Function to convert all timestamps to tz-naive
+def make_timestamps_tz_naive(timestamps):
+    """
+    This function converts all timestamps in a dictionary
+    to tz-naive timestamps.
+    """
+    timestamps = {
+        key: timestamps.tz_localize(None) for key, timestamps in timestamps.items()
+    }
+    return timestamps
+
+
+def format_time_stamp(time, ref_object=None, timestamp_col='Time Stamp'):
+    len_hh_mm = 2
+    len_hh_mm_ss = 3
+
+    if not isinstance(time, pd.Timestamp):
+        # Check if the input string contains only the time part
+        if isinstance(time, str):
+            parts = time.split(':')
+            if len(parts) == len_hh_mm:  # If format is HH:MM, assume seconds as :00
+                time += ':00'
+            elif len(parts) == 1 or len(parts) > len_hh_mm_ss:
+                raise ValueError(
+                    f"Invalid time format: {time}. Exp. 'HH:MM' or 'HH:MM:SS'."
+                )
+
+            if ref_object is not None:
+                if isinstance(ref_object, pd.DataFrame):
+                    # Handle case where df is empty to avoid IndexError
+                    if ref_object.empty:
+                        raise ValueError(
+                            'DataFrame is empty, cannot infer date for time conversion.'
+                        )
+
+                        # Assume the date of the first row of df[timestamp_col]
+                        # if only time is provided
+                    if len(time.split()) == 1:
+                        first_date = pd.to_datetime(
+                            ref_object[timestamp_col].iloc[0]
+                        ).strftime('%Y-%m-%d')
+                        time = f'{first_date} {time}'
+                elif isinstance(ref_object, dict):
+                    # Assume the date of the first key of the dictionary
+                    # if only time is provided
+                    if len(time.split()) == 1:
+                        first_key = list(ref_object['timestamp_map'].keys())[0]
+                        first_date = pd.to_datetime(
+                            ref_object['timestamp_map'][first_key]
+                        ).strftime('%Y-%m-%d')
+                        time = f'{first_date} {time}'
+        try:
+            # Create the Timestamp
+            timestamp = pd.to_datetime(time, format='%Y-%m-%d %H:%M:%S')
+        except Exception as e:
+            raise ValueError(f'Invalid timestamp format: {time}. Error: {e}')
+    else:
+        timestamp = time
+
+    return timestamp
+
+
+# Helper function to check if a column is within a time range
+def within_time_range(df, start_time, end_time, timestamp_col='Time Stamp'):
+    # Check if the dataframe has the specified column
+    if timestamp_col not in df.columns:
+        raise ValueError(f"'{timestamp_col}' column not found in DataFrame.")
+
+    # Ensure the timestamp column is in datetime format
+    if not pd.api.types.is_datetime64_any_dtype(df[timestamp_col]):
+        df[timestamp_col] = pd.to_datetime(df[timestamp_col])
+
+    # Format start_time and end_time
+    start_time = format_time_stamp(start_time, ref_object=df)
+    end_time = format_time_stamp(end_time, ref_object=df)
+
+    # Ensure both timestamps and DataFrame column are timezone-naive
+    if start_time.tzinfo is not None:
+        start_time = start_time.tz_convert(None)
+    if end_time.tzinfo is not None:
+        end_time = end_time.tz_convert(None)
+    if pd.api.types.is_datetime64tz_dtype(df[timestamp_col]):
+        df[timestamp_col] = df[timestamp_col].dt.tz_convert(None)
+
+    # Return the boolean mask for rows within the time range
+    time_cond = (df[timestamp_col] >= start_time) & (df[timestamp_col] <= end_time)
+    return time_cond
+
+
+# Function to get the source list automatically from the logfile
+# (Ex: source_list = [1, 3, 4])
+def get_source_list(data):
+    source_list = []
+    for col in data.columns:
+        if col.startswith('PC Source') and col.endswith('Loaded Target'):
+            source_number = int(col.split()[2])
+            source_list.append(source_number)
+    return source_list
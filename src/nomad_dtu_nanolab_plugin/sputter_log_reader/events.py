@@ -0,0 +1,2073 @@
+"""
+Lf_Event and its subclasses, which extract the parameters of each step of
+the process, the EventIndex of their time domains and the helpers to
+manipulate lists of events.
+"""
+
+import copy
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader.constants import (
+    BIAS_THRESHOLD,
+    CAPMAN_PRESSURE_THRESHOLD,
+    CATEGORIES_FIRST,
+    CONTINUITY_LIMIT,
+    CRACKER_ZONE_1_MIN_TEMP,
+    CRACKER_ZONE_2_MIN_TEMP,
+    CRACKER_ZONE_3_MIN_TEMP,
+    CURRENT_THRESHOLD,
+    ELEMENTS,
+    EVENT_STATS,
+    FRAQ_ROWS_AVG_VOLTAGE,
+    GAS_NUMBER,
+    IONS,
+    MAX_BASE_PRESSURE,
+    MFC_FLOW_THRESHOLD,
+    MIN_DOMAIN_SIZE,
+    POWER_FWD_RFL_THRESHOLD,
+    POWER_TYPE_TOLERANCE,
+    RT_TEMP_THRESHOLD,
+    SOURCE_NAME,
+    TOLERANCE,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.context import (
+    LogContext,
+    event_filter,
+    find_continuous_domains,
+    get_avg_timestep,
+    get_column,
+    get_column_values,
+    get_time_ns,
+    get_time_stamps,
+    is_time_sorted,
+    map_sources,
+    rows_before,
+    to_ns,
+    to_time_ns,
+)
+
+##------EVENT CLASS DEFINITION------
+
+
+class Lf_Event:
+    def __init__(
+        self, name: str, source=None, category=None, step_number=None, step_id=None
+    ):
+        # human readable name of the event
+        self.name = name
+        # category of the event (Ex: deposition, ramp_up_temp, etc)
+        self.category = category
+        # source associated with the event (Ex: source_presput)
+        # None if the event is not associated with no or more than one
+        # source (Ex: deposition)
+        self.source = source
+        # the avg_timestep is the average time difference between two
+        # consecutive timestamps in the raw_logfile. It is used as a reference
+        # time to determine the continuity of the time domains
+        self.avg_timestep = None
+        # the context is the LogContext of the logfile the event was extracted
+        # from. It is shared by all the events of the logfile, and holds the
+        # log-wide statistics (avg_timestep, time_span, source_list)
+        self.context = None
+        # the condition is a boolean pd.Series that indicates which rows of the
+        # raw_data are part of the particular event
+        self.cond = pd.DataFrame()
+        # the data is a pd.DataFrame that contains the rows of the raw_data that
+        # meet the condition defined above
+        self.data = pd.DataFrame()
+        # when the event is extracted from a LogContext, only the positions of
+        # its rows in the logfile are stored (rows, and sep_rows for each
+        # subevent), and data and sep_data are only sliced from the logfile
+        # when they are first needed
+        self.rows = None
+        self.sep_rows = None
+        # the bounds are the start and end timestamps of the continuous time
+        # there can be multiple bounds if the event is not continuous. If so
+        # there will be separate events (sep_) for each continuous domain
+        self.bounds = []
+        # the positions (in data) of the first and last rows of each bound, so
+        # that the domains can be compared and merged without looking up their
+        # timestamps. A domain without any row has a first position greater
+        # than its last position
+        self.bound_positions = []
+        # the number of time continuous domains in the event, essentially len(bounds)
+        self.events = 0
+        # if several events are within the object (time discontinuity),
+        # the step number will indicate what is index of the subevent
+        self.step_number = step_number
+        # and sep_data will store the data of each subevent
+        self.sep_data = [pd.DataFrame()]
+        # the name of each subevent. Autmatically generated based on the name
+        # of the event, the source and the index of the subevent
+        # (Ex: Source 1 Ramp Up(0), Source 1 Ramp Up(1), etc)
+        self.sep_name = ['']
+        # the bounds of each subevent
+        self.sep_bounds = []
+        # the time of the rows of the event, in seconds from its first row, as
+        # a np.array shared by all the time series of the step parameters
+        self.step_time = None
+        # the statistics (EVENT_STATS, and the other statistics looked up) of
+        # the numeric columns of the data, as a dictionary of the statistics
+        # of each column, computed on first access (see get_stat). They are
+        # reset whenever the data is set. The sources can be evaluated in
+        # several threads looking up the statistics of the same event
+        self._stats = {}
+        self._stats_lock = threading.RLock()
+
+        # here we create a unique identifier for the event
+        # based on the name, category, source and step number
+        if step_id is None:
+            self.step_id = self.generate_step_id()
+
+    def snapshot(self):
+        """
+        Returns a copy of the event that shares its data (DataFrames, row
+        positions, condition and LogContext) with the original event. The
+        DataFrames of the events are never modified in place, so only the
+        containers (bounds, sep_data, ...) are copied, so that modifying the
+        bounds or the data of one of the events does not affect the other.
+        """
+        snapshot = copy.copy(self)
+        for name, value in vars(snapshot).items():
+            if isinstance(value, (list, dict)):
+                setattr(snapshot, name, copy.copy(value))
+        return snapshot
+
+    def generate_step_id(self):
+        if self.category is not None:
+            step_id = self.category
+        else:
+            step_id = self.name
+        if self.category != 'deposition':
+            if self.source is not None:
+                step_id += f'_s{self.source}'
+            if self.step_number is not None:
+                step_id += f'_n{self.step_number}'
+        return step_id
+
+    # the data and sep_data are sliced from the LogContext on first access
+    # if the event only holds the positions of its rows
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self.context.take(self.rows)
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self.rows = None
+        self._stats = {}
+
+    @property
+    def sep_data(self):
+        if self._sep_data is None:
+            self._sep_data = [self.context.take(rows) for rows in self.sep_rows]
+        return self._sep_data
+
+    @sep_data.setter
+    def sep_data(self, sep_data):
+        self._sep_data = sep_data
+        self.sep_rows = None
+
+    # method to populate the data attribute of the event, using the raw_data,
+    # and the CONTINUITY_LIMIT (threshold for time continuity)
+    def set_data(self, data, raw_data, continuity_limit=CONTINUITY_LIMIT):
+        self.data = data
+        if isinstance(raw_data, LogContext):
+            self.context = raw_data
+        # Whenever the data is set, we also get the average timestep
+        # (computed only once per logfile if raw_data is a LogContext)...
+        self.avg_timestep = get_avg_timestep(raw_data)
+        # ... the bounds...
+        self.bounds = self.extract_domains(continuity_limit)
+        # ... and run the update_events_and_separated_data method, which will
+        # update the events, sep_data, sep_name and sep_bounds attributes
+        self.update_events_and_separated_data()
+
+    # same as set_data, but the data of the event is given by the positions
+    # of its rows in the LogContext, and is not sliced until needed
+    def set_rows(self, rows, context, continuity_limit=CONTINUITY_LIMIT):
+        self.context = context
+        self._data = None
+        self._stats = {}
+        self.rows = rows
+        self.avg_timestep = context.avg_timestep
+        self.bounds = self.extract_domains(continuity_limit)
+        self.update_events_and_separated_data()
+
+    # method to set the bounds of the event
+    def set_bounds(self, bounds):
+        self.bounds = bounds
+        # whenever the bounds are set, we also run the update_events_and_separated_data
+        self.update_events_and_separated_data()
+
+    # helper method to update events, sep_data, sep_name, and sep_bounds after
+    # bounds changes
+    def update_events_and_separated_data(self):
+        self.events = len(self.bounds)
+        time_ns, time_sorted = self.get_time_axis()
+        self.bound_positions = self.find_bound_positions(time_ns, time_sorted)
+        # The rows of each bound are sliced from the positions if the logfile
+        # is ordered in time, and filtered by their timestamps otherwise
+        if self.rows is not None and time_sorted:
+            self._sep_data = None
+            self.sep_rows = [
+                self.rows[first : last + 1] for first, last in self.bound_positions
+            ]
+        elif self.rows is not None:
+            self._sep_data = None
+            self.sep_rows = [
+                self.rows[(time_ns >= start) & (time_ns <= end)]
+                for start, end in self.get_bounds_ns()
+            ]
+        elif time_sorted:
+            self.sep_data = [
+                self.data.iloc[first : last + 1] for first, last in self.bound_positions
+            ]
+        else:
+            self.sep_data = [event_filter(self.data, bound) for bound in self.bounds]
+        self.sep_name = [f'{self.name}({i})' for i in range(self.events)]
+        self.sep_bounds = [self.bounds[i] for i in range(self.events)]
+
+    # helper method to get the time axis of the data of the event as int64
+    # nanoseconds, and whether it is ordered in time
+    def get_time_axis(self, timestamp_col='Time Stamp'):
+        if self.rows is not None:
+            return self.context.time_ns[self.rows], self.context.time_sorted
+        if not self.bounds:
+            return np.array([], dtype=np.int64), True
+        time_ns = get_time_ns(self.data, timestamp_col)
+        return time_ns, is_time_sorted(time_ns)
+
+    # helper method to get the bounds of the event as int64 nanoseconds
+    def get_bounds_ns(self):
+        return np.array(
+            [
+                (pd.Timestamp(bound[0]).value, pd.Timestamp(bound[1]).value)
+                for bound in self.bounds
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+
+    # helper method to find the positions (in data) of the first and last rows
+    # within each bound. The logfiles are ordered in time, so the positions are
+    # found by a binary search instead of scanning the rows for each bound
+    def find_bound_positions(self, time_ns, time_sorted):
+        bounds_ns = self.get_bounds_ns()
+        if time_sorted:
+            firsts = np.searchsorted(time_ns, bounds_ns[:, 0], side='left')
+            lasts = np.searchsorted(time_ns, bounds_ns[:, 1], side='right') - 1
+            return list(zip(firsts.tolist(), lasts.tolist()))
+        positions = []
+        for start, end in bounds_ns:
+            domain = np.flatnonzero((time_ns >= start) & (time_ns <= end))
+            if len(domain) > 0:
+                positions.append((int(domain[0]), int(domain[-1])))
+            else:
+                positions.append((0, -1))
+        return positions
+
+    # method to merge the consecutive time domains of the event for which
+    # predicate(end, start) is True, end being the position (in data) of the
+    # last row of a domain and start the position of the first row of the next
+    # domain (Ex: to merge the steps of a ramp). A merged domain is then
+    # compared with the next domain
+    def merge_adjacent_domains(self, predicate):
+        if any(first > last for first, last in self.bound_positions):
+            print(f'Error: Unable to merge the domains of {self.name}')
+            return
+        bounds = self.bounds[:1]
+        positions = self.bound_positions[:1]
+        for bound, position in zip(self.bounds[1:], self.bound_positions[1:]):
+            if predicate(positions[-1][1], position[0]):
+                bounds[-1] = (bounds[-1][0], bound[1])
+                positions[-1] = (positions[-1][0], position[1])
+            else:
+                bounds.append(bound)
+                positions.append(position)
+        self.set_bounds(bounds)
+
+    # very important method to extract the bounds of the continuous time domains
+    def extract_domains(
+        self, continuity_limit=CONTINUITY_LIMIT, timestamp_col='Time Stamp'
+    ):
+        """
+        This function extracts the bounds of continuous time domains in a
+        DataFrame based on the time continuity
+        For example, if the time difference between two consecutive
+        timestamps of df1 is greater than the avg_timestep of df2,
+        then the two timestamps are considered to be in
+        different timedomains.
+        """
+
+        if self.rows is not None:
+            time_stamps = self.context.time_stamps
+            positions = self.rows
+            time_ns = self.context.time_ns[positions]
+        elif self.data.empty:
+            return []
+        else:
+            time_stamps = get_time_stamps(self.data, timestamp_col)
+            positions = np.arange(len(time_stamps))
+            time_ns = to_time_ns(time_stamps)
+        starts, ends = find_continuous_domains(
+            time_ns,
+            continuity_limit * self.avg_timestep,
+            MIN_DOMAIN_SIZE * self.avg_timestep,
+        )
+        return list(
+            zip(
+                time_stamps.iloc[positions[starts]],
+                time_stamps.iloc[positions[ends]],
+            )
+        )
+
+    # method to filter the data of the event based on a conditionnal boolean pd.Series
+    def filter_data(self, raw_data):
+        if not self.cond.empty and isinstance(raw_data, LogContext):
+            self.set_rows(np.flatnonzero(self.cond.to_numpy(dtype=bool)), raw_data)
+        elif not self.cond.empty:
+            filtered_data = raw_data[self.cond]
+            self.set_data(filtered_data, raw_data)
+        else:
+            print(f'Error: Unable to filter. No condition set for event {self.name}')
+
+    def set_condition(self, condition):
+        self.cond = condition
+
+    def set_source(self, source):
+        self.source = source
+
+    # simple method to exlude events that are too small
+    def filter_out_small_events(self, min_domain_size):
+        data_list = []
+        if self.sep_rows is not None:
+            sep_sizes = [len(rows) for rows in self.sep_rows]
+        else:
+            sep_sizes = [len(data) for data in self.sep_data]
+        for i in range(self.events):
+            if sep_sizes[i] > min_domain_size:
+                data_list.append(self.sep_data[i])
+        # Concatenate the list of DataFrames
+        if data_list:
+            data = pd.concat(data_list, ignore_index=True)
+            self.set_data(data, data)
+
+    # method to only select events that come before a certain reference time
+    # with the option of selecting any event before the reference time
+    # The domains are looked up in event_index (see EventIndex) if given
+    def select_event(self, raw_data, event_loc: int, ref_time=None, event_index=None):
+        if self.rows is not None and raw_data is self.context:
+            self.select_event_rows(event_loc, ref_time, event_index)
+            return
+        if ref_time is None:
+            ref_time = self.data['Time Stamp'].iloc[-1]
+        domains = self.find_domains_before(ref_time, event_index)
+        if event_loc < len(domains):
+            i = domains[event_loc]
+            data = self.sep_data[i]
+            if not self.bounds[i][1] < ref_time:
+                # If the event is not entirely before the reference time, we
+                # filter the data to only keep the data before the reference time
+                data = data.iloc[rows_before(get_time_ns(data), to_ns(ref_time))]
+            self.set_data(data, raw_data)
+        else:
+            raise IndexError('event_loc is out of the range of the event_list')
+
+    # same as select_event, working on the positions of the rows of the event
+    def select_event_rows(self, event_loc: int, ref_time=None, event_index=None):
+        if ref_time is None:
+            ref_time = self.context.time_stamps.iloc[self.rows[-1]]
+        domains = self.find_domains_before(ref_time, event_index)
+        if event_loc < len(domains):
+            i = domains[event_loc]
+            rows = self.sep_rows[i]
+            if not self.bounds[i][1] < ref_time:
+                rows = rows[rows_before(self.context.time_ns[rows], to_ns(ref_time))]
+            self.set_rows(rows, self.context)
+        else:
+            raise IndexError('event_loc is out of the range of the event_list')
+
+    # helper method to find the indices of the domains (entirely or partly)
+    # before the reference time, from their bounds only. The domains are
+    # found with binary searches if the event is in event_index
+    def find_domains_before(self, ref_time, event_index=None):
+        if event_index is not None and self in event_index:
+            return event_index.domains_before(self, ref_time)
+        return [
+            i
+            for i, (start, end) in enumerate(self.bounds)
+            if end < ref_time or (end > ref_time and start < ref_time)
+        ]
+
+    # specific method to stitch the source ramp up events together,
+    # in the case a source is ramped up in several steps.
+    # it essentially merges the events if the last output setpoint power
+    # of first event is the same as the second event first output setpoint power
+    def stitch_source_ramp_up_events(self):
+        if self.events <= 1:
+            return
+        output_setpoint = self.data[f'Source {self.source} Output Setpoint'].to_numpy()
+        # Merge the events if the output setpoint power value at the end of the
+        # first event is the same as at the start of the next event
+        self.merge_adjacent_domains(
+            lambda end, start: output_setpoint[end] == output_setpoint[start]
+        )
+
+    # DTUsteps parameters extraction methods
+
+    # method to extract the parameters of step events, in a format that can be
+    # used to populate the Nomad DTUsteps of DTUSputtering
+    def get_nomad_step_params(self, params=None, source_list=None):
+        # Set a default value for the source list
+        if source_list is None:
+            source_list = [self.source]
+        # Initialize the params dictionary if it is not provided
+        if params is None:
+            params = {}
+        # Write the event step_id as the key of the dictionary
+
+        params[self.step_id] = {}
+
+        # Get basic step parameters in the dictionary
+
+        params[self.step_id]['name'] = self.name
+        params[self.step_id]['lab_id'] = self.step_id
+        params[self.step_id]['category'] = self.category
+        # Extract the start and end time, and duration of the event
+        params[self.step_id]['start_time'] = self.data['Time Stamp'].iloc[0]
+        params[self.step_id]['end_time'] = self.data['Time Stamp'].iloc[-1]
+        params[self.step_id]['duration'] = (
+            params[self.step_id]['end_time'] - params[self.step_id]['start_time']
+        )
+        params[self.step_id]['creates_new_thin_film'] = self.category == 'deposition'
+
+        # The time series of the step are kept as np.arrays, all sharing the
+        # same time vector
+        self.step_time = self.get_step_time()
+
+        # Get the step environment parameters
+        params = self.get_step_environment_params(params)
+        # Get the sources parameters
+        params = self.get_step_sources_params(params, source_list)
+        # get the sputter_parameters
+
+        return params
+
+    # method to get the time of the rows of the event, in seconds from its
+    # first row, as a np.array
+    def get_step_time(self):
+        return (
+            (self.data['Time Stamp'] - self.data['Time Stamp'].iloc[0])
+            .dt.total_seconds()
+            .to_numpy()
+        )
+
+    # method to get a column of the event data as a np.array (float by default)
+    def get_step_series(self, col, dtype=np.float64):
+        return self.data[col].to_numpy(dtype=dtype)
+
+    # method to compute the statistics (EVENT_STATS) of the given numeric
+    # columns of the data in a single pass, over a float np.array of the
+    # columns, and add them (as floats) to the cached statistics of the event.
+    # The columns with missing values are reduced by pandas, which skips them
+    def cache_stats(self, columns):
+        with self._stats_lock:
+            dtypes = self.data.dtypes
+            columns = [
+                col
+                for col in dict.fromkeys(columns)
+                if col not in self._stats
+                and col in dtypes.index
+                and pd.api.types.is_numeric_dtype(dtypes[col])
+            ]
+            if not columns or self.data.empty:
+                return
+            values = np.asfortranarray(self.data[columns].to_numpy(dtype=np.float64))
+            column_stats = zip(
+                values.mean(axis=0),
+                values.min(axis=0),
+                values.max(axis=0),
+                values[0],
+                values[-1],
+            )
+            missing = np.isnan(values).any(axis=0)
+            for col, stats, has_missing in zip(columns, column_stats, missing):
+                self._stats[col] = dict(
+                    zip(
+                        EVENT_STATS,
+                        [get_column_stat(self.data[col], stat) for stat in EVENT_STATS]
+                        if has_missing
+                        else stats,
+                    )
+                )
+
+    # method to get a statistic of a column of the data (one of EVENT_STATS,
+    # or the name of a reduction of pd.Series, Ex: 'std') from the cached
+    # statistics, computing and caching those of the column if needed
+    def get_stat(self, col, stat='mean'):
+        with self._stats_lock:
+            if col not in self._stats:
+                self.cache_stats([col])
+            if col not in self._stats:
+                return get_column_stat(self.data[col], stat)
+            stats = self._stats[col]
+            if stat not in stats:
+                stats[stat] = get_column_stat(self.data[col], stat)
+            return stats[stat]
+
+    # method to extract the so called environment parameters (gases, sources, etc)
+    # of single steps
+    def get_step_environment_params(self, params):
+        # Extract the gas flow parameters
+
+        # initialize the dictionaries
+        params[self.step_id]['environment'] = {}
+        params[self.step_id]['environment']['gas_flow'] = {}
+        params[self.step_id]['environment']['pressure'] = {}
+        params[self.step_id]['environment']['heater'] = {}
+
+        for gas_name in ['ar', 'ph3', 'h2s']:
+            # initialize the gas_flow dictionary
+            gas_flow = {}
+
+            gas_flow['gas'] = {}
+            gas_flow['flow_rate'] = {}
+
+            gas_flow['gas_name'] = gas_name
+            # In the following entry, we add the time series of the
+            # corresponding gas flow rate
+            # params[self.step_id]['environment']['gas_flow'][gas_name]['flow_rate'][
+            #     'set_value'
+            # ] = self.data[f'PC MFC {GAS_NUMBER[gas_name]} Setpoint'].iloc[-1]
+            # In the following entry, we set the value of the gas flow rate
+            gas_flow['flow_rate']['value'] = self.get_step_series(
+                f'PC MFC {GAS_NUMBER[gas_name]} Flow'
+            )
+            # In the following entry, we set the time values
+            gas_flow['flow_rate']['time'] = self.step_time
+            gas_flow['flow_rate']['measurement_type'] = 'Mass Flow Controller'
+            gas_flow['gas']['name'] = gas_name
+
+            params[self.step_id]['environment']['gas_flow'][gas_name] = gas_flow
+
+        # Extract the pressure parameters
+        if (self.data['PC Capman Pressure'] < CAPMAN_PRESSURE_THRESHOLD).all():
+            pressure_col = 'PC Wide Range Gauge'
+        elif (self.data['PC Wide Range Gauge'] > CAPMAN_PRESSURE_THRESHOLD).all():
+            pressure_col = 'PC Capman Pressure'
+        else:
+            pressure_col = None
+
+        if pressure_col is not None:
+            # Extract the pressure parameters
+
+            # params[self.step_id]['environment']['pressure']['set_time'] = [
+            #     start_time.to_pydatetime()
+            # ]
+            # params[self.step_id]['environment']['pressure']['set_value'] = [
+            #     self.data[
+            #     pressure_col
+            # ].iloc[-1]
+            # ]
+            params[self.step_id]['environment']['pressure']['time'] = self.step_time
+            params[self.step_id]['environment']['pressure']['value'] = (
+                self.get_step_series(pressure_col)
+            )
+
+        # Extract the heater parameters
+
+        return params
+
+    # method to extract the so called sources parameters of single steps
+    def get_step_sources_params(self, params, source_list):
+        # helper method to deduce the plasma type of the source during deposition
+
+        # initialize the sources dictionary
+        if 'sources' not in params[self.step_id]:
+            params[self.step_id]['sources'] = {}
+
+        for source_number in source_list:
+            source_name = f'{SOURCE_NAME[str(source_number)]}'
+
+            # get the power type of the source (incidentally, it also tells us if the
+            # source was used e.g. if power_type is not None)
+            power_type = self.get_power_type(source_number)
+            if (f'Source {source_number} Output Setpoint' in self.data.columns) and (
+                power_type is not None
+            ):
+                params = self.get_sputter_sources_step_params(
+                    source_name, params, power_type, source_number
+                )
+
+        # check is the cracker zone 1 above the threshold
+        if 'Sulfur Cracker Zone 1 Current Temperature' in self.data.columns:
+            if (
+                self.data['Sulfur Cracker Zone 1 Current Temperature'].mean()
+                > CRACKER_ZONE_1_MIN_TEMP
+            ):
+                params = self.get_s_cracker_step_params(params)
+
+            # params = self.get_reactive_gas_step_params(params)
+
+        return params
+
+    # def get_reactive_gas_step_params(self, params):
+    #     return params
+
+    def get_s_cracker_step_params(self, params):
+        # Initialize the source dictionary if it does not exist
+        if 's_cracker' not in params[self.step_id]['sources']:
+            params[self.step_id]['sources']['s_cracker'] = {}
+            params[self.step_id]['sources']['s_cracker']['zone1_temp'] = {}
+            params[self.step_id]['sources']['s_cracker']['zone2_temp'] = {}
+            params[self.step_id]['sources']['s_cracker']['zone3_temp'] = {}
+            params[self.step_id]['sources']['s_cracker']['valve_on_time'] = {}
+            params[self.step_id]['sources']['s_cracker']['valve_frequency'] = {}
+            params[self.step_id]['sources']['s_cracker']['valve_pulsing'] = {}
+
+        # check if the cracker is recorded by the log
+        if 'Sulfur Cracker Zone 1 Current Temperature' not in self.data.columns:
+            params[self.step_id]['sources']['s_cracker']['cracker_record'] = False
+        else:
+            params[self.step_id]['sources']['s_cracker']['cracker_record'] = True
+
+        # get the time series in seconds from the start of the step
+        time_series = self.step_time
+
+        for zone_number in ['1', '2', '3']:
+            # Extract the cracker zone temperature
+            params[self.step_id]['sources']['s_cracker'][
+                f'avg_zone{zone_number}_temp'
+            ] = self.data[
+                f'Sulfur Cracker Zone {zone_number} Current Temperature'
+            ].mean()
+            params[self.step_id]['sources']['s_cracker'][f'zone{zone_number}_temp'][
+                'value'
+            ] = self.get_step_series(
+                f'Sulfur Cracker Zone {zone_number} Current Temperature'
+            )
+            params[self.step_id]['sources']['s_cracker'][f'zone{zone_number}_temp'][
+                'time'
+            ] = time_series
+
+        # Extract the cracker valve on time
+        params[self.step_id]['sources']['s_cracker']['avg_valve_on_time'] = self.data[
+            'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'
+        ].mean()
+        params[self.step_id]['sources']['s_cracker']['valve_on_time']['value'] = (
+            self.get_step_series(
+                'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'
+            )
+        )
+        params[self.step_id]['sources']['s_cracker']['valve_on_time']['time'] = (
+            time_series
+        )
+
+        # Extract the cracker valve frequency
+        params[self.step_id]['sources']['s_cracker']['avg_valve_frequency'] = self.data[
+            'Sulfur Cracker Control Setpoint Feedback'
+        ].mean()
+        params[self.step_id]['sources']['s_cracker']['valve_frequency']['value'] = (
+            self.get_step_series('Sulfur Cracker Control Setpoint Feedback')
+        )
+        params[self.step_id]['sources']['s_cracker']['valve_frequency']['time'] = (
+            time_series
+        )
+
+        # extract if the cracker valve is pulsing (enabled) as a boolean series
+        params[self.step_id]['sources']['s_cracker']['valve_pulsing']['value'] = (
+            self.get_step_series('Sulfur Cracker Control Enabled', dtype=bool)
+        )
+        params[self.step_id]['sources']['s_cracker']['valve_pulsing']['time'] = (
+            time_series
+        )
+        # extract the mode value of the valve pulsing
+        params[self.step_id]['sources']['s_cracker']['valve_pulsing']['mode_value'] = (
+            bool(self.data['Sulfur Cracker Control Enabled'].value_counts().idxmax())
+        )
+
+        return params
+
+    def get_sputter_sources_step_params(
+        self, source_name, params, power_type, source_number
+    ):
+        # Initialize the source dictionary if it does not exist
+        if source_name not in params[self.step_id]['sources']:
+            params[self.step_id]['sources'][source_name] = {}
+            params[self.step_id]['sources'][source_name]['power_supply'] = {}
+            params[self.step_id]['sources'][source_name]['material'] = {}
+            params[self.step_id]['sources'][source_name]['source_shutter_open'] = {}
+
+        # Extract the source source id
+        params[self.step_id]['sources'][source_name]['name'] = source_name
+        params[self.step_id]['sources'][source_name]['target_id'] = self.data[
+            f'PC Source {source_number} Loaded Target'
+        ].iloc[0]
+
+        # extract the state of the source shutter
+        params[self.step_id]['sources'][source_name]['source_shutter_open']['value'] = (
+            self.get_step_series(f'PC Source {source_number} Shutter Open', dtype=bool)
+        )
+        params[self.step_id]['sources'][source_name]['source_shutter_open']['time'] = (
+            self.step_time
+        )
+        # we check if the shutter is open during more than the TOLERANCE
+        params[self.step_id]['sources'][source_name]['source_shutter_open'][
+            'mode_value'  # most common value
+        ] = bool(
+            self.data[f'PC Source {source_number} Shutter Open'].value_counts().idxmax()
+        )
+
+        # extract the power supply parameters
+        params[self.step_id]['sources'][source_name]['power_supply']['power_type'] = (
+            power_type
+        )
+
+        # get the time series in seconds from the start of the step
+        time_series = self.step_time
+        # Extract the source power setpoint
+        params[self.step_id]['sources'][source_name]['power_supply']['avg_power_sp'] = (
+            self.data[f'Source {source_number} Output Setpoint'].mean()
+        )
+        params[self.step_id]['sources'][source_name]['power_supply']['power_sp'] = {}
+        params[self.step_id]['sources'][source_name]['power_supply']['power_sp'][
+            'value'
+        ] = self.get_step_series(f'Source {source_number} Output Setpoint')
+        params[self.step_id]['sources'][source_name]['power_supply']['power_sp'][
+            'time'
+        ] = time_series
+
+        if f'Source {source_number} Current' in self.data.columns:
+            params[self.step_id]['sources'][source_name]['power_supply'][
+                'avg_current'
+            ] = self.data[f'Source {source_number} Current'].mean()
+            params[self.step_id]['sources'][source_name]['power_supply']['current'] = {}
+            params[self.step_id]['sources'][source_name]['power_supply']['current'][
+                'value'
+            ] = self.get_step_series(f'Source {source_number} Current')
+            params[self.step_id]['sources'][source_name]['power_supply']['current'][
+                'time'
+            ] = time_series
+
+        # the quantities common to dc and plused
+        # dc power supplies (avg and as time series)
+        if power_type in ['DC', 'pulsed_DC']:
+            params = self.get_dc_power_supply_params(
+                source_name, source_number, power_type, time_series, params
+            )
+
+        elif power_type == 'RF':
+            params = self.get_rf_power_supply_params(
+                source_name, source_number, time_series, params
+            )
+
+        return params
+
+    def get_rf_power_supply_params(
+        self, source_name, source_number, time_series, params
+    ):
+        # Extract the source dc bias setpoint
+        params[self.step_id]['sources'][source_name]['power_supply']['avg_dc_bias'] = (
+            self.data[f'Source {source_number} DC Bias'].mean()
+        )
+        params[self.step_id]['sources'][source_name]['power_supply']['dc_bias'] = {}
+        params[self.step_id]['sources'][source_name]['power_supply']['dc_bias'][
+            'value'
+        ] = self.get_step_series(f'Source {source_number} DC Bias')
+        params[self.step_id]['sources'][source_name]['power_supply']['dc_bias'][
+            'time'
+        ] = time_series
+
+        # Extract the fwd power
+        params[self.step_id]['sources'][source_name]['power_supply'][
+            'avg_fwd_power'
+        ] = self.data[f'Source {source_number} Fwd Power'].mean()
+        params[self.step_id]['sources'][source_name]['power_supply']['fwd_power'] = {}
+        params[self.step_id]['sources'][source_name]['power_supply']['fwd_power'][
+            'value'
+        ] = self.get_step_series(f'Source {source_number} Fwd Power')
+        params[self.step_id]['sources'][source_name]['power_supply']['fwd_power'][
+            'time'
+        ] = time_series
+
+        # Extract the rfl power
+        params[self.step_id]['sources'][source_name]['power_supply'][
+            'avg_rfl_power'
+        ] = self.data[f'Source {source_number} Rfl Power'].mean()
+        params[self.step_id]['sources'][source_name]['power_supply']['rfl_power'] = {}
+        params[self.step_id]['sources'][source_name]['power_supply']['rfl_power'][
+            'value'
+        ] = self.get_step_series(f'Source {source_number} Rfl Power')
+        params[self.step_id]['sources'][source_name]['power_supply']['rfl_power'][
+            'time'
+        ] = time_series
+
+        return params
+
+    def get_dc_power_supply_params(
+        self, source_name, source_number, power_type, time_series, params
+    ):
+        params[self.step_id]['sources'][source_name]['power_supply']['avg_voltage'] = (
+            self.data[f'Source {source_number} Voltage'].mean()
+        )
+        params[self.step_id]['sources'][source_name]['power_supply']['voltage'] = {}
+        params[self.step_id]['sources'][source_name]['power_supply']['voltage'][
+            'value'
+        ] = self.get_step_series(f'Source {source_number} Voltage')
+        params[self.step_id]['sources'][source_name]['power_supply']['voltage'][
+            'time'
+        ] = time_series
+
+        params[self.step_id]['sources'][source_name]['power_supply']['avg_current'] = (
+            self.data[f'Source {source_number} Current'].mean()
+        )
+        params[self.step_id]['sources'][source_name]['power_supply']['current'] = {}
+        params[self.step_id]['sources'][source_name]['power_supply']['current'][
+            'value'
+        ] = self.get_step_series(f'Source {source_number} Current')
+        params[self.step_id]['sources'][source_name]['power_supply']['current'][
+            'time'
+        ] = time_series
+
+        # Extract the pulse frequency and dead time if applicable
+        # (avg and as time series)
+        if power_type == 'pulsed_DC':
+            params[self.step_id]['sources'][source_name]['power_supply'][
+                'avg_pulse_frequency'
+            ] = self.data[f'Source {source_number} Pulse Frequency'].mean()
+            params[self.step_id]['sources'][source_name]['power_supply'][
+                'pulse_frequency'
+            ] = {}
+            params[self.step_id]['sources'][source_name]['power_supply'][
+                'pulse_frequency'
+            ]['value'] = self.get_step_series(f'Source {source_number} Pulse Frequency')
+            params[self.step_id]['sources'][source_name]['power_supply'][
+                'pulse_frequency'
+            ]['time'] = time_series
+
+            params[self.step_id]['sources'][source_name]['power_supply'][
+                'avg_dead_time'
+            ] = self.data[f'Source {source_number} Reverse Time'].mean()
+            params[self.step_id]['sources'][source_name]['power_supply'][
+                'dead_time'
+            ] = {}
+            params[self.step_id]['sources'][source_name]['power_supply']['dead_time'][
+                'value'
+            ] = self.get_step_series(f'Source {source_number} Reverse Time')
+            params[self.step_id]['sources'][source_name]['power_supply']['dead_time'][
+                'time'
+            ] = time_series
+
+        return params
+
+    def get_power_type(self, source_number):
+        dc_current_col = f'Source {source_number} Current'
+        rf_bias_col = f'Source {source_number} DC Bias'
+        pulse_enable_col = f'Source {source_number} Pulse Enable'
+        fwd_power_col = f'Source {source_number} Fwd Power'
+        rfl_power_col = f'Source {source_number} Rfl Power'
+
+        power_type = None
+
+        # We tolerate a certain percentage of the data to be below the threshold
+        if dc_current_col in self.data and (
+            (self.data[dc_current_col] > CURRENT_THRESHOLD).mean() >= TOLERANCE
+        ):
+            if pulse_enable_col in self.data and (
+                self.data[pulse_enable_col].mean() >= POWER_TYPE_TOLERANCE
+            ):
+                power_type = 'pulsed_DC'
+            else:
+                power_type = 'DC'
+        elif rf_bias_col in self.data and (
+            (self.data[rf_bias_col] > BIAS_THRESHOLD).mean() >= POWER_TYPE_TOLERANCE
+            or (
+                (self.data[fwd_power_col] - self.data[rfl_power_col])
+                > POWER_FWD_RFL_THRESHOLD
+            ).mean()
+            >= POWER_TYPE_TOLERANCE
+        ):
+            power_type = 'RF'
+        return power_type
+
+
+class Deposition_Event(Lf_Event):
+    def __init__(self, *args, **kwargs):
+        kwargs.pop('category', None)
+
+        super().__init__(*args, category='deposition', **kwargs)
+        self.step_id = self.generate_step_id()
+
+    # master parameters extraction method for the deposition event
+    def get_params(
+        self, raw_data=None, source_list=None, params=None, interrupt_deposition=False
+    ):
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+
+        # Extract if the deposition has beem interrupted based the interrupt_deposition
+        # flag
+        if interrupt_deposition:
+            params[self.category]['interrupted'] = True
+        else:
+            params[self.category]['interrupted'] = False
+
+        params = self.get_rt_bool(params=params)
+        params = self.get_source_used_deposition(source_list, params=params)
+        # The statistics of the columns looked up by the methods below are
+        # computed in a single pass over the data of the event
+        self.cache_stats(self.get_stats_columns(source_list, params))
+        params = self.get_cracker_params(params=params)
+        params = self.get_pressure_params(raw_data, params=params)
+        params = self.get_simple_deposition_params(params=params)
+        params = self.get_source_depostion_params(source_list, params=params)
+        params = self.get_platen_bias_params(params=params)
+        return params
+
+    # method to list the columns whose statistics are looked up by get_params,
+    # the columns of the sources only being looked up for the enabled sources
+    def get_stats_columns(self, source_list, params):
+        columns = [
+            'Sulfur Cracker Zone 1 Current Temperature',
+            'Sulfur Cracker Zone 2 Current Temperature',
+            'Sulfur Cracker Zone 3 Current Temperature',
+            'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback',
+            'Sulfur Cracker Control Setpoint Feedback',
+            'Substrate Rotation_Position',
+            'Substrate Heater Temperature',
+            'Substrate Heater Temperature 2',
+            'Substrate Heater Temperature Setpoint',
+            'PC Capman Pressure',
+            *[f'PC MFC {GAS_NUMBER[gas]} Flow' for gas in ['ar', 'ph3', 'h2s']],
+            'Power Supply 7 Output Setpoint',
+            'Power Supply 7 DC Bias',
+        ]
+        for source_number in source_list:
+            if not params[self.category][SOURCE_NAME[str(source_number)]]['enabled']:
+                continue
+            columns += [
+                f'Source {source_number} Output Setpoint',
+                f'Source {source_number} Pulse Frequency',
+                f'Source {source_number} Reverse Time',
+                f'Source {source_number} Voltage',
+                f'Source {source_number} DC Bias',
+            ]
+        return columns
+
+    # method to deduce if the deposition was done at room temperature or not
+    def get_rt_bool(self, params=None):
+        # Extract if the deposition was done at room temperature as :
+        # - the temperature control is disabled or
+        # - the temperature control is enabled but the temperature setpoint
+        # is below the RT threshold defined in the reference values
+
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+
+        if (
+            self.data['Substrate Heater Temperature Setpoint'] < RT_TEMP_THRESHOLD
+        ).mean() >= TOLERANCE:
+            params[self.category]['rt'] = True
+        elif (
+            self.data['Substrate Heater Temperature Setpoint'] > RT_TEMP_THRESHOLD
+        ).mean() >= TOLERANCE:
+            params[self.category]['rt'] = False
+        return params
+
+    # method to extrac the sources used for deposition
+    def get_source_used_deposition(self, source_list, params=None):
+        # Extract the source used for deposition
+        # For all sources, we check if the source is enabled during deposition
+        # and if it is, we set the source as the source enabled for deposition
+        # which implies that the source was also ramped up and presputtered
+
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+        for source_number in source_list:
+            if f'{SOURCE_NAME[str(source_number)]}' not in params[self.category]:
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'] = {}
+
+        for source_number in source_list:
+            if get_column(self.data, f'Source {source_number} Enabled').all():
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'enabled'
+                ] = True
+            else:
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'enabled'
+                ] = False
+
+        return params
+
+    # method to extract the s_cracker parameters
+    def get_cracker_params(self, params=None):
+        # Extract if the cracker has been used during deposition as the
+        # cracker control being enabled and the temperatures of the
+        # different zones being above the minimum temperatures
+        # defined in the reference values
+
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+        if 's_cracker' not in params[self.category]:
+            params[self.category]['s_cracker'] = {}
+
+        if 'Sulfur Cracker Zone 1 Current Temperature' in self.data.columns:
+            if (
+                (self.data['Sulfur Cracker Control Enabled'] == 1).mean() >= TOLERANCE
+                and (
+                    self.data['Sulfur Cracker Zone 1 Current Temperature']
+                    > CRACKER_ZONE_1_MIN_TEMP
+                ).all()
+                and (
+                    self.data['Sulfur Cracker Zone 2 Current Temperature']
+                    > CRACKER_ZONE_2_MIN_TEMP
+                ).all()
+                and (
+                    self.data['Sulfur Cracker Zone 3 Current Temperature']
+                    > CRACKER_ZONE_3_MIN_TEMP
+                ).all()
+            ):
+                params[self.category]['s_cracker']['enabled'] = True
+                params[self.category]['s_cracker']['zone1_temp'] = self.get_stat(
+                    'Sulfur Cracker Zone 1 Current Temperature'
+                )
+                params[self.category]['s_cracker']['zone2_temp'] = self.get_stat(
+                    'Sulfur Cracker Zone 2 Current Temperature'
+                )
+                params[self.category]['s_cracker']['zone3_temp'] = self.get_stat(
+                    'Sulfur Cracker Zone 3 Current Temperature'
+                )
+                params[self.category]['s_cracker']['pulse_width'] = self.get_stat(
+                    'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'
+                )
+                params[self.category]['s_cracker']['pulse_freq'] = self.get_stat(
+                    'Sulfur Cracker Control Setpoint Feedback'
+                )
+            else:
+                params[self.category]['s_cracker']['enabled'] = False
+        else:
+            params[self.category]['s_cracker']['enabled'] = False
+        return params
+
+    # method to extract important pressure parameters
+    def get_pressure_params(self, raw_data, params=None):
+        # Extract the some base pressure metric as the lowest positive
+        # pressure recorded before deposition (but only if
+        # it is below 1-6Torr). If the cracker is enabled, then this metric is not
+        # representative of the true base pressure and we set the
+        # true_base_pressure_meas to False to indicate that the true base
+        # pressure is not measured accurately: If the cracker is not enabled,
+        # then the base pressure is measured accurately and we set the
+        # true_base_pressure_meas to True
+
+        if params is None:
+            params = {}
+        if 'overview' not in params:
+            params['overview'] = {}
+        if 'deposition' not in params:
+            raise ValueError('Missing deposition info, run get_cracker_params first')
+
+        min_pressure_before_depostion = raw_data.loc[
+            get_time_stamps(raw_data) <= self.data['Time Stamp'].iloc[0],
+            'PC Wide Range Gauge',
+        ].min()
+
+        params['overview']['lower_pressure_before_deposition'] = (
+            min_pressure_before_depostion
+        )
+        if min_pressure_before_depostion < MAX_BASE_PRESSURE:
+            if not params[self.category]['s_cracker']['enabled']:
+                params['overview']['true_base_pressure_meas'] = True
+            elif params[self.category]['s_cracker']['enabled']:
+                params['overview']['true_base_pressure_meas'] = False
+        else:
+            params['overview']['true_base_pressure_meas'] = False
+
+        return params
+
+    # method to extract simple deposition parameters, that are not source specific
+    def get_simple_deposition_params(self, params=None):
+        # helper method to calculate the partial pressure of a gas
+        def add_partial_pressures(gas, params):
+            params[self.category][f'avg_{gas}_partial_pressure'] = (
+                params[self.category]['avg_capman_pressure']
+                * 0.1
+                * params[self.category][f'avg_{gas}_flow']
+                / (
+                    params[self.category]['avg_ar_flow']
+                    + params[self.category]['avg_ph3_flow']
+                    + params[self.category]['avg_h2s_flow']
+                )
+            )
+            return params
+
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+
+        # Extract the platen position during deposition
+        if 'Substrate Rotation_Position' in self.data:
+            params[self.category]['platen_position'] = self.get_stat(
+                'Substrate Rotation_Position'
+            )
+
+        # Extract start and end time of the deposition
+        params[self.category]['start_time'] = self.data['Time Stamp'].iloc[0]
+        params[self.category]['end_time'] = self.data['Time Stamp'].iloc[-1]
+        params[self.category]['duration'] = (
+            params[self.category]['end_time'] - params[self.category]['start_time']
+        )
+
+        # Extract average temperature during deposition
+        params[self.category]['avg_temp_1'] = self.get_stat(
+            'Substrate Heater Temperature'
+        )
+        params[self.category]['avg_temp_2'] = self.get_stat(
+            'Substrate Heater Temperature 2'
+        )
+        params[self.category]['avg_temp_setpoint'] = self.get_stat(
+            'Substrate Heater Temperature Setpoint'
+        )
+
+        # Extract the average true temperature during deposition
+        params[self.category]['avg_true_temp'] = calculate_avg_true_temp(
+            params[self.category]['avg_temp_1'], params[self.category]['avg_temp_2']
+        )
+
+        # Extract average sputter PC Capman pressure during deposition
+        params[self.category]['avg_capman_pressure'] = self.get_stat(
+            'PC Capman Pressure'
+        )
+
+        for gas in ['ar', 'ph3', 'h2s']:
+            params[self.category][f'avg_{gas}_flow'] = self.get_stat(
+                f'PC MFC {GAS_NUMBER[gas]} Flow'
+            )
+
+        # calculate the partial pressure of the gases
+        for gas in ['ph3', 'h2s']:
+            params = add_partial_pressures(gas, params)
+
+        # calculate the ratio between the PH3 and H2S flow
+        if (
+            params[self.category]['avg_h2s_flow'] > MFC_FLOW_THRESHOLD
+            and params[self.category]['avg_ph3_flow'] > MFC_FLOW_THRESHOLD
+        ):
+            params[self.category]['ph3_h2s_ratio'] = (
+                params[self.category]['avg_ph3_flow']
+                / params[self.category]['avg_h2s_flow']
+            )
+
+        return params
+
+    # method to extract the source specific parameters of the deposition event.
+    # this method uses different sub-methods to extract the parameters of the
+    # sources used during deposition
+    def get_source_depostion_params(self, source_list, params=None):
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+        elements = []
+
+        # The parameters of each source are stored in their own dictionary, so
+        # the sources can be evaluated at the same time (see map_sources)
+        def get_source_params(source_number):
+            source_elements = []
+            if params[self.category][f'{SOURCE_NAME[str(source_number)]}']['enabled']:
+                self.get_avg_output_power(params, source_number)
+                self.get_plasma_type(params, source_number)
+                self.get_deposition_voltage(params, source_number)
+                # Extract source material and target id and the elements of
+                # the source for the material space extraction
+                _, source_elements = self.get_source_material_and_target(
+                    params, source_number, source_elements
+                )
+            return source_elements
+
+        # The elements of the sources are merged in the order of the sources
+        for source_elements in map_sources(get_source_params, source_list):
+            for element in source_elements:
+                if element not in elements:
+                    elements.append(element)
+        # Extract the material space as the elements used during deposition
+        if (
+            'P' not in elements
+            and params[self.category]['avg_ph3_flow'] > MFC_FLOW_THRESHOLD
+        ):
+            elements += ['P']
+        if 'S' not in elements and (
+            (params[self.category]['avg_h2s_flow'] > MFC_FLOW_THRESHOLD)
+            or (params[self.category]['s_cracker']['enabled'])
+        ):
+            elements += ['S']
+            # add the element as an hypen separated string
+        params[self.category]['material_space'] = '-'.join(elements)
+        return params
+
+    # method to deduce the average output power of the source during deposition
+    def get_avg_output_power(self, params, source_number):
+        params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+            'avg_output_power'
+        ] = self.get_stat(f'Source {source_number} Output Setpoint')
+        return params
+
+    # method to deduce the plasma type of the source during deposition
+    def get_plasma_type(self, params, source_number):
+        dc_current_col = f'Source {source_number} Current'
+        rf_bias_col = f'Source {source_number} DC Bias'
+        pulse_enable_col = f'Source {source_number} Pulse Enable'
+        fwd_power_col = f'Source {source_number} Fwd Power'
+        rfl_power_col = f'Source {source_number} Rfl Power'
+
+        # We tolerate a certain percentage of the data to be below the threshold
+        if dc_current_col in self.data and (
+            (self.data[dc_current_col] > CURRENT_THRESHOLD).mean() >= TOLERANCE
+        ):
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}']['DC'] = True
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}']['RF'] = False
+            if pulse_enable_col in self.data and (
+                (self.data[pulse_enable_col] == 1).mean() >= TOLERANCE
+            ):
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'pulsed'
+                ] = True
+
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'plasma_type'
+                ] = 'pulsed_DC'
+
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'pulse_frequency'
+                ] = self.get_stat(f'Source {source_number} Pulse Frequency')
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'dead_time'
+                ] = self.get_stat(f'Source {source_number} Reverse Time')
+            else:
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'pulsed'
+                ] = False
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'plasma_type'
+                ] = 'DC'
+        elif rf_bias_col in self.data and (
+            (self.data[rf_bias_col] > BIAS_THRESHOLD).mean() >= TOLERANCE
+            or (
+                (self.data[fwd_power_col] - self.data[rfl_power_col])
+                > POWER_FWD_RFL_THRESHOLD
+            ).mean()
+            >= TOLERANCE
+        ):
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}']['RF'] = True
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                'plasma_type'
+            ] = 'RF'
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}']['DC'] = False
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}']['pulsed'] = (
+                False
+            )
+        else:
+            print('Error: Plasma type not recognized')
+        return params
+
+    # method to deduce the deposition voltage of the source during deposition
+    def get_deposition_voltage(self, params, source_number):
+        # the average, min, max and std of the voltage are looked up in the
+        # cached statistics of the event
+        def extract_voltage_stats(col):
+            data = self.data[col]
+            start_voltage = data.iloc[
+                : int(FRAQ_ROWS_AVG_VOLTAGE * 0.01 * len(data))
+            ].mean()
+            end_voltage = data.iloc[
+                -int(FRAQ_ROWS_AVG_VOLTAGE * 0.01 * len(data)) :
+            ].mean()
+            min_voltage = self.get_stat(col, 'min')
+            max_voltage = self.get_stat(col, 'max')
+            return {
+                'start_voltage': start_voltage,
+                'end_voltage': end_voltage,
+                'avg_voltage': self.get_stat(col),
+                'min_voltage': min_voltage,
+                'max_voltage': max_voltage,
+                'std_voltage': self.get_stat(col, 'std'),
+                'range_voltage': max_voltage - min_voltage,
+                'start_minus_end_voltage': start_voltage - end_voltage,
+            }
+
+        source_key = f'{SOURCE_NAME[f"{source_number}"]}'
+        category = params[self.category][source_key]
+
+        if category['DC']:
+            voltage_col = f'Source {source_number} Voltage'
+        elif category['RF']:
+            voltage_col = f'Source {source_number} DC Bias'
+        else:
+            return params
+
+        voltage_stats = extract_voltage_stats(voltage_col)
+        for key, value in voltage_stats.items():
+            category[key] = value
+
+        return params
+
+    # method to deduce the source material and target of the source during deposition
+    def get_source_material_and_target(self, params, source_number, elements):
+        source_material = self.data[f'PC Source {source_number} Material'].iloc[0]
+        elements, material = elements_from_string(source_material, elements)
+
+        params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+            'target_material'
+        ] = material
+        params[self.category][f'{SOURCE_NAME[str(source_number)]}']['target_id'] = (
+            self.data[f'PC Source {source_number} Loaded Target'].iloc[0]
+        )
+        return params, elements
+
+    def get_platen_bias_params(self, params=None):
+        # Extract the platen bias during deposition
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+
+        params[self.category]['platen_bias'] = {}
+
+        if 'Power Supply 7 Output Setpoint' in self.data:
+            if (
+                self.data['Power Supply 7 DC Bias'] > BIAS_THRESHOLD
+            ).mean() >= TOLERANCE:
+                params[self.category]['platen_bias']['enabled'] = True
+            else:
+                params[self.category]['platen_bias']['enabled'] = False
+        else:
+            params[self.category]['platen_bias']['enabled'] = False
+
+        if params[self.category]['platen_bias']['enabled']:
+            params[self.category]['platen_bias']['platen_power'] = self.get_stat(
+                'Power Supply 7 Output Setpoint'
+            )
+            params[self.category]['platen_bias']['avg_platen_bias'] = self.get_stat(
+                'Power Supply 7 DC Bias'
+            )
+
+        return params
+
+
+class SCracker_Pressure_Event(Lf_Event):
+    def __init__(self, *args, **kwargs):
+        kwargs.pop('category', None)
+
+        super().__init__(*args, category='cracker_base_pressure', **kwargs)
+        self.step_id = self.generate_step_id()
+
+    # method to extract the pressure induced by the cracker
+    def get_params(self, raw_data=None, source_list=None, params=None):
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+
+        # Extract the S induced base pressure as the mean pressure during
+        # the cracker being on and no gas being flown
+        if not self.data.empty:
+            params[self.category]['cracker_pressure_meas'] = True
+            params[self.category]['cracker_pressure'] = self.data[
+                'PC Wide Range Gauge'
+            ].mean()
+        else:
+            params['cracker_pressure_meas'] = False
+        return params
+
+
+class Source_Presput_Event(Lf_Event):
+    def __init__(self, *args, **kwargs):
+        kwargs.pop('category', None)
+
+        super().__init__(*args, category='source_presput', **kwargs)
+
+        self.step_id = self.generate_step_id()
+
+    # method to extract source dependent presputtering parameters
+    def get_params(self, raw_data=None, source_list=None, params=None):
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+
+        source_number = self.source
+        if f'{SOURCE_NAME[str(source_number)]}' not in params[self.category]:
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}'] = {}
+
+        # We check if the source is enabled during deposition
+        if params['deposition'][f'{SOURCE_NAME[str(source_number)]}']['enabled']:
+            # ----source presputtering parameters-----
+            # Extract the presputtering duration
+            presput_duration = 0
+            for i in range(len(self.bounds)):
+                presput_duration += (
+                    self.bounds[i][1] - self.bounds[i][0]
+                ).total_seconds()
+            presput_duration = pd.to_timedelta(presput_duration, unit='s')
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}']['duration'] = (
+                presput_duration
+            )
+            # Extract the average output power during presputtering
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                'avg_output_power'
+            ] = self.data[f'Source {source_number} Output Setpoint'].mean()
+            # Extract the avg capman pressure during presputtering
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                'avg_capman_pressure'
+            ] = self.data['PC Capman Pressure'].mean()
+            # Extract the gas flows during presputtering
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                'avg_ar_flow'
+            ] = self.data['PC MFC 1 Flow'].mean()
+        return params
+
+
+class Source_Ramp_Up_Event(Lf_Event):
+    def __init__(self, *args, **kwargs):
+        kwargs.pop('category', None)
+        super().__init__(*args, category='source_ramp_up', **kwargs)
+        self.step_id = self.generate_step_id()
+
+    # method to extract the source ramp up and ignition parameters
+    def get_params(self, raw_data=None, source_list=None, params=None):
+        # Here, we interate over the sources to extract many relevant parameters
+
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+
+        source_number = self.source
+        if f'{SOURCE_NAME[str(source_number)]}' not in params[self.category]:
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}'] = {}
+        # We check if the source is enabled during deposition
+        if params['deposition'][f'{SOURCE_NAME[str(source_number)]}']['enabled']:
+            # Extract the plasma ignition power as the power at which
+            # the plasma really ignites
+            # We first filter only the last [-1] source ramp up event with the
+            # event filter function
+            # The mask is only computed on the rows of the ramp up, the
+            # missing columns defaulting to 0
+            current = get_column_values(self.data, f'Source {source_number} Current')
+            bias = get_column_values(self.data, f'Source {source_number} DC Bias')
+            fwd_power = get_column_values(
+                self.data, f'Source {source_number} Fwd Power'
+            )
+            rfl_power = get_column_values(
+                self.data, f'Source {source_number} Rfl Power'
+            )
+            # Create a boolean mask for the conditions
+            mask = np.broadcast_to(
+                (current > CURRENT_THRESHOLD)
+                | (bias > BIAS_THRESHOLD)
+                | ((fwd_power - rfl_power) > POWER_FWD_RFL_THRESHOLD),
+                len(self.data),
+            )
+            # Apply the mask to get the moment where the plasma is on during
+            # ramp up
+            data_ignition_time = self.data.loc[mask]
+            # If the plasma turns on during ramp up, data_ignition_time should
+            # not be empty
+            if not data_ignition_time.empty:
+                ignition_time = data_ignition_time['Time Stamp'].iloc[0]
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'ignition'
+                ] = True
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'ignition_time'
+                ] = ignition_time
+                ignition_data = self.data[self.data['Time Stamp'] == ignition_time]
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'ignition_power'
+                ] = ignition_data[f'Source {source_number} Output Setpoint'].iloc[0]
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'ignition_pressure'
+                ] = ignition_data['PC Capman Pressure'].iloc[0]
+            else:
+                params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                    'source_ignition'
+                ] = False
+
+        return params
+
+
+class Sub_Ramp_Up_Event(Lf_Event):
+    def __init__(self, *args, **kwargs):
+        kwargs.pop('category', None)
+        super().__init__(*args, category='ramp_up_temp', **kwargs)
+        self.step_id = self.generate_step_id()
+
+    # method to extract the substrate ramp up parameters
+    def get_params(self, raw_data=None, source_list=None, params=None):
+        if 'deposition' not in params:
+            raise ValueError('Missing deposition info, run get_rt_bool first')
+        if self.category not in params:
+            params[self.category] = {}
+        if 's_cracker' not in params[self.category]:
+            params[self.category]['s_cracker'] = {}
+
+        if not params['deposition']['rt']:
+            # ------Extract the substrate ramp up parameters------
+            # Extract the slope assuming linear ramp up
+            # In data_ramp_up_temp only increasing setpoint temperature are
+            # considered making easier to extract the slope
+            params[self.category]['start_time'] = self.data['Time Stamp'].iloc[0]
+            params[self.category]['end_time'] = self.data['Time Stamp'].iloc[-1]
+            params[self.category]['duration'] = (
+                params[self.category]['end_time'] - params[self.category]['start_time']
+            )
+            temp_diff = (
+                self.data['Substrate Heater Temperature Setpoint'].iloc[-1]
+                - self.data['Substrate Heater Temperature Setpoint'].iloc[0]
+            )
+            time_interval_minutes = (
+                params[self.category]['duration'].total_seconds() / 60
+            )
+            params[self.category]['temp_slope'] = temp_diff / time_interval_minutes
+            # Extract the average capman pressure during the ramp up
+            params[self.category]['avg_capman_pressure'] = self.data[
+                'PC Capman Pressure'
+            ].mean()
+            # Extract the gas flows during the substrate ramp up
+
+            for gas in ['ar', 'ph3', 'h2s']:
+                params[self.category][f'avg_{gas}_flow'] = self.data[
+                    f'PC MFC {GAS_NUMBER[gas]} Flow'
+                ].mean()
+
+            # Extract if the cracker has been used during ramp up
+            # The column 'Sulfur Cracker Control Enabled' correspond to the
+            # act of opening the cracker pulse valve (1 open, 0 closed)
+            if 'Sulfur Cracker Zone 1 Current Temperature' in raw_data.columns:
+                if (
+                    (self.data['Sulfur Cracker Control Enabled'] == 1).mean()
+                    >= TOLERANCE
+                    and (
+                        self.data['Sulfur Cracker Zone 1 Current Temperature']
+                        > CRACKER_ZONE_1_MIN_TEMP
+                    ).all()
+                    and (
+                        self.data['Sulfur Cracker Zone 2 Current Temperature']
+                        > CRACKER_ZONE_2_MIN_TEMP
+                    ).all()
+                    and (
+                        self.data['Sulfur Cracker Zone 3 Current Temperature']
+                        > CRACKER_ZONE_3_MIN_TEMP
+                    ).all()
+                ):
+                    params[self.category]['s_cracker']['enabled'] = True
+                    # If the cracker has been used, extract the cracker parameters
+                    params[self.category]['s_cracker']['zone1_temp'] = self.data[
+                        'Sulfur Cracker Zone 1 Current Temperature'
+                    ].mean()
+                    params[self.category]['s_cracker']['zone2_temp'] = self.data[
+                        'Sulfur Cracker Zone 2 Current Temperature'
+                    ].mean()
+                    params[self.category]['s_cracker']['zone3_temp'] = self.data[
+                        'Sulfur Cracker Zone 3 Current Temperature'
+                    ].mean()
+                    params[self.category]['s_cracker']['pulse_width'] = self.data[
+                        'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'
+                    ].mean()
+                    params[self.category]['s_cracker']['pulse_freq'] = self.data[
+                        'Sulfur Cracker Control Setpoint Feedback'
+                    ].mean()
+                else:
+                    params[self.category]['s_cracker']['enabled'] = False
+            else:
+                params[self.category]['s_cracker']['enabled'] = False
+        return params
+
+
+class Sub_Ramp_Down_Event(Lf_Event):
+    def __init__(self, *args, **kwargs):
+        kwargs.pop('category', None)
+
+        super().__init__(*args, category='sub_ramp_down', **kwargs)
+
+        self.step_id = self.generate_step_id()
+
+    # method to extract the substatre temperature ramp down parameters,
+    def get_params(self, raw_data=None, source_list=None, params=None):
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+
+        if not params['depostion']['rt']:
+            # Extract the slope from when the temp in controled,
+            # assuming linear ramp up
+            # In data_ramp_down_temp only decreasing setpoint temperature are
+            # considered making easier to extract the slope
+            start_time = self.data['Time Stamp'].iloc[0]
+            end_time = self.data['Time Stamp'].iloc[-1]
+            time_interval = end_time - start_time
+            temp_diff = -(
+                self.data['Substrate Heater Temperature Setpoint'].iloc[-1]
+                - self.data['Substrate Heater Temperature Setpoint'].iloc[0]
+            )
+            time_interval_minutes = time_interval.total_seconds() / 60
+            params[self.category]['temp_slope'] = temp_diff / time_interval_minutes
+
+            params[self.category]['start_time'] = self.data['Time Stamp'].iloc[0]
+            params[self.category]['end_time'] = self.data['Time Stamp'].iloc[-1]
+            params[self.category]['duration'] = (
+                params[self.category]['end_time'] - params[self.category]['start_time']
+            )
+        return params
+
+
+class Sub_Ramp_Down_High_Temp_Event(Lf_Event):
+    def __init__(self, *args, **kwargs):
+        kwargs.pop('category', None)
+
+        super().__init__(*args, category='ramp_down_high_temp', **kwargs)
+        self.step_id = self.generate_step_id()
+
+    # method to extract the high temperature ramp down parameters (meaning when
+    # the substrate temperature is above the temperature where anions tend to
+    # escape the film)
+    def get_params(self, raw_data=None, source_list=None, params=None):
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+
+        if 's_cracker' not in params[self.category]:
+            params[self.category]['s_cracker'] = {}
+
+        if 'deposition' not in params:
+            raise ValueError('Missing deposition info, run get_rt_bool first')
+
+        if not params['deposition']['rt']:
+            params[self.category]['start_time'] = self.data['Time Stamp'].iloc[0]
+            params[self.category]['end_time'] = self.data['Time Stamp'].iloc[-1]
+
+            # Extract the start and end temperature of the
+            # high temperature ramp down
+            params[self.category]['start_setpoint_temp'] = self.data[
+                'Substrate Heater Temperature Setpoint'
+            ].iloc[0]
+            params[self.category]['end_setpoint_temp'] = self.data[
+                'Substrate Heater Temperature Setpoint'
+            ].iloc[-1]
+
+            # Extract the gases used during the high substrate ramp down
+            for gas in ['ar', 'ph3', 'h2s']:
+                params[self.category][f'avg_{gas}_flow'] = self.data[
+                    f'PC MFC {GAS_NUMBER[gas]} Flow'
+                ].mean()
+
+            # Extract if the cracker has been used during ramp down
+            if 'Sulfur Cracker Zone 1 Current Temperature' in self.data.columns:
+                if (
+                    (self.data['Sulfur Cracker Control Enabled'] == 1).all()
+                    and (
+                        self.data['Sulfur Cracker Zone 1 Current Temperature']
+                        > CRACKER_ZONE_1_MIN_TEMP
+                    ).all()
+                    and (
+                        self.data['Sulfur Cracker Zone 2 Current Temperature']
+                        > CRACKER_ZONE_2_MIN_TEMP
+                    ).all()
+                    and (
+                        self.data['Sulfur Cracker Zone 3 Current Temperature']
+                        > CRACKER_ZONE_3_MIN_TEMP
+                    ).all()
+                ):
+                    params[self.category]['s_cracker']['enabled'] = True
+                    # if the crack has been used, extract the cracker parameters
+                    params[self.category]['s_cracker']['zone1_temp'] = self.data[
+                        'Sulfur Cracker Zone 1 Current Temperature'
+                    ].mean()
+                    params[self.category]['s_cracker']['zone2_temp'] = self.data[
+                        'Sulfur Cracker Zone 2 Current Temperature'
+                    ].mean()
+                    params[self.category]['s_cracker']['zone3_temp'] = self.data[
+                        'Sulfur Cracker Zone 3 Current Temperature'
+                    ].mean()
+                    params[self.category]['s_cracker']['pulse_width'] = self.data[
+                        'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'
+                    ].mean()
+                    params[self.category]['s_cracker']['pulse_freq'] = self.data[
+                        'Sulfur Cracker Control Setpoint Feedback'
+                    ].mean()
+                else:
+                    params[self.category]['s_cracker']['enabled'] = False
+            else:
+                params[self.category]['s_cracker']['enabled'] = False
+            # Extract the anion input cutoff temperature as the last temperature of
+            # the high temperature ramp down
+            params[self.category]['anion_input_cutoff_temp'] = self.data[
+                'Substrate Heater Temperature Setpoint'
+            ].iloc[-1]
+            params[self.category]['anion_input_cutoff_time'] = self.data[
+                'Time Stamp'
+            ].iloc[-1]
+        return params
+
+
+class Sub_Ramp_Down_Low_Temp_Event(Lf_Event):
+    def __init__(self, *args, **kwargs):
+        kwargs.pop('category', None)
+
+        super().__init__(*args, category='ramp_down_low_temp', **kwargs)
+        self.step_id = self.generate_step_id()
+
+    # method to extract the low temperature ramp down parameters (meaning when
+    # the substrate temperature is below the temperature where anions tend to
+    # escape the film)
+    def get_params(self, raw_data=None, source_list=None, params=None):
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+
+        if 'deposition' not in params:
+            raise ValueError('Missing deposition info, run get_rt_bool first')
+
+        if not params['deposition']['rt']:
+            params[self.category]['start'] = self.data['Time Stamp'].iloc[0]
+            params[self.category]['end_time'] = self.data['Time Stamp'].iloc[-1]
+        return params
+
+
+class DepRate_Meas_Event(Lf_Event):
+    def __init__(self, *args, **kwargs):
+        kwargs.pop('category', None)
+
+        super().__init__(*args, category='source_deprate2_film_meas', **kwargs)
+        self.step_id = self.generate_step_id()
+
+    # method to extract the film deposition rate parameters
+    def get_params(self, raw_data=None, source_list=None, params=None):
+        list_allowed_categories = ['source_deprate2_film_meas']
+        if self.category not in list_allowed_categories:
+            raise ValueError(
+                'This method is only available for the film deposition rate event'
+            )
+
+        if params is None:
+            params = {}
+        if self.category not in params:
+            params[self.category] = {}
+
+        if self.source is None:
+            source_number = 'all'
+        elif self.source is not None:
+            source_number = self.source
+
+        if SOURCE_NAME[str(source_number)] not in params[self.category]:
+            params[self.category][SOURCE_NAME[str(source_number)]] = {}
+
+        if self.source is not None and self.source != 0:
+            source_number = self.source
+            source_element = str(
+                self.data[f'PC Source {source_number} Material'].iloc[0]
+            )
+            source_element = re.split(r'\s+', source_element)[0]
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                'target_material'
+            ] = ELEMENTS[source_element]
+        if self.source == 0:
+            source_number = 0
+            source_element = 'S'
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                'target_material'
+            ] = source_element
+
+        params[self.category][f'{SOURCE_NAME[str(source_number)]}']['dep_rate'] = (
+            self.data['Thickness Rate'].mean()
+        )
+        params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+            'dep_rate_ref_mat'
+        ] = self.data['Thickness Active Material'].iloc[0]
+        if 'Thickness Material Density' in self.data.columns:
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                'dep_rate_ref_density'
+            ] = self.data['Thickness Material Density'].mean()
+        if 'Thickness Material Z' in self.data.columns:
+            params[self.category][f'{SOURCE_NAME[str(source_number)]}'][
+                'dep_rate_ref_z'
+            ] = self.data['Thickness Material Z'].mean()
+
+        return params
+
+
+##------EVENT INDEX DEFINITION------
+
+
+class EventIndex:
+    """
+    Index of the time domains (bounds) of a list of events, sorted by their
+    start time, to find the events in a time window of the log with binary
+    searches instead of scanning all the events and their data. The queries
+    return (event, i) pairs, i being the index of the domain in event.bounds,
+    ordered by the start time of the domains, and can be restricted to a
+    category of events. The index is not updated when the bounds of the
+    events change, so it must be built again for the modified events.
+    """
+
+    def __init__(self, events):
+        domains = [(event, i) for event in events for i in range(len(event.bounds))]
+        bounds_ns = np.array(
+            [
+                (to_ns(event.bounds[i][0]), to_ns(event.bounds[i][1]))
+                for event, i in domains
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        order = np.argsort(bounds_ns[:, 0], kind='stable')
+        self.domains = [domains[k] for k in order]
+        self.starts = bounds_ns[order, 0]
+        self.ends = bounds_ns[order, 1]
+        # running maximum of the ends, to find the first domain that can
+        # overlap a time window, even if a longer domain started before it
+        self.max_ends = np.maximum.accumulate(self.ends) if len(order) else self.ends
+        # order of the domains by end time, for the last domain before a time
+        self.end_order = np.argsort(self.ends, kind='stable')
+        # events of each category, in the order of the list of events
+        self.categories = {}
+        for event in events:
+            self.categories.setdefault(event.category, []).append(event)
+        # positions of the domains of each event, ordered by start time
+        self._event_positions = {}
+        for k, (event, _) in enumerate(self.domains):
+            self._event_positions.setdefault(id(event), []).append(k)
+
+    def __len__(self):
+        return len(self.domains)
+
+    # whether the domains of the event are indexed
+    def __contains__(self, event):
+        return id(event) in self._event_positions
+
+    # events of the category, in the order of the list of events
+    def events_of(self, category):
+        return self.categories.get(category, [])
+
+    def _select(self, positions, category):
+        return [
+            self.domains[k]
+            for k in positions
+            if category is None or self.domains[k][0].category == category
+        ]
+
+    # domains overlapping the time window [start, end]
+    def overlapping(self, start, end, category=None):
+        start_ns, end_ns = to_ns(start), to_ns(end)
+        first = np.searchsorted(self.max_ends, start_ns, side='left')
+        stop = np.searchsorted(self.starts, end_ns, side='right')
+        positions = first + np.flatnonzero(self.ends[first:stop] >= start_ns)
+        return self._select(positions, category)
+
+    # domains entirely within the time window [start, end]
+    def within(self, start, end, category=None):
+        start_ns, end_ns = to_ns(start), to_ns(end)
+        first = np.searchsorted(self.starts, start_ns, side='left')
+        stop = np.searchsorted(self.starts, end_ns, side='right')
+        positions = first + np.flatnonzero(self.ends[first:stop] <= end_ns)
+        return self._select(positions, category)
+
+    # domains containing the time
+    def containing(self, time, category=None):
+        return self.overlapping(time, time, category)
+
+    # indices (in event.bounds) of the domains of the event starting before
+    # the time, except the ones ending at the time (see find_domains_before)
+    def domains_before(self, event, time):
+        time_ns = to_ns(time)
+        positions = np.array(self._event_positions.get(id(event), []), dtype=np.int64)
+        stop = np.searchsorted(self.starts[positions], time_ns, side='left')
+        return sorted(
+            self.domains[k][1] for k in positions[:stop] if self.ends[k] != time_ns
+        )
+
+    # last domain ending before the time (None if there is none)
+    def last_before(self, time, category=None):
+        sorted_ends = self.ends[self.end_order]
+        stop = np.searchsorted(sorted_ends, to_ns(time), side='left')
+        for k in self.end_order[:stop][::-1]:
+            if category is None or self.domains[k][0].category == category:
+                return self.domains[k]
+        return None
+
+
+# ---------HELPER FUNCTIONS FOR THE EVENT PARAMETERS------------
+
+
+def elements_from_string(source_material, elements=[]):
+    source_element_name_list = re.split(r'\s+', source_material)
+    material = ''
+    for element_name in source_element_name_list:
+        if element_name in ELEMENTS:
+            element = ELEMENTS[element_name]
+            material += element
+            if element not in elements:
+                elements.append(element)
+        elif element_name in IONS:
+            element = IONS[element_name]
+            material += element
+            if element not in elements:
+                elements.append(element)
+    return elements, material
+
+
+# Function to compute a statistic of a column with pandas (one of EVENT_STATS
+# or the name of a reduction of pd.Series), for the statistics that are not
+# computed in a single pass by the event (see Lf_Event.get_stat)
+def get_column_stat(series, stat):
+    if stat == 'first':
+        return series.iloc[0]
+    if stat == 'last':
+        return series.iloc[-1]
+    if stat == 'mode':
+        return series.value_counts().idxmax()
+    return getattr(series, stat)()
+
+
+# Function to calculate the true temperature
+def calculate_avg_true_temp(temp_1, temp_2):
+    return 0.905 * (0.5 * (temp_1 + temp_2)) + 12
+
+
+# HELPER FUNCTIONS TO MANIPULATE LISTS OF EVENTS--------
+
+
+def unfold_events(all_lf_events, data):
+    all_sub_lf_events = []
+    for step in all_lf_events:
+        for i in range(step.events):
+            new_step = Lf_Event(
+                step.sep_name[i],
+                source=step.source,
+                category=step.category,
+                step_number=i,
+            )
+            new_step.set_source(step.source)
+            if step.sep_rows is not None and data is step.context:
+                new_step.set_rows(step.sep_rows[i], data)
+            else:
+                new_step.set_data(step.sep_data[i], data)
+            all_sub_lf_events.append(new_step)
+
+    return all_sub_lf_events
+
+
+def add_event_to_events(event, all_events):
+    """
+    args:
+        all_events: list
+            List of all the events to which the event is to be added
+        event: Lf_Event, list of Lf_Event, or dict of Lf_Event
+            Event to be added to the list of all events
+    """
+    if isinstance(event, list):
+        for item in event:
+            if isinstance(item, Lf_Event):
+                all_events.append(item)
+            elif isinstance(item, dict):
+                for key in item:
+                    all_events.append(item[key])
+    elif isinstance(event, Lf_Event):
+        all_events.append(event)
+    elif isinstance(event, dict):
+        for key in event:
+            all_events.append(event[key])
+
+    else:
+        raise ValueError(
+            'The event to be added to the list of all events is not of the right type'
+        )
+    return all_events
+
+
+def event_list_to_dict(all_events):
+    if isinstance(all_events, Lf_Event):
+        all_events = [all_events]
+
+    event_dict = {}
+
+    for event in all_events:
+        event_dict[event.step_id] = event
+
+    return event_dict
+
+
+# Definition to sort the events by the start time
+# PROBLEM WITH THIS FUNCTION
+def sort_events_by_start_time(all_events):
+    """
+    args:
+        all_events: list
+            List of all the events to be sorted by start time
+    """
+    # Sort events by their start time using Python's sorted, which is stable
+    sorted_list = sorted(all_events, key=lambda event: event.bounds[0][0])
+    return sorted_list
+
+
+def filter_events_by_category(all_events, category):
+    """
+    args:
+        all_events: list
+            List of all the events to be filtered by category
+        category: str
+            Category of the events to be filtered
+    """
+    return all_events
+
+
+# Definition to place the ramp_up_temp, deposition, ramp_down_high_temp,
+# ramp_down_low_temp event first in the list of all events, in this order
+def place_deposition_ramp_up_down_events_first(all_events):
+    # Separate events into priority categories and others
+    priority_events = []
+    other_events = []
+
+    for event in all_events:
+        if event.category in CATEGORIES_FIRST:
+            priority_events.append(event)
+        else:
+            other_events.append(event)
+
+    # Group the non-priority events by source if the source is not None
+    events_by_source = {}
+    no_source_events = []
+
+    for event in other_events:
+        if event.source is not None:
+            if event.source not in events_by_source:
+                events_by_source[event.source] = []
+            events_by_source[event.source].append(event)
+        else:
+            no_source_events.append(event)
+
+    # Flatten the grouped events and append to the result
+    sorted_events = priority_events
+
+    for source, events in events_by_source.items():
+        sorted_events.extend(events)
+
+    sorted_events.extend(no_source_events)
+    return sorted_events
@@ -0,0 +1,941 @@
+"""
+Extraction of the events (steps of the process) from a formatted logfile.
+"""
+
+import operator
+from functools import reduce
+
+import pandas as pd
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader.conditions import get_event_conditions
+from nomad_dtu_nanolab_plugin.sputter_log_reader.constants import (
+    MFC_FLOW_THRESHOLD,
+    MIN_TEMP_CTRL_SIZE,
+    MIN_TEMP_RAMP_DOWN_SIZE,
+    RT_TEMP_THRESHOLD,
+    STAB_TIME,
+    TEMP_SETPOINT_DIFF_THRESHOLD,
+    WITHIN_RANGE_PARAM,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.context import (
+    LogContext,
+    get_column,
+    map_sources,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.events import (
+    Deposition_Event,
+    DepRate_Meas_Event,
+    Lf_Event,
+    SCracker_Pressure_Event,
+    Source_Presput_Event,
+    Source_Ramp_Up_Event,
+    Sub_Ramp_Down_Event,
+    Sub_Ramp_Down_High_Temp_Event,
+    Sub_Ramp_Down_Low_Temp_Event,
+    Sub_Ramp_Up_Event,
+    add_event_to_events,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.io import format_logfile
+
+# ----------CORE FUNCTIONS FOR DATA PROCESSING------------
+
+
+# Helper function to check if a column is within a certain range
+def within_range(data_col, ref_col_mean, diff_param, mode='percent'):
+    if ref_col_mean == 0:
+        cond = (data_col > (-MFC_FLOW_THRESHOLD)) & (data_col < (+MFC_FLOW_THRESHOLD))
+    elif mode == 'percent':
+        cond = (data_col > (1 - 0.01 * diff_param) * ref_col_mean) & (
+            data_col < (1 + 0.01 * diff_param) * ref_col_mean
+        )
+    elif mode == 'absolute':
+        cond = (data_col > (ref_col_mean - diff_param)) & (
+            data_col < (ref_col_mean + diff_param)
+        )
+    return cond
+
+
+# For all the sources, method to read the dataframe for columns that
+# give indication#of the status of the source (current,
+# dc bias, output setpoint)#and create conditions for the
+# plasma being on and being ramped up
+# (Ex : plasma being on is defined as the current being above a
+# threshold or the dc bias being above a threshold and the
+# source being enabled)
+# Because we have performed the previous step, we can now
+# directly use the source number to create the conditions if we handle
+# the case where the column does not exist in the dataframe
+def filter_data_plasma_on_ramp_up(data, source_list):
+    # print('Defining the conditions and filtering the data')
+    # Initialize dictionaries to store the ramp up, plasma on
+    # conditions and corresponding data for each source
+    source_ramp_up = {}
+    source_on = {}
+    source_on_open = {}
+
+    # The conditions are defined in SOURCE_EVENT_RULES
+    conditions = get_event_conditions(data, source_list)
+
+    # The events of each source only depend on the conditions of the source,
+    # so the sources can be evaluated at the same time (see map_sources)
+    def filter_source(source_number):
+        # Initiate the source on event as a Lf_Event object
+        source_on_event = Lf_Event(
+            f'Source {source_number} On', source=source_number, category='source_on'
+        )
+        # Define conditions for the plasma being on
+        source_on_cond = conditions[f'source_on_{source_number}']
+        source_on_event.set_condition(source_on_cond)
+        # Filter the data points where the plasma is on
+        source_on_event.filter_data(data)
+
+        source_on_open_event = Lf_Event(
+            f'Source {source_number} On Open',
+            source=source_number,
+            category='source_on_open',
+        )
+        # Define conditions for the plasma being on and the shutter being open
+        source_on_open_cond = conditions[f'source_on_open_{source_number}']
+        source_on_open_event.set_condition(source_on_open_cond)
+        # Filter the data points where the plasma is on and the shutter is open
+        source_on_open_event.filter_data(data)
+
+        # Initiate the source ramp up event as a Lf_Event object
+        source_ramp_up_event = Source_Ramp_Up_Event(
+            f'Source {source_number} Ramp Up',
+            source=source_number,
+            category='source_ramp_up',
+        )
+        # Define conditions for the plasma ramping up, including the first
+        # point of the ramp
+        source_ramp_up_w1stpoint_cond = conditions[f'source_ramp_up_{source_number}']
+        source_ramp_up_event.set_condition(source_ramp_up_w1stpoint_cond)
+        # Filter the data points where the plasma is ramping up
+        source_ramp_up_event.filter_data(data)
+        # Sometimes, we ramp up the sources in steps (Ex: 0->50->75)
+        # In that case, the same event is counted as two events
+        # We check if the last output setpoint power value of one event
+        # is the same as the
+        # first value of the next event and if so, we merge the two events
+        # into one
+        source_ramp_up_event.stitch_source_ramp_up_events()
+        return source_on_event, source_on_open_event, source_ramp_up_event
+
+    # We store each event in a dictionary of events, where the key is the
+    # source number, in the order of the source_list
+    for source_number, events in zip(
+        source_list, map_sources(filter_source, source_list)
+    ):
+        (
+            source_on[str(source_number)],
+            source_on_open[str(source_number)],
+            source_ramp_up[str(source_number)],
+        ) = events
+    return source_on, source_on_open, source_ramp_up
+
+
+# Define conditions for the cracker being on using the temperatures
+# of the different zones of the cracker and the control being enabled
+def filter_data_cracker_on_open(data):
+    cracker_on_open = Lf_Event(
+        'Cracker On Open',
+        category='cracker_on_open',
+    )
+
+    # The condition is defined in EVENT_RULES, and is always False if the
+    # cracker is not logged
+    cracker_on_open.set_condition(get_event_conditions(data)['cracker_on_open'])
+    cracker_on_open.filter_data(data)
+    return cracker_on_open
+
+
+# Define conditions for the temperature control (when the temperature
+# setpoint is different from the actual temperature) and filter the data
+def filter_data_temp_ctrl(data):
+    temp_ctrl = Lf_Event('Temperature Ctrl.', category='temp_ctrl')
+    # If the temperature control is not logged, the condition is defined in
+    # EVENT_RULES as the heater temperature differing from its setpoint
+    temp_ctrl.set_condition(get_event_conditions(data)['temp_ctrl'])
+    temp_ctrl.filter_data(data)
+    # There is a bug that sometimes the heater temp and the setpoint desagree
+    # even though the temperature control is off. We need to check that the
+    # size of the temperature control data is above a certain threshold or
+    # the domains are not isolate points (if so, then extract_domains will
+    # return an empty list). If the size is below the threshold or the domains
+    # are isolated points, we set the data_temp_ctrl to an empty dataframe
+    if (len(temp_ctrl.data) < MIN_TEMP_CTRL_SIZE) or (temp_ctrl.bounds == []):
+        temp_ctrl.set_data(pd.DataFrame(columns=temp_ctrl.data.columns), data)
+
+    return temp_ctrl
+
+
+# Define conditions for the different gases being flown based on
+# the setpoint and flow of the MFCs being above a threshold defined
+# by MFC_FLOW_THRESHOLD
+def filter_gas(data):
+    ph3 = Lf_Event('PH3 On', category='ph3_on')
+    h2s = Lf_Event('H2S On', category='h2s_on')
+    ar = Lf_Event('Ar On', category='ar_on')
+
+    conditions = get_event_conditions(data)
+
+    ph3.set_condition(conditions['ph3_on'])
+    ph3.filter_data(data)
+
+    h2s.set_condition(conditions['h2s_on'])
+    h2s.filter_data(data)
+
+    ar.set_condition(conditions['ar_on'])
+    ar.filter_data(data)
+
+    return ph3, h2s, ar
+
+
+# We can also define composite conditions for different events by
+# combining the base condition (AND: & OR: | NOT: ~)
+
+
+# Method to filter the data for the deposition as the substrate shutter
+# being open and any source being on and open at the same time
+def filter_data_deposition(data, source_list, **kwargs):
+    # The source_on events (kwargs) are not needed anymore, as their
+    # conditions are shared through get_event_conditions
+    any_source_on = Lf_Event('Any Source On', category='any_source_on')
+    any_source_on_open = Lf_Event(
+        'Any Source On and Open', category='any_source_on_open'
+    )
+    # We create a deposition event that is not tied to any source in particular
+    deposition = Deposition_Event('Deposition', category='deposition', source=None)
+
+    # The conditions of the sources being on (source_on) are combined using
+    # OR (|) to get any source being on, and any source being on and open
+    conditions = get_event_conditions(data, source_list)
+    any_source_on_open.set_condition(conditions['any_source_on_open'])
+    any_source_on_open.filter_data(data)
+
+    any_source_on.set_condition(conditions['any_source_on'])
+    any_source_on.filter_data(data)
+
+    # Define deposition condition as te substrate shutter being open
+    # and any source being on and open, as defined just above, and filtering
+    # the data points where the deposition is happening
+    deposition.set_condition(conditions['deposition'])
+    deposition.filter_data(data)
+
+    source_used_list = []
+    for source_number in source_list:
+        if get_column(deposition.data, f'Source {source_number} Enabled').all():
+            source_used_list.append(source_number)
+
+    return any_source_on, any_source_on_open, deposition, source_used_list
+
+
+# Method for the conditions for the plasma being presputtered as:
+# - the source being on
+# - the event happening before the deposition and after the last
+# ramp up of the sources
+# - the source not ramping up
+# - no P or S being flown or cracked
+# Note: this part may be improved as we may want to include presputtering
+# in P or S gases. We may also include postsputtering
+def filter_data_plasma_presput(data, source_list, **kwargs):
+    required_keys = [
+        'source_on',
+        'source_ramp_up',
+        'cracker_on_open',
+        'ph3',
+        'h2s',
+        'deposition',
+    ]
+
+    for key in required_keys:
+        if key not in kwargs:
+            raise ValueError(f'Missing required argument: {key}')
+
+    source_on = kwargs.get('source_on')
+    source_ramp_up = kwargs.get('source_ramp_up')
+    cracker_on_open = kwargs.get('cracker_on_open')
+    ph3 = kwargs.get('ph3')
+    h2s = kwargs.get('h2s')
+    deposition = kwargs.get('deposition')
+
+    source_presput = {}
+
+    # The presputtering of each source only depends on the events of the
+    # source, so the sources can be evaluated at the same time (see
+    # map_sources). Sources that are never on have no presputtering (None)
+    def filter_source(source_number):
+        if not source_on[str(source_number)].data.empty:
+            try:
+                source_presput_cond = (
+                    source_on[str(source_number)].cond
+                    & (data['Time Stamp'] < deposition.bounds[0][0])
+                    & (
+                        data['Time Stamp']
+                        > (
+                            source_ramp_up[str(source_number)]
+                            .data['Time Stamp']
+                            .iloc[-1]
+                        )
+                    )
+                    & ~source_ramp_up[str(source_number)].cond
+                    & ~(ph3.cond | h2s.cond | cracker_on_open.cond)
+                )
+            except IndexError:
+                print(
+                    'The time constraint on the presputtering',
+                    'has been partially relaxed',
+                    'presput may be located after the last source ramp up',
+                )
+                try:
+                    source_presput_cond = (
+                        source_on[str(source_number)].cond
+                        & (data['Time Stamp'] < deposition.bounds[0][0])
+                        & ~source_ramp_up[str(source_number)].cond
+                        & ~(ph3.cond | h2s.cond | cracker_on_open.cond)
+                    )
+                except IndexError:
+                    print(
+                        'The time constraint on the presputtering was fully relaxed',
+                        'presput may be located after the deposition',
+                    )
+                    source_presput_cond = (
+                        source_on[str(source_number)].cond
+                        & ~source_ramp_up[str(source_number)].cond
+                        & ~(ph3.cond | h2s.cond | cracker_on_open.cond)
+                    )
+
+            source_presput_event = Source_Presput_Event(
+                f'Source {source_number} Presput',
+                source=source_number,
+                category='source_presput',
+            )
+            source_presput_event.set_source(source_number)
+            source_presput_event.set_condition(source_presput_cond)
+            source_presput_event.filter_data(data)
+            return source_presput_event
+        return None
+
+    for source_number, source_presput_event in zip(
+        source_list, map_sources(filter_source, source_list)
+    ):
+        if source_presput_event is not None:
+            source_presput[str(source_number)] = source_presput_event
+    return source_presput
+
+
+# Method to define the condition for measurement of the
+# Sulfur Cracker induced base_pressure, as:
+# - the cracker is on and open
+# - no gas (h2s,ph2, or ar) is flown
+# - the time is before the deposition
+# - the cracker temperature and parameters
+# are within WITHIN_RANGE_PARAM of the deposition conditions (for the cracker, and
+# and the pressure)
+def filter_data_cracker_pressure(data, **kwargs):
+    required_keys = ['cracker_on_open', 'ph3', 'h2s', 'ar', 'deposition']
+
+    for key in required_keys:
+        if key not in kwargs:
+            raise ValueError(f'Missing required argument: {key}')
+
+    cracker_on_open = kwargs.get('cracker_on_open')
+    ph3 = kwargs.get('ph3')
+    h2s = kwargs.get('h2s')
+    ar = kwargs.get('ar')
+    deposition = kwargs.get('deposition')
+
+    cracker_base_pressure = SCracker_Pressure_Event(
+        'Cracker Pressure Meas', category='cracker_base_pressure', source=0
+    )
+    if 'Sulfur Cracker Zone 1 Current Temperature' in data.columns:
+        cracker_temp_cond = (
+            within_range(
+                data['Sulfur Cracker Zone 1 Current Temperature'],
+                deposition.data['Sulfur Cracker Zone 1 Current Temperature'].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+            & within_range(
+                data['Sulfur Cracker Zone 2 Current Temperature'],
+                deposition.data['Sulfur Cracker Zone 2 Current Temperature'].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+            & within_range(
+                data['Sulfur Cracker Zone 3 Current Temperature'],
+                deposition.data['Sulfur Cracker Zone 3 Current Temperature'].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+        )
+
+        valve_cond = within_range(
+            data['Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'],
+            deposition.data[
+                'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'
+            ].mean(),
+            WITHIN_RANGE_PARAM,
+        ) & within_range(
+            data['Sulfur Cracker Control Setpoint Feedback'],
+            deposition.data['Sulfur Cracker Control Setpoint Feedback'].mean(),
+            WITHIN_RANGE_PARAM,
+        )
+
+        if not cracker_on_open.data.empty:
+            cracker_base_pressure_cond = (
+                cracker_on_open.cond
+                & (data['Time Stamp'] < deposition.bounds[0][0])
+                & ~h2s.cond
+                & ~ph3.cond
+                & ~ar.cond
+                & cracker_temp_cond
+                & valve_cond
+                & (data['Sulfur Cracker Control Enabled'] == 1)
+            )
+        else:
+            cracker_base_pressure_cond = pd.Series(False, index=data.index)
+    else:
+        cracker_base_pressure_cond = pd.Series(False, index=data.index)
+    cracker_base_pressure.set_condition(cracker_base_pressure_cond)
+    cracker_base_pressure.filter_data(data)
+
+    return cracker_base_pressure
+
+
+# Condition of the deposition rate measurement is defined as the
+# Xtal2 substrate shutter being open from which we exclude the
+# data points just after the Xtal2 shutter opens, as the QCM
+# needs time to stabilize. The STAB_TIME stabilization time
+# is defined in the reference values section
+def filter_data_film_dep_rate(data, source_list, **kwargs):
+    required_keys = [
+        'deposition',
+        'source_on_open',
+        'any_source_on_open',
+        'cracker_on_open',
+        'ph3',
+        'h2s',
+    ]
+
+    for key in required_keys:
+        if key not in kwargs:
+            raise ValueError(f'Missing required argument: {key}')
+
+    deposition = kwargs.get('deposition')
+    source_on_open = kwargs.get('source_on_open')
+    any_source_on_open = kwargs.get('any_source_on_open')
+    cracker_on_open = kwargs.get('cracker_on_open')
+    ph3 = kwargs.get('ph3')
+    h2s = kwargs.get('h2s')
+
+    xtal2_open = Lf_Event('Xtal 2 Shutter Open', category='xtal2_shutter_open')
+    deprate2_meas = Lf_Event('Deposition Rate Measurement', category='deprate2_meas')
+    deprate2_film_meas = {}
+    deprate2_sulfur_meas = DepRate_Meas_Event(
+        'S Dep Rate Meas', category='source_deprate2_film_meas', source=0
+    )
+
+    xtal2_open, deprate2_meas = define_xtal2_open_conditions(
+        data, xtal2_open, deprate2_meas
+    )
+
+    # Define the condition for the Metal-P-S film deposition rate measurement
+    # as the condition just above, with the addition of S or P being flown
+    # or the cracker being on, and the material used as refereced by the QCM
+    # not being Sulfur
+    # We assume here that the deposition rate is not measured during deposition
+    # We also include that the condition of the plasma are within the
+    # WITHIN_RANGE_PARAM of the deposition conditions
+
+    pressure_cond, ph3_dep_cond, h2s_dep_cond, cracker_dep_cond = (
+        define_deposition_conditions(data, deposition)
+    )
+
+    deprate2_film_meas, deprate2_ternary_meas = define_film_meas_conditions(
+        data,
+        source_list,
+        deprate2_meas=deprate2_meas,
+        source_on_open=source_on_open,
+        cracker_dep_cond=cracker_dep_cond,
+        h2s_dep_cond=h2s_dep_cond,
+        ph3_dep_cond=ph3_dep_cond,
+        deposition=deposition,
+        pressure_cond=pressure_cond,
+        deprate2_film_meas=deprate2_film_meas,
+    )
+
+    deprate2_sulfur_meas = define_sulfur_meas_conditions(
+        data,
+        deprate2_meas,
+        deprate2_sulfur_meas,
+        deposition=deposition,
+        any_source_on_open=any_source_on_open,
+        cracker_on_open=cracker_on_open,
+        ph3=ph3,
+        h2s=h2s,
+    )
+
+    return (
+        deprate2_ternary_meas,
+        deprate2_film_meas,
+        deprate2_meas,
+        xtal2_open,
+        deprate2_sulfur_meas,
+    )
+
+
+def define_xtal2_open_conditions(data, xtal2_open, deprate2_meas):
+    if 'Xtal 2 Shutter Open' in data.columns:
+        xtal2_open_cond = get_event_conditions(data)['xtal2_shutter_open']
+        xtal2_open.set_condition(xtal2_open_cond)
+        xtal2_open.filter_data(data)
+
+        # Set a time window to exclude data points after
+        # the Xtal shutter opens
+        # Identify the indices where the shutter opens (transitions to 1)
+        xtal2_open_indices = data.index[data['Xtal 2 Shutter Open'].diff() == 1]
+        # Create a boolean mask to exclude points within STAB_TIME seconds
+        # after the shutter opens
+        mask = pd.Series(True, index=data.index)
+        for idx in xtal2_open_indices:
+            # Find the time of the shutter opening event
+            open_time = data.at[idx, 'Time Stamp']
+            # Find points within STAB_TIME seconds after the shutter opening
+            within_stab_time = (data['Time Stamp'] > open_time) & (
+                data['Time Stamp'] <= open_time + pd.Timedelta(seconds=STAB_TIME)
+            )
+            # Update the mask to exclude these points
+            mask &= ~within_stab_time
+        # Apply the mask to filter the data
+        deprate2_meas_cond = mask & xtal2_open.cond
+    else:
+        deprate2_meas_cond = pd.Series(False, index=data.index)
+    deprate2_meas.set_condition(deprate2_meas_cond)
+    deprate2_meas.filter_data(data)
+    return xtal2_open, deprate2_meas
+
+
+def define_deposition_conditions(data, deposition):
+    pressure_cond = within_range(
+        data['PC Capman Pressure'],
+        deposition.data['PC Capman Pressure'].mean(),
+        WITHIN_RANGE_PARAM,
+    )
+
+    ph3_dep_cond = within_range(
+        data['PC MFC 4 Setpoint'],
+        deposition.data['PC MFC 4 Setpoint'].mean(),
+        WITHIN_RANGE_PARAM,
+    )
+
+    h2s_dep_cond = within_range(
+        data['PC MFC 6 Setpoint'],
+        deposition.data['PC MFC 6 Setpoint'].mean(),
+        WITHIN_RANGE_PARAM,
+    )
+    if 'Sulfur Cracker Zone 1 Current Temperature' in data.columns:
+        cracker_dep_cond = (
+            within_range(
+                data['Sulfur Cracker Zone 1 Current Temperature'],
+                deposition.data['Sulfur Cracker Zone 1 Current Temperature'].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+            & within_range(
+                data['Sulfur Cracker Zone 2 Current Temperature'],
+                deposition.data['Sulfur Cracker Zone 2 Current Temperature'].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+            & within_range(
+                data['Sulfur Cracker Zone 3 Current Temperature'],
+                deposition.data['Sulfur Cracker Zone 3 Current Temperature'].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+            & within_range(
+                data['Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'],
+                deposition.data[
+                    'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'
+                ].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+            & within_range(
+                data['Sulfur Cracker Control Setpoint Feedback'],
+                deposition.data['Sulfur Cracker Control Setpoint Feedback'].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+        )
+    else:
+        cracker_dep_cond = pd.Series(False, index=data.index)
+    return pressure_cond, ph3_dep_cond, h2s_dep_cond, cracker_dep_cond
+
+
+def define_film_meas_conditions(data, source_list, **kwargs):
+    deprate2_meas = kwargs.get('deprate2_meas')
+    source_on_open = kwargs.get('source_on_open')
+    cracker_dep_cond = kwargs.get('cracker_dep_cond')
+    h2s_dep_cond = kwargs.get('h2s_dep_cond')
+    ph3_dep_cond = kwargs.get('ph3_dep_cond')
+    deposition = kwargs.get('deposition')
+    pressure_cond = kwargs.get('pressure_cond')
+    deprate2_film_meas = kwargs.get('deprate2_film_meas')
+
+    deprate2_film_meas_cond_list = []
+
+    # The film deposition rate measurement of each source only depends on the
+    # source, so the sources can be evaluated at the same time (see
+    # map_sources). Sources without output setpoint are skipped (None)
+    def filter_source(source_number):
+        if f'Source {source_number} Output Setpoint' in data.columns:
+            power_cond = within_range(
+                data[f'Source {source_number} Output Setpoint'],
+                deposition.data[f'Source {source_number} Output Setpoint'].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+            deprate2_film_meas_cond = (
+                deprate2_meas.cond
+                & source_on_open[str(source_number)].cond
+                & cracker_dep_cond
+                & h2s_dep_cond
+                & ph3_dep_cond
+                & (data['Thickness Active Material'] != 'Sulfur')
+                & power_cond
+                & pressure_cond
+            )
+
+            source_film_meas = DepRate_Meas_Event(
+                f'Source {source_number} Film Dep Rate Meas',
+                source=source_number,
+                category='source_deprate2_film_meas',
+            )
+            source_film_meas.set_source(source_number)
+            source_film_meas.set_condition(deprate2_film_meas_cond)
+            source_film_meas.filter_data(data)
+            return deprate2_film_meas_cond, source_film_meas
+        return None
+
+    for source_number, result in zip(
+        source_list, map_sources(filter_source, source_list)
+    ):
+        if result is not None:
+            deprate2_film_meas_cond, deprate2_film_meas[str(source_number)] = result
+            deprate2_film_meas_cond_list.append(deprate2_film_meas_cond)
+
+    # We define the condition for the all sources film
+    # deposition rate measurement
+    # as the combination of al the film dep rate conditions above
+
+    deprate2_ternary_meas_cond = reduce(operator.and_, deprate2_film_meas_cond_list)
+    deprate2_ternary_meas = DepRate_Meas_Event(
+        'All Source Film Dep Rate Meas',
+        source=None,
+        category='source_deprate2_film_meas',
+    )
+    deprate2_ternary_meas.set_condition(deprate2_ternary_meas_cond)
+    deprate2_ternary_meas.filter_data(data)
+
+    return deprate2_film_meas, deprate2_ternary_meas
+
+
+def define_sulfur_meas_conditions(data, deprate2_meas, deprate2_sulfur_meas, **kwargs):
+    deposition = kwargs.get('deposition')
+    any_source_on_open = kwargs.get('any_source_on_open')
+    cracker_on_open = kwargs.get('cracker_on_open')
+    ph3 = kwargs.get('ph3')
+    h2s = kwargs.get('h2s')
+
+    # Define the condition for the onlt Sulfur film deposition rate measurement as:
+    #  with the material used as refereced by the QCM
+    # being Sulfur
+    # We also include the condition of the cracker are
+    # within the WITHIN_RANGE_PARAM of the deposition conditions¨
+    if 'Sulfur Cracker Zone 1 Current Temperature' in data.columns:
+        cracker_temp_cond = (
+            within_range(
+                data['Sulfur Cracker Zone 1 Current Temperature'],
+                deposition.data['Sulfur Cracker Zone 1 Current Temperature'].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+            & within_range(
+                data['Sulfur Cracker Zone 2 Current Temperature'],
+                deposition.data['Sulfur Cracker Zone 2 Current Temperature'].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+            & within_range(
+                data['Sulfur Cracker Zone 3 Current Temperature'],
+                deposition.data['Sulfur Cracker Zone 3 Current Temperature'].mean(),
+                WITHIN_RANGE_PARAM,
+            )
+        )
+
+        valve_cond = within_range(
+            data['Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'],
+            deposition.data[
+                'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'
+            ].mean(),
+            WITHIN_RANGE_PARAM,
+        ) & within_range(
+            data['Sulfur Cracker Control Setpoint Feedback'],
+            deposition.data['Sulfur Cracker Control Setpoint Feedback'].mean(),
+            WITHIN_RANGE_PARAM,
+        )
+
+        pressure_cond = within_range(
+            data['PC Capman Pressure'],
+            deposition.data['PC Capman Pressure'].mean(),
+            WITHIN_RANGE_PARAM,
+        )
+
+        deprate2_sulfur_meas_cond = (
+            deprate2_meas.cond
+            & ~any_source_on_open.cond
+            & cracker_on_open.cond
+            & ~(ph3.cond | h2s.cond)
+            & (data['Thickness Active Material'] == 'Sulfur')
+            & ~deposition.cond
+            & cracker_temp_cond
+            & valve_cond
+            & pressure_cond
+        )
+    else:
+        deprate2_sulfur_meas_cond = pd.Series(False, index=data.index)
+
+    deprate2_sulfur_meas.set_condition(deprate2_sulfur_meas_cond)
+    deprate2_sulfur_meas.filter_data(data)
+    return deprate2_sulfur_meas
+
+
+# Method to filter the data for the substrate temperature was ramping up as:
+# - the temperature control is enabled
+# - the event is not a deposition
+# - the temperature setpoint is increasing faster than the threshold
+# defined in the reference values
+def filter_data_temp_ramp_up_down(data, **kwargs):
+    required_keys = ['cracker_on_open', 'temp_ctrl', 'ph3', 'h2s', 'deposition']
+
+    for key in required_keys:
+        if key not in kwargs:
+            raise ValueError(f'Missing required argument: {key}')
+
+    cracker_on_open = kwargs.get('cracker_on_open')
+    temp_ctrl = kwargs.get('temp_ctrl')
+    ph3 = kwargs.get('ph3')
+    h2s = kwargs.get('h2s')
+    deposition = kwargs.get('deposition')
+
+    ramp_up_temp = Sub_Ramp_Up_Event('Sub Temp Ramp Up', category='ramp_up_temp')
+    ramp_down_temp = Sub_Ramp_Down_Event(
+        'Sub Temp Ramp Down', category='ramp_down_temp'
+    )
+    ramp_down_high_temp = Sub_Ramp_Down_High_Temp_Event(
+        'Sub High Temp Ramp Down', category='ramp_down_high_temp'
+    )
+    ramp_down_low_temp = Sub_Ramp_Down_Low_Temp_Event(
+        'Sub Low Temp Ramp Down', category='ramp_down_low_temp'
+    )
+
+    if (
+        not temp_ctrl.data.empty
+        or (
+            deposition.data['Substrate Heater Temperature Setpoint'] > RT_TEMP_THRESHOLD
+        ).all()
+    ):
+        ramp_up_temp_cond = (
+            temp_ctrl.cond
+            & ~deposition.cond
+            & (
+                data['Substrate Heater Temperature Setpoint'].diff()
+                > TEMP_SETPOINT_DIFF_THRESHOLD
+            )
+        )
+        ramp_up_temp.set_condition(ramp_up_temp_cond)
+        ramp_up_temp.filter_data(data)
+
+        # Define conditions and filtering the data
+        # for the substrate temperature was ramping down in a similar fashion
+        ramp_down_temp_cond = (
+            temp_ctrl.cond
+            & ~deposition.cond
+            & (
+                data['Substrate Heater Temperature Setpoint'].diff()
+                < -TEMP_SETPOINT_DIFF_THRESHOLD
+            )
+            & (data['Substrate Heater Temperature Setpoint'] > 1)
+        )
+        ramp_down_temp.set_condition(ramp_down_temp_cond)
+        ramp_down_temp.filter_data(data)
+        # In the following, we distinguish betweem to phases of the ramp down:
+        # 1/ the high temperature phase where we flow H2S, PH3 or the cracker is on
+        # to prevent the film loosing P or S
+        # 2/ the low temperature phase where we do not flow H2S, PH3 or
+        # the cracker is off
+
+        # Define the ramp down high temperature condition as a events after
+        # the beginning of the ramp down of the temperature ramp down
+        # where we flow H2S, PH3 or the cracker is on
+        try:
+            ramp_down_high_temp_cond = (
+                data['Time Stamp'] > ramp_down_temp.data['Time Stamp'].iloc[0]
+            ) & (h2s.cond | cracker_on_open.cond | ph3.cond)
+        except Exception:
+            ramp_down_high_temp_cond = pd.Series(False, index=data.index)
+        ramp_down_high_temp.set_condition(ramp_down_high_temp_cond)
+        ramp_down_high_temp.filter_data(data)
+        ramp_down_high_temp.filter_out_small_events(MIN_TEMP_RAMP_DOWN_SIZE)
+
+        # Define the ramp down low temperature condition as a events after
+        # the beginning of the ramp down of the temperature ramp down
+        # where we do not flow H2S, PH3 or the cracker is off
+        try:
+            ramp_down_low_temp_cond = (
+                data['Time Stamp'] > ramp_down_temp.data['Time Stamp'].iloc[0]
+            ) & ~(h2s.cond | cracker_on_open.cond | ph3.cond)
+        except Exception:
+            ramp_down_low_temp_cond = pd.Series(False, index=data.index)
+        ramp_down_low_temp.set_condition(ramp_down_low_temp_cond)
+        ramp_down_low_temp.filter_data(data)
+
+    return ramp_up_temp, ramp_down_temp, ramp_down_high_temp, ramp_down_low_temp
+
+
+def filter_data_platen_bias_on(data):
+    platen_bias_on = Lf_Event('Platen Bias On', category='platen_bias_on')
+    platen_bias_on.set_condition(get_event_conditions(data)['platen_bias_on'])
+    platen_bias_on.filter_data(data)
+
+    return platen_bias_on
+
+
+# Function to extract all the events of a logfile, each filter being
+# recorded as a stage in stats
+def extract_events(data, stats):
+    with stats.stage('format_logfile'):
+        data, source_list = format_logfile(data)
+        # Wrap the logfile in a LogContext, so that its time axis is only
+        # converted once, and its statistics only computed once, for all the
+        # events
+        data = LogContext(data, source_list=source_list)
+
+    # ---------DEFINE DE CONDITIONS FOR DIFFERENT EVENTS-------------
+    # Initialize the list of all events
+    events = []
+
+    # ---------1/CONDITIONS FOR THE PLASMA ON OR BEING RAMPED UP--------
+    with stats.stage('filter_data_plasma_on_ramp_up'):
+        source_on, source_on_open, source_ramp_up = filter_data_plasma_on_ramp_up(
+            data, source_list
+        )
+
+    add_event_to_events([source_on, source_on_open, source_ramp_up], events)
+
+    # ---------2/CONDITION FOR THE CRACKER BEING ON--------
+    with stats.stage('filter_data_cracker_on_open'):
+        cracker_on_open = filter_data_cracker_on_open(data)
+
+    add_event_to_events(cracker_on_open, events)
+
+    # ---------3/CONDITION FOR THE TEMPERATURE CONTROL--------
+    with stats.stage('filter_data_temp_ctrl'):
+        temp_ctrl = filter_data_temp_ctrl(data)
+
+    add_event_to_events(temp_ctrl, events)
+
+    # ----- 4/CONDITIONS FOR THE DIFFERENT GASES BEING FLOWN--------
+    with stats.stage('filter_gas'):
+        ph3, h2s, ar = filter_gas(data)
+
+    add_event_to_events([ph3, h2s, ar], events)
+
+    # ---------5/CONDITIONS FOR THE DEPOSITION--------
+    with stats.stage('filter_data_deposition'):
+        any_source_on, any_source_on_open, deposition, source_used_list = (
+            filter_data_deposition(data, source_list, source_on=source_on)
+        )
+
+    add_event_to_events([any_source_on, any_source_on_open, deposition], events)
+
+    # ---------6/CONDITIONS FOR THE DIFFERENT SOURCES BEING PRESPUTTERED--------
+    with stats.stage('filter_data_plasma_presput'):
+        source_presput = filter_data_plasma_presput(
+            data,
+            source_list,
+            source_on=source_on,
+            source_ramp_up=source_ramp_up,
+            cracker_on_open=cracker_on_open,
+            ph3=ph3,
+            h2s=h2s,
+            deposition=deposition,
+        )
+
+    add_event_to_events(source_presput, events)
+
+    # ---------7/CONDITIONS FOR THE S CRACKER PRESSURE MEAS--------
+    # Filter the data for the S Cracker pressure
+    with stats.stage('filter_data_cracker_pressure'):
+        cracker_base_pressure = filter_data_cracker_pressure(
+            data,
+            cracker_on_open=cracker_on_open,
+            ph3=ph3,
+            h2s=h2s,
+            ar=ar,
+            deposition=deposition,
+        )
+
+    add_event_to_events(cracker_base_pressure, events)
+
+    # ---------8/CONDITIONS FOR THE DEPOSITION RATE MEASUREMENT--------
+
+    with stats.stage('filter_data_film_dep_rate'):
+        (
+            deprate2_ternary_meas,
+            deprate2_film_meas,
+            deprate2_meas,
+            xtal2_open,
+            deprate2_sulfur_meas,
+        ) = filter_data_film_dep_rate(
+            data,
+            source_list,
+            deposition=deposition,
+            source_on_open=source_on_open,
+            any_source_on_open=any_source_on_open,
+            cracker_on_open=cracker_on_open,
+            ph3=ph3,
+            h2s=h2s,
+        )
+
+    add_event_to_events(
+        [
+            deprate2_meas,
+            xtal2_open,
+            deprate2_sulfur_meas,
+            deprate2_film_meas,
+            deprate2_ternary_meas,
+        ],
+        events,
+    )
+
+    # ---9/CONDITIONS FOR THE SUBSTRATE TEMPERATURE RAMPING UP OR DOWN-----
+    # Filter the data for the substrate temperature ramping up or down
+    with stats.stage('filter_data_temp_ramp_up_down'):
+        ramp_up_temp, ramp_down_temp, ramp_down_high_temp, ramp_down_low_temp = (
+            filter_data_temp_ramp_up_down(
+                data,
+                cracker_on_open=cracker_on_open,
+                temp_ctrl=temp_ctrl,
+                ph3=ph3,
+                h2s=h2s,
+                deposition=deposition,
+            )
+        )
+    add_event_to_events(
+        [ramp_up_temp, ramp_down_temp, ramp_down_high_temp, ramp_down_low_temp], events
+    )
+
+    # ----10/CONDITIONS FOR THE PLATEN BIAS BEING ON----------
+    # Filter the data for the platen bias being on
+    with stats.stage('filter_data_platen_bias_on'):
+        platen_bias_on = filter_data_platen_bias_on(data)
+
+    add_event_to_events(platen_bias_on, events)
+
+    # -----FURTHER PROCESSING OF THE EVENTS-----
+    # Remove the empty events from the events
+    events = [event for event in events if event.bounds]
+
+    return data, events, deposition
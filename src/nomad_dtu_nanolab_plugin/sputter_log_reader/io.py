@@ -0,0 +1,635 @@
+"""
+Reading, formatting and caching of the logfiles, and reading of the Optix
+spectra.
+"""
+
+import csv
+import hashlib
+import importlib
+import importlib.util
+import logging
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader.constants import (
+    EVENT_COLUMN_PREFIXES,
+    LOG_READER_VERSION,
+    LOGFILE_CACHE_DIR_ENV,
+    LOGFILE_CACHE_MAX_AGE,
+    LOGFILE_CACHE_MAX_AGE_ENV,
+    LOGFILE_CACHE_MAX_SIZE,
+    LOGFILE_CACHE_MAX_SIZE_ENV,
+    LOGFILE_CHUNK_SIZE,
+    LOGFILE_HEADER_LINE,
+    TIMESTAMP_FORMAT,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.context import (
+    format_time_stamp,
+    get_source_list,
+    make_timestamps_tz_naive,
+    parse_time_stamps,
+)
+
+logger = logging.getLogger(__name__)
+
+# ----------FUNCTION FOR READING THE LOGFILE------------
+
+
+# Schemas (column dtypes) of the logfiles already read, keyed by their header.
+# All the logfiles of a given chamber configuration share the same header,
+# so the dtypes only have to be inferred once per worker
+_LOGFILE_SCHEMAS = {}
+
+
+# Function to read the IDOL combinatorial chamber CSV logfile
+def read_logfile(file_path, usecols=None, chunksize=None):
+    """
+    This function reads a logfile and returns a DataFrame with the
+    'Time Stamp' column converted to datetime format.
+    All the logged values are stored in the DataFrame
+    as they are in the logfile.
+
+    usecols can be a list of column names or 'events' to only read the columns
+    used by the event filters (see EVENT_COLUMN_PREFIXES). If the header of the
+    logfile does not have the expected layout, the logfile is read with the
+    plain pandas parser.
+    If chunksize is given, the logfile is parsed chunksize rows at a time
+    with the pandas parser (see parse_logfile_chunks). Only the parsing is
+    done in chunks: the whole logfile is still returned as one DataFrame, on
+    which the event conditions are evaluated.
+    """
+    header = read_logfile_header(file_path)
+    if header is None or 'Time Stamp' not in header:
+        df = pd.read_csv(file_path, header=[1], skiprows=[0])
+        df['Time Stamp'] = pd.to_datetime(df['Time Stamp'], format=TIMESTAMP_FORMAT)
+    else:
+        columns = select_logfile_columns(header, usecols)
+        df = None
+        if chunksize is not None:
+            df = parse_logfile_chunks(file_path, header, columns, chunksize)
+        if df is None:
+            df = read_logfile_columns(file_path, header, columns)
+            df['Time Stamp'] = parse_time_stamps(df['Time Stamp'])
+    # Ensure all timestamps in the log file and spectrum are tz-naive
+    df['Time Stamp'] = df['Time Stamp'].dt.tz_localize(None)
+    return df
+
+
+# Function to read the header line of the logfile, returns None if the
+# logfile is not a file on disk or if the header cannot be read
+def read_logfile_header(file_path):
+    if not isinstance(file_path, (str, os.PathLike)):
+        return None
+    try:
+        with open(file_path, encoding='utf-8', newline='') as file:
+            for _ in range(LOGFILE_HEADER_LINE):
+                file.readline()
+            header_line = file.readline()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not header_line:
+        return None
+    return tuple(next(csv.reader([header_line])))
+
+
+# Function to select the columns to read, always keeping the 'Time Stamp'
+# column. Requested columns that are not in the logfile are ignored, as
+# many of the logged columns are optional
+def select_logfile_columns(header, usecols=None):
+    if usecols is None:
+        return list(header)
+    if usecols == 'events':
+        return [col for col in header if col.startswith(EVENT_COLUMN_PREFIXES)]
+    usecols = set(usecols) | {'Time Stamp'}
+    return [col for col in header if col in usecols]
+
+
+# Function to read the selected columns of the logfile with the cached schema
+# of its header. Uses the multithreaded pyarrow CSV parser when it is installed
+def read_logfile_columns(file_path, header, columns):
+    schema = _LOGFILE_SCHEMAS.get(header)
+    read_kwargs = {
+        'skiprows': LOGFILE_HEADER_LINE,
+        'header': 0,
+        'usecols': columns,
+    }
+    if schema is not None:
+        read_kwargs['dtype'] = {col: schema[col] for col in columns if col in schema}
+    if importlib.util.find_spec('pyarrow') is not None:
+        try:
+            df = pd.read_csv(file_path, engine='pyarrow', **read_kwargs)
+        except Exception:
+            df = None
+    else:
+        df = None
+    if df is None:
+        try:
+            df = pd.read_csv(file_path, **read_kwargs)
+        except ValueError:
+            # The cached schema does not fit this logfile, we infer it again
+            read_kwargs.pop('dtype', None)
+            df = pd.read_csv(file_path, **read_kwargs)
+            schema = None
+    if schema is None:
+        # Only the float and string dtypes are cached. Integer columns are left
+        # to inference as they become float if a value is missing
+        _LOGFILE_SCHEMAS[header] = {
+            col: dtype
+            for col, dtype in df.dtypes.items()
+            if col != 'Time Stamp' and dtype.kind in 'fOT'
+        }
+    # Keep the column order of the logfile, whatever the parser
+    return df[columns]
+
+
+# Function to iterate over the selected columns of the logfile in time
+# ordered chunks of chunksize rows, with the 'Time Stamp' column already parsed
+def _iter_logfile_column_chunks(file_path, header, columns, chunksize):
+    schema = _LOGFILE_SCHEMAS.get(header, {})
+    dtype = {col: schema[col] for col in columns if col in schema}
+    try:
+        reader = pd.read_csv(
+            file_path,
+            skiprows=LOGFILE_HEADER_LINE,
+            header=0,
+            usecols=columns,
+            dtype=dtype or None,
+            chunksize=chunksize,
+        )
+        with reader:
+            for raw_chunk in reader:
+                chunk = raw_chunk[columns]
+                chunk['Time Stamp'] = parse_time_stamps(
+                    chunk['Time Stamp']
+                ).dt.tz_localize(None)
+                yield chunk
+    except ValueError:
+        if not dtype:
+            raise
+        # The cached schema does not fit this logfile, it is dropped for the
+        # next read to infer it again
+        _LOGFILE_SCHEMAS.pop(header, None)
+        raise
+
+
+# Function to parse the logfile by chunks into preallocated columns, so that
+# the strings of the time stamps and the buffers of the parser are only held
+# for one chunk. The returned DataFrame still holds the whole logfile. The
+# dtypes of the numeric columns are promoted across the chunks as pandas
+# would do over the whole column. Returns None if the dtypes of a column
+# cannot be combined (Ex: numbers then strings), in which case the logfile
+# must be read at once for pandas to infer them over all the rows
+def parse_logfile_chunks(file_path, header, columns, chunksize=LOGFILE_CHUNK_SIZE):
+    n_rows = count_logfile_rows(file_path)
+    arrays = {}
+    dtypes = {}
+    start = 0
+    try:
+        for chunk in _iter_logfile_column_chunks(file_path, header, columns, chunksize):
+            stop = start + len(chunk)
+            if stop > n_rows:
+                logger.info('Unexpected number of rows in %s', file_path)
+                return None
+            for col in columns:
+                values = chunk[col].to_numpy()
+                if col not in arrays:
+                    arrays[col] = np.empty(n_rows, dtype=values.dtype)
+                    dtypes[col] = chunk[col].dtype
+                elif chunk[col].dtype != dtypes[col]:
+                    dtype = promote_chunk_dtype(arrays[col].dtype, values.dtype)
+                    if dtype is None:
+                        logger.info(
+                            'Inconsistent dtypes of the column %s in %s, '
+                            'the logfile is read at once',
+                            col,
+                            file_path,
+                        )
+                        return None
+                    arrays[col] = arrays[col].astype(dtype, copy=False)
+                    dtypes[col] = dtype
+                arrays[col][start:stop] = values
+            start = stop
+    except ValueError as e:
+        logger.info('Unable to parse %s in chunks: %s', file_path, e)
+        return None
+    if header not in _LOGFILE_SCHEMAS:
+        _LOGFILE_SCHEMAS[header] = {
+            col: dtype
+            for col, dtype in dtypes.items()
+            if col != 'Time Stamp' and dtype.kind in 'fOT'
+        }
+    return pd.DataFrame(
+        {
+            col: pd.Series(arrays[col][:start], dtype=dtypes[col], copy=False)
+            for col in columns
+        },
+        copy=False,
+    )
+
+
+# Function to get the dtype of a column parsed as dtype in the previous
+# chunks and as chunk_dtype in the current one. Only the integer and float
+# dtypes are combined (Ex: int64 and float64 give float64), None otherwise
+def promote_chunk_dtype(dtype, chunk_dtype):
+    if (
+        isinstance(dtype, np.dtype)
+        and isinstance(chunk_dtype, np.dtype)
+        and dtype.kind in 'iuf'
+        and chunk_dtype.kind in 'iuf'
+    ):
+        return np.result_type(dtype, chunk_dtype)
+    return None
+
+
+# Function to count the data rows of the logfile without parsing it
+def count_logfile_rows(file_path, block_size=2**24):
+    n_lines = 0
+    last = b''
+    with open(file_path, 'rb') as file:
+        while block := file.read(block_size):
+            n_lines += block.count(b'\n')
+            last = block[-1:]
+    if last and last != b'\n':
+        n_lines += 1
+    # The header line and the lines before it are not data rows
+    return max(n_lines - LOGFILE_HEADER_LINE - 1, 0)
+
+
+# ----------FUNCTIONS FOR CACHING THE PARSED LOGFILES------------
+
+
+# Function to read a logfile and format it for the event filters, going
+# through an on-disk cache of the formatted DataFrames. The cache is keyed by
+# the hash of the logfile content and LOG_READER_VERSION, so that unchanged
+# logfiles are never parsed twice, even when the entries are reprocessed
+def read_cached_logfile(file_path, usecols=None, cache_dir=None):
+    """
+    This function returns the formatted DataFrame of the logfile
+    (see format_logfile), loading it from the logfile cache if possible.
+    The cache is opt-in: it is only used if cache_dir is given or the
+    DTU_NANOLAB_LOGFILE_CACHE_DIR environment variable is set, and only if a
+    Parquet engine (pyarrow or fastparquet) is installed, as the cached
+    logfiles are only stored as Parquet. The maximum size (MB) and maximum
+    age (days) of the cache are set by the DTU_NANOLAB_LOGFILE_CACHE_MAX_SIZE
+    and DTU_NANOLAB_LOGFILE_CACHE_MAX_AGE environment variables.
+    """
+    if cache_dir is None:
+        cache_dir = get_logfile_cache_dir()
+    if cache_dir is None or not has_parquet_engine():
+        if cache_dir is not None:
+            logger.debug('No Parquet engine installed, the logfile is not cached')
+        data, _ = format_logfile(read_logfile(file_path, usecols=usecols))
+        return data
+
+    cache_path = os.path.join(
+        cache_dir, get_logfile_cache_key(file_path, usecols) + LOGFILE_CACHE_EXTENSION
+    )
+    data = load_cached_logfile(cache_path)
+    if data is None:
+        data, _ = format_logfile(read_logfile(file_path, usecols=usecols))
+        store_cached_logfile(data, cache_path)
+        evict_logfile_cache(cache_dir)
+    return data
+
+
+# Function to get the directory of the logfile cache, None (no cache) unless
+# the DTU_NANOLAB_LOGFILE_CACHE_DIR environment variable is set
+def get_logfile_cache_dir():
+    return os.environ.get(LOGFILE_CACHE_DIR_ENV) or None
+
+
+# Function to build the cache key of a logfile from the sha256 of its
+# content, the reader version and the columns read
+def get_logfile_cache_key(file_path, usecols=None):
+    if usecols is None or isinstance(usecols, str):
+        columns = str(usecols)
+    else:
+        columns = ','.join(sorted(usecols))
+    options = hashlib.sha256(
+        f'{LOG_READER_VERSION};{pd.__version__};{columns}'.encode()
+    ).hexdigest()
+    return f'{hash_file(file_path)}_{options[:16]}'
+
+
+# Function to get the sha256 hash of the content of a file
+def hash_file(file_path):
+    file_hash = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+# The cached logfiles are only stored as Parquet, which only holds data. In
+# particular they are never pickled, as loading a pickle from a directory
+# other users can write to would run their code
+LOGFILE_CACHE_EXTENSION = '.parquet'
+
+
+def has_parquet_engine():
+    return (
+        importlib.util.find_spec('pyarrow') is not None
+        or importlib.util.find_spec('fastparquet') is not None
+    )
+
+
+def load_cached_logfile(cache_path):
+    if not cache_path.endswith(LOGFILE_CACHE_EXTENSION) or not os.path.exists(
+        cache_path
+    ):
+        return None
+    try:
+        data = pd.read_parquet(cache_path)
+    except Exception as e:
+        logger.warning('Removing unreadable cached logfile %s: %s', cache_path, e)
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+        return None
+    # Refresh the modification time, used as last access time by the eviction
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    data.attrs['formatted'] = True
+    return data
+
+
+def store_cached_logfile(data, cache_path):
+    # Write to a temporary file first, so that concurrent workers never read
+    # a partially written cache file. The cache directory is only accessible
+    # by its owner when it is created here
+    try:
+        os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+        temp_path = f'{cache_path}.{os.getpid()}.tmp'
+        data.to_parquet(temp_path)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        logger.warning('Unable to cache the logfile in %s: %s', cache_path, e)
+
+
+# Function to remove the cached logfiles older than max_age (days), and then
+# the least recently used ones until the cache is smaller than max_size (MB)
+def evict_logfile_cache(cache_dir, max_size=None, max_age=None):
+    if max_size is None:
+        max_size = float(
+            os.environ.get(LOGFILE_CACHE_MAX_SIZE_ENV, LOGFILE_CACHE_MAX_SIZE)
+        )
+    if max_age is None:
+        max_age = float(
+            os.environ.get(LOGFILE_CACHE_MAX_AGE_ENV, LOGFILE_CACHE_MAX_AGE)
+        )
+
+    cached_files = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith(LOGFILE_CACHE_EXTENSION):
+            stat = entry.stat()
+            cached_files.append((stat.st_mtime, stat.st_size, entry.path))
+    # Oldest last access first
+    cached_files.sort()
+
+    now = time.time()
+    total_size = sum(size for _, size, _ in cached_files)
+    for mtime, size, path in cached_files:
+        too_old = now - mtime > max_age * 86400
+        too_big = total_size > max_size * 1e6
+        if not (too_old or too_big):
+            continue
+        try:
+            os.remove(path)
+            total_size -= size
+        except OSError:
+            pass
+
+
+# ----------FUNCTIONS FOR FORMATTING THE LOGFILE------------
+
+
+def format_logfile(data):
+    # Logfiles loaded from the cache are already formatted
+    if data.attrs.get('formatted', False):
+        return data, get_source_list(data)
+    # print('Formatting the dataframe for conditional filtering')
+    # -----FORMATTING THE DATAFRAME FOR CONDITIONAL FILTERING-------
+    # -------RENAME THE CRACKER COLUMNS OF THE DATAFRAME---------
+    data = rename_cracker_columns(data)
+    # ---------READING THE SOURCE USED--------
+    # Get the source list automatically from the logfile
+    source_list = get_source_list(data)
+    # ---------CONNECTING THE SOURCES TO THE POWER SUPPLIES--------
+    # Read what source is connected to which power supply and
+    # create column names that relate directly to the source instead
+    # of the power supply
+    connect_source_to_power_supply(data, source_list)
+    data.attrs['formatted'] = True
+    # ---------DEFINE DE CONDITIONS FOR DIFFERENT EVENTS-------------
+    # Initialize the list of all events
+    return data, source_list
+
+
+# Function to read what source is connected to which power supply and creates column
+# names that relate directly to the source instead of the power supply
+# Iterate over source numbers and perform column creation
+# (Ex: 'Power Supply 1 DC Bias' -> 'Source 4 DC Bias')
+# Additiomal we check if, at any point the shutter
+# is open and the source is switch at the same time
+# to ensure that the algorithm does think that we used a source if
+# we switched it on to a power supply by mistake
+def connect_source_to_power_supply(data, source_list):
+    for source_number in source_list:
+        shutter_col = f'PC Source {source_number} Shutter Open'
+        if f'PC Source {source_number} Switch-PDC-PWS1' in data.columns:
+            switch_columns = {
+                f'PC Source {source_number} Switch-PDC-PWS1': 'Power Supply 1',
+                f'PC Source {source_number} Switch-RF1-PWS2': 'Power Supply 2',
+                f'PC Source {source_number} Switch-RF2-PWS3': 'Power Supply 3',
+            }
+            for switch_col, power_supply in switch_columns.items():
+                condition_met = (data[switch_col] == 1) & (data[shutter_col] == 1)
+                if condition_met.any():
+                    for col in data.columns:
+                        if col.startswith(power_supply):
+                            new_col = col.replace(
+                                power_supply, f'Source {source_number}'
+                            )
+                            data[new_col] = data[col]
+        elif f'PC Source {source_number} Switch-PDC-PWS1' not in data.columns:
+            for power_supply in ['Power Supply 1', 'Power Supply 2', 'Power Supply 3']:
+                condition_met = (data[f'{power_supply} Enabled'] == 1) & (
+                    data[shutter_col] == 1
+                )
+                if condition_met.any():
+                    for col in data.columns:
+                        if col.startswith(power_supply):
+                            new_col = col.replace(
+                                power_supply, f'Source {source_number}'
+                            )
+                            data[new_col] = data[col]
+        else:
+            print('No source found')
+            break
+
+
+# Method to rename all 'Sulfur Cracker Control Setpoint' columns to
+#'Sulfur Cracker Control Setpoint Feedback' and all
+#'Sulfur Cracker Control Valve PulseWidth Setpoint' columns to
+#'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'
+# This allows to harmonize the column name for samples deposited
+# before the 12/08/2024, for which the column name was wrong and
+# cracker data is not logged properly
+def rename_cracker_columns(data):
+    cond_column = ('Sulfur Cracker Control Setpoint' in data.columns) & (
+        'Sulfur Cracker Control Valve PulseWidth Setpoint' in data.columns
+    )
+    cond_column_feedback = (
+        'Sulfur Cracker Control Setpoint Feedback' in data.columns
+    ) & ('Sulfur Cracker Control Valve PulseWidth Setpoint Feedback' in data.columns)
+
+    if cond_column and not cond_column_feedback:
+        # If the wrong cracker columns are present exclusively, we rename them
+        data.rename(
+            columns={
+                'Sulfur Cracker Control Setpoint': (
+                    'Sulfur Cracker Control Setpoint Feedback'
+                ),
+                'Sulfur Cracker Control Valve PulseWidth Setpoint': (
+                    'Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'
+                ),
+            },
+            inplace=True,
+        )
+    return data
+
+
+# -------ADDITIONAL FUNCTIONS FOR THE OPTIX SPECTRA------------
+
+
+# Function to read the OPTIX spectrum CSV file
+def read_spectrum(file_path):
+    """
+    Intended to read OPTIX spectrum
+    Reads a CSV file with spectrum data and returns a DataFrame
+    with columns 'x', 'y1', 'y2', etc.,
+    and a dictionary mapping each 'y' column to its corresponding timestamp.
+
+    You can access the timestamps of each spectrum by looking up the
+    timestamp_map dictionary. For example, timestamp_map['y1'] will give
+    you the timestamp for the first intensity spectrum,
+    timestamp_map['y2'] for the second, and so on
+
+    Parameters:
+    file_path (str): Path to the CSV file.
+
+    Returns:
+    result_df (DataFrame): A DataFrame with columns 'x', 'y1', 'y2', etc.
+    timestamp_map (dict): A dictionary mapping each 'y'
+    column to its corresponding timestamp.
+    """
+
+    # Step 0: Initiate a dictionary to store the spectrum and timestamp
+    spectra = {}
+
+    # Step 1: Read the CSV file, specifying that the header is in the first row
+    df = pd.read_csv(file_path, header=None)
+
+    # Step 2: Extract the x wavelength values
+    # (from the first row, starting from the third column)
+    x_wavelengths = df.iloc[0, 2:].values
+
+    # Step 3: Process the rest of the data (from the second row onwards)
+    data = df.iloc[1:].copy()
+
+    # Step 4: Rename the columns to 'Timestamp', 'Triggered', and x wavelength values
+    data.columns = ['Timestamp', 'Triggered'] + list(x_wavelengths)
+    data.drop('Triggered', axis=1, inplace=True)
+
+    # Step 5: Convert the 'Timestamp' column to datetime
+    data['Timestamp'] = pd.to_datetime(data['Timestamp'])
+
+    # Step 6: Reshape the DataFrame to have columns 'x', 'y1', 'y2', etc.
+    reshaped_data = data.melt(id_vars='Timestamp', var_name='x', value_name='Intensity')
+
+    # Step 7: Create a new DataFrame with columns 'x', 'y1', 'y2', etc.
+    result_df = reshaped_data.pivot(
+        index='x', columns='Timestamp', values='Intensity'
+    ).reset_index()
+
+    # Rename the columns appropriately
+    result_df.columns.name = None
+    y_columns = [f'y{i + 1}' for i in range(len(result_df.columns) - 1)]
+    result_df.columns = ['x'] + y_columns
+
+    # Step 8: Drop the first row if it is filled with NaNs
+    if result_df.iloc[0].isna().all():
+        result_df = result_df.drop(result_df.index[0])
+
+    # Step 9: Create a timestamp map
+    timestamp_map = {
+        f'y{i + 1}': timestamp
+        for i, timestamp in enumerate(reshaped_data['Timestamp'].unique())
+    }
+
+    timestamp_map_tz_naive = make_timestamps_tz_naive(timestamp_map)
+
+    spectra['data'] = result_df
+    spectra['timestamp_map'] = timestamp_map_tz_naive
+
+    return spectra
+
+
+def filter_spectrum(spectra, bounds):
+    """
+    This function filters in the Optix spectrums based on the conditions that they
+    have been recorded during the time bounds passed in the 'bounds' list.
+    """
+    filtered_spectra = {'data': [], 'timestamp_map': {}}
+
+    spectra['timestamp_map'] = make_timestamps_tz_naive(spectra['timestamp_map'])
+
+    if not isinstance(bounds[0], tuple):
+        bounds = [bounds]
+
+    # The timestamps of the spectra are compared to each bound at once
+    timestamp_keys = list(spectra['timestamp_map'])
+    timestamps = pd.DatetimeIndex(list(spectra['timestamp_map'].values()))
+
+    for bound in bounds:
+        start_time, end_time = bound
+        # Format start_time and end_time in case they are input strings instead
+        # of event.bounds
+        start_time = format_time_stamp(start_time, ref_object=spectra)
+        end_time = format_time_stamp(end_time, ref_object=spectra)
+
+        in_bound = (timestamps >= start_time) & (timestamps <= end_time)
+        for k in np.flatnonzero(in_bound):
+            timestamp_key = timestamp_keys[k]
+            filtered_spectra['data'].append(spectra['data'][['x', timestamp_key]])
+            filtered_spectra['timestamp_map'][timestamp_key] = spectra['timestamp_map'][
+                timestamp_key
+            ]
+
+    if filtered_spectra['data']:
+        filtered_spectra['data'] = (
+            pd.concat(filtered_spectra['data'], axis=1).T.drop_duplicates().T
+        )
+    else:
+        filtered_spectra['data'] = pd.DataFrame()
+
+    return filtered_spectra
+
+
+# normalize the data in a column
+def normalize_column(df, column_name):
+    min_val = df[column_name].min()
+    max_val = df[column_name].max()
+    return (df[column_name] - min_val) / (max_val - min_val)
+
+
+def calc_mean_norm_spectrum(spectra):
+    spectra['data']['mean'] = spectra['data'].iloc[:, 1:].mean(axis=1)
+    spectra['data']['mean_norm'] = normalize_column(spectra['data'], 'mean')
+    return spectra
@@ -0,0 +1,504 @@
+"""
+Mapping of the parameters derived from the logfiles to the quantities of the
+NOMAD sputtering sections.
+"""
+
+import collections
+import operator
+
+# ----NOMAD HELPER FUNCTION-----
+
+
+# Helper method to get the nested value, if it exists
+def get_nested_value(dictionary, key_path):
+    """
+    Safely get a nested value from a dictionary.
+
+    :param dictionary: The dictionary to traverse.
+    :param key_path: A list of keys representing the path
+        to the desired value.
+    :return: The value at the end of the key path, or None if not found.
+    """
+    for key in key_path:
+        if isinstance(dictionary, dict):
+            dictionary = dictionary.get(key)
+        else:
+            return None
+    return dictionary
+
+
+def map_params_to_nomad(params, gun_list):
+    # Definiting the input, ouput and unit
+    param_nomad_map = [
+        # Deposition parameters
+        [
+            ['deposition', 'avg_temp_1'],
+            ['deposition_parameters', 'deposition_temp'],
+            'degC',
+        ],
+        # duration has no unit since it is a TimeDelta object
+        [
+            ['deposition', 'duration'],
+            ['deposition_parameters', 'deposition_time'],
+            None,
+        ],
+        [
+            ['deposition', 'avg_capman_pressure'],
+            ['deposition_parameters', 'sputter_pressure'],
+            'mtorr',
+        ],
+        [
+            ['deposition', 'material_space'],
+            ['deposition_parameters', 'material_space'],
+            None,
+        ],
+        [
+            ['deposition', 'avg_ar_flow'],
+            ['deposition_parameters', 'ar_flow'],
+            'cm^3/minute',
+        ],
+        [
+            ['deposition', 'avg_h2s_flow'],
+            ['deposition_parameters', 'h2s_in_ar_flow'],
+            'cm^3/minute',
+        ],
+        [
+            ['deposition', 'avg_h2s_partial_pressure'],
+            ['deposition_parameters', 'h2s_partial_pressure'],
+            'mtorr',
+        ],
+        [
+            ['deposition', 'avg_ph3_flow'],
+            ['deposition_parameters', 'ph3_in_ar_flow'],
+            'cm^3/minute',
+        ],
+        [
+            ['deposition', 'avg_ph3_partial_pressure'],
+            ['deposition_parameters', 'ph3_partial_pressure'],
+            'mtorr',
+        ],
+        # End of process parameters
+        [
+            ['overview', 'end_of_process_temp'],
+            ['end_of_process', 'heater_temp'],
+            'degC',
+        ],
+        [
+            ['overview', 'time_in_chamber_after_deposition'],
+            ['end_of_process', 'time_in_chamber_after_deposition'],
+            'second',
+        ],
+    ]
+    if params['deposition'].get('SCracker', {}).get('enabled', False):
+        # SCracker parameters
+        param_nomad_map.extend(
+            [
+                [
+                    ['deposition', 'SCracker', 'zone1_temp'],
+                    ['deposition_parameters', 'SCracker', 'zone1_temp'],
+                    'degC',
+                ],
+                [
+                    ['deposition', 'SCracker', 'zone2_temp'],
+                    ['deposition_parameters', 'SCracker', 'zone2_temp'],
+                    'degC',
+                ],
+                [
+                    ['deposition', 'SCracker', 'zone3_temp'],
+                    ['deposition_parameters', 'SCracker', 'zone3_temp'],
+                    'degC',
+                ],
+                [
+                    ['deposition', 'SCracker', 'pulse_width'],
+                    ['deposition_parameters', 'SCracker', 'valve_on_time'],
+                    'millisecond',
+                ],
+                [
+                    ['deposition', 'SCracker', 'pulse_freq'],
+                    ['deposition_parameters', 'SCracker', 'valve_frequency'],
+                    'mHz',
+                ],
+            ]
+        )
+    # Gun parameters
+    for gun in gun_list:
+        if params['deposition'].get(gun, {}).get('enabled', False):
+            param_nomad_map.extend(
+                [
+                    [
+                        ['deposition', gun, 'target_material'],
+                        ['deposition_parameters', gun, 'target_material'],
+                        None,
+                    ],
+                    [
+                        ['deposition', gun, 'target_id'],
+                        ['deposition_parameters', gun, 'target_id', 'lab_id'],
+                        None,
+                    ],
+                    [
+                        ['deposition', gun, 'avg_output_power'],
+                        ['deposition_parameters', gun, 'applied_power'],
+                        'W',
+                    ],
+                    [
+                        ['source_ramp_up', gun, 'ignition_power'],
+                        ['deposition_parameters', gun, 'plasma_ignition_power'],
+                        'W',
+                    ],
+                    [
+                        ['deposition', gun, 'plasma_type'],
+                        ['deposition_parameters', gun, 'power_type'],
+                        None,
+                    ],
+                    [
+                        ['deposition', gun, 'avg_voltage'],
+                        ['deposition_parameters', gun, 'average_voltage'],
+                        'V',
+                    ],
+                ]
+            )
+
+    return param_nomad_map
+
+
+def map_step_params_to_nomad(key):
+    step_param_nomad_map = [
+        [[key, 'name'], ['name'], None],
+        # start_time has no unit since it is a TimeStamp object
+        [[key, 'start_time'], ['start_time'], None],
+        # duration has no unit since it is a TimeDelta object
+        [[key, 'duration'], ['duration'], None],
+    ]
+
+    # Defining the input, output and unit
+    return step_param_nomad_map
+
+
+def map_environment_params_to_nomad(key):
+    """
+    Heater section missing arguments
+    In nomad
+    (nomad-material-processing/src/nomad_material_processing/vapor_deposition/general.py)
+
+    class SubstrateHeater(ArchiveSection):
+        pass
+    """
+    environment_param_nomad_map = [
+        [[key, 'environment', 'pressure', 'value'], ['pressure', 'value'], 'mtorr'],
+        [[key, 'environment', 'pressure', 'time'], ['pressure', 'time'], 'second'],
+    ]
+
+    return environment_param_nomad_map
+
+
+def map_gas_flow_params_to_nomad(key, gas_name):
+    gas_flow_param_nomad_map = [
+        [[key, 'environment', 'gas_flow', gas_name, 'gas', 'name'], ['gas_name'], None],
+        [
+            [key, 'environment', 'gas_flow', gas_name, 'gas', 'name'],
+            ['gas', 'name'],
+            None,
+        ],
+        [
+            [key, 'environment', 'gas_flow', gas_name, 'flow_rate', 'value'],
+            ['flow_rate', 'value'],
+            'cm^3/minute',
+        ],
+        [
+            [key, 'environment', 'gas_flow', gas_name, 'flow_rate', 'time'],
+            ['flow_rate', 'time'],
+            'second',
+        ],
+        [
+            [key, 'environment', 'gas_flow', gas_name, 'flow_rate', 'measurement_type'],
+            ['flow_rate', 'measurement_type'],
+            None,
+        ],
+    ]
+
+    return gas_flow_param_nomad_map
+
+
+def map_s_cracker_params_to_nomad(key):
+    s_cracker_param_nomad_map = [
+        [
+            [key, 'sources', 's_cracker', 'valve_pulsing', 'value'],
+            ['valve_open', 'value'],
+            None,
+        ],
+        [
+            [key, 'sources', 's_cracker', 'valve_pulsing', 'time'],
+            ['valve_open', 'time'],
+            'second',
+        ],
+        [
+            [key, 'sources', 's_cracker', 'valve_pulsing', 'mode_value'],
+            ['valve_open', 'mode_value'],
+            None,
+        ],
+    ]
+    for zone_number in ['1', '2', '3']:
+        s_cracker_param_nomad_map.extend(
+            [
+                [
+                    [key, 'sources', 's_cracker', f'avg_zone{zone_number}_temp'],
+                    ['vapor_source', f'avg_zone{zone_number}_temp'],
+                    'degC',
+                ],
+                [
+                    [key, 'sources', 's_cracker', f'zone{zone_number}_temp', 'value'],
+                    ['vapor_source', f'zone{zone_number}_temp', 'value'],
+                    'degC',
+                ],
+                [
+                    [key, 'sources', 's_cracker', f'zone{zone_number}_temp', 'time'],
+                    ['vapor_source', f'zone{zone_number}_temp', 'time'],
+                    'second',
+                ],
+            ]
+        )
+
+    return s_cracker_param_nomad_map
+
+
+def map_sputter_source_params_to_nomad(key, source_name, power_type):
+    source_param_nomad_map = [
+        [
+            [key, 'sources', source_name, 'power_supply', 'power_type'],
+            ['vapor_source', 'power_type'],
+            None,
+        ],
+        [
+            [key, 'sources', source_name, 'power_supply', 'avg_power_sp'],
+            ['vapor_source', 'avg_power_sp'],
+            'W',
+        ],
+        [
+            [key, 'sources', source_name, 'power_supply', 'power_sp', 'value'],
+            ['vapor_source', 'power_sp', 'value'],
+            'W',
+        ],
+        [
+            [key, 'sources', source_name, 'power_supply', 'power_sp', 'time'],
+            ['vapor_source', 'power_sp', 'time'],
+            'second',
+        ],
+        [
+            [key, 'sources', source_name, 'source_shutter_open', 'value'],
+            ['source_shutter_open', 'value'],
+            None,
+        ],
+        [
+            [key, 'sources', source_name, 'source_shutter_open', 'time'],
+            ['source_shutter_open', 'time'],
+            'second',
+        ],
+        [
+            [key, 'sources', source_name, 'source_shutter_open', 'mode_value'],
+            ['source_shutter_open', 'mode_value'],
+            None,
+        ],
+    ]
+    if power_type == 'RF':
+        source_param_nomad_map.extend(
+            [
+                [
+                    [key, 'sources', source_name, 'power_supply', 'avg_dc_bias'],
+                    ['vapor_source', 'avg_dc_bias'],
+                    'V',
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'dc_bias', 'value'],
+                    ['vapor_source', 'dc_bias', 'value'],
+                    'V',
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'dc_bias', 'time'],
+                    ['vapor_source', 'dc_bias', 'time'],
+                    'second',
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'avg_fwd_power'],
+                    ['vapor_source', 'avg_fwd_power'],
+                    'W',
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'avg_rfl_power'],
+                    ['vapor_source', 'avg_rfl_power'],
+                    'W',
+                ],
+            ]
+        )
+    if power_type in ['DC', 'pulsed_DC']:
+        source_param_nomad_map.extend(
+            [
+                [
+                    [key, 'sources', source_name, 'power_supply', 'avg_voltage'],
+                    ['vapor_source', 'avg_voltage'],
+                    'V',
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'voltage', 'value'],
+                    ['vapor_source', 'voltage', 'value'],
+                    'V',
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'voltage', 'time'],
+                    ['vapor_source', 'voltage', 'time'],
+                    'second',
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'avg_current'],
+                    ['vapor_source', 'avg_current'],
+                    'A',  # Check if this is correct
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'current', 'value'],
+                    ['vapor_source', 'current', 'value'],
+                    'A',
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'current', 'time'],
+                    ['vapor_source', 'current', 'time'],
+                    'second',
+                ],
+            ]
+        )
+    if power_type == 'pulsed_DC':
+        source_param_nomad_map.extend(
+            [
+                [
+                    [
+                        key,
+                        'sources',
+                        source_name,
+                        'power_supply',
+                        'avg_pulse_frequency',
+                    ],
+                    ['vapor_source', 'avg_pulse_frequency'],
+                    'kHz',
+                ],
+                [
+                    [
+                        key,
+                        'sources',
+                        source_name,
+                        'power_supply',
+                        'pulse_frequency',
+                        'value',
+                    ],
+                    ['vapor_source', 'pulse_frequency', 'value'],
+                    'kHz',
+                ],
+                [
+                    [
+                        key,
+                        'sources',
+                        source_name,
+                        'power_supply',
+                        'pulse_frequency',
+                        'time',
+                    ],
+                    ['vapor_source', 'pulse_frequency', 'time'],
+                    'second',
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'avg_dead_time'],
+                    ['vapor_source', 'avg_dead_time'],
+                    'microsecond',
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'dead_time', 'value'],
+                    ['vapor_source', 'dead_time', 'value'],
+                    'microsecond',
+                ],
+                [
+                    [key, 'sources', source_name, 'power_supply', 'dead_time', 'time'],
+                    ['vapor_source', 'dead_time', 'time'],
+                    'second',
+                ],
+            ]
+        )
+
+    return source_param_nomad_map
+
+
+def map_material_params_to_nomad(key, source_name):
+    material_param_nomad_map = [
+        [
+            [key, 'sources', source_name, 'target_id'],
+            ['lab_id'],
+            None,
+        ],
+    ]
+    return material_param_nomad_map
+
+
+# ----COMPILED NOMAD MAPS-----
+
+# A compiled entry of a NOMAD map: the accessor of the value in the
+# parameters (get), the setter of the value in the NOMAD section (set), the
+# unit of the value (resolved once by the unit_factory, if any), the input
+# keys and the path of the quantity in the section (Ex: step.name), only used
+# to format the log messages
+CompiledParam = collections.namedtuple(
+    'CompiledParam', ['get', 'set', 'unit', 'input_keys', 'output_path']
+)
+
+
+# Function to make the accessor of a key path, returning None if the path
+# does not exist (see get_nested_value)
+def make_getter(key_path):
+    key_path = tuple(key_path)
+
+    def get(dictionary):
+        for key in key_path:
+            if not isinstance(dictionary, dict):
+                return None
+            dictionary = dictionary.get(key)
+        return dictionary
+
+    return get
+
+
+# Function to make the setter of an attribute path (Ex: ['vapor_source',
+# 'power_sp', 'value']), the parent sections being looked up with a single
+# precompiled attrgetter
+def make_setter(attr_path):
+    name = attr_path[-1]
+    if len(attr_path) == 1:
+        return lambda obj, value: setattr(obj, name, value)
+    get_parent = operator.attrgetter('.'.join(attr_path[:-1]))
+    return lambda obj, value: setattr(get_parent(obj), name, value)
+
+
+# Function to compile a NOMAD map (list of [input_keys, output_keys, unit], as
+# returned by the map_*_to_nomad functions) of the output_obj_name section into
+# a tuple of CompiledParam. The first skip keys of the input keys are dropped,
+# so that the maps of the steps (whose input keys start with the step key) can
+# be compiled once and applied to the parameters of each step
+def compile_nomad_map(param_nomad_map, output_obj_name, skip=0, unit_factory=None):
+    compiled = []
+    for input_keys, output_keys, unit in param_nomad_map:
+        compiled.append(
+            CompiledParam(
+                get=make_getter(input_keys[skip:]),
+                set=make_setter(output_keys),
+                unit=(
+                    unit_factory(unit)
+                    if unit is not None and unit_factory is not None
+                    else unit
+                ),
+                input_keys=tuple(input_keys[skip:]),
+                output_path=f'{output_obj_name}.{".".join(output_keys)}',
+            )
+        )
+    return tuple(compiled)
+
+
+# Function to format the path of a compiled entry in the parameters for the
+# log messages (Ex: params['deposition']['avg_temp_1']), prefixed by the keys
+# skipped when compiling it
+def format_input_path(compiled_param, prefix=()):
+    joined_keys = "']['".join([*prefix, *compiled_param.input_keys])
+    return f"params['{joined_keys}']"
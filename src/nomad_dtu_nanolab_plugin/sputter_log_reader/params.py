@@ -0,0 +1,598 @@
+"""
+read_events and its ReadEventsResult, and the reports of the parameters
+derived from the events.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader.constants import (
+    CATEGORIES_LAST_EVENT,
+    CATEGORIES_MAIN_REPORT,
+    CATEGORIES_STEPS,
+    DEPOSITION_CONTINUITY_LIMIT,
+    MIN_DEPOSITION_SIZE,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.context import (
+    ProcessingStats,
+    get_time_span,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.events import (
+    EventIndex,
+    place_deposition_ramp_up_down_events_first,
+    sort_events_by_start_time,
+    unfold_events,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.filters import extract_events
+
+##------READ EVENTS RESULT DEFINITION------
+
+
+class ReadEventsResult:
+    """
+    Result of read_events, holding the LogContext of the logfile (context),
+    the events to plot and their EventIndex (event_index). The parameters of
+    the reports (main_params, step_params) are only extracted when they are
+    first accessed, so that the callers only pay for what they need (Ex: a
+    timeline only needs events_to_plot).
+    The processing is split in stages ('events', 'index', 'deposition',
+    'main_params', 'step_params'), recorded with their nested stages in stats
+    (see ProcessingStats). The error of a failed stage is stored in errors,
+    the parameters depending on a failed stage being left empty. For backward
+    compatibility, the result can be unpacked as (events_to_plot,
+    main_params, step_params).
+    """
+
+    def __init__(self, context, events, deposition, stats=None):
+        self.context = context
+        self.source_list = context.source_list
+        # working list of the events, modified by the deposition stage
+        self.events = events
+        # deposition event, the reference of the last events before deposition
+        self.deposition = deposition
+        self.stats = ProcessingStats() if stats is None else stats
+        self.errors = {}
+        self._stages = {}
+        # If the index stage fails, the events are plotted as they are
+        self.events_to_plot = events
+        self.run_stage('index', self._index_events)
+        if context.event_index is None:
+            context.event_index = EventIndex(self.events_to_plot)
+
+    @property
+    def event_index(self):
+        return self.context.event_index
+
+    # wall time of each stage
+    @property
+    def timings(self):
+        return self.stats.timings
+
+    @property
+    def main_params(self):
+        return self.run_stage('main_params', self._get_main_params) or {}
+
+    @property
+    def step_params(self):
+        return self.run_stage('step_params', self._get_step_params) or {}
+
+    def __iter__(self):
+        return iter((self.events_to_plot, self.main_params, self.step_params))
+
+    # method to run a stage of the processing once, storing its result and
+    # error, and recording it in stats. The result of a failed stage is None
+    def run_stage(self, stage, func):
+        if stage not in self._stages:
+            with self.stats.stage(stage, rows=len(self.context)):
+                try:
+                    self._stages[stage] = func()
+                except Exception as e:
+                    print('Error: ', e)
+                    print(f'The {stage} stage failed and its parameters are left empty')
+                    self.errors[stage] = e
+                    self._stages[stage] = None
+        return self._stages[stage]
+
+    def _index_events(self):
+        # Place the ramp_up_temp, deposition, ramp_down_high_temp,
+        # ramp_down_low_temp event first in the list of all events, in this
+        # particular order
+        self.events = place_deposition_ramp_up_down_events_first(self.events)
+        # Getting the list of all events to pass it to the plotting function
+        self.events_to_plot = [event.snapshot() for event in self.events]
+        # The events to plot are indexed by their time domains, so that the
+        # events in a time window can be queried from the event_index
+        self.context.event_index = EventIndex(self.events_to_plot)
+        return True
+
+    def _select_deposition(self):
+        # The working events are indexed to look up the events by category
+        # and their domains before the deposition. Only the deposition events
+        # are modified by verify_deposition_unicity, and they are not looked
+        # up afterwards, so the index is only built once
+        event_index = EventIndex(self.events)
+        # We verify the unicity of the deposition event, and try to fix it if
+        # needed
+        with self.stats.stage('verify_deposition_unicity'):
+            self.events, interrupt_deposition = verify_deposition_unicity(
+                self.events, self.context, event_index
+            )
+        # To make a list sutable for making a report, we remove
+        # all the events that do not match the CATEGORIES_MAIN_REPORT
+        events_main_report = [
+            event.snapshot()
+            for event in self.events
+            if event.category in CATEGORIES_MAIN_REPORT
+        ]
+        # For all the events of the main report list, we also get the
+        # last_event before the deposition, using the select_event function,
+        # -1 (last) event together with the deposition first bounds
+        with self.stats.stage('select_last_event'):
+            self.events = select_last_event(
+                self.events,
+                self.context,
+                self.deposition,
+                CATEGORIES_LAST_EVENT,
+                event_index=event_index,
+            )
+        return events_main_report, interrupt_deposition
+
+    def _get_main_params(self):
+        selection = self.run_stage('deposition', self._select_deposition)
+        if selection is None:
+            return {}
+        events_main_report, interrupt_deposition = selection
+        # for event in events_for_main_report, we apply the get_ methods for
+        # the class Lf_Event to get the params dict
+        main_params = get_overview(self.context)
+        for event in events_main_report:
+            if event.category == 'deposition':
+                main_params = event.get_params(
+                    raw_data=self.context,
+                    source_list=self.source_list,
+                    params=main_params,
+                    interrupt_deposition=interrupt_deposition,
+                )
+            else:
+                main_params = event.get_params(
+                    raw_data=self.context,
+                    source_list=self.source_list,
+                    params=main_params,
+                )
+        return get_end_of_process(self.context, main_params)
+
+    def _get_step_params(self):
+        if self.run_stage('deposition', self._select_deposition) is None:
+            return {}
+        # We only get the events that are in the CATEGORIES_STEPS
+        events_steps = [
+            event.snapshot()
+            for event in self.events
+            if event.category in CATEGORIES_STEPS
+        ]
+        # unfold all the events_main_report events to get sep_events
+        with self.stats.stage('unfold_events'):
+            sep_events = unfold_events(
+                [event.snapshot() for event in events_steps], self.context
+            )
+            # Sort the subevents by the start time
+            sep_events = sort_events_by_start_time(sep_events)
+        # get the individual step params
+        step_params = {}
+        with self.stats.stage('get_nomad_step_params'):
+            for event in sep_events:
+                step_params = event.get_nomad_step_params(step_params, self.source_list)
+        return step_params
+
+
+# ---------HELPERS FUNCTIONS FOR REPORT GENERATION------------
+
+
+# def get_material_list(source_mat):
+#     material_list = []
+#     material_stoichiometry = []
+#     i = 0
+#     if source_mat in ELEMENTS:
+#         source_mat = ELEMENTS[source_mat]
+#     elif source_mat in IONS:
+#         source_mat = IONS[source_mat]
+#     while i < len(source_mat):
+#         if source_mat[i].isupper():
+#             element = source_mat[i]
+#             i += 1
+#             # Check if the next character is lowercase (for elements like "Si")
+#             if i < len(source_mat) and source_mat[i].islower():
+#                 element += source_mat[i]
+#                 i += 1
+#             material_list.append(element)
+#             # Read the stoichiometry number
+#             stoichiometry = ''
+#             while i < len(source_mat) and source_mat[i].isdigit():
+#                 stoichiometry += source_mat[i]
+#                 i += 1
+#             material_stoichiometry.append(int(stoichiometry) if stoichiometry else 1)
+#         else:
+#             i += 1
+#     return material_list, material_stoichiometry
+
+
+def get_overview(raw_data, params=None):
+    if params is None:
+        params = {}
+    if 'overview' not in params:
+        params['overview'] = {}
+
+    # Extract start and end time of the log file
+    (
+        params['overview']['log_start_time'],
+        params['overview']['log_end_time'],
+    ) = get_time_span(raw_data)
+
+    return params
+
+
+def get_end_of_process(raw_data, params=None):
+    # Extract the end of process temperature as the last temperature logged
+    # Note: this part can be improved by extracting the temperature at
+    # the vent recipe step
+    if params is None:
+        params = {}
+    if 'overview' not in params:
+        params['overview'] = {}
+
+    if 'deposition' not in params:
+        raise ValueError(
+            'Missing deposition info, ' 'run get_simple_deposition_params first'
+        )
+    params['overview']['end_of_process_temp'] = raw_data[
+        'Substrate Heater Temperature'
+    ].iloc[-1]
+
+    # Extract the time in chamber after deposition as the time difference
+    # between end of logging and end of deposition time
+    params['overview']['time_in_chamber_after_deposition'] = (
+        params['overview']['log_end_time'] - params['deposition']['end_time']
+    )
+    return params
+
+
+# method to save the derived quantities report as a text file
+def save_report_as_text(params: dict, txt_file_path, logfile_name=None):
+    # Save the derived quantities report as a text file as
+    with open(txt_file_path, 'w') as txt_file:
+        if logfile_name is not None:
+            txt_file.write(
+                f'Derived quantities report for logfile\n{logfile_name}:\n\n'
+            )
+        txt_file.write(write_params(params))
+
+
+# method to flatten a nested dictionary
+def flatten_dict(d, parent_key='', sep=';'):
+    """
+    Flatten a nested dictionary.
+
+    Args:
+        d (dict): The dictionary to flatten.
+        parent_key (str): The base key string for nested keys.
+        sep (str): The separator between parent and child keys.
+
+    Returns:
+        dict: The flattened dictionary.
+    """
+    items = []
+    for k, v in d.items():
+        new_key = f'{parent_key}{sep}{k}' if parent_key else k
+        if isinstance(v, dict):
+            items.extend(flatten_dict(v, new_key, sep=sep).items())
+        else:
+            items.append((new_key, v))
+
+    return dict(items)
+
+
+def fix_single_dict_level(dict_var, sep='__'):
+    # Calculate the max depth of the dict
+    max_depth = 0
+    for key in dict_var.keys():
+        current_depth = len(key.split('__'))
+        max_depth = max(current_depth, max_depth)
+
+    new_dict = {}
+
+    # Iterate over the original dictionary to construct the new dictionary
+    for key in list(
+        dict_var.keys()
+    ):  # Make a list to avoid modifying the dict during iteration
+        if len(key.split('__')) == max_depth - 1:
+            key_split = key.split('__')
+            key_split[1] = f'{key_split[1]}{sep}general'
+            new_key = '__'.join(key_split)
+            new_dict[new_key] = dict_var[key]
+            del dict_var[key]  # Safely remove the key from the original dict
+
+    # Merge new keys into the original dictionary
+    dict_var.update(new_dict)
+
+    return dict_var
+
+
+def consolidate_data_to_csv(all_params, samples_dir, sep='__', process_NaN=False):
+    # Flatten the dictionary with the specified separator
+    flatten_all_params = flatten_dict(all_params, sep=sep)
+
+    # fix the level of the dict
+    flatten_all_params = fix_single_dict_level(flatten_all_params)
+
+    # Convert the flattened dictionary to a DataFrame
+    df = pd.DataFrame([flatten_all_params])
+
+    # Split the column names using the separator and ensure consistent levels
+    split_columns = [tuple(col.split(sep)) for col in df.columns]
+
+    # Set the standardized MultiIndex for the DataFrame columns
+    df.columns = pd.MultiIndex.from_tuples(split_columns)
+
+    # Fill NaN values in the MultiIndex headers
+    if process_NaN:
+        df.columns = pd.MultiIndex.from_tuples(
+            [tuple('' if pd.isna(x) else x for x in col) for col in df.columns]
+        )
+
+    # Save the DataFrame to a CSV file
+    output_path = os.path.join(samples_dir, 'all_params.csv')
+    df.to_csv(output_path, index=False, na_rep='')
+
+    print(f'Data successfully saved to {output_path}')
+
+
+def open_csv_as_multiindex(csv_path, replace_nan=False):
+    """
+    Reopen a CSV file as a MultiIndex DataFrame.
+
+    Args:
+        csv_path (str): The path to the CSV file.
+
+    Returns:
+        pd.DataFrame: The MultiIndex DataFrame.
+    """
+    # Read the CSV file with the appropriate header levels
+    df = pd.read_csv(csv_path, header=[0, 1, 2, 3], na_filter=False)
+
+    # The columns are already MultiIndex, so no need to split them again
+    df.columns = pd.MultiIndex.from_tuples(df.columns)
+
+    # set the index names to ['sample','event','source','parameter']
+    df.columns.names = ['sample', 'event', 'source', 'parameter']
+
+    if replace_nan:
+        # Replace the string 'nan' with an empty string in MultiIndex column names
+        df.columns = df.columns.set_levels(
+            [level.str.replace('nan', '') for level in df.columns.levels]
+        )
+
+    return df
+
+
+# method to get a parameter from a MultiIndex DataFrame
+# path being a list of strings pointing to the parameter
+def get_df_param(df, path: list):
+    for key in path:
+        df = df.xs(key, axis=1, level=1)
+    # set the data row index to path[-1]
+    df.index = pd.Index(df.index, name=path[-1])
+    return df
+
+
+# Function to convert timestamps to isoformat
+def convert_timestamps(obj):
+    if isinstance(obj, dict):
+        return {k: convert_timestamps(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [convert_timestamps(i) for i in obj]
+    elif isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    elif isinstance(obj, pd.Timedelta):
+        return str(obj)
+    else:
+        return obj
+
+
+# Function to print the derived quantities in a nested format
+def print_params(quantities, indent=''):
+    for key, value in quantities.items():
+        if isinstance(value, dict):
+            print(f'{indent}{key}:')
+            print_params(value, indent + '    ')
+        else:
+            formatted_value = value
+            if isinstance(value, pd.Timestamp):
+                if key in {'log_start_time', 'log_end_time'}:
+                    formatted_value = value.strftime('%Y-%m-%d %H:%M:%S')
+                else:
+                    formatted_value = value.strftime('%H:%M:%S')
+            elif isinstance(value, pd.Timedelta):
+                total_seconds = int(value.total_seconds())
+                hours, remainder = divmod(total_seconds, 3600)
+                minutes, seconds = divmod(remainder, 60)
+                formatted_value = f'{hours:02d}:{minutes:02d}:{seconds:02d}'
+            elif isinstance(value, pd.Series):
+                formatted_value = 'Cannot display pd.DataFrame'
+            print(f'{indent}{key}: {formatted_value}')
+
+
+def build_file_paths(logfiles, i):
+    file_dir = os.path.join(logfiles['folder'][i])
+
+    # Specify the main report export location and file name
+    txt_file_name = f'{logfiles["name"][i]}_derived_quantities.txt'
+    txt_file_path = os.path.join(file_dir, txt_file_name)
+
+    # Specify the step report export location and file name
+    step_file_name = f'{logfiles["name"][i]}_derived_quantities_step.txt'
+    step_file_path = os.path.join(file_dir, step_file_name)
+
+    # Specify the plotly graph export location and file name for timelines
+    timeline_file_name = f'{logfiles["name"][i]}_plotly_timeline.html'
+    timeline_file_path = os.path.join(file_dir, timeline_file_name)
+
+    # Specify the plotly graph export location and file name for bias/power plots
+    bias_file_name = f'{logfiles["name"][i]}_plotly_bias.html'
+    bias_file_path = os.path.join(file_dir, bias_file_name)
+
+    # Specify the plotly graph export location and file name
+    # for the overview plot
+    overview_file_name = f'{logfiles["name"][i]}_plotly_overview.html'
+    overview_file_path = os.path.join(file_dir, overview_file_name)
+
+    # Specify the chamber config plot export location and file name
+    chamber_config_file_name = f'{logfiles["name"][i]}_chamber_config.png'
+    chamber_config_file_path = os.path.join(file_dir, chamber_config_file_name)
+
+    return (
+        txt_file_path,
+        step_file_path,
+        timeline_file_path,
+        bias_file_path,
+        overview_file_path,
+        chamber_config_file_path,
+    )
+
+
+# Function to write the derived quantities in a nested format
+def write_params(quantities, indent=''):
+    output = []
+    for key, value in quantities.items():
+        if isinstance(value, dict):
+            output.append(f'{indent}{key}:')
+            output.append(write_params(value, indent + '    '))
+        else:
+            formatted_value = value
+            if isinstance(value, pd.Timestamp):
+                if key in {'log_start_time', 'log_end_time'}:
+                    formatted_value = value.strftime('%Y-%m-%d %H:%M:%S')
+                else:
+                    formatted_value = value.strftime('%H:%M:%S')
+            elif isinstance(value, pd.Timedelta):
+                total_seconds = int(value.total_seconds())
+                hours, remainder = divmod(total_seconds, 3600)
+                minutes, seconds = divmod(remainder, 60)
+                formatted_value = f'{hours:02d}:{minutes:02d}:{seconds:02d}'
+            elif isinstance(value, pd.Series):
+                formatted_value = '[...](pd.DataFrame)'
+            elif isinstance(value, list):
+                formatted_value = '[...](list)'
+            elif isinstance(value, np.ndarray):
+                formatted_value = '[...](array)'
+            output.append(f'{indent}{key}: {formatted_value}')
+    return '\n'.join(output)
+
+
+# ------------------------CORE METHODS----------------------
+
+
+# The deposition events are looked up in event_index (see EventIndex), which
+# is built from events if not given
+def verify_deposition_unicity(events, raw_data, event_index=None):
+    if event_index is None:
+        event_index = EventIndex(events)
+    interrupt_deposition = False
+    for event in event_index.events_of('deposition'):
+        # if a deposition event time between the bounds is lower
+        # than MIN_DEPOSITION_SIZE, we consider that the deposition
+        # event is not valid
+        if event.events == 1:
+            interrupt_deposition = False
+        elif event.events == 0:
+            print('Error: No deposition event found')
+            break
+        elif event.events > 1:
+            print(
+                'More than one deposition event detected.',
+                'Removing deposition events smaller than',
+                f'{MIN_DEPOSITION_SIZE} steps',
+            )
+            print('Number of deposition events before filtering:', event.events)
+            for i in range(event.events):
+                print(
+                    f'Deposition({i}) start time: {event.bounds[i][0]}',
+                    f'Deposition({i}) end time: {event.bounds[i][1]}',
+                )
+            event.filter_out_small_events(MIN_DEPOSITION_SIZE)
+            print('Number of deposition events after filtering:', event.events)
+            for i in range(event.events):
+                print(
+                    f'Deposition({i + 1}) start time: {event.bounds[i][0]}',
+                    f'Deposition({i + 1}) end time: {event.bounds[i][1]}',
+                )
+            if event.events == 1:
+                print('A unique deposition event was succesfully filtered')
+                interrupt_deposition = False
+            if event.events != 1:
+                print(
+                    'Removal failed. The number of deposition events is not 1.',
+                    'Increasing the continuity limit to',
+                    DEPOSITION_CONTINUITY_LIMIT,
+                )
+                # We try to increase the continuity limit to
+                # DEPOSITION_CONTINUITY_LIMIT)
+                event.set_data(
+                    event.data,
+                    raw_data,
+                    continuity_limit=DEPOSITION_CONTINUITY_LIMIT,
+                )
+                if event.events == 1:
+                    print('A unique deposition event was succesfully filtered')
+                    interrupt_deposition = True
+                else:
+                    raise ValueError(
+                        'Error: The number of deposition events is not 1 ',
+                        'after increasing the continuity limit and filttering ',
+                        'smaller events',
+                    )
+                    break
+
+    return events, interrupt_deposition
+
+
+# The events of the categories and their domains before the reference event
+# are looked up in event_index (see EventIndex), which is built from events if
+# not given
+def select_last_event(events, raw_data, ref_event, categories, event_index=None):
+    if event_index is None:
+        event_index = EventIndex(events)
+    for category in categories:
+        for event in event_index.events_of(category):
+            try:
+                event.select_event(
+                    raw_data, -1, ref_event.bounds[0][0], event_index=event_index
+                )
+            except Exception as e:
+                print(
+                    'Warning: ',
+                    f'Failed to find any event before {ref_event.bounds[0][0]}',
+                    f'for {event.step_id}. Error: {e}',
+                )
+    return events
+
+
+def extract_category_from_list(events: list, category: str):
+    list_of_events = []
+    for event in events:
+        if event.category == category:
+            list_of_events.append(event)
+    return list_of_events
+
+
+def read_events(data, stats=None):
+    # The stages of the processing are recorded in stats (see ProcessingStats)
+    if stats is None:
+        stats = ProcessingStats()
+    with stats.stage('events', rows=len(data)):
+        data, events, deposition = extract_events(data, stats)
+
+    # The parameters of the reports are only extracted when they are first
+    # accessed on the result (main_params, step_params)
+    return ReadEventsResult(data, events, deposition, stats=stats)
@@ -0,0 +1,1309 @@
+"""
+Plotting functions of the logfile reader (plotly timelines, bias, overview
+and spectra plots) and the chamber visualization (matplotlib). This module is
+the only one importing the plotting stacks, and is only imported when a plot
+is generated.
+"""
+# ---------PACKAGES-------------
+
+# Core
+import io
+import re
+
+# Chamber visualization
+import matplotlib.font_manager as fm
+import matplotlib.pyplot as plt
+import numpy as np
+
+# Data manipulation
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from matplotlib import patches
+from matplotlib.transforms import Affine2D
+from mpl_toolkits.axes_grid1.anchored_artists import AnchoredSizeBar
+from PIL import Image
+from plotly.colors import sample_colorscale
+from plotly.subplots import make_subplots
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader.constants import (
+    DICT_RENAME,
+    DPI,
+    HEIGHT,
+    OVERVIEW_PLOT,
+    ROLLING_FRAC_MAX,
+    ROLLING_NUM,
+    SOURCE_LABEL,
+    STEP_COLORS,
+    VERTICAL_SPACING,
+    WIDTH,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.events import (
+    Lf_Event,
+    event_list_to_dict,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.io import filter_spectrum
+
+# -------PLOTTING DEFINITIONS------------
+
+
+def generate_optix_cascade_plot(spectra, **kwargs):
+    """
+    Generate a 3D cascade plot with optional coloring based on
+    experimental data.
+
+    Parameters:
+    - spectra (dict): Contains 'data' (DataFrame with x and
+         intensity columns) and 'timestamp_map' (dict of timestamps).
+    - kwargs (dict): Additional keyword arguments:
+      - 'color_df': DataFrame with a 'Timestamp' column and data columns
+            for custom coloring.
+      - 'color_column': Name of the column in color_df to use for coloring.
+      - 'time_col': The column name representing time in color_df.
+      - 'wv_range': The wavelength range for filtering the data (e.g., (200, 800)).
+      - 'time_range': Time range for filtering the data (optional).
+      - 'color_scale': The color scale to use for the plot (e.g., 'Jet').
+
+    Returns:
+    - plotly.graph_objects.Figure: The resulting 3D cascade plot.
+    """
+
+    # Extract values from kwargs with defaults
+    color_df = kwargs.get('color_df', None)
+    color_column = kwargs.get('color_column', None)
+    time_col = kwargs.get('time_col', 'Time Stamp')
+    color_scale = kwargs.get('color_scale', 'Jet')
+    wv_range = kwargs.get('wv_range', (200, 800))
+    time_range = kwargs.get('time_range', None)
+    plot_title = kwargs.get('plot_title', '3D Cascade Plot')
+
+    # filter the data based on the time range
+    if time_range is not None:
+        spectra = filter_spectrum(spectra.copy(), time_range)
+
+    # Extract the x-axis and intensity columns
+    data = spectra['data']
+    timestamp_map = spectra['timestamp_map']
+
+    x_values = data['x']
+
+    # Convert timestamps to numeric elapsed time
+    timestamps = list(timestamp_map.values())
+    base_time = min(timestamps)
+    time_offsets = {
+        col: (timestamp - base_time).total_seconds()
+        for col, timestamp in timestamp_map.items()
+    }
+
+    # Initialize color mapping
+    cols = [col for col in data.columns if col != 'x']
+    colors = []
+
+    # Process color_df for custom coloring if provided
+    if color_df is not None and color_column is not None:
+        # Ensure the color_df has a 'Timestamp' column
+        if time_col not in color_df.columns:
+            raise ValueError(f'color_df must contain a {time_col} column.')
+
+        # Set 'Time Stamp' as the index if not already
+        if not np.issubdtype(color_df[time_col].dtype, np.datetime64):
+            raise ValueError(
+                f'The {time_col} column in color_df must be of datetime type.'
+            )
+
+        if color_df.index.name != time_col:
+            color_df = color_df.set_index(time_col)
+
+        # Ensure the selected column exists
+        if color_column not in color_df.columns:
+            raise ValueError(f"Column '{color_column}' not found in color_df.")
+
+        # Match timestamps in timestamp_map to the closest time in color_df
+        for col in cols:
+            spectrum_time = timestamp_map[col]
+            closest_idx = color_df.index.get_loc(spectrum_time, method='nearest')
+            color_value = color_df.iloc[closest_idx][color_column]
+            colors.append(color_value)
+
+        # Normalize the values for the colormap
+        min_color = min(colors)
+        max_color = max(colors)
+        normalized_colors = [
+            (value - min_color) / (max_color - min_color) for value in colors
+        ]
+        colors = sample_colorscale(color_scale, normalized_colors)
+    else:
+        # Default to time-based coloring
+        max_offset = max(time_offsets.values())
+        min_offset = min(time_offsets.values())
+        colors = sample_colorscale(
+            color_scale,
+            [
+                (time_offsets[col] - min_offset) / (max_offset - min_offset)
+                for col in cols
+            ],
+        )
+
+    # Filter the data based on the provided wavelength range (if applicable)
+    if wv_range is not None:
+        data_wv_filtered = data[(data['x'] >= wv_range[0]) & (data['x'] <= wv_range[1])]
+
+        # Calculate the min/max intensity based on the filtered wavelength data
+        cols = [col for col in data_wv_filtered.columns if col != 'x']
+        min_intensity = data_wv_filtered[cols].min().min()  # Min intensity
+        max_intensity = data_wv_filtered[cols].max().max()  # Max intensity
+
+    fig = create_3d_plot(
+        cols=cols,
+        colors=colors,
+        x_values=x_values,
+        data=data,
+        time_offsets=time_offsets,
+        timestamp_map=timestamp_map,
+        color_df=color_df,
+        color_column=color_column,
+        min_color=min_color,
+        max_color=max_color,
+        color_scale=color_scale,
+        wv_range=wv_range,
+        min_intensity=min_intensity,
+        max_intensity=max_intensity,
+        plot_title=plot_title,
+    )
+
+    return fig
+
+
+def create_3d_plot(**kwargs):
+    # Extract values from kwargs with defaults
+    cols = kwargs.get('cols', None)
+    colors = kwargs.get('colors', None)
+    x_values = kwargs.get('x_values', None)
+    data = kwargs.get('data', None)
+    time_offsets = kwargs.get('time_offsets', None)
+    timestamp_map = kwargs.get('timestamp_map', None)
+    color_df = kwargs.get('color_df', None)
+    color_column = kwargs.get('color_column', None)
+    min_color = kwargs.get('min_color', None)
+    max_color = kwargs.get('max_color', None)
+    color_scale = kwargs.get('color_scale', None)
+    wv_range = kwargs.get('wv_range', None)
+    min_intensity = kwargs.get('min_intensity', None)
+    max_intensity = kwargs.get('max_intensity', None)
+    plot_title = kwargs.get('plot_title', None)
+
+    # Create the 3D plot
+    fig = go.Figure()
+
+    for col, color in zip(cols, colors):
+        x_axis_values = x_values  # Left-right direction
+        z_axis_values = data[col]  # Intensity towards the top
+        y_axis_values = [time_offsets[col]] * len(x_axis_values)
+        timestamp = timestamp_map[col]
+
+        fig.add_trace(
+            go.Scatter3d(
+                x=x_axis_values,  # Left-right direction
+                y=y_axis_values,  # Depth direction (numeric time)
+                z=z_axis_values,  # Intensity towards the top
+                mode='lines',
+                name=f'Trace {col}',
+                line=dict(color=color),
+                hovertemplate=(
+                    f"X: %{{x}}<br>"
+                    f"Intensity: %{{z}}<br>"
+                    f"Time: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}<extra></extra>"
+                ),
+            )
+        )
+
+    # Add a dummy scatter trace for the color bar
+    if color_df is not None and color_column is not None:
+        fig.add_trace(
+            go.Scatter3d(
+                x=[None],
+                y=[None],
+                z=[None],  # Dummy data
+                mode='markers',
+                marker=dict(
+                    size=0,  # Invisible markers
+                    color=np.linspace(min_color, max_color, 100),  # Range of values
+                    colorscale=color_scale,  # Use the same colorscale
+                    colorbar=dict(
+                        title=color_column,  # Color bar title
+                        titleside='right',
+                        tickvals=np.linspace(min_color, max_color, 5),
+                        tickformat='.2f',
+                    ),
+                ),
+                hoverinfo='none',
+            )
+        )
+
+    fig.update_layout(
+        title=plot_title,
+        scene=dict(
+            xaxis=dict(
+                title='Wavelength (nm)',
+                range=[wv_range[0], wv_range[1]],  # You can adjust the range here
+                showspikes=True,
+                showticklabels=True,
+            ),
+            yaxis=dict(
+                title='Time (s)',
+                range=[min(time_offsets.values()), max(time_offsets.values())],
+                showspikes=True,
+                showticklabels=True,
+            ),
+            zaxis=dict(
+                title='Intensity',
+                range=[min_intensity, max_intensity],  # Set the range of intensity
+                showspikes=True,
+                showticklabels=True,
+            ),
+        ),
+        showlegend=False,  # Hide legend
+        # margin=dict(l=0, r=0, t=0, b=0),  # Remove margins
+    )
+
+    # make it larger in the  wavelegnth direction
+    fig.update_layout(scene=dict(aspectmode='manual', aspectratio=dict(x=2, y=1, z=1)))
+
+    return fig
+
+
+def plot_logfile_chamber(main_params, logfile_name=''):
+    # Reading guns
+    guns = []
+    for gun_param in ['taurus', 'magkeeper3', 'magkeeper4', 's_cracker']:
+        if (
+            gun_param in main_params['deposition']
+            and (main_params['deposition'][gun_param]['enabled'])
+        ):
+            if 'target_material' in main_params['deposition'][gun_param]:
+                material = main_params['deposition'][gun_param]['target_material']
+            elif gun_param == 's_cracker':
+                material = 'S'
+            gun = Gun(gun_param, material)
+            guns.append(gun)
+
+    # Assuming dummy samples for now
+    samples = [
+        Sample('BR', 20, 35, 40),
+        Sample('BL', -20, 35, 40),
+        Sample('FR', 20, -5, 40),
+        Sample('FL', -20, -5, 40),
+    ]
+
+    platen_rot = main_params['deposition']['platen_position']
+
+    # Plotting
+    fig = plot_matplotlib_chamber_config(samples, guns, platen_rot)
+
+    # Save the Matplotlib figure to a BytesIO object
+    png = io.BytesIO()
+    fig.savefig(png, format='png', bbox_inches='tight', dpi=DPI)
+    png.seek(0)
+
+    # Convert the PNG to a NumPy array
+    image = np.array(Image.open(png))
+
+    # Create a Plotly figure with the image
+    plotly_fig = go.Figure(go.Image(z=image))
+
+    # Customize the layout (optional)
+    plotly_fig.update_layout(
+        title=f'Chamber Configuration:{logfile_name}',
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False),
+        margin=dict(l=0, r=0, t=100, b=0),
+        width=WIDTH,
+    )
+
+    # Return both the Matplotlib and Plotly figures
+    return fig, plotly_fig
+
+
+def quick_plot(df, Y, **kwargs):
+    """
+    Quick plot function to plot the data in the dataframe.
+
+    Args:
+        df (pd.DataFrame): The dataframe containing the data to plot.
+        Y (list or str): The column name(s) for the y-axis.
+        **kwargs: Additional keyword arguments for plot customization:
+            - X (str): Column name for the x-axis. Default is 'Time Stamp'.
+            - mode (str): Plotting mode, either 'default', 'stack', or 'dual_y'.
+                Default is 'default'.
+            - plot_type (str): Type of plot, either 'line' or 'scatter'.
+                Default is 'scatter'.
+            - Y2 (list or str): Column name(s) for the right y-axis (Y2).
+                Default is an empty list.
+            - width (int): Width of the plot. Default is WIDTH.
+            - height (int): Height of the plot. Default is HEIGHT.
+            - plot_title (str): Title of the plot. Default is 'Quick Plot'.
+
+    Returns:
+        plotly.graph_objects.Figure: The Plotly figure object.
+    """
+    if isinstance(Y, str):
+        Y = [Y]
+
+    plot_params = setup_plot_params(df, Y, **kwargs)
+    mode = plot_params['mode']
+
+    if mode == 'default':
+        fig = create_default_plot(plot_params)
+    elif mode == 'stack':
+        fig, num_plot = create_stack_plot(plot_params)
+    elif mode == 'dual_y':
+        fig = create_dual_y_plot(plot_params)
+
+    # Update layout for better visualization
+    fig.update_layout(template='plotly_white')
+    fig.update_layout(
+        legend=dict(
+            bgcolor='rgba(0,0,0,0)',  # Transparent legend background
+        )
+    )
+
+    # Add vertical lines to separate the plots
+    if mode == 'stack':
+        add_vertical_lines(fig, num_plot)
+    else:
+        fig.update_layout(
+            shapes=[
+                dict(
+                    type='rect',
+                    x0=0,
+                    x1=1,
+                    y0=0,
+                    y1=1,
+                    xref='paper',
+                    yref='paper',
+                    line=dict(color='black', width=1),
+                )
+            ]
+        )
+
+    return fig
+
+
+def get_axis_title(column, default_title='Values'):
+    """
+    Helper function to get the axis title from DICT_RENAME
+    or use the column name.
+
+    Args:
+        column (str): The column name.
+        default_title (str): The default title to use if the column
+        name is not found in DICT_RENAME.
+
+    Returns:
+        str: The axis title.
+    """
+    return DICT_RENAME.get(column, column) if isinstance(column, str) else default_title
+
+
+def setup_plot_params(df, Y, **kwargs):
+    """
+    Helper function to setup plot parameters.
+
+    Args:
+        df (pd.DataFrame): The dataframe containing the data to plot.
+        Y (list or str): The column name(s) for the y-axis.
+        **kwargs: Additional keyword arguments for plot customization:
+            - X (str): Column name for the x-axis. Default is 'Time Stamp'.
+            - mode (str): Plotting mode, either 'default', 'stack',
+                or 'dual_y'. Default is 'default'.
+            - plot_type (str): Type of plot, either 'line' or 'scatter'.
+                Default is 'scatter'.
+            - Y2 (list or str): Column name(s) for the right y-axis (Y2).
+                Default is an empty list.
+            - width (int): Width of the plot. Default is WIDTH.
+            - height (int): Height of the plot. Default is HEIGHT.
+            - plot_title (str): Title of the plot. Default is 'Quick Plot'.
+
+    Returns:
+        dict: A dictionary containing the plot parameters.
+    """
+    X = kwargs.get('X', 'Time Stamp')
+    mode = kwargs.get('mode', 'default')
+    plot_type = kwargs.get('plot_type', 'scatter')
+    Y2 = kwargs.get('Y2', [])
+    width = kwargs.get('width', WIDTH)
+    height = kwargs.get('height', HEIGHT)
+    plot_title = kwargs.get('plot_title', 'Quick Plot')
+    df_names = kwargs.get('df_names', None)
+
+    # Ensure Y and Y2 are lists
+    if isinstance(Y, str):
+        Y = [Y]
+    if isinstance(Y2, str):
+        Y2 = [Y2]
+
+    if isinstance(df, list):
+        if df_names is None:
+            raise ValueError(
+                'df_names must be provided when df is a list of dataframes'
+            )
+
+        # checkk if the first column of each dataframe is the same
+        if not all(df[0].columns[0] == df_i.columns[0] for df_i in df):
+            raise ValueError('The first column of each dataframe must be the same')
+
+        # If the data is a list of dataframes,
+        # we first rename the columns to avoid conflicts
+        renamed_dfs = []
+        for i, df_i in enumerate(df):
+            # Create a copy to avoid modifying the original
+            df_copy = df_i.copy()
+            df_copy.columns = [
+                f'{df_names[i]}_{col}' if col != X else col for col in df_copy.columns
+            ]
+            renamed_dfs.append(df_copy)
+
+        # Concatenate them into a single dataframe
+        df_cont = pd.concat(
+            [df_i.set_index(df_i.columns[0]) for df_i in renamed_dfs], axis=1
+        ).reset_index()
+
+        # Create new lists of X, Y, and Y2 columns with the new column names
+        Y_return = [f'{df_names[i]}_{col}' for i in range(len(df)) for col in Y]
+        Y2_return = [f'{df_names[i]}_{col}' for i in range(len(df)) for col in Y2]
+
+        df_return = df_cont
+    else:
+        df_return = df
+        Y_return = Y
+        Y2_return = Y2
+
+    y_axis_title = get_axis_title(Y[0]) if len(Y) == 1 else 'Values'
+    y2_axis_title = get_axis_title(Y2[0]) if len(Y2) == 1 else 'Values'
+
+    return {
+        'df': df_return,
+        'X': X,
+        'Y': Y_return,
+        'Y2': Y2_return,
+        'plot_type': plot_type,
+        'plot_title': plot_title,
+        'y_axis_title': y_axis_title,
+        'y2_axis_title': y2_axis_title,
+        'width': width,
+        'height': height,
+        'mode': mode,
+    }
+
+
+def add_vertical_lines(fig, num_plot):
+    """
+    Helper function to add vertical lines to separate the plots.
+
+    Args:
+        fig (plotly.graph_objects.Figure): The Plotly figure object.
+        num_plot (int): The number of plots.
+
+    Returns:
+        None
+    """
+    shapes = [
+        dict(
+            type='rect',
+            x0=0,
+            x1=1,
+            y0=i * (1 / num_plot),
+            y1=(i + 1) * (1 / num_plot),
+            xref='paper',
+            yref='paper',
+            line=dict(color='black', width=1),
+        )
+        for i in range(num_plot)
+    ]
+    fig.update_layout(shapes=shapes)
+
+
+def create_default_plot(plot_params):
+    """
+    Create a default plot.
+
+    Args:
+        df (pd.DataFrame): The dataframe containing the data to plot.
+        plot_params (dict): A dictionary containing the plot parameters.
+
+    Returns:
+        plotly.graph_objects.Figure: The Plotly figure object.
+    """
+    df = plot_params['df']
+    X = plot_params['X']
+    Y = plot_params['Y']
+    plot_type = plot_params['plot_type']
+    plot_title = plot_params['plot_title']
+    y_axis_title = plot_params['y_axis_title']
+    width = plot_params['width']
+    height = plot_params['height']
+
+    if plot_type == 'line':
+        fig = px.line(df, x=X, y=Y, title=plot_title)
+    elif plot_type == 'scatter':
+        fig = px.scatter(df, x=X, y=Y, title=plot_title)
+
+    fig.update_layout(
+        yaxis_title=y_axis_title, legend_title_text='', width=width, height=height
+    )
+    return fig
+
+
+def create_stack_plot(plot_params):
+    """
+    Create a stacked plot.
+
+    Args:
+        df (pd.DataFrame): The dataframe containing the data to plot.
+        plot_params (dict): A dictionary containing the plot parameters.
+
+    Returns:
+        tuple: A tuple containing the Plotly figure objec
+        and the number of plots.
+    """
+    df = plot_params['df']
+    X = plot_params['X']
+    Y = plot_params['Y']
+    plot_type = plot_params['plot_type']
+    plot_title = plot_params['plot_title']
+    width = plot_params['width']
+    height = plot_params['height']
+
+    fig = make_subplots(
+        rows=len(Y), cols=1, shared_xaxes=True, vertical_spacing=VERTICAL_SPACING
+    )
+
+    for i, y_col in enumerate(Y):
+        # Setup y-axis titles
+
+        if y_col in DICT_RENAME:
+            y_axis_title = DICT_RENAME[y_col]
+        else:
+            y_axis_title = y_col
+
+        trace = go.Scatter(
+            x=df[X],
+            y=df[y_col],
+            mode='lines' if plot_type == 'line' else 'markers',
+            name=y_axis_title,
+        )
+        fig.add_trace(trace, row=i + 1, col=1)
+        fig.update_yaxes(title_text=y_axis_title, row=i + 1, col=1)
+
+    num_plot = len(Y)
+    fig.update_xaxes(title_text='Time', row=num_plot, col=1)
+    fig.update_layout(
+        title_text=plot_title,
+        height=height * 0.5 * num_plot,
+        width=width,
+        showlegend=False,  # Hide the legend
+    )
+    return fig, num_plot
+
+
+def create_dual_y_plot(plot_params):
+    """
+    Create a default plot.
+
+    Args:
+        df (pd.DataFrame): The dataframe containing the data to plot.
+        plot_params (dict): A dictionary containing the plot parameters.
+
+    Returns:
+        plotly.graph_objects.Figure: The Plotly figure object.
+    """
+    df = plot_params['df']
+    X = plot_params['X']
+    Y = plot_params['Y']
+    Y2 = plot_params['Y2']
+    plot_type = plot_params['plot_type']
+    plot_title = plot_params['plot_title']
+    y_axis_title = plot_params['y_axis_title']
+    y2_axis_title = plot_params['y2_axis_title']
+    width = plot_params['width']
+    height = plot_params['height']
+
+    fig = go.Figure()
+
+    for y_col in Y:
+        trace = go.Scatter(
+            x=df[X],
+            y=df[y_col],
+            mode='lines' if plot_type == 'line' else 'markers',
+            name=f'{y_col} (Left)',
+        )
+        fig.add_trace(trace)
+
+    for y2_col in Y2:
+        trace = go.Scatter(
+            x=df[X],
+            y=df[y2_col],
+            mode='lines' if plot_type == 'line' else 'markers',
+            name=f'{y2_col} (Right)',
+            yaxis='y2',
+        )
+        fig.add_trace(trace)
+
+    fig.update_layout(
+        yaxis=dict(title=y_axis_title),
+        yaxis2=dict(title=y2_axis_title, overlaying='y', side='right', showgrid=False),
+        title=plot_title,
+        legend_title_text='',
+        width=width,
+        height=height,
+    )
+    return fig
+
+
+def update_scatter_colors(fig, df, color_column, color_map):
+    """
+    Update the colors of the existing traces in the Plotly figure based
+    on the direction.
+
+    Args:
+        fig (go.Figure): The Plotly figure object to update.
+        df (pd.DataFrame): The original dataframe used for plotting.
+        color_column (str): The column containing the column name for coloring.
+        color_map (dict): A dictionary mapping values to colors.
+    """
+
+    # Check if there is more than one trace
+    if len(fig.data) > 1:
+        raise ValueError('The figure contains more than one trace.')
+
+    # If there is exactly one trace, proceed with updating it
+    if len(fig.data) == 1:
+        trace = fig.data[0]  # Get the only trace in the figure
+
+        # Get the x-values of the current trace
+        x_vals = trace.x
+
+        # Ensure the x-values are numeric or timestamp-like
+        if isinstance(x_vals[0], str):
+            x_vals = pd.to_datetime(x_vals)  # Convert to datetime if necessary
+
+        # Filter the DataFrame based on the x-values of the trace
+        filtered_df = df[df['Time Stamp'].isin(x_vals)]
+
+        # Check if the color_column exists and update the trace color
+        if not filtered_df.empty and color_column in filtered_df.columns:
+            # Map the color for each point based on the color_column value
+            colors = filtered_df[color_column].map(color_map).fillna('gray')
+
+            # Update the trace's marker color (apply color for each point)
+            trace.marker.color = colors.tolist()
+            trace.showlegend = False  # Remove default legend for this trace
+
+        # Create legend entries based on the color_map (keys are labels,
+        # values are colors)
+        legend_entries = []
+        # Add a legend entry for the color_column (no marker, just the label)
+        legend_entries.append(
+            go.Scatter(
+                x=[None],  # No data points needed for the legend entry
+                y=[None],  # No data points needed for the legend entry
+                mode='text',  # This makes it just a label without a marker
+                text=[f'{color_column}'],  # Display the color_column as the label
+                showlegend=True,
+                name=f'{color_column}',  # The legend label as the color column name
+            )
+        )
+        for key, color in color_map.items():
+            legend_entries.append(
+                go.Scatter(
+                    x=[None],  # No data points needed for the legend entry
+                    y=[None],  # No data pointsi d needed for the legend entry
+                    mode='markers',
+                    marker=dict(color=color, size=5),  # Customize marker
+                    name=str(key),  # The legend label as the color map key
+                    showlegend=True,
+                )
+            )
+
+        # Add the legend entries to the figure
+        fig.add_traces(legend_entries)
+
+
+def generate_timeline(
+    events_to_plot,
+    sample_name=None,
+    plot_title='Process Timeline',
+    width=WIDTH,
+    height=HEIGHT,
+):
+    """
+    args:
+        logfile_name: str
+            Name of the logfile to be used in the title of the plot
+        data: pd.DataFrame
+            Dataframe containing the raw data
+        source_used_list: list
+            List of sources used during the process
+        bottom_steps: list
+            List of steps to be plotted at the bottom of the plot
+        non_source_steps: list
+            List of steps to be plotted above the bottom steps
+        source_steps: list
+            List of source dependent steps to be plotted
+            above the non_source_steps
+    """
+
+    # Check if the events_to_plot is a single event or a list of events
+    if isinstance(events_to_plot, Lf_Event):
+        events_to_plot = [events_to_plot]
+
+    # Format the steps to be plotted for the plotly timeline
+    rows = []
+    for step in events_to_plot:
+        if isinstance(step, Lf_Event):
+            for bounds in step.bounds:
+                rows.append(
+                    {
+                        'Event': step.name,
+                        'Start': bounds[0],
+                        'End': bounds[1],
+                        'Average Temp': step.data[
+                            'Substrate Heater Temperature'
+                        ].mean(),
+                        'Average Pressure': step.data['PC Capman Pressure'].mean(),
+                    }
+                )
+                # add more quantities if needed
+
+    df = pd.DataFrame(rows)
+
+    # Set the time extend of the plot
+    time_margin = pd.Timedelta(minutes=15)
+    # Determine the timeline duration
+    min_start_time = df['Start'].min() - time_margin
+    # Calculate end time overlooking the Ar On event
+    max_end_time = df[df['Event'] != 'Ar On']['End'].max() + time_margin
+
+    # Define the title of the plot
+    if sample_name is not None:
+        plot_title += f':\n{sample_name}'
+
+    # Create the plot with plotly express.timeline
+    fig = px.timeline(
+        df,
+        x_start='Start',
+        x_end='End',
+        y='Event',
+        color='Event',
+        color_discrete_map=STEP_COLORS,
+        title=plot_title,
+        hover_data=['Average Temp', 'Average Pressure'],
+    )
+    fig.update_xaxes(range=[min_start_time, max_end_time])
+
+    # Update the layout to include a border around the plot area
+    fig.update_layout(
+        xaxis_title='Time',
+        yaxis_title=None,
+        yaxis=dict(
+            tickvals=df['Event'].unique(),
+            ticktext=df['Event'].unique(),
+            autorange='reversed',  # Ensure tasks are displayed in order
+        ),
+        template='plotly_white',  # Use a white background template
+        hovermode='closest',
+        dragmode='zoom',
+        title=plot_title,
+        margin=dict(l=50, r=50, t=120, b=50),  # Increased top margin for title
+        width=width,  # Dynamic width
+        height=height,  # Dynamic height
+        showlegend=False,  # Hide the legend
+        paper_bgcolor='white',  # Background color of the entire figure
+        plot_bgcolor='white',  # Background color of the plotting area
+        shapes=[
+            dict(
+                type='rect',
+                x0=0,
+                x1=1,
+                y0=0,
+                y1=1,
+                xref='paper',
+                yref='paper',
+                line=dict(color='black', width=1),
+            )
+        ],
+    )
+
+    return fig
+
+
+def generate_bias_plot(
+    events_to_plot,
+    logfile_name,
+    rolling_num=ROLLING_NUM,
+    rolling_frac_max=ROLLING_FRAC_MAX,
+):
+    Y_plot = []
+    patterns = [
+        r'Source \d+ DC Bias',
+        r'Source \d+ Voltage',
+    ]
+
+    deposition = event_list_to_dict(events_to_plot)['deposition']
+
+    # The smoothed columns are added to a copy of the plotted columns, as the
+    # data of the event is shared with the other snapshots of the event (and
+    # possibly with the logfile) and must not be modified
+    bias_cols = [
+        col
+        for col in deposition.data.columns
+        if any(re.search(pattern, col) for pattern in patterns)
+    ]
+    data = deposition.data[['Time Stamp', *bias_cols]].copy()
+
+    for col in bias_cols:
+        # Add the original column to the list of columns to plot
+        Y_plot.append(col)
+
+        # Add the smoothed column to the list of columns to plot
+        data[f'{col} Smoothed {rolling_num}pt'] = (
+            data[col].rolling(rolling_num, center=True).mean()
+        )
+        Y_plot.append(f'{col} Smoothed {rolling_num}pt')
+
+        # check that the sample name contains Sb
+        if '_Sb_' in logfile_name:
+            rolling_num_max = int(rolling_num * rolling_frac_max)
+            # add the max instead of the mean after rolling
+            data[f'{col} Max {rolling_num_max}pt'] = (
+                data[col]
+                .rolling(int(rolling_num * rolling_frac_max), center=True)
+                .max()
+            )
+            Y_plot.append(f'{col} Max {rolling_num_max}pt')
+            # smooth the max curve
+            data[f'{col} Max {rolling_num_max}pt Smoothed {rolling_num}pt'] = (
+                data[f'{col} Max {rolling_num_max}pt']
+                .rolling(rolling_num, center=True)
+                .mean()
+            )
+            Y_plot.append(f'{col} Max {rolling_num_max}pt Smoothed {rolling_num}pt')
+            # iterate over the columns to plot and change zeros for NaN
+            data[f'{col} No Zero'] = data[col].replace(0, np.nan)
+            Y_plot.append(f'{col} No Zero')
+            # smooth the no zero curve
+            data[f'{col} No Zero Smoothed {rolling_num}pt'] = (
+                data[f'{col} No Zero']
+                .rolling(rolling_num, min_periods=1, center=True)
+                .mean()
+            )
+            Y_plot.append(f'{col} No Zero Smoothed {rolling_num}pt')
+
+    bias_plot = quick_plot(
+        data,
+        Y_plot,
+        mode='default',
+        plot_type='line',
+        width=WIDTH,
+        plot_title=f'Bias Plot: {logfile_name}',
+    )
+
+    return bias_plot
+
+
+def generate_overview_plot(data, logfile_name):
+    Y_plot = OVERVIEW_PLOT
+    # Check if the columns are in the data
+    Y_plot = [col for col in Y_plot if col in data.columns]
+    overview_plot = quick_plot(
+        data,
+        Y_plot,
+        plot_type='line',
+        plot_title=f'Overview Plot: {logfile_name}',
+        mode='stack',
+        heigth=0.5 * HEIGHT,
+        width=WIDTH,
+    )
+    return overview_plot
+
+
+def generate_plots(log_data, events_to_plot, main_params, sample_name=''):
+    # initialize a dict of plots
+    plots = {}
+
+    # Generate the timeline plot
+    plotly_timeline = generate_timeline(events_to_plot, sample_name)
+    plots['timeline'] = plotly_timeline
+
+    bias_plot = generate_bias_plot(
+        events_to_plot,
+        sample_name,
+        rolling_num=ROLLING_NUM,
+        rolling_frac_max=ROLLING_FRAC_MAX,
+    )
+    plots['bias_plot'] = bias_plot
+
+    # Generate the overview plot
+    overview_plot = generate_overview_plot(log_data, sample_name)
+    plots['overview_plot'] = overview_plot
+
+    # _, chamber_plotly_plot = plot_logfile_chamber(main_params, sample_name)
+    # plots.append(chamber_plotly_plot)
+
+    return plots
+
+
+# -------CHAMBER VISUALIZATION PLOTTING METHODS-----------
+
+# ----DEFINE GRAPHICAL PARAMETERS, SPUTTER CHAMBER AND PLATEN ----------
+
+# Define the default grapihcal parameters
+DEFAULT_FONTSIZE = 10
+DEFAULT_LINEWIDTH = 1
+GUN_TO_PLATEN = 1.4
+
+X_LIM = (-130, 130)
+Y_LIM = (-110, 110)
+
+# Define the platen geometry
+PLATEN_POS, PLATEN_DIAM, PLATEN_CENTER_DIAM = (0, 0), 75, 2
+
+MIDDLE_SCREW_POS, MIDDLE_SCREW_DIAM = (0, 15), 3
+
+TOXIC_GAS_INLET_ANGLE = np.radians(-58)
+
+# Define a dictionary to map names to their colors and locations
+GUN_PROPERTIES = {
+    's_cracker': {'color': 'red', 'location': np.radians(180)},
+    'taurus': {'color': 'green', 'location': np.radians(135)},
+    'magkeeper3': {'color': 'blue', 'location': np.radians(315)},
+    'magkeeper4': {'color': 'magenta', 'location': np.radians(45)},
+}
+
+GUN_OVERVIEW_NAMES = [
+    'taurus',
+    'magkeeper3',
+    'magkeeper4',
+]
+
+
+# Very simples classes to store the samples and guns information
+class Sample:
+    # Note that sample positions are the position of the center of
+    # the square samples. sub_size=40 is assumed by default.
+    def __init__(self, label, pos_x, pos_y, sub_size=40, mat='cSi'):
+        self.label = label
+        self.pos_x = pos_x
+        self.pos_y = pos_y
+        self.sub_size = sub_size
+        self.pos_x_bl = pos_x - sub_size / 2
+        self.pos_y_bl = pos_y - sub_size / 2
+        self.mat = mat
+
+
+class Gun:
+    def __init__(
+        self,
+        name,
+        mat,
+        pos_x=None,
+        pos_y=None,
+    ):
+        self.name = name
+        self.mat = mat
+        self.pos_x = pos_x
+        self.pos_y = pos_y
+        self.gcolor = GUN_PROPERTIES[name]['color']
+        self.location = GUN_PROPERTIES[name]['location']
+
+        # Function to go back in forth between polar and cartesian
+
+
+def polar(x, y):
+    r = np.sqrt(x**2 + y**2)
+    theta = np.arctan2(y, x)
+    return r, theta
+
+
+def cartesian(r, theta):
+    x = r * np.cos(theta)
+    y = r * np.sin(theta)
+    return x, y
+
+
+# function to read samples number and their position from the logbook
+def read_samples(sample_list: list):
+    samples = []
+    for sample_obj in sample_list:
+        label = str(sample_obj.relative_position)
+        pos_x = sample_obj.position_x.to('mm').magnitude
+        pos_y = sample_obj.position_y.to('mm').magnitude
+        # size = sample_obj.reference.SIZE?
+        sample = Sample(label, pos_x, pos_y)
+        samples.append(sample)
+    return samples
+
+
+# Function to read the gun used from the logbook
+def read_guns(gun_list: list, gun_names: str):
+    guns = []
+    for gun_obj, name in zip(gun_list, gun_names):
+        if gun_obj is not None:
+            if name in GUN_OVERVIEW_NAMES:
+                if gun_obj.target_material is not None:
+                    gun = Gun(name, gun_obj.target_material)
+                    guns.append(gun)
+            elif name == 's_cracker':
+                gun = Gun(name, 'S')
+                guns.append(gun)
+    return guns
+
+
+def plot_matplotlib_chamber_config(
+    samples, guns, platen_angle, plot_platen_angle=False
+):
+    fig, ax = plt.subplots()
+
+    # Define the shapes
+    squares = [
+        patches.Rectangle(
+            (sample.pos_x_bl, sample.pos_y_bl),
+            sample.sub_size,
+            sample.sub_size,
+            linewidth=DEFAULT_LINEWIDTH,
+            edgecolor='g',
+            facecolor='none',
+        )
+        for sample in samples
+    ]
+
+    arrowsX = [
+        patches.FancyArrow(
+            sample.pos_x_bl + sample.sub_size / 10,
+            sample.pos_y_bl + sample.sub_size / 10,
+            sample.sub_size / 4,
+            0,
+            width=1,
+            head_width=3,
+            head_length=3,
+            color='red',
+        )
+        for sample in samples
+    ]
+
+    for arrow in arrowsX:
+        ax.add_patch(arrow)
+
+    arrowsY = [
+        patches.FancyArrow(
+            sample.pos_x_bl + sample.sub_size / 10,
+            sample.pos_y_bl + sample.sub_size / 10,
+            0,
+            sample.sub_size / 4,
+            width=1,
+            head_width=3,
+            head_length=3,
+            color='blue',
+        )
+        for sample in samples
+    ]
+
+    for arrow in arrowsY:
+        ax.add_patch(arrow)
+
+    circles = [
+        patches.Circle(
+            (gun.pos_x, gun.pos_y),
+            2,
+            linewidth=DEFAULT_LINEWIDTH,
+            edgecolor=gun.gcolor,
+            facecolor=gun.gcolor,
+        )
+        for gun in guns
+        if gun.pos_x is not None and gun.pos_y is not None
+    ]
+
+    circle_platen = patches.Circle(
+        PLATEN_POS,
+        PLATEN_DIAM,
+        linewidth=DEFAULT_LINEWIDTH,
+        edgecolor='black',
+        facecolor='none',
+    )
+
+    circle_platen_center = patches.Circle(
+        PLATEN_POS,
+        PLATEN_CENTER_DIAM,
+        linewidth=DEFAULT_LINEWIDTH,
+        edgecolor='black',
+        facecolor='black',
+    )
+
+    circle_middle_screw = patches.Circle(
+        MIDDLE_SCREW_POS,
+        MIDDLE_SCREW_DIAM,
+        linewidth=DEFAULT_LINEWIDTH,
+        edgecolor='black',
+        facecolor='black',
+    )
+
+    # Create a transformation to rotate around the origin
+    rotation_angle = platen_angle - 90
+    rotation_transform = Affine2D().rotate_deg(rotation_angle)
+
+    # Draw the shapes and rotate around the origin when necessary
+    for square in squares:
+        square.set_transform(rotation_transform + ax.transData)
+        ax.add_patch(square)
+
+    for arrow in arrowsX:
+        arrow.set_transform(rotation_transform + ax.transData)
+        ax.add_patch(arrow)
+
+    for arrow in arrowsY:
+        arrow.set_transform(rotation_transform + ax.transData)
+        ax.add_patch(arrow)
+
+    for circle in circles:
+        ax.add_patch(circle)
+
+    circle_middle_screw.set_transform(rotation_transform + ax.transData)
+    ax.add_patch(circle_middle_screw)
+
+    ax.add_patch(circle_platen_center)
+
+    circle_platen.set_transform(rotation_transform + ax.transData)
+    ax.add_patch(circle_platen)
+
+    # Add text labels to samples (rotating with a)
+    for sample in samples:
+        rotated_edge = rotation_transform.transform(
+            (
+                sample.pos_x_bl + 0.8 * sample.sub_size,
+                sample.pos_y_bl + 0.8 * sample.sub_size,
+            )
+        )
+        rotated_arrowX_end = rotation_transform.transform(
+            (
+                sample.pos_x_bl + 0.55 * sample.sub_size,
+                sample.pos_y_bl + 0.15 * sample.sub_size,
+            )
+        )
+        rotated_arrowY_end = rotation_transform.transform(
+            (
+                sample.pos_x_bl + 0.15 * sample.sub_size,
+                sample.pos_y_bl + 0.55 * sample.sub_size,
+            )
+        )
+        ax.text(
+            rotated_edge[0],
+            rotated_edge[1],
+            sample.label,
+            ha='center',
+            va='center',
+            color='black',
+            fontsize=DEFAULT_FONTSIZE,
+        )
+        # Add legend for X
+        ax.text(
+            rotated_arrowX_end[0],
+            rotated_arrowX_end[1],
+            'X',
+            ha='center',
+            va='center',
+            color='red',
+            fontsize=DEFAULT_FONTSIZE,
+            weight='bold',
+        )
+        # Add legend for Y
+        ax.text(
+            rotated_arrowY_end[0],
+            rotated_arrowY_end[1],
+            'Y',
+            ha='center',
+            va='center',
+            color='blue',
+            fontsize=DEFAULT_FONTSIZE,
+            weight='bold',
+        )
+
+    # Add text labels to sputter chamber modules (not rotating)
+    for gun in guns:
+        ax.text(
+            cartesian(GUN_TO_PLATEN * PLATEN_DIAM, gun.location)[0],
+            cartesian(GUN_TO_PLATEN * PLATEN_DIAM, gun.location)[1],
+            f'{SOURCE_LABEL[gun.name]}\n({gun.mat})',
+            ha='center',
+            va='center',
+            color=gun.gcolor,
+            fontsize=DEFAULT_FONTSIZE,
+        )
+
+    ax.text(
+        0,
+        Y_LIM[1] - 10,
+        'Glovebox Door',
+        ha='center',
+        va='center',
+        color='black',
+        fontsize=DEFAULT_FONTSIZE,
+        weight='bold',
+    )
+
+    ax.text(
+        0,
+        Y_LIM[0] + 10,
+        'Service Door',
+        ha='center',
+        va='center',
+        color='black',
+        fontsize=DEFAULT_FONTSIZE,
+        weight='bold',
+    )
+
+    ax.text(
+        cartesian((GUN_TO_PLATEN + 0.2) * PLATEN_DIAM, TOXIC_GAS_INLET_ANGLE)[0],
+        cartesian((GUN_TO_PLATEN + 0.2) * PLATEN_DIAM, TOXIC_GAS_INLET_ANGLE)[1],
+        'Toxic\nGas',
+        ha='center',
+        va='center',
+        color='black',
+        fontsize=DEFAULT_FONTSIZE,
+        weight='bold',
+    )
+
+    # Add legend
+    if plot_platen_angle:
+        ax.legend(
+            title=f'a={platen_angle}\u00b0', loc='upper left', fontsize=DEFAULT_FONTSIZE
+        )
+
+    # Remove axis lines and ticks
+    for spine in ['top', 'right', 'left', 'bottom']:
+        ax.spines[spine].set_visible(False)
+    ax.tick_params(left=False, bottom=False, labelleft=False, labelbottom=False)
+
+    # Add a 50mm scale bar
+    fontprops = fm.FontProperties(size=DEFAULT_FONTSIZE)
+    scalebar = AnchoredSizeBar(
+        ax.transData,
+        50,
+        '50 mm',
+        'upper right',
+        pad=0.1,
+        color='black',
+        frameon=False,
+        size_vertical=1,
+        fontproperties=fontprops,
+    )
+
+    ax.add_artist(scalebar)
+    # Set limits and show the plot
+    plt.xlim(X_LIM)
+    plt.ylim(Y_LIM)
+    ax.set_aspect('equal', adjustable='box')
+
+    # make layout tight
+    plt.tight_layout()
+
+    return fig
@@ -0,0 +1,79 @@
+"""
+LogfileProcessor, the entry point of the logfile reader, running the stages
+of the processing of a logfile when their output is first needed.
+"""
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader.context import ProcessingStats
+from nomad_dtu_nanolab_plugin.sputter_log_reader.io import (
+    read_cached_logfile,
+    read_logfile,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.params import read_events
+
+
+class LogfileProcessor:
+    """
+    Processes a logfile of the sputtering chamber on demand. Each stage (reading
+    the logfile, extracting the events, the main and the step parameters) is
+    run once, when its output is first needed, and recorded in stats:
+
+        processor = LogfileProcessor(file_path)
+        events = processor.events()
+        main_params = processor.params()
+
+    only reads the logfile, extracts its events and the main parameters, the
+    step parameters (steps) being left aside. Only the columns of the logfile
+    needed by the events are read. Unless cached is False, they are read
+    through the cache of the parsed logfiles when it is enabled (see
+    read_cached_logfile).
+    """
+
+    def __init__(self, file_path, cached=True, stats=None):
+        self.file_path = file_path
+        self.cached = cached
+        self.stats = ProcessingStats() if stats is None else stats
+        self._data = None
+        self._result = None
+
+    # method to read the logfile, returning the DataFrame of the logfile
+    def data(self):
+        if self._data is None:
+            with self.stats.stage('read_logfile') as stage:
+                if self.cached:
+                    self._data = read_cached_logfile(self.file_path, usecols='events')
+                else:
+                    self._data = read_logfile(self.file_path, usecols='events')
+                stage['rows'] = len(self._data)
+        return self._data
+
+    # method to extract the events of the logfile, returning the
+    # ReadEventsResult of read_events
+    def result(self):
+        if self._result is None:
+            self._result = read_events(self.data(), stats=self.stats)
+        return self._result
+
+    # method to get the events of the logfile, as plotted on the timeline
+    def events(self):
+        return self.result().events_to_plot
+
+    # method to get the main parameters of the logfile (main report)
+    def params(self):
+        return self.result().main_params
+
+    # method to get the parameters of the steps of the logfile (step report)
+    def steps(self):
+        return self.result().step_params
+
+    # method to plot the events of the logfile on a timeline (plotly)
+    def timeline(self, sample_name=None):
+        from nomad_dtu_nanolab_plugin.sputter_log_reader.plotting import (
+            generate_timeline,
+        )
+
+        return generate_timeline(self.events(), sample_name)
+
+    # errors of the failed stages of the extraction of the parameters
+    @property
+    def errors(self):
+        return self.result().errors
@@ -0,0 +1,221 @@
+"""
+Reduction of the time series of the step parameters before they are written
+to the steps of the NOMAD entries, so that long steps do not bloat the
+archives. Each time series is reduced according to the type of its channel
+(measurement, setpoint or state), see STEP_SERIES_REDUCTION. The series are
+not reduced by default, the reductions being enabled with the
+DTU_NANOLAB_STEP_SERIES_<CHANNEL> environment variables.
+"""
+
+import copy
+import functools
+import os
+
+import numpy as np
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader.constants import (
+    MIN_SERIES_POINTS,
+    SETPOINT_SERIES,
+    STEP_SERIES_REDUCTION,
+    STEP_SERIES_REDUCTION_ENV,
+)
+
+##------REDUCTION STRATEGIES------
+
+# Each strategy takes the time and value np.arrays of a series and the maximum
+# number of points to keep, and returns the reduced time and value arrays. The
+# first and last points of the series are always kept, except by the bucket
+# strategies which average the time of each bucket
+
+
+# Function to keep every n-th point of the series
+def reduce_stride(time, value, max_points):
+    stride = int(np.ceil((len(time) - 1) / (max_points - 1)))
+    indices = np.append(np.arange(0, len(time) - 1, stride), len(time) - 1)
+    return time[indices], value[indices]
+
+
+# Function to aggregate the series over max_points buckets of equal duration,
+# with the mean, min or max of the values of each bucket. The time of each
+# bucket is the mean time of its points, and empty buckets are skipped
+def reduce_buckets(time, value, max_points, how='mean'):
+    span = time[-1] - time[0]
+    if span > 0:
+        buckets = ((time - time[0]) * (max_points / span)).astype(np.int64)
+        buckets = np.minimum(buckets, max_points - 1)
+    else:
+        buckets = np.zeros(len(time), dtype=np.int64)
+    starts = np.flatnonzero(np.diff(buckets, prepend=-1))
+    counts = np.diff(np.append(starts, len(time)))
+    bucket_time = np.add.reduceat(time, starts) / counts
+    if how == 'mean':
+        bucket_value = np.add.reduceat(value.astype(np.float64), starts) / counts
+        # the mean of a boolean state is its most common value in the bucket
+        if value.dtype == bool:
+            bucket_value = bucket_value.round().astype(bool)
+    elif how == 'min':
+        bucket_value = np.minimum.reduceat(value, starts)
+    elif how == 'max':
+        bucket_value = np.maximum.reduceat(value, starts)
+    else:
+        raise ValueError(f'Unknown bucket aggregation: {how}')
+    return bucket_time, bucket_value
+
+
+# Function to downsample the series with the Largest-Triangle-Three-Buckets
+# algorithm, keeping in each bucket the point forming the largest triangle
+# with the point kept in the previous bucket and the mean of the next bucket,
+# which preserves the visual shape of the series (peaks, steps). With at most
+# MIN_SERIES_POINTS points, there is no bucket and only the first and last
+# points are kept
+def reduce_lttb(time, value, max_points):
+    n_points = len(time)
+    if max_points <= MIN_SERIES_POINTS:
+        return time[[0, -1]], value[[0, -1]]
+    y = value.astype(np.float64)
+    # bounds of the max_points - 2 buckets between the first and last points
+    bounds = (np.arange(max_points - 1) * (n_points - 2) / (max_points - 2)).astype(
+        np.int64
+    ) + 1
+    bounds[-1] = n_points - 1
+    # the mean of each bucket, the last point being the mean of the bucket
+    # following the last bucket
+    counts = np.diff(bounds)
+    mean_time = np.append(np.add.reduceat(time[:-1], bounds[:-1]) / counts, time[-1])
+    mean_y = np.append(np.add.reduceat(y[:-1], bounds[:-1]) / counts, y[-1])
+
+    indices = np.empty(max_points, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n_points - 1
+    selected = 0
+    for i in range(max_points - 2):
+        start, end = bounds[i], bounds[i + 1]
+        area = np.abs(
+            (time[selected] - mean_time[i + 1]) * (y[start:end] - y[selected])
+            - (time[selected] - time[start:end]) * (mean_y[i + 1] - y[selected])
+        )
+        selected = start + int(np.argmax(area))
+        indices[i + 1] = selected
+    return time[indices], value[indices]
+
+
+# Function to keep only the points where the value changes, and the points
+# just before, which is lossless for setpoint-like and boolean series. If the
+# series changes at more than max_points points, it is not setpoint-like and
+# is reduced with LTTB instead
+def reduce_change_points(time, value, max_points):
+    changes = value[1:] != value[:-1]
+    keep = np.zeros(len(time), dtype=bool)
+    keep[[0, -1]] = True
+    keep[1:] |= changes
+    keep[:-1] |= changes
+    if np.count_nonzero(keep) > max_points:
+        return reduce_lttb(time, value, max_points)
+    return time[keep], value[keep]
+
+
+REDUCTION_STRATEGIES = {
+    'stride': reduce_stride,
+    'bucket_mean': functools.partial(reduce_buckets, how='mean'),
+    'bucket_min': functools.partial(reduce_buckets, how='min'),
+    'bucket_max': functools.partial(reduce_buckets, how='max'),
+    'lttb': reduce_lttb,
+    'change_point': reduce_change_points,
+}
+
+
+# Function to reduce a time series with the given strategy, the series with at
+# most max_points points (or reduced with the 'none' strategy) being returned
+# as they are
+def reduce_series(time, value, strategy, max_points):
+    if strategy == 'none' or len(time) <= max_points:
+        return time, value
+    return REDUCTION_STRATEGIES[strategy](time, value, max_points)
+
+
+##------STEP PARAMETERS REDUCTION------
+
+
+# Function to get the reduction (strategy and max_points) of each type of
+# channel, from STEP_SERIES_REDUCTION, overridden by the
+# DTU_NANOLAB_STEP_SERIES_<CHANNEL> environment variables and then by config
+# (Ex: {'measurement': {'strategy': 'bucket_mean'}})
+def get_series_reduction(config=None):
+    reduction = copy.deepcopy(STEP_SERIES_REDUCTION)
+    for channel_type, channel_reduction in reduction.items():
+        env_value = os.environ.get(
+            STEP_SERIES_REDUCTION_ENV.format(channel_type.upper())
+        )
+        if env_value:
+            strategy, _, max_points = env_value.partition(':')
+            channel_reduction['strategy'] = strategy
+            if max_points:
+                channel_reduction['max_points'] = int(max_points)
+    for channel_type, channel_reduction in (config or {}).items():
+        if channel_type not in reduction:
+            raise ValueError(f'Unknown channel type: {channel_type}')
+        reduction[channel_type].update(channel_reduction)
+    for channel_type, channel_reduction in reduction.items():
+        strategy = channel_reduction['strategy']
+        if strategy != 'none' and strategy not in REDUCTION_STRATEGIES:
+            raise ValueError(
+                f'Unknown reduction strategy for {channel_type}: {strategy}'
+            )
+        if channel_reduction['max_points'] < MIN_SERIES_POINTS:
+            raise ValueError(
+                f'max_points of {channel_type} must be at least {MIN_SERIES_POINTS}'
+            )
+    return reduction
+
+
+# Function to get the type of channel of a time series of the step parameters
+# from its name and values
+def get_channel_type(name, value):
+    if value.dtype == bool:
+        return 'state'
+    if name in SETPOINT_SERIES:
+        return 'setpoint'
+    return 'measurement'
+
+
+# Function to reduce the time series (the dictionaries with a 'time' and a
+# 'value' np.array) of the step parameters. The step parameters are not
+# modified, the reduced series being written in a copy of their dictionaries.
+# Returns the reduced step parameters and, for each type of channel, its
+# reduction along with the number of series reduced and their number of
+# points before and after the reduction
+def reduce_step_params(step_params, config=None):
+    reduction = get_series_reduction(config)
+    report = {
+        channel_type: {
+            **channel_reduction,
+            'series': 0,
+            'points': 0,
+            'reduced_points': 0,
+        }
+        for channel_type, channel_reduction in reduction.items()
+    }
+
+    def reduce_dict(params):
+        reduced = {}
+        for key, value in params.items():
+            if not isinstance(value, dict):
+                reduced[key] = value
+            elif isinstance(value.get('value'), np.ndarray) and 'time' in value:
+                channel_type = get_channel_type(key, value['value'])
+                channel_report = report[channel_type]
+                reduced[key] = dict(value)
+                reduced[key]['time'], reduced[key]['value'] = reduce_series(
+                    value['time'],
+                    value['value'],
+                    channel_report['strategy'],
+                    channel_report['max_points'],
+                )
+                channel_report['series'] += 1
+                channel_report['points'] += len(value['time'])
+                channel_report['reduced_points'] += len(reduced[key]['time'])
+            else:
+                reduced[key] = reduce_dict(value)
+        return reduced
+
+    return reduce_dict(step_params), report
@@ -0,0 +1,85 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader import (
+    CONTINUITY_LIMIT,
+    MIN_DOMAIN_SIZE,
+    Lf_Event,
+    cal_avg_timestep,
+)
+
+BENCHMARK_ENV = 'DTU_NANOLAB_BENCHMARKS'
+BENCHMARK_ROWS = 1_000_000
+
+
+def loop_extract_domains(data, avg_timestep, timestamp_col='Time Stamp'):
+    """Row by row extraction of the continuous domains, used as reference."""
+    continuity_time = CONTINUITY_LIMIT * avg_timestep
+    discontinuities = data[timestamp_col].diff() > continuity_time
+    bounds = []
+    start_idx = 0
+    for i in range(1, len(data)):
+        if discontinuities.iloc[i]:
+            bounds.append(
+                (data[timestamp_col].iloc[start_idx], data[timestamp_col].iloc[i - 1])
+            )
+            start_idx = i
+    bounds.append((data[timestamp_col].iloc[start_idx], data[timestamp_col].iloc[-1]))
+    return [
+        bound
+        for bound in bounds
+        if (bound[1] - bound[0]) > MIN_DOMAIN_SIZE * avg_timestep
+    ]
+
+
+def gapped_log(n_rows, seed=0):
+    """Time axis sampled every second, with gaps and short isolated domains."""
+    rng = np.random.default_rng(seed)
+    steps = np.ones(n_rows)
+    gaps = rng.choice(n_rows, size=max(n_rows // 500, 1), replace=False)
+    steps[gaps] = rng.uniform(5, 100, len(gaps))
+    time_stamps = pd.Timestamp('2024-06-03') + pd.to_timedelta(
+        np.cumsum(steps), unit='s'
+    )
+    return pd.DataFrame({'Time Stamp': time_stamps})
+
+
+def make_event(data):
+    event = Lf_Event('Benchmark')
+    event.data = data
+    event.avg_timestep = cal_avg_timestep(data)
+    return event
+
+
+def test_extract_domains_matches_loop():
+    data = gapped_log(20_000)
+    event = make_event(data)
+
+    assert event.extract_domains() == loop_extract_domains(data, event.avg_timestep)
+
+
+@pytest.mark.skipif(
+    not os.environ.get(BENCHMARK_ENV), reason=f'set {BENCHMARK_ENV} to run'
+)
+def test_extract_domains_benchmark():
+    data = gapped_log(BENCHMARK_ROWS)
+    event = make_event(data)
+
+    start = time.perf_counter()
+    bounds = event.extract_domains()
+    vectorized_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = loop_extract_domains(data, event.avg_timestep)
+    loop_time = time.perf_counter() - start
+
+    print(
+        f'extract_domains on {BENCHMARK_ROWS} rows: vectorized '
+        f'{vectorized_time:.3f}s, loop {loop_time:.3f}s'
+    )
+    assert bounds == expected
+    assert vectorized_time < loop_time
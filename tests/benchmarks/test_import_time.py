@@ -0,0 +1,56 @@
+import inspect
+import subprocess
+import sys
+
+from nomad_dtu_nanolab_plugin import sputter_log_reader
+from nomad_dtu_nanolab_plugin.sputter_log_reader import plotting
+
+SCHEMA_MODULE = 'nomad_dtu_nanolab_plugin.schema_packages.sputtering'
+# Packages of the plotting stacks, only imported by sputter_log_reader.plotting
+PLOTTING_STACKS = ['matplotlib', 'mpl_toolkits', 'plotly.express', 'PIL']
+
+
+def import_times(module):
+    """
+    Imports module in a new interpreter with `python -X importtime` and
+    returns the cumulative import time (in us) of each module imported.
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.removeprefix('import time:').split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def is_plotting_module(name):
+    return any(
+        name == package or name.startswith(f'{package}.') for package in PLOTTING_STACKS
+    )
+
+
+def test_import_time_without_plotting_stacks():
+    times = import_times(SCHEMA_MODULE)
+
+    print(f'{SCHEMA_MODULE} imported in {times[SCHEMA_MODULE] / 1e6:.2f}s')
+    assert 'nomad_dtu_nanolab_plugin.sputter_log_reader' in times
+    assert [name for name in times if is_plotting_module(name)] == []
+
+
+def test_plotting_names():
+    plotting_definitions = {
+        name
+        for name, obj in vars(plotting).items()
+        if (inspect.isfunction(obj) or inspect.isclass(obj))
+        and obj.__module__ == plotting.__name__
+    }
+
+    assert sputter_log_reader.PLOTTING_NAMES == plotting_definitions
+    assert sputter_log_reader.quick_plot is plotting.quick_plot
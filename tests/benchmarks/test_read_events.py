@@ -0,0 +1,79 @@
+import tracemalloc
+
+import pandas as pd
+
+from nomad_dtu_nanolab_plugin import sputter_log_reader
+from nomad_dtu_nanolab_plugin.sputter_log_reader import read_events, read_logfile
+
+# Peak memory allowed during read_events, as a multiple of the logfile size
+MAX_MEMORY_RATIO = 3
+
+
+def count_time_stamp_parses(monkeypatch):
+    """
+    Counts the calls to pd.to_datetime parsing strings, i.e. the times the
+    'Time Stamp' column (or one of its elements) is parsed again.
+    """
+    calls = []
+    to_datetime = pd.to_datetime
+
+    def counting_to_datetime(arg, *args, **kwargs):
+        if isinstance(arg, str) or (
+            hasattr(arg, 'dtype') and not pd.api.types.is_datetime64_any_dtype(arg)
+        ):
+            calls.append(arg)
+        return to_datetime(arg, *args, **kwargs)
+
+    monkeypatch.setattr(pd, 'to_datetime', counting_to_datetime)
+    return calls
+
+
+def test_read_events_parses_time_stamps_once(synthetic_logfile, monkeypatch):
+    data = read_logfile(synthetic_logfile)
+    calls = count_time_stamp_parses(monkeypatch)
+
+    events, _, _ = read_events(data)
+
+    assert events
+    assert calls == []
+
+
+def test_read_events_computes_log_statistics_once(synthetic_logfile, monkeypatch):
+    data = read_logfile(synthetic_logfile)
+    full_log_calls = []
+    cal_avg_timestep = sputter_log_reader.context.cal_avg_timestep
+
+    def counting_cal_avg_timestep(df, *args, **kwargs):
+        if len(df) == len(data):
+            full_log_calls.append(df)
+        return cal_avg_timestep(df, *args, **kwargs)
+
+    monkeypatch.setattr(
+        sputter_log_reader.context, 'cal_avg_timestep', counting_cal_avg_timestep
+    )
+
+    events, _, _ = read_events(data)
+
+    assert len(full_log_calls) == 1
+    contexts = {id(event.context) for event in events if event.context is not None}
+    assert len(contexts) == 1
+
+
+def test_read_events_memory(synthetic_logfile):
+    """
+    The peak of the memory allocated during read_events (traced with
+    tracemalloc, as the peak RSS of the process is not reset between tests)
+    stays within a small multiple of the size of the logfile, as the events
+    share the logfile instead of copying it.
+    """
+    data = read_logfile(synthetic_logfile)
+    log_size = data.memory_usage(deep=True).sum()
+
+    tracemalloc.start()
+    try:
+        read_events(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < MAX_MEMORY_RATIO * log_size
@@ -0,0 +1,171 @@
+import os
+
+import pytest
+from nomad.client import normalize_all, parse
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader import (
+    SOURCE_NAME,
+    ProcessingStats,
+    read_events,
+    read_logfile,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader.plotting import (
+    generate_bias_plot,
+    generate_timeline,
+)
+
+BENCHMARK_ENV = 'DTU_NANOLAB_BENCHMARKS'
+SAMPLE = 'synth_0001_Cu'
+# Duration (s) of the benchmarked logfiles, recorded at each of the sample
+# rates (Hz) in turn
+BENCHMARK_DURATION = 6 * 3600
+BENCHMARK_SAMPLE_RATES = [1, 2]
+# Minimum throughput (rows of the logfile per second) of each benchmarked stage
+MIN_THROUGHPUT = {
+    'read_logfile': 20_000,
+    'read_events': 20_000,
+    'generate_timeline': 5_000,
+    'generate_bias_plot': 5_000,
+    'normalize': 200,
+}
+# Peak memory allowed during each benchmarked stage, as a multiple of the size
+# of the logfile in memory
+MAX_MEMORY_RATIO = {
+    'read_logfile': 3,
+    'read_events': 3,
+    'generate_timeline': 3,
+    'generate_bias_plot': 3,
+    'normalize': 10,
+}
+
+benchmark = pytest.mark.skipif(
+    not os.environ.get(BENCHMARK_ENV), reason=f'set {BENCHMARK_ENV} to run'
+)
+
+
+@pytest.fixture(scope='module', params=BENCHMARK_SAMPLE_RATES, ids='{}Hz'.format)
+def benchmark_logfile(request, synthetic_logfile_factory):
+    return synthetic_logfile_factory(
+        name=f'{SAMPLE}_{request.param}Hz',
+        duration=BENCHMARK_DURATION,
+        sample_rate=request.param,
+        recipe={'cracker': True},
+    )
+
+
+@pytest.fixture(scope='module')
+def benchmark_data(benchmark_logfile):
+    data = read_logfile(benchmark_logfile)
+    return data, data.memory_usage(deep=True).sum()
+
+
+def run_benchmark(name, func, n_rows, log_size):
+    """
+    Runs func once to time it and once more tracing its memory (as tracing
+    slows it down), prints the throughput and the peak memory of the stage
+    and checks them against MIN_THROUGHPUT and MAX_MEMORY_RATIO.
+    """
+    stats = ProcessingStats(trace_memory=False)
+    with stats.stage(name, rows=n_rows):
+        func()
+    throughput = n_rows / stats.stages[name]['wall_time']
+
+    stats = ProcessingStats(trace_memory=True)
+    with stats.stage(name, rows=n_rows):
+        func()
+    peak_memory = stats.stages[name]['peak_memory']
+
+    print(
+        f'{name} on {n_rows} rows: {throughput:.0f} rows/s, '
+        f'peak memory {peak_memory / 1e6:.1f} MB'
+    )
+    assert throughput > MIN_THROUGHPUT[name]
+    assert peak_memory < MAX_MEMORY_RATIO[name] * log_size
+
+
+def test_synthetic_logfile_recipe(synthetic_logfile_factory):
+    recipe = {
+        'guns': {
+            1: {'material': 'Tin', 'target': 'Sn_T_003', 'switch': None},
+            3: {'material': 'Zinc', 'target': 'Zn_T_002', 'switch': None},
+            4: {
+                'material': 'Copper',
+                'target': 'Cu_T_001',
+                'switch': 'RF2-PWS3',
+                'power': 80,
+            },
+        },
+        'temperature': 300,
+    }
+    logfile = synthetic_logfile_factory(
+        name='recipe', duration=5000, sample_rate=0.5, recipe=recipe
+    )
+    data = read_logfile(logfile)
+
+    _, main_params, _ = read_events(data)
+
+    assert len(data) == 2500  # noqa: PLR2004
+    assert main_params['deposition'][SOURCE_NAME['4']]['enabled']
+    assert main_params['deposition'][SOURCE_NAME['4']]['RF']
+    assert not main_params['deposition'][SOURCE_NAME['1']]['enabled']
+    assert main_params['deposition']['avg_temp_1'] == pytest.approx(300, abs=1)
+
+
+@benchmark
+def test_read_logfile_benchmark(benchmark_logfile, benchmark_data):
+    data, log_size = benchmark_data
+    run_benchmark(
+        'read_logfile', lambda: read_logfile(benchmark_logfile), len(data), log_size
+    )
+
+
+@benchmark
+def test_read_events_benchmark(benchmark_data):
+    data, log_size = benchmark_data
+    run_benchmark('read_events', lambda: tuple(read_events(data)), len(data), log_size)
+
+
+@benchmark
+def test_generate_timeline_benchmark(benchmark_data):
+    data, log_size = benchmark_data
+    events_to_plot = read_events(data).events_to_plot
+    run_benchmark(
+        'generate_timeline',
+        lambda: generate_timeline(events_to_plot, sample_name=SAMPLE),
+        len(data),
+        log_size,
+    )
+
+
+@benchmark
+def test_generate_bias_plot_benchmark(benchmark_data):
+    data, log_size = benchmark_data
+    events_to_plot = read_events(data).events_to_plot
+    run_benchmark(
+        'generate_bias_plot',
+        lambda: generate_bias_plot(events_to_plot, SAMPLE),
+        len(data),
+        log_size,
+    )
+
+
+@benchmark
+def test_normalize_benchmark(benchmark_logfile, benchmark_data):
+    data, log_size = benchmark_data
+    archive_file = os.path.join(
+        os.path.dirname(benchmark_logfile), f'{SAMPLE}.archive.yaml'
+    )
+    with open(archive_file, 'w') as file:
+        file.write(
+            'data:\n'
+            '  m_def: nomad_dtu_nanolab_plugin.schema_packages.sputtering.'
+            'DTUSputtering\n'
+            f"  log_file: '{os.path.basename(benchmark_logfile)}'\n"
+        )
+
+    def normalize():
+        entry_archive = parse(archive_file)[0]
+        normalize_all(entry_archive)
+        assert entry_archive.data.processing_stats is not None
+
+    run_benchmark('normalize', normalize, len(data), log_size)
@@ -0,0 +1,169 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from nomad.datamodel import EntryArchive
+from nomad.units import ureg
+from nomad.utils import get_logger
+
+from nomad_dtu_nanolab_plugin.schema_packages.edx import EDXMeasurement
+from nomad_dtu_nanolab_plugin.schema_packages.sputtering import (
+    ENVIRONMENT_NOMAD_MAP,
+    GAS_FLOW_NOMAD_MAPS,
+    DTUSputtering,
+)
+from nomad_dtu_nanolab_plugin.schema_packages.units import (
+    get_unit,
+    to_magnitude,
+    to_quantities,
+    to_quantity,
+)
+from nomad_dtu_nanolab_plugin.sputter_log_reader import read_events, read_logfile
+
+BENCHMARK_ENV = 'DTU_NANOLAB_BENCHMARKS'
+# Number of points of the benchmarked EDX map
+EDX_MAP_POINTS = 1000
+EDX_ELEMENTS = ['Cu', 'Sn', 'S']
+# Duration (s) and sample rate (Hz) of the logfile of the benchmarked step
+STEP_DURATION = 6 * 3600
+STEP_SAMPLE_RATE = 1
+# Minimum throughput (points per second) of each benchmarked writer
+MIN_THROUGHPUT = {
+    'write_edx_data': 250,
+    'generate_step_log_data': 200_000,
+}
+# Minimum speedup of the cached conversion over the conversion of each value
+# with its unit string, and number of runs of each timed conversion
+MIN_SPEEDUP = 5
+CONVERSION_REPEATS = 3
+
+benchmark = pytest.mark.skipif(
+    not os.environ.get(BENCHMARK_ENV), reason=f'set {BENCHMARK_ENV} to run'
+)
+
+
+def run_timed(func, repeat=1):
+    """
+    Returns the shortest wall time (s) of repeat runs of func.
+    """
+    wall_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        wall_times.append(time.perf_counter() - start)
+    return min(wall_times)
+
+
+def make_edx_map(n_points, seed=0):
+    """
+    Makes the data and alignment DataFrames of a synthetic EDX map of n_points
+    points, as read from the EDX quantification files.
+    """
+    rng = np.random.default_rng(seed)
+    fractions = rng.dirichlet(np.ones(len(EDX_ELEMENTS)), n_points) * 100
+    df_data = pd.DataFrame(
+        {
+            'X (mm)': rng.uniform(-20, 20, n_points),
+            'Y (mm)': rng.uniform(-20, 20, n_points),
+            'Layer 1 Thickness (nm)': rng.uniform(100, 500, n_points),
+            **{
+                f'Layer 1 {element} Atomic %': fractions[:, i]
+                for i, element in enumerate(EDX_ELEMENTS)
+            },
+        }
+    )
+    df_alignment = pd.DataFrame({'corner x': [-20.0, 20.0], 'corner y': [20.0, -20.0]})
+    return df_data, df_alignment
+
+
+def test_unit_conversion():
+    values = np.linspace(0, 1, 5)
+
+    quantity = to_quantity(values.tolist(), 'cm^3/minute')
+    quantities = to_quantities(pd.Series(values), 'mm')
+
+    assert get_unit('mm') is get_unit('mm')
+    assert isinstance(quantity.magnitude, np.ndarray)
+    assert quantity.units == ureg.Unit('cm^3/minute')
+    assert len(quantities) == len(values)
+    assert quantities[1] == ureg.Quantity(values[1], 'mm')
+    assert to_magnitude(quantities[-1], 'um') == pytest.approx(1000)
+
+
+@benchmark
+def test_edx_unit_conversion_benchmark():
+    df_data, df_alignment = make_edx_map(EDX_MAP_POINTS)
+    archive = EntryArchive()
+    logger = get_logger(__name__)
+
+    measurement = EDXMeasurement()
+    wall_time = run_timed(
+        lambda: measurement.write_edx_data(df_data, df_alignment, archive, logger)
+    )
+    throughput = EDX_MAP_POINTS / wall_time
+
+    values = df_data['X (mm)']
+    string_time = run_timed(
+        lambda: [ureg.Quantity(value, 'mm') for value in values],
+        repeat=CONVERSION_REPEATS,
+    )
+    cached_time = run_timed(
+        lambda: to_quantities(values, 'mm'), repeat=CONVERSION_REPEATS
+    )
+
+    print(
+        f'write_edx_data on {EDX_MAP_POINTS} points: {throughput:.0f} points/s, '
+        f'positions converted {string_time / cached_time:.1f}x faster'
+    )
+    assert len(measurement.results) == EDX_MAP_POINTS
+    assert throughput > MIN_THROUGHPUT['write_edx_data']
+    assert string_time / cached_time > MIN_SPEEDUP
+
+
+@benchmark
+def test_step_unit_conversion_benchmark(synthetic_logfile_factory):
+    logfile = synthetic_logfile_factory(
+        name='unit_conversion',
+        duration=STEP_DURATION,
+        sample_rate=STEP_SAMPLE_RATE,
+    )
+    step_params = read_events(read_logfile(logfile)).step_params
+    archive = EntryArchive()
+    logger = get_logger(__name__)
+
+    sputtering = DTUSputtering()
+    wall_time = run_timed(
+        lambda: sputtering.generate_step_log_data(step_params, archive, logger)
+    )
+    # the time series of the environments of the steps, with their units
+    nomad_maps = [ENVIRONMENT_NOMAD_MAP, *GAS_FLOW_NOMAD_MAPS.values()]
+    series = [
+        (value, str(param.unit))
+        for params in step_params.values()
+        for nomad_map in nomad_maps
+        for param in nomad_map
+        if isinstance(value := param.get(params), np.ndarray)
+    ]
+    n_points = sum(len(value) for value, _ in series)
+    throughput = n_points / wall_time
+
+    string_time = run_timed(
+        lambda: [
+            [ureg.Quantity(element, unit) for element in value.tolist()]
+            for value, unit in series
+        ],
+        repeat=CONVERSION_REPEATS,
+    )
+    cached_time = run_timed(
+        lambda: [to_quantity(value, unit) for value, unit in series],
+        repeat=CONVERSION_REPEATS,
+    )
+
+    print(
+        f'generate_step_log_data on {n_points} points: {throughput:.0f} points/s, '
+        f'series converted {string_time / cached_time:.0f}x faster'
+    )
+    assert throughput > MIN_THROUGHPUT['generate_step_log_data']
+    assert string_time / cached_time > MIN_SPEEDUP
@@ -0,0 +1,236 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+TIMESTAMP_FORMAT = '%b-%d-%Y %I:%M:%S.%f %p'
+LOG_START = pd.Timestamp('2024-06-03 09:52:29.123')
+# Output setpoints (W) above which the DC and RF plasmas ignite
+DC_IGNITION_POWER = 20
+RF_IGNITION_POWER = 15
+# Start times (s) of the ramp up of the power supplies and ramp durations (s)
+# of the DC (1) and RF (2, 3) power supplies
+POWER_SUPPLY_RAMP_START = {1: 1500, 2: 1700, 3: 1800}
+DC_RAMP_DURATION = 100
+RF_RAMP_DURATION = 60
+# Process recipe of the synthetic logfiles: the targets loaded in the sources
+# (1, 3 and 4, as in the chamber) with the power supply switched to them, if
+# any, and its output setpoint (W), the deposition temperature (°C), the
+# H2S flow (sccm) of MFC 6 and whether the sulfur cracker is used
+DEFAULT_RECIPE = {
+    'guns': {
+        1: {
+            'material': 'Copper',
+            'target': 'Cu_T_001',
+            'switch': 'PDC-PWS1',
+            'power': 100,
+        },
+        3: {
+            'material': 'Zinc',
+            'target': 'Zn_T_002',
+            'switch': 'RF1-PWS2',
+            'power': 60,
+        },
+        4: {'material': 'Tin', 'target': 'Sn_T_003', 'switch': None},
+    },
+    'temperature': 400,
+    'h2s_flow': 10,
+    'cracker': False,
+}
+
+
+def _ramp(t, points):
+    """Piecewise linear profile through the (time, value) points."""
+    times, values = zip(*points)
+    return np.interp(t, times, values)
+
+
+def _window(t, start, end):
+    return ((t >= start) & (t < end)).astype(int)
+
+
+def write_synthetic_logfile(path, duration=7200, sample_rate=1.0, seed=0, recipe=None):
+    """
+    Writes a synthetic IDOL chamber logfile mimicking a standard recipe:
+    Ar flow, substrate ramp up, ramp up and presputtering of a DC (source 1)
+    and an RF (source 3) gun, a QCM rate measurement, the deposition under
+    H2S and the ramp down with and without H2S. Source 4 is loaded but never
+    switched to a power supply. The holds are stretched with `duration`
+    (in seconds, at least 4500) so that the ramps keep realistic slopes.
+    The guns, powers, temperature, H2S flow and the use of the sulfur cracker
+    can be changed with `recipe` (see DEFAULT_RECIPE).
+    """
+    recipe = {**DEFAULT_RECIPE, **(recipe or {})}
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+
+    def noise(scale):
+        return rng.normal(0, scale, len(t))
+
+    dep_end = duration - 1500
+    data = {}
+    data['Time Stamp'] = (LOG_START + pd.to_timedelta(t, unit='s')).strftime(
+        TIMESTAMP_FORMAT
+    )
+    data.update(_environment_columns(t, dep_end, noise, recipe))
+    data.update(_source_columns(t, dep_end, noise, recipe))
+    data.update(_cracker_columns(t, dep_end, noise, recipe['cracker']))
+
+    df = pd.DataFrame(data)
+    with open(path, 'w', newline='') as file:
+        file.write('Recording Set,Synthetic\n')
+        file.write(f'Date,{LOG_START.date()}\n')
+        df.to_csv(file, index=False)
+    return path
+
+
+def _environment_columns(t, dep_end, noise, recipe):
+    n_rows = len(t)
+    data = {}
+    ar_on = _window(t, 300, dep_end + 1300)
+    data['PC Wide Range Gauge'] = np.where(ar_on, 5e-3, 2e-8 + 1e-9 * t / t[-1])
+    data['PC Capman Pressure'] = np.where(ar_on, 5 + noise(0.01), 0)
+    data['PC Capman Pressure Setpoint'] = 5 * ar_on
+
+    h2s_on = _window(t, 2250, dep_end + 600)
+    for mfc, (setpoint, on) in {
+        1: (40, ar_on),
+        2: (0, 0 * ar_on),
+        3: (0, 0 * ar_on),
+        4: (0, 0 * ar_on),
+        5: (0, 0 * ar_on),
+        6: (recipe['h2s_flow'], h2s_on),
+    }.items():
+        data[f'PC MFC {mfc} Setpoint'] = setpoint * on
+        data[f'PC MFC {mfc} Flow'] = np.round(setpoint * on + noise(0.05) * on, 3)
+
+    temp_sp = _ramp(
+        t,
+        [
+            (0, 25),
+            (600, 25),
+            (1350, recipe['temperature']),
+            (dep_end, recipe['temperature']),
+            (dep_end + 1250, 25),
+        ],
+    )
+    data['Substrate Heater Temperature Setpoint'] = np.round(temp_sp, 2)
+    data['Substrate Heater Temperature'] = np.round(temp_sp + noise(0.3), 2)
+    data['Substrate Heater Temperature 2'] = np.round(temp_sp + noise(0.3) - 2, 2)
+    data['Substrate Heater Current'] = np.round(temp_sp / 100, 3)
+    data['Substrate Rotation_Position'] = np.zeros(n_rows)
+    data['PC Substrate Shutter Open'] = _window(t, 2700, dep_end)
+
+    xtal2_open = _window(t, 2300, 2500)
+    data['Xtal 2 Shutter Open'] = xtal2_open
+    data['Thickness Rate'] = np.round(0.5 * xtal2_open + noise(0.001), 4)
+    data['Thickness Active Material'] = ['Copper'] * n_rows
+    data['Thickness Material Density'] = np.full(n_rows, 8.93)
+    data['Thickness Material Z'] = np.full(n_rows, 0.437)
+    return data
+
+
+def _power_supply_setpoint(t, number, power, sources_off):
+    start = POWER_SUPPLY_RAMP_START[number]
+    ramp = DC_RAMP_DURATION if number == 1 else RF_RAMP_DURATION
+    on = _window(t, start, sources_off) * (power > 0)
+    setpoint = _ramp(t, [(start, 0), (start + ramp, power), (sources_off, power)])
+    return on, setpoint * on
+
+
+def _source_columns(t, dep_end, noise, recipe):
+    n_rows = len(t)
+    data = {}
+    sources_off = dep_end + 100
+    guns = recipe['guns']
+    powers = {1: 0, 2: 0, 3: 0}
+    for number, gun in guns.items():
+        if gun['switch']:
+            powers[int(gun['switch'][-1])] = gun['power']
+        data[f'PC Source {number} Loaded Target'] = [gun['target']] * n_rows
+        data[f'PC Source {number} Material'] = [gun['material']] * n_rows
+        shutter = _window(t, 2200, dep_end) if gun['switch'] else 0 * t
+        data[f'PC Source {number} Shutter Open'] = shutter.astype(int)
+        for switch in ['PDC-PWS1', 'RF1-PWS2', 'RF2-PWS3']:
+            data[f'PC Source {number} Switch-{switch}'] = np.full(
+                n_rows, int(switch == gun['switch'])
+            )
+
+    # Power supply 1 (pulsed-capable DC)
+    ps1_on, ps1_sp = _power_supply_setpoint(t, 1, powers[1], sources_off)
+    ps1_lit = ps1_sp >= DC_IGNITION_POWER
+    data['Power Supply 1 Enable'] = ps1_on
+    data['Power Supply 1 Enabled'] = ps1_on
+    data['Power Supply 1 Output Setpoint'] = np.round(ps1_sp, 1)
+    data['Power Supply 1 Voltage Setpoint'] = np.full(n_rows, 1000)
+    data['Power Supply 1 Current Setpoint'] = np.full(n_rows, 1)
+    data['Power Supply 1 Power'] = np.round(ps1_sp * ps1_lit, 1)
+    data['Power Supply 1 Voltage'] = np.round((350 + noise(2)) * ps1_lit, 1)
+    data['Power Supply 1 Current'] = np.round(ps1_sp / 350 * ps1_lit, 4)
+    data['Power Supply 1 Pulse Enable'] = np.zeros(n_rows, dtype=int)
+    data['Power Supply 1 Pulse Frequency Setpoint'] = np.zeros(n_rows)
+    data['Power Supply 1 Pulse Frequency'] = np.zeros(n_rows)
+    data['Power Supply 1 Reverse Time Setpoint'] = np.zeros(n_rows)
+    data['Power Supply 1 Reverse Time'] = np.zeros(n_rows)
+
+    # RF power supplies 2 and 3 and the platen bias power supply 7, which
+    # stays off
+    rf_supplies = {}
+    for number in [2, 3]:
+        on, setpoint = _power_supply_setpoint(t, number, powers[number], sources_off)
+        rf_supplies[number] = (on, setpoint, setpoint >= RF_IGNITION_POWER)
+    rf_supplies[7] = (0 * t, 0 * t, 0 * t)
+    for number, (on, setpoint, lit) in rf_supplies.items():
+        data[f'Power Supply {number} Enable'] = on.astype(int)
+        data[f'Power Supply {number} Enabled'] = on.astype(int)
+        data[f'Power Supply {number} Output Setpoint'] = np.round(setpoint, 1)
+        data[f'Power Supply {number} Fwd Power'] = np.round(setpoint * lit, 1)
+        data[f'Power Supply {number} Rfl Power'] = np.round(lit * 0.5, 1)
+        data[f'Power Supply {number} DC Bias'] = np.round((80 + noise(1)) * lit, 1)
+        data[f'Power Supply {number} Load Cap Position'] = np.round(50 * lit, 1)
+        data[f'Power Supply {number} Tune Cap Position'] = np.round(40 * lit, 1)
+    return data
+
+
+def _cracker_columns(t, dep_end, noise, cracker):
+    data = {}
+    cracker_on = _window(t, 2000, dep_end + 600) if cracker else 0 * t
+    zones = {1: (25, 150), 2: (25, 250), 3: (25, 300)}
+    for zone, (cold, hot) in zones.items():
+        data[f'Sulfur Cracker Zone {zone} Current Temperature'] = np.round(
+            np.where(cracker_on, hot, cold) + noise(0.2), 2
+        )
+        data[f'Sulfur Cracker Zone {zone} Enabled'] = cracker_on.astype(int)
+    valve_open = _window(t, 2400, dep_end + 600) * cracker_on
+    data['Sulfur Cracker Control Enabled'] = valve_open.astype(int)
+    data['Sulfur Cracker Control Setpoint Feedback'] = np.where(valve_open, 1.0, 0)
+    data['Sulfur Cracker Control Valve PulseWidth Setpoint Feedback'] = np.where(
+        valve_open, 20.0, 0
+    )
+    data['Sulfur Cracker Control Sensor Value'] = np.round(noise(0.01), 4)
+    return data
+
+
+@pytest.fixture(scope='session')
+def synthetic_logfile(tmp_path_factory):
+    path = tmp_path_factory.mktemp('logfiles') / 'synthetic_Recording Set.CSV'
+    return str(write_synthetic_logfile(path))
+
+
+@pytest.fixture(scope='session')
+def synthetic_logfile_factory(tmp_path_factory):
+    """
+    Factory writing synthetic logfiles with a given duration, sample rate and
+    recipe (see write_synthetic_logfile) in a temporary folder.
+    """
+
+    def factory(name='synthetic', **kwargs):
+        path = tmp_path_factory.mktemp('logfiles') / f'{name}_Recording Set.CSV'
+        return str(write_synthetic_logfile(path, **kwargs))
+
+    return factory
+
+
+@pytest.fixture(scope='session')
+def synthetic_cracker_logfile(tmp_path_factory):
+    path = tmp_path_factory.mktemp('logfiles') / 'synthetic_cracker_Recording Set.CSV'
+    return str(write_synthetic_logfile(path, recipe={'cracker': True}))
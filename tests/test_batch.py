@@ -0,0 +1,141 @@
+import json
+import os
+import shutil
+
+from nomad_dtu_nanolab_plugin.sputter_log_reader import (
+    LOGFILE_MANIFEST_NAME,
+    batch_main,
+    cli,
+    decode_params,
+    encode_params,
+    read_events,
+    read_logfile,
+    run_batch,
+)
+
+SAMPLE = 'synth_0001_Cu'
+LOGFILE_NAME = f'{SAMPLE}_Recording Set 2024.06.03-09.52.29'
+BROKEN_LOGFILE_NAME = 'synth_0002_Cu_Recording Set 2024.06.04-09.52.29'
+
+
+def make_samples_dir(tmp_path, synthetic_logfile):
+    for name in [LOGFILE_NAME, BROKEN_LOGFILE_NAME]:
+        log_dir = tmp_path / name[: len(SAMPLE)] / 'log_files'
+        os.makedirs(log_dir)
+        if name == LOGFILE_NAME:
+            shutil.copy(synthetic_logfile, log_dir / f'{name}.CSV')
+        else:
+            (log_dir / f'{name}.CSV').write_text('Not a logfile\n')
+    return tmp_path
+
+
+def test_run_batch(tmp_path, synthetic_logfile):
+    samples_dir = make_samples_dir(tmp_path, synthetic_logfile)
+
+    all_params, errors = run_batch(samples_dir, workers=2, stages=['report'])
+
+    assert list(all_params) == [SAMPLE]
+    assert 'deposition' in all_params[SAMPLE]
+    assert list(errors) == [BROKEN_LOGFILE_NAME]
+    assert (samples_dir / 'all_params.csv').exists()
+    log_dir = samples_dir / SAMPLE / 'log_files'
+    assert (log_dir / f'{LOGFILE_NAME}_derived_quantities.txt').exists()
+    assert not (log_dir / f'{LOGFILE_NAME}_plotly_timeline.html').exists()
+
+
+def test_batch_main(tmp_path, synthetic_logfile):
+    samples_dir = make_samples_dir(tmp_path, synthetic_logfile)
+
+    stages = ['--no-timeline', '--no-bias', '--no-overview', '--no-chamber']
+    assert batch_main([str(samples_dir), '-j', '1', *stages]) == 1
+
+
+def test_run_batch_incremental(tmp_path, synthetic_logfile, capsys):
+    samples_dir = make_samples_dir(tmp_path, synthetic_logfile)
+    log_dir = samples_dir / SAMPLE / 'log_files'
+    logfile_path = log_dir / f'{LOGFILE_NAME}.CSV'
+    report_path = log_dir / f'{LOGFILE_NAME}_derived_quantities.txt'
+
+    all_params, _ = run_batch(samples_dir, workers=1, stages=['report'])
+    report_mtime = os.path.getmtime(report_path)
+
+    # Touching the logfile without changing it does not process it again
+    os.utime(logfile_path)
+    capsys.readouterr()
+    rerun_params, errors = run_batch(samples_dir, workers=1, stages=['report'])
+    assert '1 logfiles to process, 1 logfiles up to date' in capsys.readouterr().out
+    assert list(errors) == [BROKEN_LOGFILE_NAME]
+    assert rerun_params.keys() == all_params.keys()
+    assert os.path.getmtime(report_path) == report_mtime
+
+    # New stages, removed outputs and forced runs process it again
+    for kwargs in [{'stages': ['report', 'chamber']}, {'force': True}]:
+        run_batch(samples_dir, workers=1, **kwargs)
+        assert '2 logfiles to process' in capsys.readouterr().out
+    os.remove(report_path)
+    run_batch(samples_dir, workers=1, stages=['report'])
+    assert '2 logfiles to process' in capsys.readouterr().out
+    assert report_path.exists()
+
+
+def test_run_batch_touched_logfile(tmp_path, synthetic_logfile, monkeypatch, capsys):
+    samples_dir = make_samples_dir(tmp_path, synthetic_logfile)
+    shutil.rmtree(samples_dir / BROKEN_LOGFILE_NAME[: len(SAMPLE)])
+    logfile_path = samples_dir / SAMPLE / 'log_files' / f'{LOGFILE_NAME}.CSV'
+    manifest_path = samples_dir / LOGFILE_MANIFEST_NAME
+
+    run_batch(samples_dir, workers=1, stages=['report'])
+    os.utime(logfile_path, (0, 0))
+    # the manifest is saved with the new mtime, although nothing is processed
+    manifest_mtime = os.path.getmtime(manifest_path)
+    os.utime(manifest_path, (manifest_mtime - 1, manifest_mtime - 1))
+    run_batch(samples_dir, workers=1, stages=['report'])
+    assert os.path.getmtime(manifest_path) > manifest_mtime - 1
+
+    # so the logfile is not hashed again by the next runs
+    def hash_file(*args):
+        raise AssertionError('the logfile was hashed again')
+
+    monkeypatch.setattr(cli, 'hash_file', hash_file)
+    capsys.readouterr()
+    run_batch(samples_dir, workers=1, stages=['report'])
+    assert '0 logfiles to process, 1 logfiles up to date' in capsys.readouterr().out
+
+
+def test_params_json(synthetic_logfile):
+    main_params = read_events(read_logfile(synthetic_logfile)).main_params
+
+    loaded = json.loads(
+        json.dumps(encode_params(main_params)), object_hook=decode_params
+    )
+
+    def types(params):
+        if isinstance(params, dict):
+            return {key: types(value) for key, value in params.items()}
+        return type(params).__name__.replace('float64', 'float')
+
+    assert loaded == main_params
+    assert types(loaded) == types(main_params)
+
+
+def test_run_batch_params_cache(tmp_path, synthetic_logfile, capsys):
+    samples_dir = make_samples_dir(tmp_path, synthetic_logfile)
+    shutil.rmtree(samples_dir / BROKEN_LOGFILE_NAME[: len(SAMPLE)])
+    params_path = samples_dir / SAMPLE / 'log_files' / f'{LOGFILE_NAME}_params.json'
+    csv_path = samples_dir / 'all_params.csv'
+
+    run_batch(samples_dir, workers=1, stages=['report'])
+    all_params_csv = csv_path.read_text()
+    assert params_path.exists()
+
+    # the params loaded from the manifest give the same consolidated CSV
+    capsys.readouterr()
+    run_batch(samples_dir, workers=1, stages=['report'])
+    assert '0 logfiles to process' in capsys.readouterr().out
+    assert csv_path.read_text() == all_params_csv
+
+    # params that cannot be parsed are processed again
+    params_path.write_text('not json')
+    run_batch(samples_dir, workers=1, stages=['report'])
+    assert '1 logfiles to process' in capsys.readouterr().out
+    assert csv_path.read_text() == all_params_csv
@@ -0,0 +1,862 @@
+import concurrent.futures
+import copy
+import os
+import threading
+import time
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nomad_dtu_nanolab_plugin import sputter_log_reader
+from nomad_dtu_nanolab_plugin.sputter_log_reader import (
+    BIAS_THRESHOLD,
+    CURRENT_THRESHOLD,
+    LOGFILE_CACHE_DIR_ENV,
+    POWER_FWD_RFL_THRESHOLD,
+    POWER_SETPOINT_DIFF_THRESHOLD,
+    STEP_SERIES_REDUCTION_ENV,
+    TIMESTAMP_FORMAT,
+    EventConditions,
+    EventExpr,
+    EventIndex,
+    EventRule,
+    Lf_Event,
+    LogContext,
+    LogfileProcessor,
+    ProcessingStats,
+    ReadEventsResult,
+    Source_Ramp_Up_Event,
+    cal_avg_timestep,
+    col,
+    compile_nomad_map,
+    cond,
+    event_filter,
+    evict_logfile_cache,
+    filter_spectrum,
+    format_input_path,
+    format_logfile,
+    get_column,
+    get_event_conditions,
+    get_logfile_cache_key,
+    has_parquet_engine,
+    load_cached_logfile,
+    map_sources,
+    map_sputter_source_params_to_nomad,
+    parse_time_stamps,
+    read_cached_logfile,
+    read_events,
+    read_logfile,
+    reduce_series,
+    reduce_step_params,
+)
+
+
+def test_read_logfile(synthetic_logfile):
+    expected = pd.read_csv(synthetic_logfile, header=[1], skiprows=[0])
+    expected['Time Stamp'] = pd.to_datetime(
+        expected['Time Stamp'], format=TIMESTAMP_FORMAT
+    )
+    # The second read uses the schema cached by the first one
+    for _ in range(2):
+        df = read_logfile(synthetic_logfile)
+        pd.testing.assert_frame_equal(df, expected)
+
+
+def test_read_logfile_chunked(synthetic_logfile, monkeypatch):
+    expected = read_logfile(synthetic_logfile, usecols='events')
+
+    df = read_logfile(synthetic_logfile, usecols='events', chunksize=1000)
+    pd.testing.assert_frame_equal(df, expected)
+
+    # the logfiles are only parsed in chunks if a chunksize is given
+    def parse_in_chunks(*args):
+        raise AssertionError('the logfile was parsed in chunks')
+
+    monkeypatch.setattr(sputter_log_reader.io, 'parse_logfile_chunks', parse_in_chunks)
+    pd.testing.assert_frame_equal(read_logfile(synthetic_logfile, 'events'), expected)
+
+
+def test_read_logfile_chunk_border_in_event(synthetic_logfile):
+    def summary(result):
+        return [
+            (event.step_id, event.bounds, len(event.data)) for event in result.events
+        ]
+
+    expected = read_events(read_logfile(synthetic_logfile))
+    ramp_up = next(
+        event for event in expected.events if event.step_id == 'source_ramp_up_s1'
+    )
+    deposition_rows = expected.deposition.data.index
+    # the first border is on the second row of the ramp up (the setpoint
+    # difference is taken with the last row of the previous chunk), the
+    # second one inside the deposition
+    chunksize = ramp_up.data.index[1]
+    assert deposition_rows[0] < 2 * chunksize < deposition_rows[-1]
+
+    result = read_events(read_logfile(synthetic_logfile, chunksize=chunksize))
+
+    assert summary(result) == summary(expected)
+    assert result.main_params == expected.main_params
+
+
+def test_read_logfile_chunked_dtypes(synthetic_logfile, tmp_path, monkeypatch):
+    # a column logged as floats in the first chunk and as integers in the
+    # second one
+    with open(synthetic_logfile) as file:
+        lines = file.readlines()
+    header = lines[:3]
+    n_rows = len(lines) - len(header)
+    column = header[2].rstrip('\n').split(',').index('PC MFC 1 Setpoint')
+    rows = []
+    for i, line in enumerate(lines[3:]):
+        values = line.rstrip('\n').split(',')
+        values[column] = '0.5' if i < n_rows // 2 else '3'
+        rows.append(','.join(values) + '\n')
+    logfile = tmp_path / 'dtypes_Recording Set.CSV'
+    logfile.write_text(''.join(header + rows))
+    expected = pd.read_csv(logfile, header=[1], skiprows=[0])
+    expected['Time Stamp'] = pd.to_datetime(
+        expected['Time Stamp'], format=TIMESTAMP_FORMAT
+    )
+
+    # the dtypes are inferred on each chunk, and the chunks are combined
+    # without reading the logfile again at once
+    def read_at_once(*args):
+        raise AssertionError('the logfile was read at once')
+
+    monkeypatch.setattr(sputter_log_reader.io, '_LOGFILE_SCHEMAS', {})
+    monkeypatch.setattr(sputter_log_reader.io, 'read_logfile_columns', read_at_once)
+    df = read_logfile(logfile, chunksize=n_rows // 2)
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert df['PC MFC 1 Setpoint'].dtype == np.float64
+
+
+def test_read_logfile_usecols(synthetic_logfile):
+    df = read_logfile(synthetic_logfile, usecols=['PC MFC 1 Flow', 'Not Logged'])
+    assert list(df.columns) == ['Time Stamp', 'PC MFC 1 Flow']
+
+    df = read_logfile(synthetic_logfile, usecols='events')
+    assert 'Sulfur Cracker Control Enabled' in df.columns
+    assert pd.api.types.is_datetime64_dtype(df['Time Stamp'])
+
+
+@pytest.mark.parametrize(
+    'time_stamps',
+    [
+        ['Jun-03-2024 12:52:29.123 AM', 'Jun-03-2024 12:52:30.123 PM'],
+        ['Feb-29-2024 09:00:00.999999 pm', 'Mar-01-2024 10:00:00.000001 am'],
+        # Mixed widths are left to pd.to_datetime
+        ['Dec-31-1999 11:59:59.9 PM', 'Jan-01-2000 12:00:00.25 AM'],
+    ],
+)
+def test_parse_time_stamps(time_stamps):
+    time_stamps = pd.Series(time_stamps, name='Time Stamp')
+    pd.testing.assert_series_equal(
+        parse_time_stamps(time_stamps),
+        pd.to_datetime(time_stamps, format=TIMESTAMP_FORMAT),
+    )
+
+
+def test_parse_time_stamps_invalid():
+    with pytest.raises(ValueError):
+        parse_time_stamps(pd.Series(['Feb-30-2024 09:00:00.000 AM']))
+
+
+@pytest.mark.skipif(not has_parquet_engine(), reason='no Parquet engine')
+def test_read_cached_logfile(synthetic_logfile, tmp_path, monkeypatch):
+    data = read_cached_logfile(synthetic_logfile, cache_dir=tmp_path)
+    expected, _ = format_logfile(read_logfile(synthetic_logfile))
+    pd.testing.assert_frame_equal(data, expected)
+    assert len(os.listdir(tmp_path)) == 1
+
+    # The second read must not parse the CSV again
+    def fail(*args, **kwargs):
+        raise AssertionError('The logfile was parsed again')
+
+    monkeypatch.setattr(sputter_log_reader.io, 'read_logfile', fail)
+    cached = read_cached_logfile(synthetic_logfile, cache_dir=tmp_path)
+    pd.testing.assert_frame_equal(cached, expected)
+    assert cached.attrs['formatted']
+
+
+def test_logfile_cache_opt_in(synthetic_logfile, tmp_path, monkeypatch):
+    monkeypatch.delenv(LOGFILE_CACHE_DIR_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+    expected, _ = format_logfile(read_logfile(synthetic_logfile))
+
+    # without a cache directory, nothing is cached
+    data = read_cached_logfile(synthetic_logfile)
+    pd.testing.assert_frame_equal(data, expected)
+    assert os.listdir(tmp_path) == []
+
+    # pickles found in the cache directory are never loaded
+    cache_dir = tmp_path / 'cache'
+    cache_dir.mkdir()
+    key = get_logfile_cache_key(synthetic_logfile)
+    expected.iloc[:1].to_pickle(cache_dir / f'{key}.pkl')
+    data = read_cached_logfile(synthetic_logfile, cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(data, expected)
+    assert load_cached_logfile(str(cache_dir / f'{key}.pkl')) is None
+
+
+def test_evict_logfile_cache(tmp_path):
+    for name, age in [('old.parquet', 40), ('recent.parquet', 2), ('new.parquet', 1)]:
+        path = tmp_path / name
+        path.write_bytes(b'0' * 1000)
+        mtime = time.time() - age * 86400
+        os.utime(path, (mtime, mtime))
+
+    evict_logfile_cache(tmp_path, max_size=1, max_age=30)
+    assert sorted(os.listdir(tmp_path)) == ['new.parquet', 'recent.parquet']
+
+    evict_logfile_cache(tmp_path, max_size=0.0015, max_age=30)
+    assert os.listdir(tmp_path) == ['new.parquet']
+
+
+def test_log_context(synthetic_logfile):
+    data, _ = format_logfile(read_logfile(synthetic_logfile))
+    context = LogContext(data)
+
+    assert len(context) == len(data)
+    assert context.columns is data.columns
+    assert context.time_ns.dtype == 'int64'
+    assert context.time_ns[0] == data['Time Stamp'].iloc[0].value
+    assert copy.deepcopy(context) is context
+
+    bounds = [data['Time Stamp'].iloc[10], data['Time Stamp'].iloc[20]]
+    pd.testing.assert_frame_equal(event_filter(context, bounds), data.iloc[10:21])
+    assert cal_avg_timestep(context) == data['Time Stamp'].diff().dropna().mean()
+
+
+def test_log_context_columns(synthetic_logfile):
+    data, _ = format_logfile(read_logfile(synthetic_logfile))
+    data.index += 100
+    context = LogContext(data)
+
+    assert np.shares_memory(
+        context.column('Source 1 Current').to_numpy(),
+        data['Source 1 Current'].to_numpy(),
+    )
+    # source 1 is a DC source, so it has no Fwd Power column
+    fwd_power = context.column('Source 1 Fwd Power')
+    assert fwd_power.index.equals(data.index)
+    assert (fwd_power == 0).all()
+    assert not fwd_power.to_numpy().flags.writeable
+    # the values of the missing columns are shared for each default value
+    rfl_power = context.column('Source 1 Rfl Power')
+    assert np.shares_memory(fwd_power.to_numpy(), rfl_power.to_numpy())
+    assert context.column_values('Source 1 DC Bias') == 0
+    assert context.missing_columns == {
+        'Source 1 Fwd Power',
+        'Source 1 Rfl Power',
+        'Source 1 DC Bias',
+    }
+    # the same access is available on the plain DataFrames
+    assert get_column(data, 'Source 1 Fwd Power').index.equals(data.index)
+
+
+def test_event_rows(synthetic_logfile):
+    data, _ = format_logfile(read_logfile(synthetic_logfile))
+    context = LogContext(data)
+    cond = data['PC MFC 1 Flow'] > 1
+
+    event = Lf_Event('Ar On')
+    event.set_condition(cond)
+    event.filter_data(context)
+    expected = Lf_Event('Ar On')
+    expected.set_condition(cond)
+    expected.filter_data(data)
+
+    assert event.rows is not None
+    assert event._data is None
+    assert event.bounds == expected.bounds
+    pd.testing.assert_frame_equal(event.data, expected.data)
+    for sep_data, expected_sep_data in zip(event.sep_data, expected.sep_data):
+        pd.testing.assert_frame_equal(sep_data, expected_sep_data)
+    # continuous events are slices sharing the memory of the logfile
+    assert np.shares_memory(
+        event.sep_data[0]['PC MFC 1 Flow'].to_numpy(),
+        data['PC MFC 1 Flow'].to_numpy(),
+    )
+
+
+def test_stitch_source_ramp_up_events():
+    # a ramp up in two steps (0->50, then 50->75 after a hold) and a second
+    # ramp up after the source was switched off
+    setpoint = np.concatenate(
+        [
+            np.linspace(0, 50, 20),
+            np.full(30, 50),
+            np.linspace(50, 75, 21)[1:],
+            np.full(10, 75),
+            np.linspace(0, 40, 20),
+        ]
+    )
+    data = pd.DataFrame(
+        {
+            'Time Stamp': pd.Timestamp('2024-06-03')
+            + pd.to_timedelta(np.arange(len(setpoint)), unit='s'),
+            'Source 1 Output Setpoint': setpoint,
+        }
+    )
+    ramp_up = (data['Source 1 Output Setpoint'].diff() > 0) | (
+        data['Source 1 Output Setpoint'].diff().shift(-1) > 0
+    )
+    for raw_data in [data, LogContext(data)]:
+        event = Source_Ramp_Up_Event('Source 1 Ramp Up', source=1)
+        event.set_condition(ramp_up)
+        event.filter_data(raw_data)
+        assert [len(sep_data) for sep_data in event.sep_data] == [20, 21, 20]
+
+        event.stitch_source_ramp_up_events()
+        time_stamps = data['Time Stamp']
+        assert event.bounds == [
+            (time_stamps.iloc[0], time_stamps.iloc[69]),
+            (time_stamps.iloc[80], time_stamps.iloc[99]),
+        ]
+        assert [len(sep_data) for sep_data in event.sep_data] == [41, 20]
+        assert event.bound_positions == [(0, 40), (41, 60)]
+
+
+def test_event_snapshot(synthetic_logfile):
+    data, _ = format_logfile(read_logfile(synthetic_logfile))
+    event = Lf_Event('Ar On')
+    event.set_condition(data['PC MFC 1 Flow'] > 1)
+    event.filter_data(LogContext(data))
+
+    snapshot = event.snapshot()
+    assert snapshot.rows is event.rows
+    assert snapshot.context is event.context
+    assert snapshot.bounds == event.bounds
+
+    snapshot.bounds.pop()
+    assert len(event.bounds) == len(snapshot.bounds) + 1
+
+
+def test_event_conditions(synthetic_logfile):
+    data, source_list = format_logfile(read_logfile(synthetic_logfile))
+    conditions = get_event_conditions(data, source_list)
+
+    # Source 1 is DC (no DC bias and RF power columns), source 3 is RF (no
+    # current column), the missing columns default to 0
+    enabled = data['Source 1 Enabled'] != 0
+    rf_power = data['Source 3 Fwd Power'] - data['Source 3 Rfl Power']
+    rf_on = (data['Source 3 DC Bias'] > BIAS_THRESHOLD) | (
+        rf_power > POWER_FWD_RFL_THRESHOLD
+    )
+    ramp_up = enabled & (
+        data['Source 1 Output Setpoint'].diff() > POWER_SETPOINT_DIFF_THRESHOLD
+    )
+    expected = {
+        'source_on_1': enabled & (data['Source 1 Current'] > CURRENT_THRESHOLD),
+        'source_on_3': (data['Source 3 Enabled'] != 0) & rf_on,
+        'source_ramp_up_1': ramp_up | ramp_up.shift(-1, fill_value=False),
+        'deposition': (data['PC Substrate Shutter Open'] == 1)
+        & (
+            conditions['source_on_open_1']
+            | conditions['source_on_open_3']
+            | conditions['source_on_open_4']
+        ),
+        'temp_ctrl': data['Substrate Heater Temperature Setpoint']
+        != data['Substrate Heater Temperature'],
+        'cracker_on_open': pd.Series(False, index=data.index),
+    }
+    for name, expected_cond in expected.items():
+        pd.testing.assert_series_equal(
+            conditions[name], expected_cond, check_names=False
+        )
+    assert conditions['source_on_1'].any()
+    assert conditions['source_on_3'].any()
+
+
+def test_event_conditions_circular_reference(synthetic_logfile):
+    data = read_logfile(synthetic_logfile, usecols=['PC MFC 1 Flow'])
+    conditions = EventConditions(
+        data,
+        {
+            'a': EventRule(cond('b') & (col('PC MFC 1 Flow') > 1)),
+            'b': EventRule(~cond('a')),
+        },
+    )
+    with pytest.raises(ValueError, match='Circular reference'):
+        conditions['a']
+
+
+def test_event_conditions_threads(synthetic_logfile):
+    data = read_logfile(synthetic_logfile, usecols=['PC MFC 1 Flow', 'PC MFC 6 Flow'])
+    barrier = threading.Barrier(2, timeout=5)
+
+    # the columns are only read once both threads are evaluating a condition
+    class BarrierConditions(EventConditions):
+        def _evaluate(self, expr):
+            if isinstance(expr, EventExpr) and expr.op == 'col':
+                barrier.wait()
+            return super()._evaluate(expr)
+
+    conditions = BarrierConditions(
+        data,
+        {
+            'ar_flow': EventRule(col('PC MFC 1 Flow') > 1),
+            'h2s_flow': EventRule(col('PC MFC 6 Flow') > 1),
+        },
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        results = dict(
+            zip(
+                ['ar_flow', 'h2s_flow'],
+                executor.map(conditions.__getitem__, ['ar_flow', 'h2s_flow']),
+            )
+        )
+
+    for name, column in [('ar_flow', 'PC MFC 1 Flow'), ('h2s_flow', 'PC MFC 6 Flow')]:
+        pd.testing.assert_series_equal(
+            results[name], data[column] > 1, check_names=False
+        )
+        assert conditions[name] is results[name]
+
+
+def test_map_sources():
+    # the last sources finish first, but the results keep the order of the
+    # sources
+    def evaluate(source_number):
+        time.sleep(0.01 * (4 - source_number))
+        return source_number
+
+    assert map_sources(evaluate, [1, 3, 4], workers=3) == [1, 3, 4]
+    assert map_sources(evaluate, [1, 3, 4], workers=1) == [1, 3, 4]
+
+
+def test_read_events_source_workers(synthetic_logfile, monkeypatch):
+    def summary(events):
+        return [(event.step_id, event.bounds, len(event.data)) for event in events]
+
+    monkeypatch.setenv(sputter_log_reader.SOURCE_WORKERS_ENV, '1')
+    serial_events, _, _ = read_events(read_logfile(synthetic_logfile))
+    monkeypatch.setenv(sputter_log_reader.SOURCE_WORKERS_ENV, '4')
+    parallel_events, _, _ = read_events(read_logfile(synthetic_logfile))
+
+    assert summary(parallel_events) == summary(serial_events)
+
+
+def test_event_index(synthetic_logfile):
+    events, _, _ = read_events(read_logfile(synthetic_logfile))
+    index = events[0].context.event_index
+    domains = [(event, i) for event in events for i, _ in enumerate(event.bounds)]
+    assert len(index) == len(domains)
+
+    def brute_force(select):
+        return {
+            (id(event), i)
+            for event, i in domains
+            if select(event.bounds[i][0], event.bounds[i][1])
+        }
+
+    def found(result):
+        return {(id(event), i) for event, i in result}
+
+    time_stamps = events[0].context.time_stamps
+    for start_row, end_row in [(0, 100), (2000, 2600), (2300, 2300), (7000, 7199)]:
+        start, end = time_stamps.iloc[start_row], time_stamps.iloc[end_row]
+        assert found(index.overlapping(start, end)) == brute_force(
+            lambda first, last: first <= end and last >= start
+        )
+        assert found(index.within(start, end)) == brute_force(
+            lambda first, last: first >= start and last <= end
+        )
+    deposition = next(event for event in events if event.category == 'deposition')
+    ref_time = deposition.bounds[0][0]
+    event, i = index.last_before(ref_time, category='source_ramp_up')
+    assert event.bounds[i][1] < ref_time
+    assert event.bounds[i][1] == max(
+        e.bounds[j][1]
+        for e, j in domains
+        if e.category == 'source_ramp_up' and e.bounds[j][1] < ref_time
+    )
+    assert index.last_before(time_stamps.iloc[0]) is None
+    assert EventIndex([]).overlapping(time_stamps.iloc[0], time_stamps.iloc[-1]) == []
+
+
+def test_event_index_lookups(synthetic_logfile):
+    events, _, _ = read_events(read_logfile(synthetic_logfile))
+    index = EventIndex(events)
+
+    assert index.events_of('deposition') == [
+        event for event in events if event.category == 'deposition'
+    ]
+    assert index.events_of('not_a_category') == []
+    # the domains before a time are the ones found by scanning the bounds,
+    # including at the bounds of the domains
+    time_stamps = events[0].context.time_stamps
+    for event in events:
+        assert event in index
+        ref_times = [time_stamps.iloc[0], time_stamps.iloc[3000]]
+        ref_times += [time for bounds in event.bounds for time in bounds]
+        for ref_time in ref_times:
+            assert event.find_domains_before(
+                ref_time, event_index=index
+            ) == event.find_domains_before(ref_time)
+    # the events that are not indexed are scanned
+    assert Lf_Event('Not Indexed') not in index
+
+
+def test_filter_spectrum():
+    timestamps = pd.date_range('2024-06-03 10:00', periods=5, freq='min')
+    spectra = {
+        'data': pd.DataFrame(
+            {'x': [400, 500], **{f'y{i + 1}': [i, i + 1] for i in range(5)}}
+        ),
+        'timestamp_map': {f'y{i + 1}': t for i, t in enumerate(timestamps)},
+    }
+    filtered = filter_spectrum(
+        spectra, [(timestamps[0], timestamps[1]), (timestamps[3], timestamps[4])]
+    )
+    assert list(filtered['timestamp_map']) == ['y1', 'y2', 'y4', 'y5']
+    assert list(filtered['data'].columns) == ['x', 'y1', 'y2', 'y4', 'y5']
+
+
+def test_read_events_result(synthetic_logfile, monkeypatch):
+    result = read_events(read_logfile(synthetic_logfile))
+    assert isinstance(result, ReadEventsResult)
+    assert result.event_index is result.context.event_index
+    assert len(result.event_index) == sum(
+        len(event.bounds) for event in result.events_to_plot
+    )
+    # the parameters of the reports are only extracted when accessed
+    assert 'events' in result.timings
+    assert 'index' in result.timings
+    assert 'deposition' not in result.timings
+    assert result.step_params
+    assert 'deposition' in result.timings
+    assert 'main_params' not in result.timings
+    assert result.errors == {}
+
+    # a failing stage only empties its own parameters
+    def fail(data):
+        raise ValueError('no overview')
+
+    monkeypatch.setattr(sputter_log_reader.params, 'get_overview', fail)
+    events_to_plot, main_params, step_params = result
+    assert events_to_plot is result.events_to_plot
+    assert main_params == {}
+    assert step_params is result.step_params
+    assert isinstance(result.errors['main_params'], ValueError)
+
+
+def test_processing_stats(synthetic_logfile):
+    class Logger:
+        def __init__(self):
+            self.records = []
+
+        def info(self, event, **kwargs):
+            self.records.append((event, kwargs))
+
+    logger = Logger()
+    stats = ProcessingStats(trace_memory=True, logger=logger)
+    with stats.stage('read_logfile') as stage:
+        data = read_logfile(synthetic_logfile)
+        stage['rows'] = len(data)
+    result = read_events(data, stats=stats)
+    assert result.stats is stats
+    assert result.main_params
+
+    assert stats.stages['read_logfile']['rows'] == len(data)
+    assert stats.stages['filter_gas']['parent'] == 'events'
+    assert stats.stages['verify_deposition_unicity']['parent'] == 'deposition'
+    assert stats.stages['deposition']['parent'] == 'main_params'
+    # the peak memory of a stage includes the peaks of its nested stages
+    assert stats.stages['events']['peak_memory'] >= max(
+        record['peak_memory']
+        for record in stats.stages.values()
+        if record['parent'] == 'events'
+    )
+    assert stats.total_time == pytest.approx(
+        sum(stats.timings[name] for name in ['read_logfile', 'events', 'index'])
+        + stats.timings['main_params']
+    )
+    # the slowest stage is a stage without nested stages
+    parents = {record['parent'] for record in stats.stages.values()}
+    assert stats.slowest_stage() not in parents
+    # every stage is logged once, when it ends
+    assert len(logger.records) == len(stats.stages)
+    assert {kwargs['stage'] for _, kwargs in logger.records} == set(stats.stages)
+
+
+def test_processing_stats_repeated_stage():
+    class Logger:
+        def __init__(self):
+            self.records = []
+
+        def info(self, event, **kwargs):
+            self.records.append(kwargs)
+
+    logger = Logger()
+    stats = ProcessingStats(trace_memory=True, logger=logger)
+    source_rows = [5, 7]
+    with stats.stage('sources'):
+        for rows in source_rows:
+            with stats.stage('source', rows=rows):
+                list(range(1000 * rows))
+    # the runs of a repeated stage are aggregated instead of overwritten
+    runs = [kwargs for kwargs in logger.records if kwargs['stage'] == 'source']
+    assert len(runs) == len(source_rows)
+    record = stats.stages['source']
+    assert record['count'] == len(source_rows)
+    assert record['parent'] == 'sources'
+    assert record['rows'] == sum(source_rows)
+    assert record['wall_time'] == pytest.approx(sum(run['wall_time'] for run in runs))
+    assert record['peak_memory'] == max(run['peak_memory'] for run in runs)
+    assert list(stats.stages) == ['sources', 'source']
+    assert stats.stages['sources']['count'] == 1
+    assert stats.total_time == stats.stages['sources']['wall_time']
+
+
+def test_logfile_processor(synthetic_logfile, tmp_path, monkeypatch):
+    monkeypatch.setenv(LOGFILE_CACHE_DIR_ENV, str(tmp_path))
+    processor = LogfileProcessor(synthetic_logfile)
+
+    events = processor.events()
+    # only the stages needed for the events are run
+    assert processor.stats.stages['read_logfile']['rows'] == len(processor.data())
+    assert 'main_params' not in processor.stats.stages
+    main_params = processor.params()
+    assert 'step_params' not in processor.stats.stages
+
+    expected = read_events(read_logfile(synthetic_logfile))
+    assert [event.name for event in events] == [
+        event.name for event in expected.events_to_plot
+    ]
+    assert main_params.keys() == expected.main_params.keys()
+    assert processor.steps().keys() == expected.step_params.keys()
+    assert processor.errors == {}
+
+    # the same columns are read without the cache, the columns that are not
+    # used by the events being left aside
+    with open(synthetic_logfile) as file:
+        lines = file.read().splitlines()
+    logfile = tmp_path / 'extra_Recording Set.CSV'
+    logfile.write_text(
+        '\n'.join(
+            [*lines[:2], f'{lines[2]},Chamber Light']
+            + [f'{line},1' for line in lines[3:]]
+        )
+        + '\n'
+    )
+    cached = LogfileProcessor(logfile)
+    uncached = LogfileProcessor(logfile, cached=False)
+    uncached.events()
+    assert 'Chamber Light' not in uncached.data().columns
+    pd.testing.assert_frame_equal(uncached.data(), cached.data())
+
+
+def test_generate_bias_plot_keeps_events(synthetic_logfile):
+    result = read_events(read_logfile(synthetic_logfile))
+    deposition = next(
+        event for event in result.events_to_plot if event.category == 'deposition'
+    )
+    original = next(event for event in result.events if event.category == 'deposition')
+    columns = list(deposition.data.columns)
+    original_columns = list(original.data.columns)
+
+    # the Sb samples also get the max and no zero curves
+    bias_plot = sputter_log_reader.generate_bias_plot(
+        result.events_to_plot, 'synth_Sb_0001'
+    )
+
+    assert any('Smoothed' in trace.name for trace in bias_plot.data)
+    assert list(deposition.data.columns) == columns
+    assert list(original.data.columns) == original_columns
+
+
+def test_event_stats(synthetic_logfile):
+    events = read_events(read_logfile(synthetic_logfile)).events
+    deposition = next(event for event in events if event.category == 'deposition')
+    data = deposition.data
+    numeric_columns = ['PC Capman Pressure', 'Source 1 Output Setpoint']
+
+    deposition.cache_stats([*numeric_columns, 'PC Source 1 Material'])
+
+    # only the numeric columns are cached, in a single pass
+    assert set(deposition._stats) == set(numeric_columns)
+    for column in numeric_columns:
+        assert deposition.get_stat(column) == data[column].mean()
+        assert deposition.get_stat(column, 'min') == data[column].min()
+        assert deposition.get_stat(column, 'max') == data[column].max()
+        assert deposition.get_stat(column, 'last') == data[column].iloc[-1]
+        assert deposition.get_stat(column, 'std') == data[column].std()
+    assert (
+        deposition.get_stat('PC Source 1 Material', 'first')
+        == (data['PC Source 1 Material'].iloc[0])
+    )
+    # the statistics are reset with the data, and missing values are skipped
+    deposition.data = data.assign(**{'PC Capman Pressure': np.nan})
+    assert deposition._stats == {}
+    assert np.isnan(deposition.get_stat('PC Capman Pressure'))
+    assert deposition.get_stat('Source 1 Output Setpoint', 'mode') == (
+        data['Source 1 Output Setpoint'].value_counts().idxmax()
+    )
+
+
+def test_event_stats_threads(synthetic_logfile, monkeypatch):
+    events = read_events(read_logfile(synthetic_logfile)).events
+    deposition = next(event for event in events if event.category == 'deposition')
+    column = 'PC Capman Pressure'
+    get_column_stat = sputter_log_reader.events.get_column_stat
+    computed = []
+
+    # a slow statistic, so that the threads look it up at the same time
+    def slow_column_stat(series, stat):
+        computed.append((series.name, stat))
+        time.sleep(0.01)
+        return get_column_stat(series, stat)
+
+    monkeypatch.setattr(sputter_log_reader.events, 'get_column_stat', slow_column_stat)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        stds = list(
+            executor.map(lambda _: deposition.get_stat(column, 'std'), range(16))
+        )
+
+    # the statistic is computed once, and shared by all the threads
+    assert computed == [(column, 'std')]
+    assert stds == [deposition.data[column].std()] * len(stds)
+
+
+def test_step_params_arrays(synthetic_logfile):
+    step_params = read_events(read_logfile(synthetic_logfile)).step_params
+
+    for step in step_params.values():
+        pressure = step['environment']['pressure']
+        gas_flow = step['environment']['gas_flow']['ar']['flow_rate']
+        h2s_flow = step['environment']['gas_flow']['h2s']['flow_rate']
+        # the time series of a step are arrays sharing the same time vector
+        assert isinstance(gas_flow['value'], np.ndarray)
+        assert gas_flow['time'] is h2s_flow['time']
+        assert len(gas_flow['time']) == len(gas_flow['value'])
+        assert gas_flow['time'][0] == 0
+        if 'time' in pressure:
+            assert pressure['time'] is gas_flow['time']
+        for source in step['sources'].values():
+            if 'source_shutter_open' in source:
+                assert source['source_shutter_open']['value'].dtype == bool
+                assert source['source_shutter_open']['time'] is gas_flow['time']
+
+
+@pytest.mark.parametrize(
+    'strategy',
+    ['stride', 'bucket_mean', 'bucket_min', 'bucket_max', 'lttb', 'change_point'],
+)
+def test_reduce_series(strategy):
+    time = np.arange(10_000, dtype=np.float64)
+    value = np.sin(time / 500)
+    value[5000] = 10
+
+    reduced_time, reduced_value = reduce_series(time, value, strategy, 500)
+
+    assert 1 < len(reduced_time) <= 500  # noqa: PLR2004
+    assert len(reduced_time) == len(reduced_value)
+    assert (np.diff(reduced_time) > 0).all()
+    if strategy in ['bucket_max', 'lttb', 'change_point']:
+        # the peaks are kept
+        assert reduced_value.max() == 10  # noqa: PLR2004
+    if strategy not in ['bucket_mean', 'bucket_min', 'bucket_max']:
+        assert reduced_time[[0, -1]].tolist() == [0, 9999]
+    # the series with at most max_points points are not reduced
+    assert reduce_series(time, value, strategy, 10_000)[0] is time
+
+
+# the buckets of lttb used to be divided by zero with 2 points
+@pytest.mark.filterwarnings('error')
+@pytest.mark.parametrize('strategy', ['lttb', 'change_point'])
+def test_reduce_series_two_points(strategy):
+    time = np.arange(100, dtype=np.float64)
+    value = np.sin(time / 10)
+
+    reduced_time, reduced_value = reduce_series(time, value, strategy, 2)
+
+    assert reduced_time.tolist() == [0, 99]
+    assert reduced_value.tolist() == value[[0, -1]].tolist()
+
+
+def test_reduce_series_change_point():
+    time = np.arange(1000, dtype=np.float64)
+    setpoint = np.where(time < 400, 50.0, 100.0)  # noqa: PLR2004
+    state = (time > 200) & (time < 700)  # noqa: PLR2004
+
+    reduced_time, reduced_value = reduce_series(time, setpoint, 'change_point', 10)
+    assert reduced_time.tolist() == [0, 399, 400, 999]
+    assert reduced_value.tolist() == [50, 50, 100, 100]
+
+    reduced_time, reduced_value = reduce_series(time, state, 'change_point', 10)
+    assert reduced_time.tolist() == [0, 200, 201, 699, 700, 999]
+    assert reduced_value.dtype == bool
+
+
+def test_reduce_step_params(synthetic_logfile, monkeypatch):
+    step_params = read_events(read_logfile(synthetic_logfile)).step_params
+    for channel_type in ['MEASUREMENT', 'SETPOINT', 'STATE']:
+        monkeypatch.delenv(STEP_SERIES_REDUCTION_ENV.format(channel_type), False)
+
+    # the time series are not reduced by default
+    _, report = reduce_step_params(step_params)
+    for channel_report in report.values():
+        assert channel_report['strategy'] == 'none'
+        assert channel_report['points'] == channel_report['reduced_points']
+
+    monkeypatch.setenv(STEP_SERIES_REDUCTION_ENV.format('MEASUREMENT'), 'stride:100')
+    monkeypatch.setenv(STEP_SERIES_REDUCTION_ENV.format('SETPOINT'), 'change_point')
+    reduced, report = reduce_step_params(
+        step_params, config={'state': {'strategy': 'none'}}
+    )
+
+    assert report['measurement']['strategy'] == 'stride'
+    assert report['measurement']['max_points'] == 100  # noqa: PLR2004
+    assert report['state']['points'] == report['state']['reduced_points']
+    assert report['setpoint']['strategy'] == 'change_point'
+    for key, step in step_params.items():
+        flow_rate = step['environment']['gas_flow']['ar']['flow_rate']
+        reduced_flow_rate = reduced[key]['environment']['gas_flow']['ar']['flow_rate']
+        if len(flow_rate['time']) <= 100:  # noqa: PLR2004
+            assert reduced_flow_rate['time'] is flow_rate['time']
+        else:
+            assert len(reduced_flow_rate['time']) <= 100  # noqa: PLR2004
+        assert reduced_flow_rate['measurement_type'] == 'Mass Flow Controller'
+        # the step parameters are not modified
+        assert len(flow_rate['time']) == len(step['environment']['pressure']['time'])
+    with pytest.raises(ValueError):
+        reduce_step_params(step_params, config={'setpoint': {'strategy': 'mean'}})
+
+
+def test_compile_nomad_map():
+    step_params = {
+        'deposition': {
+            'sources': {
+                'taurus': {
+                    'power_supply': {'power_type': 'RF', 'avg_dc_bias': 150},
+                    'source_shutter_open': {'mode_value': True},
+                }
+            }
+        }
+    }
+    source = types.SimpleNamespace(
+        vapor_source=types.SimpleNamespace(),
+        source_shutter_open=types.SimpleNamespace(),
+    )
+
+    nomad_map = compile_nomad_map(
+        map_sputter_source_params_to_nomad(None, 'taurus', 'RF'), 'source', skip=1
+    )
+    for param in nomad_map:
+        value = param.get(step_params['deposition'])
+        if value is not None:
+            param.set(source, value)
+
+    assert source.vapor_source.power_type == 'RF'
+    assert source.vapor_source.avg_dc_bias == 150  # noqa: PLR2004
+    assert source.source_shutter_open.mode_value
+    assert not hasattr(source.vapor_source, 'avg_fwd_power')
+    assert nomad_map[0].output_path == 'source.vapor_source.power_type'
+    assert format_input_path(nomad_map[0], prefix=('deposition',)) == (
+        "params['deposition']['sources']['taurus']['power_supply']['power_type']"
+    )